@@ -15,16 +15,33 @@ PII_PATTERNS = {
     'nhs_number': NHS_PATTERN,
 }
 
+# Every PII pattern needs an '@' (email) or a digit (everything else) to match
+ANCHOR_DIGIT = re.compile(r"\d")
+ANCHORED_ON_AT = {'email'}
+
 RISKY_SHARE = re.compile(r"\b(public|publish|posted|share publicly|broadcast|disclose|release|expose|leak|dump|pastebin|github)\b", re.IGNORECASE)
 
 
 def scan_pii(text: str, document_type: str | None = None):
     content = text or ''
+    return classify_pii(find_pii_entities(content), content, document_type)
+
+
+def find_pii_entities(content: str):
+    """Raw PII matches with their spans; patterns whose anchor character is absent are skipped."""
+    has_digit = ANCHOR_DIGIT.search(content) is not None
+    has_at = '@' in content
     entities = []
     for etype, pattern in PII_PATTERNS.items():
+        if not (has_at if etype in ANCHORED_ON_AT else has_digit):
+            continue
         for match in pattern.finditer(content):
-            entities.append({'type': etype, 'match': match.group(0)})
+            entities.append({'type': etype, 'match': match.group(0), 'start': match.start(), 'end': match.end()})
+    return entities
+
 
+def classify_pii(entities, content: str, document_type: str | None = None, content_lower: str | None = None):
+    """Turn raw matches into the analyzer verdict."""
     # Critical/high classes always escalate
     has_cc = any(e['type'] == 'credit_card' for e in entities)
     has_ni = any(e['type'] == 'ni_number' for e in entities)
@@ -54,7 +71,8 @@ def scan_pii(text: str, document_type: str | None = None):
     phone_count = sum(1 for e in entities if e['type'] == 'phone')
     risky_language = bool(RISKY_SHARE.search(content))
 
-    content_lower = content.lower()
+    if content_lower is None:
+        content_lower = content.lower()
     policy_context = any(k in content_lower for k in ['privacy policy', 'privacy notice', 'contact us', 'contact', 'support@', 'help@'])
     allowed_doc_types = {'privacy_notice', 'privacy_policy', 'consent_form', 'security_policy', 'contact_page'}
     if policy_context or (document_type or '').lower() in allowed_doc_types:
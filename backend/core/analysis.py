@@ -0,0 +1,145 @@
+"""
+Per-document analysis stage
+Runs each universal detector and analyzer once and fans the results out
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Set
+
+from analyzers.pii_scanner import classify_pii, find_pii_entities
+from core.document_context import DocumentContext
+
+
+# Keys of the ``universal`` and ``analyzers`` response sections, in order
+UNIVERSAL_CHECKS = ('pii', 'contradictions', 'hallucinations', 'bias', 'harm', 'illegal_content')
+ANALYZER_CHECKS = ('pii', 'contradictions', 'hallucinations')
+
+
+class AnalysisCounters:
+    """Thread-safe count of detector executions across all documents."""
+
+    def __init__(self) -> None:
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+class DocumentAnalysis:
+    """
+    Memoized detector results for one document.
+
+    ``contradictions`` and ``hallucinations`` are reported under both
+    ``universal`` and ``analyzers``; they are computed once here and copied
+    into each section. The two PII views (span-level ``detect_pii`` and
+    entity-level ``scan_pii``) are built by a single ``pii`` stage from one
+    scan of the text. Stages a section gave up waiting for are listed in
+    ``timed_out``.
+    """
+
+    def __init__(self, universal, ctx: DocumentContext, counters: Optional[AnalysisCounters] = None) -> None:
+        self.universal = universal
+        self.ctx = ctx
+        self.counters = counters if counters is not None else AnalysisCounters()
+        self._stages: Dict[str, Callable[[], Any]] = {
+            'pii': self._pii,
+            'contradictions': lambda: self.universal.detect_contradictions(ctx.text),
+            'hallucinations': lambda: self.universal.detect_hallucination_markers(ctx.text),
+            'bias': lambda: self.universal.detect_bias(ctx.text),
+            'harm': lambda: self.universal.detect_harm(ctx.text),
+            'illegal_content': lambda: self.universal.detect_illegal_content(ctx.text),
+        }
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.timed_out: Set[str] = set()
+
+    def _pii(self):
+        ctx = self.ctx
+        entities = find_pii_entities(ctx.text)
+        universal_view = self.universal.detect_pii(
+            ctx.text, document_type=ctx.document_type, text_lower=ctx.lower, entities=entities
+        )
+        analyzer_view = classify_pii(entities, ctx.text, document_type=ctx.document_type, content_lower=ctx.lower)
+        return {'universal': universal_view, 'analyzer': analyzer_view}
+
+    def _run(self, name: str):
+        self.counters.increment(name)
+        return self._stages[name]()
+
+    def start(self, executor) -> None:
+        """Submit every stage to ``executor`` so they overlap with gate execution."""
+        for name in self._stages:
+            self._future(name, executor)
+
+    def _future(self, name: str, executor=None) -> Future:
+        with self._lock:
+            future = self._futures.get(name)
+            if future is not None:
+                return future
+            if executor is not None:
+                future = self._futures[name] = executor.submit(self._run, name)
+                return future
+            future = self._futures[name] = Future()
+
+        # Never started: compute inline, outside the lock
+        try:
+            future.set_result(self._run(name))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def result(self, name: str, timeout: Optional[float] = None):
+        """Result of stage ``name``, computing it inline if it was never started."""
+        try:
+            return self._future(name).result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self.timed_out.add(name)
+            raise
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+    def universal_section(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        The ``universal`` response section; raises if any detector failed.
+
+        ``timeout`` (seconds) bounds the wait for the whole section.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        section = {}
+        for name in UNIVERSAL_CHECKS:
+            value = self.result(name, timeout=self._remaining(deadline))
+            section[name] = value['universal'] if name == 'pii' else value
+        return section
+
+    def analyzer_section(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        The ``analyzers`` response section; failures are reported per analyzer.
+
+        ``timeout`` (seconds) bounds the wait for the whole section.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        section = {}
+        for name in ANALYZER_CHECKS:
+            try:
+                value = self.result(name, timeout=self._remaining(deadline))
+                # Copy so the two sections never share a mutable dict
+                section[name] = dict(value['analyzer'] if name == 'pii' else value)
+            except Exception:
+                section[name] = {
+                    'status': 'ERROR',
+                    'message': 'Analyzer timeout or error'
+                }
+        return section
@@ -1,35 +1,131 @@
 """
-Async/parallel gate execution for improved performance
-Uses concurrent.futures for parallel processing
+LOKI validation engine with pluggable gate execution
+Gates run serially, on a thread pool, on a process pool or on an asyncio
+loop; every mode produces the same verdicts
 """
-import concurrent.futures
 from datetime import datetime
+import concurrent.futures
 import hashlib
+import time
 
 from core.universal_detectors import UniversalDetectors
-from analyzers.pii_scanner import scan_pii
+from core.document_context import DocumentContext
+from core.analysis import AnalysisCounters, DocumentAnalysis
 from core.cross_validation import CrossValidator
 from core.gate_registry import gate_registry
+from core.block_memo import BlockMatchMemo
+from core.pattern_registry import pattern_registry
+from core.regex_backends import create_backend
+from core.relevance import relevance_index
+from core.executors import (
+    EXECUTION_MODES, GATE_SKIPPED, GATE_TIMEOUT, GateExecutor, ProcessGateExecutor, create_gate_executor,
+)
 
 
 class AsyncLOKIEngine:
     """
-    Enhanced LOKI engine with parallel gate execution
+    LOKI engine with a pluggable gate executor
+
+    This is the single engine implementation; ``core.engine.LOKIEngine`` is
+    the same engine defaulting to serial execution.
     """
 
-    def __init__(self, max_workers=4):
+    EXECUTION_MODES = EXECUTION_MODES
+    # Gates are scheduled in this order so a latency budget spends itself on
+    # the most critical checks first
+    SEVERITY_PRIORITY = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+    # 'full' runs every gate; 'verdict' stops once overall_risk is fixed at CRITICAL
+    CHECK_MODES = ('full', 'verdict')
+
+    def __init__(self, max_workers=4, max_queue=None, execution_mode='thread', process_workers=None,
+                 gate_cache=None):
         """
         Args:
             max_workers: Maximum concurrent gate executions
+            max_queue: Maximum tasks waiting for a worker (default 64 per worker)
+            execution_mode: 'thread' (shared thread pool), 'process' (pre-forked
+                process pool, for CPU-bound gates), 'asyncio' (tasks on a
+                dedicated event loop) or 'serial'
+            process_workers: Worker processes in 'process' mode (default: CPU count)
+            gate_cache: Optional GateResultCache; gate verdicts already known
+                for the same document and gate version are reused
         """
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(f"execution_mode must be one of {', '.join(self.EXECUTION_MODES)}")
+
         self.modules = {}
         self.logger = None
         self.universal = UniversalDetectors()
         self.cross = CrossValidator()
+        # How many times each universal detector/analyzer actually ran
+        self.analysis_counters = AnalysisCounters()
         self.max_workers = max_workers
+        self.execution_mode = execution_mode
+        self.gate_cache = gate_cache
+        # One long-lived pool for analyzers (and gates in thread mode) across all requests
+        self.executor = GateExecutor(max_workers=max_workers, max_queue=max_queue)
+        self.gate_executor = create_gate_executor(
+            execution_mode, self.executor, max_workers=max_workers, process_workers=process_workers
+        )
+
+    @classmethod
+    def from_config(cls, config, **overrides):
+        """
+        Build an engine from a mapping such as ``os.environ`` or ConfigManager
+
+        Keys: LOKI_EXECUTION_MODE, LOKI_GATE_WORKERS, LOKI_GATE_QUEUE,
+        LOKI_PROCESS_WORKERS, LOKI_BLOCK_MEMO_BLOCKS, LOKI_REGEX_BACKEND,
+        LOKI_REGEX_TIMEOUT_MS (all optional).
+        LOKI_BLOCK_MEMO_BLOCKS sizes the shared paragraph match memo of
+        ``pattern_registry``; 0 disables it. LOKI_REGEX_BACKEND picks the
+        registry's regex engine ('stdlib', 're2', 'regex' or 'auto');
+        LOKI_REGEX_TIMEOUT_MS is the per-call limit of the 'regex' engine
+        (default 1000; 0 disables it).
+        """
+        def as_int(key):
+            value = config.get(key)
+            return int(value) if value not in (None, '') else None
+
+        options = {
+            'execution_mode': config.get('LOKI_EXECUTION_MODE') or 'thread',
+            'max_workers': as_int('LOKI_GATE_WORKERS') or 4,
+            'max_queue': as_int('LOKI_GATE_QUEUE'),
+            'process_workers': as_int('LOKI_PROCESS_WORKERS'),
+        }
+        options.update(overrides)
+
+        memo_blocks = as_int('LOKI_BLOCK_MEMO_BLOCKS')
+        if memo_blocks is not None:
+            pattern_registry.block_memo = BlockMatchMemo(max_blocks=memo_blocks) if memo_blocks > 0 else None
+
+        backend = config.get('LOKI_REGEX_BACKEND')
+        if backend:
+            timeout_ms = as_int('LOKI_REGEX_TIMEOUT_MS')
+            if timeout_ms is None:
+                timeout = 1.0
+            else:
+                timeout = timeout_ms / 1000.0 if timeout_ms > 0 else None
+            pattern_registry.set_backend(create_backend(backend, timeout=timeout))
+        return cls(**options)
+
+    def warm_up(self):
+        """
+        Start process workers with the currently loaded modules (no-op for other modes)
+
+        Call once after loading modules at start-up; until then, and for modules
+        loaded later, 'process' mode runs the gates in this process.
+        """
+        if isinstance(self.gate_executor, ProcessGateExecutor):
+            self.gate_executor.start(list(self.modules))
+
+    def shutdown(self):
+        """Stop the engine's executors"""
+        if self.gate_executor is not self.executor:
+            self.gate_executor.shutdown()
+        self.executor.shutdown()
 
     def load_module(self, module_name):
-        """Dynamically import module and register gates"""
+        """Dynamically import module, register gates and precompile their patterns"""
         try:
             module_path = f"modules.{module_name}.module"
             imported = __import__(module_path, fromlist=[''])
@@ -48,21 +144,30 @@ class AsyncLOKIEngine:
                         gate_obj=gate_obj,
                         version=gate_version
                     )
+                    pattern_registry.register_gate(module_name, gate_id, gate_obj)
+                    relevance_index.register_gate(module_name, gate_id, gate_obj)
 
             return True
         except Exception as e:
             print(f"Failed to load module {module_name}: {e}")
             return False
 
-    def _execute_gate(self, gate_name, gate, text, document_type):
+    def _execute_gate(self, gate_name, gate, ctx):
         """
         Execute a single gate (for parallel execution)
 
+        Gates exposing ``check_ctx`` receive the shared DocumentContext;
+        all others fall back to the classic ``check(text, document_type)``.
+
         Returns:
             tuple: (gate_name, result_dict)
         """
         try:
-            result = gate.check(text, document_type)
+            check_ctx = getattr(gate, 'check_ctx', None)
+            if check_ctx is not None:
+                result = check_ctx(ctx)
+            else:
+                result = gate.check(ctx.text, ctx.document_type)
             return (gate_name, result)
         except Exception as e:
             return (gate_name, {
@@ -71,53 +176,186 @@ class AsyncLOKIEngine:
                 'message': f'Gate error: {str(e)}'
             })
 
-    def _execute_module_parallel(self, module, text, document_type):
+    @staticmethod
+    def _gate_version(module_name, gate_name, gate):
+        """Version recorded for a gate in gate_registry (falls back to the gate's own attribute)"""
+        info = gate_registry.get_gate_info(f"{module_name}.{gate_name}")
+        return info.version if info is not None else getattr(gate, 'version', '1.0.0')
+
+    def _gate_priority(self, module_name, gate_name, gate):
+        """Scheduling rank of a gate from its registered severity (lower runs first)"""
+        info = gate_registry.get_gate_info(f"{module_name}.{gate_name}")
+        severity = info.severity if info is not None else getattr(gate, 'severity', 'medium')
+        return self.SEVERITY_PRIORITY.get(str(severity).lower(), len(self.SEVERITY_PRIORITY))
+
+    @staticmethod
+    def _unfinished_result(gate_name, gate_obj, status, message):
+        """Placeholder verdict for a gate that was cut off (TIMEOUT) or not needed (SKIPPED)"""
+        return {
+            'gate': gate_name,
+            'version': getattr(gate_obj, 'version', '1.0.0'),
+            'legal_source': getattr(gate_obj, 'legal_source', 'Unknown'),
+            'status': status,
+            'severity': 'none',
+            'message': message,
+            'timestamp': datetime.utcnow().isoformat(),
+        }
+
+    def _verdict_fixed(self):
+        """
+        Stop condition for 'verdict' mode
+
+        Counts critical/high gate FAILs as results arrive and reports True
+        once they alone make overall_risk CRITICAL; more results can only
+        raise the counts, so the verdict cannot change after that.
         """
-        Execute all gates in a module in parallel
+        counts = {'critical': 0, 'high': 0}
+
+        def fixed(result):
+            if isinstance(result, dict) and (result.get('status') or '').upper() == 'FAIL':
+                severity = (result.get('severity') or 'none').lower()
+                if severity in counts:
+                    counts[severity] += 1
+            return self._risk_level(counts['critical'], counts['high'], 0, 0) == 'CRITICAL'
+
+        return fixed
+
+    @staticmethod
+    def _tally(summary, normalized):
+        status = normalized.get('status', 'UNKNOWN').upper()
+        if status == 'TIMEOUT':
+            summary['timeout'] += 1
+        elif status == 'SKIPPED':
+            summary['skipped'] += 1
+        elif status == 'PASS':
+            summary['pass'] += 1
+        elif status == 'FAIL':
+            summary['fail'] += 1
+        elif status in ('WARNING', 'WARN'):
+            summary['warning'] += 1
+        elif status in ('N/A', 'NA'):
+            summary['na'] += 1
+        else:
+            summary['error'] += 1
+
+    def _execute_modules(self, modules, ctx, relevance=None, deadline=None, stop_when=None,
+                         document_key=None, cache_stats=None, plan_stats=None):
+        """
+        Execute the gates of all given modules as one flat task list
+
+        Every gate is handed to the engine's gate executor up front, so a
+        large module (fca_uk) does not serialize behind module boundaries.
 
         Args:
-            module: Module object
-            text: Document text
-            document_type: Document type
+            modules: {module_name: module object} to run
+            ctx: Shared DocumentContext for the document under validation
+            relevance: Optional RelevanceScan; gates it rules out are answered
+                with their own N/A payload instead of being executed
+            deadline: Optional ``time.monotonic()`` deadline; gates unfinished
+                by then are reported with status TIMEOUT
+            stop_when: Optional condition on each gate result; once it holds
+                the remaining gates are reported with status SKIPPED
+            document_key: GateResultCache document key; with ``self.gate_cache``
+                set, cached verdicts are reused and only missing gates run
+            cache_stats: Optional dict receiving 'hits' and 'stored' counts
+            plan_stats: Optional dict receiving the PatternPlan stats of the
+                executed gates (unique patterns, searches avoided)
 
         Returns:
-            dict: Gate results
+            dict: {module_name: {'name', 'version', 'gates', 'summary'}}
         """
-        gates = getattr(module, 'gates', {})
-        if not gates:
-            return {}
-
-        results = {}
-        summary = {'pass': 0, 'fail': 0, 'warning': 0, 'error': 0, 'na': 0}
-
-        # Execute gates in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all gate tasks
-            future_to_gate = {
-                executor.submit(self._execute_gate, gate_name, gate, text, document_type): (gate_name, gate)
-                for gate_name, gate in gates.items()
-            }
+        module_results = {}
+        tasks = []
+
+        for module_name, module in modules.items():
+            try:
+                entry = {
+                    'name': getattr(module, 'name', module_name.title()),
+                    'version': getattr(module, 'version', '1.0.0'),
+                    'gates': {},
+                    'summary': {'pass': 0, 'fail': 0, 'warning': 0, 'error': 0, 'na': 0, 'timeout': 0, 'skipped': 0},
+                }
+                for gate_name, gate in getattr(module, 'gates', {}).items():
+                    # Reserve the slot so results keep the module's gate order
+                    entry['gates'][gate_name] = None
+                    if relevance is not None and not relevance.is_relevant(module_name, gate_name):
+                        payload = relevance_index.not_applicable(module_name, gate_name, gate, ctx.document_type)
+                        if payload is not None:
+                            tasks.append((module_name, gate_name, gate, payload))
+                            continue
+                    tasks.append((module_name, gate_name, gate, None))
+                module_results[module_name] = entry
+            except Exception as mod_err:
+                module_results[module_name] = {
+                    'error': 'Module execution failed',
+                    'detail': str(mod_err),
+                    # NO TRACEBACK - security enhancement
+                }
 
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_gate):
-                gate_name, gate = future_to_gate[future]
-                _, result = future.result()
+        gate_cache = self.gate_cache if document_key is not None else None
+        cache_hits = 0
+        verdict_fixed = False
+        if gate_cache is not None:
+            for i, (module_name, gate_name, gate, payload) in enumerate(tasks):
+                if payload is not None:
+                    continue
+                version = self._gate_version(module_name, gate_name, gate)
+                cached = gate_cache.get(document_key, module_name, gate_name, version)
+                if cached is not None:
+                    tasks[i] = (module_name, gate_name, gate, cached)
+                    cache_hits += 1
+                    # Cached verdicts count towards the early-exit condition too
+                    if stop_when is not None and stop_when(cached):
+                        verdict_fixed = True
+
+        runnable = [(module_name, gate_name, gate) for module_name, gate_name, gate, payload in tasks
+                    if payload is None]
+        if verdict_fixed:
+            executed_results = [GATE_SKIPPED] * len(runnable)
+        else:
+            # Submit critical gates first; results are mapped back to module order
+            order = sorted(range(len(runnable)), key=lambda i: self._gate_priority(*runnable[i]))
+            # Patterns several of these gates search for run once on this document
+            plan = pattern_registry.plan(f"{module_name}.{gate_name}" for module_name, gate_name, _ in runnable)
+            with pattern_registry.bind(ctx, plan):
+                scheduled = self.gate_executor.run_gates(
+                    [runnable[i] for i in order], ctx, self._execute_gate, deadline, stop_when
+                )
+            if plan_stats is not None:
+                plan_stats.update(plan.get_stats())
+            executed_results = [None] * len(runnable)
+            for i, result in zip(order, scheduled):
+                executed_results[i] = result
+
+        stored = 0
+        if gate_cache is not None:
+            for (module_name, gate_name, gate), result in zip(runnable, executed_results):
+                # Only complete verdicts; errors may be transient
+                if isinstance(result, dict) and (result.get('status') or '').upper() != 'ERROR':
+                    version = self._gate_version(module_name, gate_name, gate)
+                    gate_cache.set(document_key, module_name, gate_name, version, result)
+                    stored += 1
+        if cache_stats is not None:
+            cache_stats.update({'hits': cache_hits, 'stored': stored})
+        executed = iter(executed_results)
+
+        for module_name, gate_name, gate, payload in tasks:
+            result = next(executed) if payload is None else payload
+            entry = module_results[module_name]
+            if isinstance(result, str) and result == GATE_TIMEOUT:
+                normalized = self._unfinished_result(
+                    gate_name, gate, 'TIMEOUT', 'Gate did not finish within the latency budget'
+                )
+            elif isinstance(result, str) and result == GATE_SKIPPED:
+                normalized = self._unfinished_result(
+                    gate_name, gate, 'SKIPPED', 'Not run: overall risk was already CRITICAL'
+                )
+            else:
                 normalized = self._normalize_gate_result(gate_name, gate, result)
-                results[gate_name] = normalized
-
-                status = normalized.get('status', 'UNKNOWN').upper()
-                if status == 'PASS':
-                    summary['pass'] += 1
-                elif status == 'FAIL':
-                    summary['fail'] += 1
-                elif status in ('WARNING', 'WARN'):
-                    summary['warning'] += 1
-                elif status in ('N/A', 'NA'):
-                    summary['na'] += 1
-                else:
-                    summary['error'] += 1
-
-        return results, summary
+            entry['gates'][gate_name] = normalized
+            self._tally(entry['summary'], normalized)
+
+        return module_results
 
     def _normalize_gate_result(self, gate_name, gate_obj, result):
         """Ensure gate responses follow the standard schema."""
@@ -160,7 +398,7 @@ class AsyncLOKIEngine:
         normalized['timestamp'] = datetime.utcnow().isoformat()
         return normalized
 
-    def check_document(self, text, document_type, active_modules):
+    def check_document(self, text, document_type, active_modules, budget_ms=None, mode='full'):
         """
         Run validation with parallel gate execution
 
@@ -168,10 +406,21 @@ class AsyncLOKIEngine:
             text: Document text
             document_type: Type of document
             active_modules: List of module IDs to run
+            budget_ms: Optional latency budget. Gates run most critical first;
+                those unfinished when it expires are marked TIMEOUT, detectors
+                still running are reported as errors, and either way the
+                result carries ``partial: True``
+            mode: 'full' (default) runs every gate. 'verdict' runs critical
+                gates first and skips the rest once overall_risk is certain
+                to be CRITICAL; skipped gates are listed in ``skipped_gates``
 
         Returns:
             dict: Validation results
         """
+        if mode not in self.CHECK_MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.CHECK_MODES)}")
+        started = time.monotonic()
+        deadline = started + budget_ms / 1000.0 if budget_ms is not None else None
         try:
             if not isinstance(text, str):
                 raise ValueError("text must be a string")
@@ -183,6 +432,9 @@ class AsyncLOKIEngine:
 
             active_modules = [m for m in active_modules if m in self.modules]
 
+            ctx = DocumentContext(text, document_type)
+            relevance = relevance_index.scan(ctx)
+
             results = {
                 'document_hash': self._hash_text(text or ''),
                 'timestamp': datetime.utcnow().isoformat(),
@@ -191,56 +443,61 @@ class AsyncLOKIEngine:
                 'overall_risk': None
             }
 
-            # Run universal safety checks (sequential, fast)
-            try:
-                universal = {
-                    'pii': self.universal.detect_pii(text, document_type=document_type),
-                    'contradictions': self.universal.detect_contradictions(text),
-                    'hallucinations': self.universal.detect_hallucination_markers(text),
-                    'bias': self.universal.detect_bias(text),
-                    'harm': self.universal.detect_harm(text),
-                    'illegal_content': self.universal.detect_illegal_content(text),
+            # Each detector runs once; universal and analyzers share the results.
+            # Submitted first so the detectors overlap with the gates.
+            analysis = DocumentAnalysis(self.universal, ctx, counters=self.analysis_counters)
+            analysis.start(self.executor)
+
+            # Run gates of all active modules as one flat task list
+            active = {module_name: self.modules[module_name] for module_name in active_modules}
+            stop_when = self._verdict_fixed() if mode == 'verdict' else None
+            document_key = None
+            cache_stats = {}
+            plan_stats = {}
+            if self.gate_cache is not None:
+                document_key = self.gate_cache.document_key(results['document_hash'], ctx.document_type)
+            results['modules'] = self._execute_modules(
+                active, ctx, relevance, deadline, stop_when, document_key=document_key, cache_stats=cache_stats,
+                plan_stats=plan_stats
+            )
+            results['relevance'] = relevance.summary(active)
+            if cache_stats:
+                results['gate_cache'] = cache_stats
+            if plan_stats:
+                results['pattern_plan'] = plan_stats
+            if mode == 'verdict':
+                results['mode'] = mode
+                results['skipped_gates'] = [
+                    f"{module_name}.{gate_name}"
+                    for module_name, module in results['modules'].items()
+                    for gate_name, gate in (module.get('gates') or {}).items()
+                    if gate.get('status') == 'SKIPPED'
+                ]
+            timed_out = sum(
+                (module.get('summary') or {}).get('timeout', 0) for module in results['modules'].values()
+            )
+            results['partial'] = timed_out > 0
+            if budget_ms is not None:
+                results['budget'] = {
+                    'budget_ms': budget_ms,
+                    'gates_elapsed_ms': round((time.monotonic() - started) * 1000, 1),
+                    'gates_timed_out': timed_out,
                 }
+
+            try:
+                universal = analysis.universal_section(
+                    timeout=None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+            except concurrent.futures.TimeoutError:
+                universal = {'error': 'Detector timeout'}
             except Exception as e:
                 universal = {'error': str(e)}
             results['universal'] = universal
-
-            # Run modules with parallel gate execution
-            for module_name in active_modules or []:
-                try:
-                    if module_name in self.modules:
-                        module = self.modules[module_name]
-                        gate_results, summary = self._execute_module_parallel(module, text, document_type)
-                        results['modules'][module_name] = {
-                            'name': getattr(module, 'name', module_name.title()),
-                            'version': getattr(module, 'version', '1.0.0'),
-                            'gates': gate_results,
-                            'summary': summary
-                        }
-                except Exception as mod_err:
-                    results['modules'][module_name] = {
-                        'error': 'Module execution failed',
-                        'detail': str(mod_err),
-                        # NO TRACEBACK - security enhancement
-                    }
-
-            # Run analyzers (parallel where beneficial)
-            results['analyzers'] = {}
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                futures = {
-                    'pii': executor.submit(scan_pii, text, document_type=document_type),
-                    'contradictions': executor.submit(self.universal.detect_contradictions, text),
-                    'hallucinations': executor.submit(self.universal.detect_hallucination_markers, text),
-                }
-
-                for analyzer_name, future in futures.items():
-                    try:
-                        results['analyzers'][analyzer_name] = future.result(timeout=10)
-                    except Exception as e:
-                        results['analyzers'][analyzer_name] = {
-                            'status': 'ERROR',
-                            'message': 'Analyzer timeout or error'
-                        }
+            analyzer_timeout = 10 if deadline is None else min(10, max(0.0, deadline - time.monotonic()))
+            results['analyzers'] = analysis.analyzer_section(timeout=analyzer_timeout)
+            if analysis.timed_out:
+                # Detectors still running are missing from the result, like timed-out gates
+                results['partial'] = True
 
             # Calculate risk
             results['overall_risk'] = self._calculate_risk(results)
@@ -337,7 +594,11 @@ class AsyncLOKIEngine:
                 elif severity == 'medium':
                     medium += 1
 
-        # Weighted risk calculation
+        return self._risk_level(critical, high, medium, warnings)
+
+    @staticmethod
+    def _risk_level(critical, high, medium, warnings):
+        """Weighted risk calculation; never decreases as any count grows"""
         if critical >= 2 or (critical >= 1 and high >= 2):
             return 'CRITICAL'
         elif critical >= 1 or high >= 3 or (high >= 1 and medium >= 3):
@@ -131,6 +131,9 @@ class AuditLogger:
             'has_universal': bool(validation_result.get('universal')),
             'has_cross': bool(validation_result.get('cross')),
         }
+        if validation_result.get('near_duplicate'):
+            # Verdict reused from a near-identical document, not computed for this one
+            metadata['near_duplicate'] = validation_result['near_duplicate']
 
         cursor.execute('''
             INSERT INTO audit_log
@@ -224,7 +227,7 @@ class AuditLogger:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT id, timestamp, document_type, modules_used,
-                   overall_risk, critical_count, high_count
+                   overall_risk, critical_count, high_count, metadata
             FROM audit_log
             ORDER BY timestamp DESC
             LIMIT ?
@@ -241,6 +244,7 @@ class AuditLogger:
                 'overall_risk': row[4],
                 'critical_count': row[5],
                 'high_count': row[6],
+                'near_duplicate': json.loads(row[7] or '{}').get('near_duplicate'),
             }
             for row in rows
         ]
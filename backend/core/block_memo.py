@@ -0,0 +1,667 @@
+"""
+Paragraph-level memo of regex matches
+Templated documents share most paragraphs: match spans are cached per
+paragraph block and rebased onto each document, so only changed blocks
+are scanned again
+"""
+from __future__ import annotations
+
+import bisect
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from core.regex_parser import sre_constants, sre_parse
+
+
+# Blocks are separated by blank lines (the same breaks as DocumentContext.paragraphs)
+_BLOCK_BREAK = re.compile(r"\n\s*\n")
+_SOLID = re.compile(r"\S")
+_SPACE = re.compile(r"\s")
+
+# Pattern tiers
+LOCAL = 'local'  # cannot match a newline: matches never leave a block
+SEAM = 'seam'    # may cross a blank line; each gap is checked in a bounded window
+
+_MAXREPEAT = sre_constants.MAXREPEAT
+_INFINITE = float('inf')
+_SPACE_SAMPLES = [c for c in map(chr, range(0x3001)) if c.isspace()]
+
+Span = Tuple[int, int]
+
+# (can match '\n', can match whitespace, can match non-whitespace) per class escape
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: (False, False, True),
+    sre_constants.CATEGORY_NOT_DIGIT: (True, True, True),
+    sre_constants.CATEGORY_SPACE: (True, True, False),
+    sre_constants.CATEGORY_NOT_SPACE: (False, False, True),
+    sre_constants.CATEGORY_WORD: (False, False, True),
+    sre_constants.CATEGORY_NOT_WORD: (True, True, True),
+    sre_constants.CATEGORY_LINEBREAK: (True, True, False),
+    sre_constants.CATEGORY_NOT_LINEBREAK: (False, True, True),
+}
+
+
+# ----------------------------------------------------------------------
+# Pattern analysis
+# ----------------------------------------------------------------------
+class _Unsupported(Exception):
+    """The pattern's matches may depend on text outside its block."""
+
+
+@dataclass
+class _Shape:
+    newline: bool = False    # some match can contain '\n'
+    min_solid: float = 0     # non-whitespace characters every match contains
+    max_solid: float = 0     # non-whitespace characters any match can contain
+    end_line: bool = False   # uses MULTILINE '$'
+
+
+def _charset(items, flags) -> Tuple[bool, bool, bool]:
+    """(can match '\\n', can match whitespace, can match non-whitespace) for a class."""
+    negate = False
+    newline = space = solid = False
+    covers_space = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            ch = chr(av)
+            newline |= ch == '\n'
+            space |= ch.isspace()
+            solid |= not ch.isspace()
+        elif op is sre_constants.RANGE:
+            lo, hi = av
+            newline |= lo <= 10 <= hi
+            space |= any(lo <= ord(c) <= hi for c in _SPACE_SAMPLES)
+            solid |= hi - lo > 64 or any(not chr(c).isspace() for c in range(lo, hi + 1))
+        elif op is sre_constants.CATEGORY:
+            cat_newline, cat_space, cat_solid = _CATEGORIES[av]
+            newline |= cat_newline
+            space |= cat_space
+            solid |= cat_solid
+            covers_space |= av is sre_constants.CATEGORY_SPACE and not flags & re.ASCII
+        else:
+            raise _Unsupported(op)
+    if negate:
+        return not newline, not covers_space, True
+    return newline, space, solid
+
+
+def _atom(op, av, flags) -> Tuple[bool, bool, bool]:
+    if op is sre_constants.LITERAL:
+        ch = chr(av)
+        return ch == '\n', ch.isspace(), not ch.isspace()
+    if op is sre_constants.NOT_LITERAL:
+        return av != 10, True, True
+    if op is sre_constants.ANY:
+        return bool(flags & re.DOTALL), True, True
+    if op is sre_constants.IN:
+        return _charset(av, flags)
+    raise _Unsupported(op)
+
+
+def _can_match_space(items, flags) -> bool:
+    for op, av in items:
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, _POSSESSIVE):
+            if _can_match_space(av[2], flags):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            if _can_match_space(av[3], (flags | av[1]) & ~av[2]):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_can_match_space(alt, flags) for alt in av[1]):
+                return True
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if _can_match_space(av[1], flags):
+                return True
+        elif op is _ATOMIC:
+            if _can_match_space(av, flags):
+                return True
+        elif op is sre_constants.AT:
+            continue
+        elif _atom(op, av, flags)[1]:
+            return True
+    return False
+
+
+_POSSESSIVE = getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+_ATOMIC = getattr(sre_constants, 'ATOMIC_GROUP', None)
+_BOUNDARIES = (sre_constants.AT_BOUNDARY, sre_constants.AT_NON_BOUNDARY)
+
+
+def _shape(items, flags) -> _Shape:
+    shape = _Shape()
+    for op, av in items:
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, _POSSESSIVE):
+            lo, hi, sub = av
+            inner = _shape(sub, flags)
+            shape.newline |= inner.newline
+            shape.end_line |= inner.end_line
+            shape.min_solid += lo * inner.min_solid
+            if inner.max_solid:
+                shape.max_solid += _INFINITE if hi == _MAXREPEAT else hi * inner.max_solid
+        elif op is sre_constants.SUBPATTERN:
+            inner = _shape(av[3], (flags | av[1]) & ~av[2])
+            shape.newline |= inner.newline
+            shape.end_line |= inner.end_line
+            shape.min_solid += inner.min_solid
+            shape.max_solid += inner.max_solid
+        elif op is _ATOMIC:
+            inner = _shape(av, flags)
+            shape.newline |= inner.newline
+            shape.end_line |= inner.end_line
+            shape.min_solid += inner.min_solid
+            shape.max_solid += inner.max_solid
+        elif op is sre_constants.BRANCH:
+            alternatives = [_shape(alt, flags) for alt in av[1]]
+            shape.newline |= any(alt.newline for alt in alternatives)
+            shape.end_line |= any(alt.end_line for alt in alternatives)
+            shape.min_solid += min(alt.min_solid for alt in alternatives)
+            shape.max_solid += max(alt.max_solid for alt in alternatives)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            # Lookarounds must fail on whitespace, as they would at a block edge
+            if _can_match_space(av[1], flags):
+                raise _Unsupported(op)
+            _shape(av[1], flags)
+        elif op is sre_constants.AT:
+            if av in _BOUNDARIES:
+                continue
+            if av is sre_constants.AT_BEGINNING and flags & re.MULTILINE:
+                continue
+            if av is sre_constants.AT_END and flags & re.MULTILINE:
+                shape.end_line = True
+                continue
+            raise _Unsupported(av)
+        else:
+            newline, space, solid = _atom(op, av, flags)
+            shape.newline |= newline
+            shape.min_solid += not space
+            shape.max_solid += solid
+    return shape
+
+
+def pattern_tier(compiled: Pattern) -> Optional[Tuple[str, int]]:
+    """
+    Classify a compiled pattern for block-wise matching.
+
+    Returns ``(LOCAL, 0)`` when no match can contain a newline,
+    ``(SEAM, width)`` when matches may cross a blank line but contain at
+    most ``width`` non-whitespace characters, or None when the pattern must
+    always be run on the whole document (anchors, back-references,
+    whitespace lookarounds, unbounded non-whitespace repeats, or matches
+    that may be all whitespace).
+    """
+    if not isinstance(compiled.pattern, str):
+        return None
+    try:
+        parsed = sre_parse.parse(compiled.pattern, compiled.flags)
+        shape = _shape(list(parsed), parsed.state.flags)
+    except (_Unsupported, re.error, RecursionError):
+        return None
+    if shape.min_solid < 1:
+        return None
+    if not shape.newline:
+        return LOCAL, 0
+    if shape.end_line or shape.max_solid == _INFINITE:
+        return None
+    return SEAM, int(shape.max_solid)
+
+
+# ----------------------------------------------------------------------
+# Document blocks
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Block:
+    """A run of paragraphs with its offsets and content digest."""
+    start: int
+    end: int
+    key: bytes
+    solid: int  # non-whitespace characters
+
+
+@dataclass(frozen=True)
+class Gap:
+    """Whitespace between two blocks, or between a block and an end of the text."""
+    start: int
+    end: int
+    left: Optional[int]   # index of the block before, None at the start of the text
+    right: Optional[int]  # index of the block after, None at the end of the text
+    key: tuple
+
+
+@dataclass
+class BlockIndex:
+    """Blocks of one document plus the whitespace gaps around them."""
+    text: str
+    blocks: List[Block]
+    min_solid: int
+    # Unseen documents are scanned whole; their spans then seed the blocks of later ones
+    cold: bool = False
+    # Per-pattern results for this document: slot -> spans, or None (run whole-document)
+    spans: Dict[int, Optional[Tuple[Span, ...]]] = field(default_factory=dict)
+    # Match objects of whole-document scans of a cold document
+    matches: Dict[int, list] = field(default_factory=dict)
+    _gaps: Optional[List[Optional[Gap]]] = None
+    # Memo entries of the blocks and gaps, resolved once per document
+    block_entries: Optional[list] = None
+    gap_entries: Optional[list] = None
+    _edges: Dict[int, Tuple[List[int], List[int]]] = field(default_factory=dict)
+
+    @property
+    def gaps(self) -> List[Optional[Gap]]:
+        """``gaps[i]`` precedes ``blocks[i]`` and ``gaps[-1]`` follows the last block (None if empty)."""
+        if self._gaps is None:
+            text, blocks = self.text, self.blocks
+            gaps = []
+            for i, start in enumerate([0] + [block.end for block in blocks]):
+                end = blocks[i].start if i < len(blocks) else len(text)
+                if start == end:
+                    gaps.append(None)
+                    continue
+                left = i - 1 if i > 0 else None
+                right = i if i < len(blocks) else None
+                key = (blocks[left].key if left is not None else b'', text[start:end],
+                       blocks[right].key if right is not None else b'')
+                gaps.append(Gap(start, end, left, right, key))
+            self._gaps = gaps
+        return self._gaps
+
+    def block_spans(self, i: int, spans: Tuple[Span, ...]) -> Optional[Tuple[Span, ...]]:
+        """
+        Spans inside block ``i`` (relative to its start), taken from this
+        document's whole-document ``spans``.
+
+        They equal the spans of matching the block on its own unless a match
+        touches a gap next to it, in which case None is returned.
+        """
+        block = self.blocks[i]
+        before, after = self.gaps[i], self.gaps[i + 1]
+        low = before.start if before is not None else block.start
+        high = after.end if after is not None else block.end
+        first = bisect.bisect_left(spans, (low,))
+        last = bisect.bisect_left(spans, (high,))
+        if first and spans[first - 1][1] > low:
+            return None
+        if first < last and (spans[first][0] < block.start or spans[last - 1][1] > block.end):
+            return None
+        start = block.start
+        return tuple((s - start, e - start) for s, e in spans[first:last])
+
+    def edges(self, i: int) -> Tuple[List[int], List[int]]:
+        """Positions of the first and last ``min_solid`` non-whitespace characters of block ``i``."""
+        edges = self._edges.get(i)
+        if edges is None:
+            block = self.blocks[i]
+            count = self.min_solid
+            head = [m.start() for m in islice(_SOLID.finditer(self.text, block.start, block.end), count)]
+            window = max(block.start, block.end - 8 * count)
+            tail = [m.start() for m in _SOLID.finditer(self.text, window, block.end)]
+            if len(tail) < count:
+                tail = [m.start() for m in _SOLID.finditer(self.text, block.start, block.end)]
+            edges = self._edges[i] = (head, tail[-count:])
+        return edges
+
+
+def split_blocks(text: str, min_solid: int) -> List[Block]:
+    """
+    Split ``text`` at blank lines into blocks of at least ``min_solid``
+    non-whitespace characters (short paragraphs are merged with the next).
+
+    Every block starts at the beginning of a line and ends at the end of
+    one, so a block edge always borders a newline or the end of the text.
+    """
+    paragraphs = []
+    start = 0
+    for brk in _BLOCK_BREAK.finditer(text):
+        paragraphs.append((start, brk.start()))
+        start = brk.end()
+    paragraphs.append((start, len(text)))
+
+    blocks = []
+    first = None
+    solid = 0
+    for start, end in paragraphs:
+        count = sum(map(len, text[start:end].split()))
+        if not count:
+            continue
+        if first is None:
+            first = start
+        solid += count
+        if solid >= min_solid:
+            blocks.append((first, end, solid))
+            first, solid = None, 0
+    if first is not None:
+        if blocks:
+            prev_start, _, prev_solid = blocks.pop()
+            blocks.append((prev_start, end, prev_solid + solid))
+        else:
+            blocks.append((first, end, solid))
+
+    return [
+        Block(start, end, hashlib.blake2b(text[start:end].encode('utf-8', 'surrogatepass'),
+                                          digest_size=16).digest(), solid)
+        for start, end, solid in blocks
+    ]
+
+
+# ----------------------------------------------------------------------
+# Memo
+# ----------------------------------------------------------------------
+class _Entry:
+    """Per-pattern results cached for one block or gap."""
+    __slots__ = ('scanned', 'values')
+
+    def __init__(self) -> None:
+        self.scanned = bytearray()
+        self.values: Dict[int, object] = {}
+
+
+class BlockMatchMemo:
+    """
+    LRU cache of per-block match spans, shared across documents.
+
+    A block's spans are computed by matching the block on its own and are
+    rebased onto each document that contains it; they equal the spans a
+    whole-document scan finds there because an eligible pattern behaves
+    the same at a block edge (next to a newline) as at the end of a string.
+    Patterns that may match across a blank line are also checked around
+    every gap (memoized by the gap and its two blocks); if a match could
+    touch one, that pattern is run on the whole document instead.
+
+    A document with mostly unseen blocks is scanned whole (per-block
+    scanning would only add overhead); its spans are kept with the recent
+    documents and cut into block spans when a later document reuses them.
+    """
+
+    def __init__(self, max_blocks: int = 4096, min_chars: int = 4096, min_block_solid: int = 256,
+                 max_documents: int = 8) -> None:
+        """
+        Args:
+            max_blocks: Blocks (and, separately, gaps) kept in the LRU
+            min_chars: Shorter documents are always scanned whole
+            min_block_solid: Non-whitespace characters per block (short paragraphs merge)
+            max_documents: Recent documents whose block index is kept
+        """
+        self.max_blocks = max_blocks
+        self.min_chars = min_chars
+        self.min_block_solid = min_block_solid
+        self.max_documents = max_documents
+        self._blocks: OrderedDict = OrderedDict()
+        self._gaps: OrderedDict = OrderedDict()
+        self._documents: OrderedDict = OrderedDict()
+        self._sources: Dict[bytes, Tuple[BlockIndex, int]] = {}  # block key -> recent document holding it
+        self._slots: Dict[Pattern, int] = {}
+        self._tiers: List[Optional[Tuple[str, int]]] = []
+        self._lock = threading.Lock()
+
+        self.block_hits = 0
+        self.block_scans = 0
+        self.block_seeds = 0
+        self.cold_documents = 0
+        self.gap_hits = 0
+        self.gap_checks = 0
+        self.whole_document = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Lookup helpers
+    # ------------------------------------------------------------------
+    def _slot(self, compiled: Pattern) -> int:
+        slot = self._slots.get(compiled)
+        if slot is None:
+            tier = pattern_tier(compiled)
+            with self._lock:
+                slot = self._slots.get(compiled)
+                if slot is None:
+                    slot = self._slots[compiled] = len(self._tiers)
+                    self._tiers.append(tier)
+        return slot
+
+    def index(self, text: str) -> Optional[BlockIndex]:
+        """The block index of ``text`` (kept for the last few documents), or None if too short."""
+        if len(text) < self.min_chars:
+            return None
+        # Keyed by content: gates often receive equal copies of the same text
+        with self._lock:
+            if text in self._documents:
+                self._documents.move_to_end(text)
+                return self._documents[text]
+        blocks = split_blocks(text, self.min_block_solid)
+        if len(blocks) < 2:
+            with self._lock:
+                self._documents[text] = None
+                self._evict_documents()
+            return None
+        index = BlockIndex(text, blocks, min(block.solid for block in blocks))
+        with self._lock:
+            known = sum(1 for block in blocks if block.key in self._blocks or block.key in self._sources)
+            index.cold = known * 2 < len(blocks)
+            if index.cold:
+                self.cold_documents += 1
+            for i, block in enumerate(blocks):
+                self._sources.setdefault(block.key, (index, i))
+            self._documents[text] = index
+            self._evict_documents()
+        return index
+
+    def _evict_documents(self) -> None:
+        while len(self._documents) > self.max_documents:
+            _, evicted = self._documents.popitem(last=False)
+            for block in evicted.blocks if evicted is not None else ():
+                source = self._sources.get(block.key)
+                if source is not None and source[0] is evicted:
+                    del self._sources[block.key]
+
+    def _entry(self, table: OrderedDict, key) -> _Entry:
+        with self._lock:
+            entry = table.get(key)
+            if entry is None:
+                entry = table[key] = _Entry()
+                while len(table) > self.max_blocks:
+                    table.popitem(last=False)
+                    self.evictions += 1
+            else:
+                table.move_to_end(key)
+            return entry
+
+    def _store(self, entry: _Entry, slot: int, value) -> None:
+        # Only non-empty values are kept; ``scanned`` marks the rest
+        if value:
+            entry.values[slot] = value
+        with self._lock:
+            if len(entry.scanned) <= slot:
+                entry.scanned.extend(bytes(slot + 1 - len(entry.scanned)))
+            entry.scanned[slot] = 1
+
+    def _block_spans(self, compiled: Pattern, slot: int, text: str, block: Block,
+                     entry: _Entry) -> Tuple[Span, ...]:
+        """Spans of ``compiled`` in ``block``, relative to the block start."""
+        if slot < len(entry.scanned) and entry.scanned[slot]:
+            self.block_hits += 1
+            return entry.values.get(slot, ())
+        spans = None
+        source = self._sources.get(block.key)
+        if source is not None and source[0].spans.get(slot) is not None:
+            spans = source[0].block_spans(source[1], source[0].spans[slot])
+        if spans is not None:
+            self.block_seeds += 1
+        else:
+            self.block_scans += 1
+            spans = tuple(m.span() for m in compiled.finditer(text[block.start:block.end]))
+        self._store(entry, slot, spans)
+        return spans
+
+    def _gap_touched(self, compiled: Pattern, slot: int, width: int, index: BlockIndex, gap: Gap,
+                     entry: _Entry, left_spans: Tuple[Span, ...]) -> bool:
+        """
+        True if a whole-document match of ``compiled`` may touch ``gap``.
+
+        Such a match holds at most ``width`` non-whitespace characters, so it
+        starts after the last ``width + 1`` of them in the left block and
+        ends before the first ``width + 1`` in the right one. Scanning that
+        window reproduces the whole-document scan there (it resumes after
+        any match straddling the window start) up to the first match in the
+        right block. The verdict depends only on the gap and its two blocks.
+        """
+        if slot < len(entry.scanned) and entry.scanned[slot]:
+            self.gap_hits += 1
+            return slot in entry.values
+
+        self.gap_checks += 1
+        text = index.text
+        pos = 0
+        if gap.left is not None:
+            pos = index.edges(gap.left)[1][-(width + 1)] + 1
+            offset = index.blocks[gap.left].start
+            for start, end in reversed(left_spans):
+                if offset + end <= pos:
+                    break
+                if offset + start < pos:
+                    pos = offset + end
+                    break
+        endpos = len(text)
+        if gap.right is not None:
+            right = index.blocks[gap.right]
+            # Stop at whitespace, where a lookahead fails just as at the end of the window
+            space = _SPACE.search(text, index.edges(gap.right)[0][width], right.end)
+            endpos = space.start() if space else right.end
+        touched = False
+        for match in compiled.finditer(text, pos, endpos):
+            if match.start() >= gap.end:
+                break
+            if match.end() > gap.start:
+                touched = True
+                break
+        self._store(entry, slot, touched)
+        return touched
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+    def spans(self, compiled: Pattern, text: str) -> Optional[Tuple[Span, ...]]:
+        """
+        Spans of every match of ``compiled`` in ``text``, assembled from blocks.
+
+        Returns None when the pattern or document cannot be matched
+        block-wise; the caller then runs the pattern on the whole text.
+        """
+        index = self.index(text)
+        if index is None:
+            return None
+        slot = self._slot(compiled)
+        if slot in index.spans:
+            return index.spans[slot]
+
+        tier = self._tiers[slot]
+        result = None
+        if tier is not None and index.cold:
+            matches = index.matches[slot] = list(compiled.finditer(text))
+            result = tuple(m.span() for m in matches)
+        elif tier is not None and (tier[0] == LOCAL or tier[1] < index.min_solid):
+            result = self._assemble(compiled, slot, tier, index)
+        if result is None:
+            self.whole_document += 1
+        index.spans[slot] = result
+        return result
+
+    def _assemble(self, compiled: Pattern, slot: int, tier: Tuple[str, int], index: BlockIndex):
+        text = index.text
+        width = tier[1]
+        if index.block_entries is None:
+            index.block_entries = [self._entry(self._blocks, block.key) for block in index.blocks]
+        gaps = gap_entries = None
+        if tier[0] == SEAM:
+            gaps = index.gaps
+            if index.gap_entries is None:
+                index.gap_entries = [gap and self._entry(self._gaps, gap.key) for gap in gaps]
+            gap_entries = index.gap_entries
+
+        result: List[Span] = []
+        spans: Tuple[Span, ...] = ()
+        for i, block in enumerate(index.blocks):
+            if gaps and gaps[i] is not None and self._gap_touched(
+                    compiled, slot, width, index, gaps[i], gap_entries[i], spans):
+                return None
+            spans = self._block_spans(compiled, slot, text, block, index.block_entries[i])
+            start = block.start
+            result.extend([(start + s, start + e) for s, e in spans])
+        if gaps and gaps[-1] is not None and self._gap_touched(
+                compiled, slot, width, index, gaps[-1], gap_entries[-1], spans):
+            return None
+        return tuple(result)
+
+    def _matches(self, compiled: Pattern, text: str, spans) -> list:
+        """Rebuild Match objects on ``text`` for known spans."""
+        index = self.index(text)
+        matches = index.matches.get(self._slot(compiled))
+        if matches is not None:
+            return matches[:len(spans)]
+        ends = [block.end for block in index.blocks]
+        matches = []
+        block = 0
+        for start, end in spans:
+            while ends[block] < end:
+                block += 1
+            matches.append(compiled.match(text, start, ends[block]))
+        return matches
+
+    def search(self, compiled: Pattern, text: str):
+        """``compiled.search(text)``, served from cached blocks where possible."""
+        spans = self.spans(compiled, text)
+        if spans is None:
+            return compiled.search(text)
+        return self._matches(compiled, text, spans[:1])[0] if spans else None
+
+    def finditer(self, compiled: Pattern, text: str):
+        """``compiled.finditer(text)``, served from cached blocks where possible."""
+        spans = self.spans(compiled, text)
+        if spans is None:
+            return compiled.finditer(text)
+        return iter(self._matches(compiled, text, spans))
+
+    def findall(self, compiled: Pattern, text: str):
+        """``compiled.findall(text)``, served from cached blocks where possible."""
+        spans = self.spans(compiled, text)
+        if spans is None:
+            return compiled.findall(text)
+        if compiled.groups == 0:
+            return [text[start:end] for start, end in spans]
+        matches = self._matches(compiled, text, spans)
+        if compiled.groups == 1:
+            return [m.group(1) or '' for m in matches]
+        return [m.groups('') for m in matches]
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    def clear(self) -> None:
+        with self._lock:
+            self._blocks.clear()
+            self._gaps.clear()
+            self._documents.clear()
+            self._sources.clear()
+
+    def get_stats(self):
+        """Block reuse counters."""
+        lookups = self.block_hits + self.block_scans
+        tiers = [tier[0] if tier else 'whole' for tier in self._tiers]
+        return {
+            'blocks': len(self._blocks),
+            'gaps': len(self._gaps),
+            'max_blocks': self.max_blocks,
+            'block_hits': self.block_hits,
+            'block_scans': self.block_scans,
+            'block_seeds': self.block_seeds,
+            'cold_documents': self.cold_documents,
+            'block_hit_rate': round(self.block_hits / lookups * 100, 2) if lookups else 0,
+            'gap_hits': self.gap_hits,
+            'gap_checks': self.gap_checks,
+            'whole_document_scans': self.whole_document,
+            'evictions': self.evictions,
+            'patterns': {name: tiers.count(name) for name in (LOCAL, SEAM, 'whole')},
+        }
@@ -2,31 +2,525 @@
 Content-hash based caching for validation results
 Reduces redundant gate execution
 """
+import copy
+import gzip
 import hashlib
+import heapq
+import threading
 import time
 import json
-from collections import OrderedDict
+import os
+import sqlite3
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+from core.near_duplicate import NearDuplicateIndex
+
+
+# Characters hashed per chunk when keying a document, so a 10 MB text is
+# never copied whole into one encoded buffer
+_HASH_CHUNK_CHARS = 64 * 1024
+
+
+def _update_hash(digest, text):
+    """Feed ``text`` to ``digest`` as UTF-8 in bounded chunks (same digest as one update)"""
+    for start in range(0, len(text), _HASH_CHUNK_CHARS):
+        digest.update(text[start:start + _HASH_CHUNK_CHARS].encode())
+
+
+class CachedResult(NamedTuple):
+    """
+    Immutable cache entry: the encoded ``/validate-document`` response body
+
+    ``body`` is the JSON of ``{"validation": ..., "risk": ...}``, gzip
+    compressed when ``gzipped``; a hit is served by writing it as-is, so
+    nothing is re-serialized and no request can mutate another's result.
+    """
+    body: bytes
+    risk: str
+    gzipped: bool = False
+
+    def json_bytes(self):
+        """The uncompressed JSON body"""
+        return gzip.decompress(self.body) if self.gzipped else self.body
+
+    def validation(self):
+        """A freshly decoded copy of the validation result"""
+        return json.loads(self.json_bytes())['validation']
+
+
+def encode_result(result, compress_threshold=None):
+    """
+    Serialize a validation result into a CachedResult
+
+    Args:
+        result: Validation result from the engine
+        compress_threshold: Gzip bodies of at least this many bytes (None: never)
+    """
+    risk = result.get('overall_risk') if isinstance(result, dict) else None
+    risk = risk if risk is not None else 'LOW'
+    body = json.dumps({'validation': result, 'risk': risk}, separators=(',', ':'), default=str).encode()
+    if compress_threshold is not None and len(body) >= compress_threshold:
+        return CachedResult(gzip.compress(body, compresslevel=6), risk, True)
+    return CachedResult(body, risk)
+
+
+class _Shard:
+    """One lock-protected slice of the cache: LRU order, byte total and TTL heap"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # {cache_key: (CachedResult, expires_at, size)}
+        self.expiry = []  # heap of (expires_at, cache_key); stale items are skipped
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def remove(self, cache_key):
+        _, _, size = self.entries.pop(cache_key)
+        self.bytes -= size
+
+    def expire(self, now):
+        """Pop expired entries off the heap; returns how many were removed"""
+        removed = 0
+        while self.expiry and self.expiry[0][0] <= now:
+            expires_at, cache_key = heapq.heappop(self.expiry)
+            entry = self.entries.get(cache_key)
+            # Skip heap items left behind by a replaced or evicted entry
+            if entry is not None and entry[1] == expires_at:
+                self.remove(cache_key)
+                removed += 1
+        return removed
+
+    def compact(self):
+        """Rebuild the heap once stale items dominate it"""
+        if len(self.expiry) > 2 * len(self.entries) + 64:
+            self.expiry = [(expires_at, key) for key, (_, expires_at, _) in self.entries.items()]
+            heapq.heapify(self.expiry)
+
+
+class MemoryCacheBackend:
+    """
+    In-process storage for ValidationCache
+
+    Keys are spread over lock-striped shards so Flask's threaded workers
+    only contend on the same shard; each shard evicts least-recently-used
+    entries once its share of ``max_size`` or ``max_bytes`` is exceeded and
+    expires entries from a min-heap of expiry times. Nothing is shared
+    between processes, so leases are always granted.
+    """
+
+    name = 'memory'
+
+    def __init__(self, max_size=1000, max_bytes=256 * 1024 * 1024, shards=16):
+        self.shard_count = max(1, min(shards, max_size))
+        # Each shard gets an even share of the limits
+        self._shard_max_size = -(-max_size // self.shard_count)
+        self.max_entry_bytes = -(-max_bytes // self.shard_count)
+        self._shards = [_Shard() for _ in range(self.shard_count)]
+        self._counters = {}
+        self._counter_lock = threading.Lock()
+
+    def _shard(self, cache_key):
+        return self._shards[int(cache_key[:8], 16) % self.shard_count]
+
+    def get(self, cache_key, record=True):
+        shard = self._shard(cache_key)
+        with shard.lock:
+            entry = shard.entries.get(cache_key)
+            if entry is None:
+                shard.misses += record
+                return None
+
+            cached, expires_at, _ = entry
+            # Check if expired
+            if time.time() >= expires_at:
+                shard.remove(cache_key)
+                shard.misses += record
+                return None
+
+            # Move to end (most recently used)
+            shard.entries.move_to_end(cache_key)
+            shard.hits += record
+            return cached
+
+    def set(self, cache_key, entry, size, expires_at):
+        shard = self._shard(cache_key)
+        with shard.lock:
+            if cache_key in shard.entries:
+                shard.remove(cache_key)
+            shard.expire(time.time())
+
+            # Evict least recently used entries until the new one fits
+            while shard.entries and (
+                len(shard.entries) >= self._shard_max_size
+                or shard.bytes + size > self.max_entry_bytes
+            ):
+                oldest = next(iter(shard.entries))
+                shard.remove(oldest)
+                shard.evictions += 1
+
+            shard.entries[cache_key] = (entry, expires_at, size)
+            shard.bytes += size
+            heapq.heappush(shard.expiry, (expires_at, cache_key))
+            shard.compact()
+
+    def acquire_lease(self, cache_key, seconds):
+        return True
+
+    def release_lease(self, cache_key):
+        pass
+
+    def count(self, name, amount=1):
+        with self._counter_lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def clear(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.expiry.clear()
+                shard.bytes = 0
+                shard.hits = 0
+                shard.misses = 0
+                shard.evictions = 0
+        with self._counter_lock:
+            self._counters.clear()
+
+    def stats(self):
+        stats = {'size': 0, 'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+        for shard in self._shards:
+            with shard.lock:
+                stats['size'] += len(shard.entries)
+                stats['bytes'] += shard.bytes
+                stats['hits'] += shard.hits
+                stats['misses'] += shard.misses
+                stats['evictions'] += shard.evictions
+        with self._counter_lock:
+            stats.update(self._counters)
+        stats['shards'] = self.shard_count
+        return stats
+
+    def cleanup_expired(self):
+        now = time.time()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.expire(now)
+                shard.compact()
+        return removed
+
+
+class SQLiteCacheBackend:
+    """
+    ValidationCache storage shared by every worker process on one host
+
+    Entries live in an SQLite database in WAL mode, so readers never block
+    the writer and no external service is needed. Reads take no write lock:
+    each process buffers access times and hit/miss counts and writes them
+    in batches (see ``flush``), so the counters in the database, and
+    ``get_stats``, are global across workers up to one batch each.
+    Writers evict least-recently-accessed entries once ``max_size`` or
+    ``max_bytes`` is exceeded. A ``cache_leases`` row marks a key as being
+    computed, which is how ``ValidationCache.get_or_compute`` keeps two
+    workers from validating the same document at once.
+    """
+
+    name = 'sqlite'
+
+    _SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS cache_entries (
+            key TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            risk TEXT NOT NULL,
+            gzipped INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries(expires_at)",
+        "CREATE INDEX IF NOT EXISTS idx_cache_entries_access ON cache_entries(last_access)",
+        "CREATE TABLE IF NOT EXISTS cache_counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS cache_leases (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)",
+    )
+
+    def __init__(self, path='data/cache.db', max_size=1000, max_bytes=256 * 1024 * 1024, busy_timeout=5.0,
+                 access_batch=100, access_interval=1.0):
+        """
+        Args:
+            path: Database file, created if missing; every worker opens the same one
+            max_size: Maximum number of cached entries across all workers
+            max_bytes: Maximum size of all cached bodies across all workers
+            busy_timeout: Seconds to wait for another worker's write lock
+            access_batch: Buffered reads that trigger a write of their access times and counts
+            access_interval: Seconds after which the next read writes the buffer regardless
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.max_bytes = self.max_entry_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        self.access_batch = access_batch
+        self.access_interval = access_interval
+        self._local = threading.local()
+        self._reads_lock = threading.Lock()
+        self._reset_reads()
+
+        conn = self._connect()
+        conn.execute('PRAGMA journal_mode=WAL')
+        with self._write(conn):
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self):
+        """This thread's connection; reopened after a fork"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(str(self.path), timeout=self.busy_timeout, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _write(self, conn):
+        """An immediate (write-locked) transaction"""
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    @staticmethod
+    def _bump(conn, name, amount=1):
+        conn.execute(
+            "INSERT INTO cache_counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def _owner(self):
+        return f"{os.getpid()}:{threading.get_ident()}"
+
+    def _reset_reads(self):
+        self._accessed = {}
+        self._read_counts = Counter()
+        self._pending_reads = 0
+        self._reads_pid = os.getpid()
+        self._reads_flushed = time.monotonic()
+
+    def _record_read(self, cache_key, counter):
+        """Buffer a read's access time (``cache_key`` None: none) and counter (None: none)"""
+        with self._reads_lock:
+            if self._reads_pid != os.getpid():
+                # Inherited over a fork: the parent writes its own buffer
+                self._reset_reads()
+            if cache_key is not None:
+                self._accessed[cache_key] = time.time()
+            if counter is not None:
+                self._read_counts[counter] += 1
+            self._pending_reads += 1
+            due = (self._pending_reads >= self.access_batch
+                   or time.monotonic() - self._reads_flushed >= self.access_interval)
+        if due:
+            self.flush()
+
+    def _write_reads(self, conn):
+        """Write the buffered reads inside the write transaction on ``conn``"""
+        with self._reads_lock:
+            accessed, counts = self._accessed, self._read_counts
+            if self._reads_pid != os.getpid():
+                accessed, counts = {}, Counter()
+            self._reset_reads()
+        if accessed:
+            conn.executemany("UPDATE cache_entries SET last_access = MAX(last_access, ?) WHERE key = ?",
+                             [(accessed_at, key) for key, accessed_at in accessed.items()])
+        for name, amount in counts.items():
+            self._bump(conn, name, amount)
+
+    def flush(self):
+        """Write this process's buffered access times and hit/miss counts"""
+        conn = self._connect()
+        with self._write(conn):
+            self._write_reads(conn)
+
+    def get(self, cache_key, record=True):
+        conn = self._connect()
+        now = time.time()
+        # A plain read: no write lock unless the entry has expired
+        row = conn.execute(
+            "SELECT body, risk, gzipped, expires_at FROM cache_entries WHERE key = ?", (cache_key,)
+        ).fetchone()
+        if row is None or row[3] <= now:
+            if row is not None:
+                with self._write(conn):
+                    conn.execute("DELETE FROM cache_entries WHERE key = ? AND expires_at <= ?", (cache_key, now))
+            if record:
+                self._record_read(None, 'misses')
+            return None
+        self._record_read(cache_key, 'hits' if record else None)
+        return CachedResult(bytes(row[0]), row[1], bool(row[2]))
+
+    def set(self, cache_key, entry, size, expires_at):
+        conn = self._connect()
+        now = time.time()
+        with self._write(conn):
+            # Eviction goes by last access, so write the buffered reads first
+            self._write_reads(conn)
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, body, risk, gzipped, size, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, entry.body, entry.risk, int(entry.gzipped), size, expires_at, now),
+            )
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+            if count <= self.max_size and total <= self.max_bytes:
+                return
+
+            # Evict least recently accessed entries (never the new one) until within limits
+            victims = []
+            for key, victim_size in conn.execute(
+                "SELECT key, size FROM cache_entries WHERE key != ? ORDER BY last_access", (cache_key,)
+            ):
+                if count <= self.max_size and total <= self.max_bytes:
+                    break
+                victims.append((key,))
+                count -= 1
+                total -= victim_size
+            conn.executemany("DELETE FROM cache_entries WHERE key = ?", victims)
+            self._bump(conn, 'evictions', len(victims))
+
+    def acquire_lease(self, cache_key, seconds):
+        """Claim ``cache_key`` for computation; False while another worker holds it"""
+        conn = self._connect()
+        now = time.time()
+        with self._write(conn):
+            conn.execute("DELETE FROM cache_leases WHERE key = ? AND expires_at <= ?", (cache_key, now))
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO cache_leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                (cache_key, self._owner(), now + seconds),
+            )
+            return cursor.rowcount == 1
+
+    def release_lease(self, cache_key):
+        conn = self._connect()
+        with self._write(conn):
+            conn.execute("DELETE FROM cache_leases WHERE key = ? AND owner = ?", (cache_key, self._owner()))
+
+    def count(self, name, amount=1):
+        conn = self._connect()
+        with self._write(conn):
+            self._bump(conn, name, amount)
+
+    def clear(self):
+        conn = self._connect()
+        with self._reads_lock:
+            self._reset_reads()
+        with self._write(conn):
+            conn.execute("DELETE FROM cache_entries")
+            conn.execute("DELETE FROM cache_counters")
+            conn.execute("DELETE FROM cache_leases")
+
+    def stats(self):
+        self.flush()
+        conn = self._connect()
+        size, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+        stats = {'size': size, 'bytes': total, 'hits': 0, 'misses': 0, 'evictions': 0}
+        stats.update(conn.execute("SELECT name, value FROM cache_counters").fetchall())
+        stats['path'] = str(self.path)
+        return stats
+
+    def cleanup_expired(self):
+        conn = self._connect()
+        with self._write(conn):
+            return conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)).rowcount
 
 
 class ValidationCache:
-    """LRU cache for validation results with TTL"""
+    """
+    LRU cache for validation results with TTL, bounded by entries and bytes
+
+    Results are stored as immutable pre-encoded JSON bodies (CachedResult).
+    Storage is pluggable: the default MemoryCacheBackend is private to this
+    process, while SQLiteCacheBackend is shared by every worker on the host.
+    Concurrent misses on the same key are coalesced onto one computation
+    (see ``get_or_compute``), and an optional NearDuplicateIndex lets a
+    miss reuse the verdict of a near-identical document. An optional
+    ResultStore keeps results across restarts (see ``persist`` and
+    ``preload``).
+    """
 
-    def __init__(self, max_size=1000, ttl_seconds=3600):
+    def __init__(self, max_size=1000, ttl_seconds=3600, max_bytes=256 * 1024 * 1024, shards=16,
+                 compress_threshold=None, backend=None, near_duplicates=None, result_store=None):
         """
         Args:
             max_size: Maximum number of cached entries
             ttl_seconds: Time-to-live for cache entries (default 1 hour)
+            max_bytes: Maximum size of all cached bodies (default 256 MB)
+            shards: Number of independently locked shards (memory backend)
+            compress_threshold: Gzip bodies of at least this many bytes (None: never)
+            backend: Storage backend (default: a MemoryCacheBackend built from the limits)
+            near_duplicates: NearDuplicateIndex consulted by ``get_or_compute`` on a miss (None: off)
+            result_store: ResultStore used by ``persist`` and ``preload`` (None: off)
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache = OrderedDict()  # {cache_key: (result, timestamp)}
-        self.hits = 0
-        self.misses = 0
+        self.max_bytes = max_bytes
+        self.compress_threshold = compress_threshold
+        self.backend = backend if backend is not None else MemoryCacheBackend(max_size, max_bytes, shards)
+        self.near_duplicates = near_duplicates
+        self.result_store = result_store
+        self.preloaded = 0
+        # cache key -> Future of (entry, result) for computations running in this process
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, env, **kwargs):
+        """
+        Build a cache whose backend is chosen by ``LOKI_CACHE_BACKEND``
+
+        ``memory`` (default) or ``sqlite``; the SQLite file is
+        ``LOKI_CACHE_PATH`` (default ``data/cache.db``). Setting
+        ``LOKI_NEAR_DUPLICATE_THRESHOLD`` (e.g. ``0.95``) enables reuse of
+        near-duplicate verdicts, and ``LOKI_RESULT_STORE_PATH`` (e.g.
+        ``data/results.db``) a persistent result store.
+        """
+        name = (env.get('LOKI_CACHE_BACKEND') or 'memory').strip().lower()
+        if name == 'sqlite':
+            kwargs['backend'] = SQLiteCacheBackend(
+                env.get('LOKI_CACHE_PATH') or 'data/cache.db',
+                max_size=kwargs.get('max_size', 1000),
+                max_bytes=kwargs.get('max_bytes', 256 * 1024 * 1024),
+            )
+        elif name != 'memory':
+            raise ValueError(f"Unknown cache backend: {name}")
+
+        threshold = (env.get('LOKI_NEAR_DUPLICATE_THRESHOLD') or '').strip()
+        if threshold:
+            kwargs['near_duplicates'] = NearDuplicateIndex(float(threshold),
+                                                           max_size=kwargs.get('max_size', 1000))
+
+        store_path = (env.get('LOKI_RESULT_STORE_PATH') or '').strip()
+        if store_path:
+            # Imported here: the store module depends on this one
+            from core.result_store import ResultStore
+            kwargs['result_store'] = ResultStore(store_path)
+        return cls(**kwargs)
 
     def _make_cache_key(self, text, document_type, active_modules):
         """
         Generate cache key from validation inputs
 
+        The document is hashed incrementally; the digest equals that of
+        ``f"{text}|{document_type}|{modules}"`` without building the string.
+
         Args:
             text: Document text
             document_type: Type of document
@@ -35,85 +529,552 @@ class ValidationCache:
         Returns:
             str: SHA-256 hash cache key
         """
+        digest = hashlib.sha256()
+        _update_hash(digest, text if isinstance(text, str) else str(text))
+        digest.update(f"|{self._scope(document_type, active_modules)}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _scope(document_type, active_modules):
+        """Everything but the text that a validation depends on"""
         # Sort modules for consistency
-        modules_str = ','.join(sorted(active_modules or []))
-        key_input = f"{text}|{document_type}|{modules_str}"
-        return hashlib.sha256(key_input.encode()).hexdigest()
+        return f"{document_type}|{','.join(sorted(active_modules or []))}"
 
     def get(self, text, document_type, active_modules):
         """
         Retrieve cached validation result
 
         Returns:
-            dict or None: Cached result if valid, None otherwise
+            dict or None: A private copy of the cached result if valid, None otherwise
         """
-        cache_key = self._make_cache_key(text, document_type, active_modules)
-
-        if cache_key in self.cache:
-            result, timestamp = self.cache[cache_key]
-
-            # Check if expired
-            if time.time() - timestamp > self.ttl_seconds:
-                del self.cache[cache_key]
-                self.misses += 1
-                return None
+        entry = self.get_entry(text, document_type, active_modules)
+        return entry.validation() if entry is not None else None
 
-            # Move to end (most recently used)
-            self.cache.move_to_end(cache_key)
-            self.hits += 1
-            return result
+    def get_entry(self, text, document_type, active_modules):
+        """
+        Retrieve the cached encoded response
 
-        self.misses += 1
-        return None
+        Returns:
+            CachedResult or None: Cached entry if valid, None otherwise
+        """
+        return self.backend.get(self._make_cache_key(text, document_type, active_modules))
 
     def set(self, text, document_type, active_modules, result):
         """
         Store validation result in cache
 
+        Results larger than the backend's per-entry byte budget are encoded
+        but not cached.
+
         Args:
             text: Document text
             document_type: Type of document
             active_modules: List of module IDs
             result: Validation result to cache
+
+        Returns:
+            CachedResult: The encoded entry, usable as the response body
+        """
+        cache_key = self._make_cache_key(text, document_type, active_modules)
+        entry = self._store(cache_key, result)
+        self._index(cache_key, text, document_type, active_modules)
+        return entry
+
+    def _store(self, cache_key, result):
+        entry = encode_result(result, self.compress_threshold)
+        size = len(entry.body) + len(cache_key)
+        if size <= self.backend.max_entry_bytes:
+            self.backend.set(cache_key, entry, size, time.time() + self.ttl_seconds)
+        return entry
+
+    def _index(self, cache_key, text, document_type, active_modules):
+        if self.near_duplicates is not None and self.backend.get(cache_key, record=False) is not None:
+            self.near_duplicates.add(cache_key, text, self._scope(document_type, active_modules))
+
+    def _index_hit(self, cache_key, text, document_type, active_modules):
+        # Entries preloaded from the result store (which keeps no text) or
+        # stored by another worker are indexed on their first hit here
+        if self.near_duplicates is not None and cache_key not in self.near_duplicates:
+            self.near_duplicates.add(cache_key, text, self._scope(document_type, active_modules))
+
+    def get_near_duplicate(self, text, document_type, active_modules):
+        """
+        Reuse the cached verdict of a near-identical document
+
+        The copy's ``document_hash`` is rewritten for ``text`` (the
+        source's moves into the ``near_duplicate`` section) and its span
+        offsets are dropped, since they point into the other document.
+
+        Returns:
+            dict or None: A private copy of that result with a
+            ``near_duplicate`` section naming its source and similarity,
+            or None when no indexed document is similar enough
+        """
+        if self.near_duplicates is None:
+            return None
+        match = self.near_duplicates.find(text, self._scope(document_type, active_modules))
+        if match is None:
+            return None
+        entry = self.backend.get(match.key, record=False)
+        if entry is None:
+            # Evicted or expired since it was indexed
+            self.near_duplicates.discard(match.key)
+            return None
+        self.backend.count('near_duplicates')
+        result = _without_offsets(entry.validation())
+        source_hash = result.get('document_hash')
+        result['document_hash'] = hashlib.sha256(text.encode()).hexdigest()
+        result['near_duplicate'] = {
+            'source_key': match.key,
+            'source_document_hash': source_hash,
+            'similarity': round(match.similarity, 4),
+            'threshold': self.near_duplicates.threshold,
+            'offsets_dropped': True,
+        }
+        return result
+
+    def persist(self, text, document_type, active_modules, entry):
+        """Record a computed entry in the result store (no-op without one or for uncached results)"""
+        if self.result_store is not None and entry is not None:
+            self.result_store.record(self._make_cache_key(text, document_type, active_modules),
+                                     text, document_type, active_modules, entry)
+
+    def touch(self, text, document_type, active_modules):
+        """Count a request served from the cache in the result store (no-op without one)"""
+        if self.result_store is not None:
+            self.result_store.touch(self._make_cache_key(text, document_type, active_modules))
+
+    def preload(self, limit=200, budget_seconds=2.0):
+        """
+        Load the hottest stored results into the cache
+
+        Stops after ``limit`` entries or once ``budget_seconds`` have
+        elapsed, whichever comes first; keys already cached are left alone.
+        Loaded entries join the near-duplicate index on their first hit.
+
+        Returns:
+            int: Number of entries loaded
+        """
+        if self.result_store is None:
+            return 0
+        deadline = time.monotonic() + budget_seconds
+        loaded = 0
+        for cache_key, entry in self.result_store.hottest(limit):
+            if time.monotonic() >= deadline:
+                break
+            size = len(entry.body) + len(cache_key)
+            if size > self.backend.max_entry_bytes or self.backend.get(cache_key, record=False) is not None:
+                continue
+            self.backend.set(cache_key, entry, size, time.time() + self.ttl_seconds)
+            loaded += 1
+        self.preloaded += loaded
+        return loaded
+
+    def get_or_compute(self, text, document_type, active_modules, compute, cacheable=None,
+                       lease_seconds=60, poll_interval=0.05):
+        """
+        Return the cached entry, or compute and store it exactly once
+
+        Within this process, requests that miss while the same key is being
+        computed wait on that computation and share its outcome (counted as
+        ``coalesced``), including an uncacheable result or an exception.
+        The one computing request then takes a lease on the key. With a
+        shared backend, another worker that misses on the same key
+        meanwhile waits for the entry instead of validating the document
+        again; if the holder dies or its result is not cacheable, the lease
+        is released (or expires after ``lease_seconds``) and a waiter
+        computes it itself.
+
+        Args:
+            text: Document text
+            document_type: Type of document
+            active_modules: List of module IDs
+            compute: Zero-argument callable producing the validation result
+            cacheable: Optional predicate; results it rejects are returned but not stored
+            lease_seconds: Longest time one computation may hold the key
+            poll_interval: Seconds between checks while another worker holds the key
+
+        With a near-duplicate index, a miss first looks for a near-identical
+        cached document; its verdict is returned (flagged, see
+        ``get_near_duplicate``) as an uncacheable result instead of calling
+        ``compute``. Computed results are indexed for later lookups.
+
+        Returns:
+            tuple: ``(entry, result)`` -- ``result`` is None when served from
+            the cache or a coalesced entry; ``entry`` is None when the result
+            was not cacheable (coalesced requests get their own copy)
         """
         cache_key = self._make_cache_key(text, document_type, active_modules)
+        entry = self.backend.get(cache_key)
+        if entry is not None:
+            self._index_hit(cache_key, text, document_type, active_modules)
+            return entry, None
+
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = self._inflight[cache_key] = Future()
 
-        # Remove oldest entry if at capacity
-        if len(self.cache) >= self.max_size and cache_key not in self.cache:
-            self.cache.popitem(last=False)
+        if not leader:
+            self.backend.count('coalesced')
+            entry, result = future.result()
+            if entry is not None:
+                return entry, None
+            return None, copy.deepcopy(result)
 
-        # Store with timestamp
-        self.cache[cache_key] = (result, time.time())
+        try:
+            reused = self.get_near_duplicate(text, document_type, active_modules)
+            if reused is not None:
+                outcome = None, reused
+            else:
+                outcome = self._compute_once(cache_key, compute, cacheable, lease_seconds, poll_interval)
+                self._index(cache_key, text, document_type, active_modules)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(outcome)
+            return outcome
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+    def _compute_once(self, cache_key, compute, cacheable, lease_seconds, poll_interval):
+        """Compute ``cache_key`` under the backend lease; returns ``(entry, result)``"""
+        if not self.backend.acquire_lease(cache_key, lease_seconds):
+            self.backend.count('lease_waits')
+            while True:
+                time.sleep(poll_interval)
+                entry = self.backend.get(cache_key, record=False)
+                if entry is not None:
+                    return entry, None
+                if self.backend.acquire_lease(cache_key, lease_seconds):
+                    break
+
+        try:
+            # The previous holder may have stored the entry just before releasing
+            entry = self.backend.get(cache_key, record=False)
+            if entry is not None:
+                return entry, None
+            result = compute()
+            if cacheable is not None and not cacheable(result):
+                return None, result
+            return self._store(cache_key, result), result
+        finally:
+            self.backend.release_lease(cache_key)
 
     def clear(self):
         """Clear all cached entries"""
-        self.cache.clear()
-        self.hits = 0
-        self.misses = 0
+        self.backend.clear()
 
     def get_stats(self):
         """Get cache statistics"""
-        total_requests = self.hits + self.misses
-        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+        stats = self.backend.stats()
+        total_requests = stats['hits'] + stats['misses']
+        hit_rate = (stats['hits'] / total_requests * 100) if total_requests > 0 else 0
 
-        return {
-            'size': len(self.cache),
+        stats.update({
+            'backend': self.backend.name,
+            'coalesced': stats.get('coalesced', 0),
+            'lease_waits': stats.get('lease_waits', 0),
+            'near_duplicates': stats.get('near_duplicates', 0),
+            'near_duplicate_index': self.near_duplicates.get_stats() if self.near_duplicates is not None else None,
+            'preloaded': self.preloaded,
+            'result_store': self.result_store.get_stats() if self.result_store is not None else None,
             'max_size': self.max_size,
-            'hits': self.hits,
-            'misses': self.misses,
+            'max_bytes': self.max_bytes,
             'hit_rate': round(hit_rate, 2),
-            'ttl_seconds': self.ttl_seconds
-        }
+            'ttl_seconds': self.ttl_seconds,
+        })
+        return stats
 
     def cleanup_expired(self):
-        """Remove expired entries from cache"""
-        now = time.time()
-        expired_keys = [
-            key for key, (_, timestamp) in self.cache.items()
-            if now - timestamp > self.ttl_seconds
-        ]
+        """Remove expired entries from cache (pops only what has expired)"""
+        return self.backend.cleanup_expired()
+
 
-        for key in expired_keys:
-            del self.cache[key]
+class GateResultCache:
+    """
+    Second-level LRU cache of individual gate verdicts with TTL
 
-        return len(expired_keys)
+    Entries are keyed on (document hash, module, gate id) and stamped with
+    the gate version from ``gate_registry``; a lookup under a different
+    version drops the entry, so upgrading a gate invalidates its verdicts
+    without touching any other gate. Unlike ``ValidationCache`` this is
+    shared across module selections: validating ``['gdpr_uk']`` and then
+    ``['gdpr_uk', 'nda_uk']`` only runs the nda_uk gates the second time.
+    """
+
+    def __init__(self, max_size=20000, ttl_seconds=3600):
+        """
+        Args:
+            max_size: Maximum number of cached gate verdicts
+            ttl_seconds: Time-to-live for cache entries (default 1 hour)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.cache = OrderedDict()  # {(document_key, module, gate): (version, result, timestamp)}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def document_key(document_hash, document_type):
+        """Gates see the document type as well as the text, so both form the key"""
+        return f"{document_hash}|{document_type}"
+
+    def get(self, document_key, module_id, gate_id, version):
+        """
+        Retrieve a cached gate verdict
+
+        Returns:
+            dict or None: Copy of the cached raw gate result, None on miss,
+            expiry or version mismatch
+        """
+        key = (document_key, module_id, gate_id)
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            cached_version, result, timestamp = entry
+            if cached_version != version:
+                del self.cache[key]
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            if time.time() - timestamp > self.ttl_seconds:
+                del self.cache[key]
+                self.misses += 1
+                return None
+
+            self.cache.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(result)
+
+    def set(self, document_key, module_id, gate_id, version, result):
+        """Store the raw result of one gate execution"""
+        key = (document_key, module_id, gate_id)
+        entry = (version, copy.deepcopy(result), time.time())
+        with self._lock:
+            if key not in self.cache and len(self.cache) >= self.max_size:
+                self.cache.popitem(last=False)
+            self.cache[key] = entry
+            self.cache.move_to_end(key)
+
+    def invalidate_gate(self, module_id, gate_id):
+        """Drop every cached verdict of one gate; returns the number removed"""
+        with self._lock:
+            keys = [key for key in self.cache if key[1] == module_id and key[2] == gate_id]
+            for key in keys:
+                del self.cache[key]
+            self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self):
+        """Clear all cached verdicts"""
+        with self._lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+
+    def get_stats(self):
+        """Get cache statistics"""
+        with self._lock:
+            total_requests = self.hits + self.misses
+            hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+            return {
+                'size': len(self.cache),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_rate': round(hit_rate, 2),
+                'ttl_seconds': self.ttl_seconds
+            }
+
+
+def _without_offsets(value):
+    """Copy of a validation with ``spans`` emptied and entity ``start``/``end`` removed"""
+    if isinstance(value, dict):
+        span_like = 'start' in value and 'end' in value
+        return {k: [] if k == 'spans' else _without_offsets(v) for k, v in value.items()
+                if not (span_like and k in ('start', 'end'))}
+    if isinstance(value, (list, tuple)):
+        return [_without_offsets(v) for v in value]
+    return value
+
+
+def _without_timestamps(value):
+    if isinstance(value, dict):
+        return {k: _without_timestamps(v) for k, v in value.items() if k != 'timestamp'}
+    if isinstance(value, (list, tuple)):
+        return [_without_timestamps(v) for v in value]
+    return value
+
+
+def result_signature(*parts):
+    """
+    SHA-256 digest of JSON-serializable inputs
+
+    Dict keys are sorted and per-run ``timestamp`` fields dropped, so two
+    validations of the same document give the same signature.
+    """
+    payload = json.dumps(_without_timestamps(parts), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class DeterministicResultCache:
+    """
+    LRU cache of results of deterministic computations (corrections, synthesis)
+
+    Callers build the key from everything the computation depends on
+    (see ``result_signature``); there is no TTL because an unchanged key
+    always yields the same result. Values are deep-copied in and out, so a
+    caller may mutate what it gets back.
+    """
+
+    def __init__(self, max_size=256):
+        """
+        Args:
+            max_size: Maximum number of cached results
+        """
+        self.max_size = max_size
+        self.cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """A private copy of the result cached under ``key``, or None"""
+        with self._lock:
+            value = self.cache.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.cache.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        """Cache a private copy of ``value`` under ``key``"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self.cache[key] = value
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+
+    def clear(self):
+        """Clear all cached results"""
+        with self._lock:
+            self.cache.clear()
+
+    def get_stats(self):
+        """Get cache statistics"""
+        with self._lock:
+            total_requests = self.hits + self.misses
+            hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+            return {
+                'size': len(self.cache),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(hit_rate, 2),
+            }
+
+
+class ProviderResponseCache:
+    """
+    TTL cache of LLM provider responses together with their validation
+
+    Only deterministic requests (``temperature`` 0) are cached, keyed on a
+    canonical hash of the filtered payload. Entries are scoped per API key
+    (by its hash; the key itself is never stored), so a response fetched
+    with one client's credentials is never served to another.
+    """
+
+    def __init__(self, max_size=1000, ttl_seconds=600):
+        """
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_seconds: Time-to-live for cache entries (default 10 minutes)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.cache = OrderedDict()  # {key: (value, timestamp)}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    @staticmethod
+    def is_deterministic(payload):
+        """True if ``payload`` asks for greedy sampling (``temperature`` 0)"""
+        temperature = payload.get('temperature')
+        return isinstance(temperature, (int, float)) and not isinstance(temperature, bool) and temperature == 0
+
+    def make_key(self, provider, api_key, payload, scope=None):
+        """
+        Cache key for a request, or None if it is not deterministic
+
+        Args:
+            provider: Provider name
+            api_key: Client API key (only its hash enters the key)
+            payload: Filtered request payload as sent to the provider
+            scope: Anything else the cached value depends on (e.g. validation modules)
+        """
+        if not self.is_deterministic(payload):
+            with self._lock:
+                self.skipped += 1
+            return None
+        canonical = json.dumps([provider, payload, scope], sort_keys=True, separators=(',', ':'), default=str)
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+        return f"{key_hash[:32]}:{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    def get(self, key):
+        """A private copy of the value cached under ``key`` if still valid, None otherwise"""
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None or time.time() - entry[1] >= self.ttl_seconds:
+                if entry is not None:
+                    del self.cache[key]
+                self.misses += 1
+                return None
+            self.cache.move_to_end(key)
+            self.hits += 1
+            value = entry[0]
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        """Cache a private copy of ``value`` under ``key``"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self.cache[key] = (value, time.time())
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+
+    def clear(self):
+        """Clear all cached responses"""
+        with self._lock:
+            self.cache.clear()
+
+    def get_stats(self):
+        """Get cache statistics"""
+        with self._lock:
+            total_requests = self.hits + self.misses
+            hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+            return {
+                'size': len(self.cache),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'skipped_nondeterministic': self.skipped,
+                'hit_rate': round(hit_rate, 2),
+                'ttl_seconds': self.ttl_seconds,
+            }
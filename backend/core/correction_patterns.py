@@ -2,6 +2,8 @@
 Correction Patterns - Gate-Specific Correction Rules
 Organized by regulatory module: FCA UK, GDPR UK, Tax UK, NDA UK, HR Scottish
 """
+import hashlib
+import json
 import re
 from typing import Dict, List
 
@@ -1056,3 +1058,8 @@ EXCLUSIONS: Confidential Information does NOT include information that:
             'templates': self.templates,
             'structural': self.structural_rules
         }
+
+    def get_version(self) -> str:
+        """Digest of all patterns, templates and rules; changes whenever any of them does"""
+        payload = json.dumps(self.get_all_patterns(), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
@@ -8,6 +8,7 @@ Features:
 - Deterministic synthesis ensuring repeatable corrections
 - Multi-level strategies: regex replacements, template insertions, structural reorganization
 """
+import hashlib
 import re
 from typing import Dict, List, Tuple, Optional
 
@@ -21,6 +22,7 @@ try:
     )
     from .correction_patterns import CorrectionPatternRegistry
     from .correction_synthesizer import CorrectionSynthesizer, CorrectionValidator
+    from .cache import result_signature
 except ImportError:
     from correction_strategies import (
         RegexReplacementStrategy,
@@ -30,6 +32,7 @@ except ImportError:
     )
     from correction_patterns import CorrectionPatternRegistry
     from correction_synthesizer import CorrectionSynthesizer, CorrectionValidator
+    from cache import result_signature
 
 
 class DocumentCorrector:
@@ -44,14 +47,17 @@ class DocumentCorrector:
     5. Validation layer to ensure correction integrity
     """
 
-    def __init__(self, advanced_mode: bool = True):
+    def __init__(self, advanced_mode: bool = True, result_cache=None):
         """
         Initialize corrector with advanced or legacy mode
 
         Args:
             advanced_mode: Use advanced multi-level correction system (default: True)
+            result_cache: Optional DeterministicResultCache; corrections are
+                deterministic, so repeated requests are served from it
         """
         self.advanced_mode = advanced_mode
+        self.result_cache = result_cache
 
         if advanced_mode:
             # Initialize advanced correction system
@@ -73,6 +79,7 @@ class DocumentCorrector:
 
         # Register patterns with strategies
         self._register_patterns()
+        self.patterns_version = self.pattern_registry.get_version()
 
         # List of all strategies
         self.strategies = [
@@ -177,10 +184,43 @@ class DocumentCorrector:
         if advanced_options is None:
             advanced_options = {}
 
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self._result_key(text, validation_results, document_type, advanced_options)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         if self.advanced_mode:
-            return self._correct_document_advanced(text, validation_results, document_type, advanced_options)
+            result = self._correct_document_advanced(text, validation_results, document_type, advanced_options)
         else:
-            return self._correct_document_legacy(text, validation_results)
+            result = self._correct_document_legacy(text, validation_results)
+
+        if cache_key is not None:
+            self.result_cache.set(cache_key, result)
+        return result
+
+    def _result_key(self, text: str, validation_results: Dict, document_type: Optional[str],
+                    options: Dict) -> str:
+        """
+        Cache key: text hash, failing-gate signature, options and pattern version
+
+        Only failing and warning gates are read by the strategies, so
+        passing gates (and per-run timestamps) do not affect the key.
+        """
+        failing_gates = [
+            (gate_id, gate_result)
+            for gate_id, gate_result in self._extract_gates(validation_results)
+            if gate_result.get('status') in ['FAIL', 'WARNING']
+        ]
+        return result_signature(
+            hashlib.sha256(text.encode('utf-8')).hexdigest(),
+            failing_gates,
+            document_type,
+            options,
+            'advanced' if self.advanced_mode else 'legacy',
+            getattr(self, 'patterns_version', None),
+        )
 
     def _correct_document_advanced(self, text: str, validation_results: Dict,
                                    document_type: str = None, options: Dict = None) -> Dict:
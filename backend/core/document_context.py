@@ -0,0 +1,106 @@
+"""
+Shared per-document analysis context
+Built once per validation request and handed to every gate
+"""
+from __future__ import annotations
+
+import bisect
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import FrozenSet, Iterable, List, Optional
+
+
+_SENTENCE_PATTERN = re.compile(r"[^.!?\n]+(?:[.!?]+|$)", re.MULTILINE)
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class TextSpan:
+    """A block of the document with its character offsets."""
+    start: int
+    end: int
+    text: str
+
+
+class DocumentContext:
+    """
+    Lazily computed, read-only views of a document shared across gates.
+
+    Every view is computed at most once per context, so gates that opt in via
+    ``check_ctx(ctx)`` reuse the same lowered copy, sentence boundaries and
+    token set instead of rebuilding them per gate.
+    """
+
+    def __init__(self, text: Optional[str], document_type: Optional[str] = 'unknown') -> None:
+        self.text = text or ''
+        self.document_type = document_type or 'unknown'
+        # Match lists of patterns shared by several gates, filled while the
+        # context is bound to ``pattern_registry`` (see PatternRegistry.bind)
+        self.matches = {}
+
+    @cached_property
+    def lower(self) -> str:
+        """Lower-cased copy of the document."""
+        return self.text.lower()
+
+    @cached_property
+    def normalized(self) -> str:
+        """Lower-cased document with all whitespace runs collapsed to one space."""
+        return ' '.join(self.lower.split())
+
+    @cached_property
+    def sentences(self) -> List[TextSpan]:
+        """Sentence blocks with offsets into ``text``."""
+        return self._spans(_SENTENCE_PATTERN.finditer(self.text))
+
+    @cached_property
+    def paragraphs(self) -> List[TextSpan]:
+        """Paragraph blocks (separated by blank lines) with offsets into ``text``."""
+        spans = []
+        start = 0
+        for brk in _PARAGRAPH_BREAK.finditer(self.text):
+            spans.append((start, brk.start()))
+            start = brk.end()
+        spans.append((start, len(self.text)))
+        return self._spans(spans)
+
+    @cached_property
+    def tokens(self) -> FrozenSet[str]:
+        """Set of lower-cased word tokens in the document."""
+        return frozenset(_TOKEN_PATTERN.findall(self.lower))
+
+    @cached_property
+    def _sentence_starts(self) -> List[int]:
+        return [span.start for span in self.sentences]
+
+    def contains(self, term: str) -> bool:
+        """Case-insensitive substring test against the lowered document."""
+        return term in self.lower
+
+    def contains_any(self, terms: Iterable[str]) -> bool:
+        """True if any of the (lower-case) terms occur in the document."""
+        lowered = self.lower
+        return any(term in lowered for term in terms)
+
+    def sentence_at(self, offset: int) -> Optional[TextSpan]:
+        """Return the sentence containing ``offset``, if any."""
+        index = bisect.bisect_right(self._sentence_starts, offset) - 1
+        if index < 0:
+            return None
+        span = self.sentences[index]
+        return span if offset < span.end else None
+
+    def _spans(self, bounds) -> List[TextSpan]:
+        spans = []
+        for item in bounds:
+            start, end = item.span() if hasattr(item, 'span') else item
+            # Trim surrounding whitespace so offsets point at real content
+            while start < end and self.text[start].isspace():
+                start += 1
+            while end > start and self.text[end - 1].isspace():
+                end -= 1
+            if start < end:
+                spans.append(TextSpan(start, end, self.text[start:end]))
+        return spans
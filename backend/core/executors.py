@@ -0,0 +1,576 @@
+"""
+Long-lived executors for gate and analyzer tasks
+Shared by every validation instead of a pool per module per request
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# (module_name, gate_name, gate_obj) as scheduled by the engine
+GateItem = Tuple[str, str, Any]
+# run_gate(gate_name, gate_obj, ctx) -> (gate_name, result)
+GateRunner = Callable[[str, Any, Any], Tuple[str, Any]]
+
+# Placeholder result for a gate that had not finished when the deadline expired
+GATE_TIMEOUT = '__loki_gate_timeout__'
+# Placeholder result for a gate abandoned because ``stop_when`` was satisfied
+GATE_SKIPPED = '__loki_gate_skipped__'
+# stop_when(result) -> True once no further gate result can change the outcome
+StopCondition = Callable[[Any], bool]
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until ``deadline`` (a ``time.monotonic()`` value), or None."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class GateExecutor:
+    """
+    Persistent thread pool with a bounded queue.
+
+    At most ``max_workers`` tasks run and at most ``max_queue`` wait; further
+    submissions block (or raise ``queue.Full`` after ``submit_timeout``)
+    until a slot frees up, so a burst of requests applies back-pressure to
+    callers instead of growing an unbounded backlog.
+    """
+
+    mode = 'thread'
+
+    def __init__(self, max_workers: int = 4, max_queue: Optional[int] = None,
+                 submit_timeout: Optional[float] = None) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.max_queue = max_queue if max_queue is not None else max_workers * 64
+        self.submit_timeout = submit_timeout
+
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='loki-gate'
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.active = 0
+        self.queued = 0
+        self.peak_queue_depth = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> concurrent.futures.Future:
+        """Schedule ``fn(*args, **kwargs)``; blocks while the queue is full."""
+        if not self._slots.acquire(timeout=self.submit_timeout):
+            with self._lock:
+                self.rejected += 1
+            raise queue.Full("gate executor queue is full")
+
+        enqueued = time.monotonic()
+        with self._lock:
+            self.submitted += 1
+            self.queued += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, self.queued)
+
+        def run():
+            started = time.monotonic()
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+                self.wait_seconds += started - enqueued
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+                    if failed:
+                        self.failed += 1
+                    self.busy_seconds += time.monotonic() - started
+                self._slots.release()
+
+        def release_if_cancelled(future):
+            # A task cancelled while queued never runs, so free its slot here
+            if future.cancelled():
+                with self._lock:
+                    self.queued -= 1
+                self._slots.release()
+
+        try:
+            future = self._pool.submit(run)
+        except Exception:
+            with self._lock:
+                self.queued -= 1
+            self._slots.release()
+            raise
+        future.add_done_callback(release_if_cancelled)
+        return future
+
+    def run_gates(self, items: Sequence[GateItem], ctx, run_gate: GateRunner,
+                  deadline: Optional[float] = None, stop_when: Optional[StopCondition] = None) -> List[Any]:
+        """
+        Run every gate on the pool; results are returned in ``items`` order.
+
+        Gates still queued or running at ``deadline`` are reported as
+        ``GATE_TIMEOUT``, and those left once ``stop_when`` returns True as
+        ``GATE_SKIPPED`` (queued ones are cancelled).
+        """
+        if deadline is None and stop_when is None:
+            futures = [self.submit(run_gate, gate_name, gate, ctx) for _, gate_name, gate in items]
+            return [future.result()[1] for future in futures]
+
+        # Keep only a window of gates in flight so the rest can still be
+        # dropped without ever reaching the pool
+        window = self.max_workers * 2
+        results: List[Any] = [None] * len(items)
+        in_flight: Dict[concurrent.futures.Future, int] = {}
+        submitted = 0
+        outcome = None
+        while outcome is None and (submitted < len(items) or in_flight):
+            while submitted < len(items) and len(in_flight) < window:
+                _, gate_name, gate = items[submitted]
+                in_flight[self.submit(run_gate, gate_name, gate, ctx)] = submitted
+                submitted += 1
+            done, _ = concurrent.futures.wait(
+                in_flight, timeout=_remaining(deadline), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            if not done:
+                outcome = GATE_TIMEOUT
+            for future in done:
+                index = in_flight.pop(future)
+                results[index] = future.result()[1]
+                if stop_when is not None and stop_when(results[index]) and outcome is None:
+                    outcome = GATE_SKIPPED
+
+        for future, index in in_flight.items():
+            # Keep results that finished meanwhile; cancel what is still queued
+            if not future.cancel() and future.done():
+                results[index] = future.result()[1]
+            else:
+                results[index] = outcome
+        for index in range(submitted, len(items)):
+            results[index] = outcome
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Utilization and queue depth since the executor started."""
+        with self._lock:
+            uptime = max(time.monotonic() - self._started, 1e-9)
+            return {
+                'mode': self.mode,
+                'workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'active': self.active,
+                'queue_depth': self.queued,
+                'peak_queue_depth': self.peak_queue_depth,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'utilization': round(self.busy_seconds / (self.max_workers * uptime) * 100, 2),
+                'avg_wait_ms': round(self.wait_seconds / self.completed * 1000, 3) if self.completed else 0,
+            }
+
+
+class SerialGateExecutor:
+    """Runs gates one after another in the calling thread (baseline/debugging)."""
+
+    mode = 'serial'
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.gates_run = 0
+
+    def run_gates(self, items: Sequence[GateItem], ctx, run_gate: GateRunner,
+                  deadline: Optional[float] = None, stop_when: Optional[StopCondition] = None) -> List[Any]:
+        self.batches += 1
+        results = []
+        outcome = None
+        for _, gate_name, gate in items:
+            if outcome is None and deadline is not None and time.monotonic() >= deadline:
+                outcome = GATE_TIMEOUT
+            if outcome is not None:
+                results.append(outcome)
+                continue
+            results.append(run_gate(gate_name, gate, ctx)[1])
+            self.gates_run += 1
+            if stop_when is not None and stop_when(results[-1]):
+                outcome = GATE_SKIPPED
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'mode': self.mode, 'workers': 1, 'batches': self.batches, 'gates_run': self.gates_run}
+
+
+# ----------------------------------------------------------------------
+# Process pool
+# ----------------------------------------------------------------------
+_worker_engine = None
+_worker_document: Tuple[Optional[str], Any] = (None, None)
+
+
+def _init_worker(module_names: Sequence[str]) -> None:
+    """Load every module once per worker process."""
+    global _worker_engine
+    from core.async_engine import AsyncLOKIEngine
+
+    _worker_engine = AsyncLOKIEngine(max_workers=1, execution_mode='serial')
+    for module_name in module_names:
+        _worker_engine.load_module(module_name)
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _attach_shared(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block the parent owns (and unlinks)."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        # Older versions register the block again; workers share the parent's
+        # resource tracker (see ProcessGateExecutor.start), so this is a no-op
+        return shared_memory.SharedMemory(name=name)
+
+
+def _unlink_when_done(shm: shared_memory.SharedMemory, futures: Sequence[concurrent.futures.Future]) -> None:
+    """
+    Unlink the parent's block once no batch can still attach to it.
+
+    A batch still running when the validation returns (deadline or early
+    exit) may not have attached yet, so the last one to finish unlinks.
+    """
+    outstanding = [future for future in futures if not future.done()]
+    lock = threading.Lock()
+    remaining = [len(outstanding)]
+
+    def release(_future):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        shm.close()
+        shm.unlink()
+
+    if not outstanding:
+        shm.close()
+        shm.unlink()
+    for future in outstanding:
+        future.add_done_callback(release)
+
+
+def _worker_context(token: str, shm_name: str, size: int, document_type: str):
+    """Attach to the shared document once per request and reuse it across batches."""
+    global _worker_document
+    from core.document_context import DocumentContext
+
+    if _worker_document[0] != token:
+        shm = _attach_shared(shm_name)
+        try:
+            text = bytes(shm.buf[:size]).decode('utf-8')
+        finally:
+            shm.close()
+        _worker_document = (token, DocumentContext(text, document_type))
+    return _worker_document[1]
+
+
+def _run_gate_batch(token: str, shm_name: str, size: int, document_type: str,
+                    batch: Sequence[Tuple[str, str]]) -> List[Any]:
+    """Execute a batch of ``(module, gate)`` pairs against the shared document."""
+    ctx = _worker_context(token, shm_name, size, document_type)
+    results = []
+    for module_name, gate_name in batch:
+        module = _worker_engine.modules.get(module_name)
+        gate = getattr(module, 'gates', {}).get(gate_name) if module is not None else None
+        if gate is None:
+            results.append(ProcessGateExecutor.MISSING)
+        else:
+            results.append(_worker_engine._execute_gate(gate_name, gate, ctx)[1])
+    return results
+
+
+class ProcessGateExecutor:
+    """
+    Pre-forked process pool for CPU-bound gate work.
+
+    Gates are pure-Python regex code, so threads mostly wait on the GIL.
+    Each worker process loads the engine's modules once at start-up; a
+    validation then ships only ``(module, gate)`` names in a few batches
+    per worker, while the document itself is written once to
+    ``multiprocessing.shared_memory`` instead of being pickled per task.
+    Gates a worker does not know (e.g. registered on the engine at runtime)
+    run in the parent process instead, as does every gate until ``start``.
+
+    Workers come from a ``forkserver`` (or ``spawn``) context: forking the
+    threaded server directly could copy a lock some other thread holds.
+    """
+
+    mode = 'process'
+    MISSING = '__loki_gate_missing__'
+
+    def __init__(self, max_workers: Optional[int] = None, batches_per_worker: int = 2,
+                 mp_context: Optional[str] = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batches_per_worker = max(1, batches_per_worker)
+        if mp_context is None:
+            mp_context = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        self._context = multiprocessing.get_context(mp_context)
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._modules: Tuple[str, ...] = ()
+        self._lock = threading.Lock()
+        # Serializes start() without holding up validations on self._lock
+        self._start_lock = threading.Lock()
+        self._tokens = itertools.count()
+
+        self.starts = 0
+        self.batches = 0
+        self.gates_run = 0
+        self.local_fallbacks = 0
+        self.shared_bytes = 0
+
+    def start(self, module_names: Sequence[str]) -> None:
+        """
+        Start the workers and load ``module_names`` in each (no-op if already running).
+
+        Called once at start-up. A different module set gets a new pool,
+        ready before it replaces the old one; batches already on the old
+        pool finish there.
+        """
+        module_names = tuple(module_names)
+        with self._start_lock:
+            with self._lock:
+                if self._pool is not None and module_names == self._modules:
+                    return
+            # Workers must inherit the parent's tracker rather than start their own,
+            # otherwise each would report the parent's shared blocks as leaked
+            resource_tracker.ensure_running()
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(module_names,),
+            )
+            # Pre-start: make every worker start and load its modules now
+            for future in [pool.submit(_worker_ready) for _ in range(self.max_workers)]:
+                future.result()
+            with self._lock:
+                previous, self._pool = self._pool, pool
+                self._modules = module_names
+                self.starts += 1
+            if previous is not None:
+                previous.shutdown(wait=False)
+
+    def run_gates(self, items: Sequence[GateItem], ctx, run_gate: GateRunner,
+                  deadline: Optional[float] = None, stop_when: Optional[StopCondition] = None) -> List[Any]:
+        if not items:
+            return []
+        with self._lock:
+            started = self._pool is not None
+        if not started:
+            # Never started (see AsyncLOKIEngine.warm_up): run in this process
+            results = SerialGateExecutor().run_gates(items, ctx, run_gate, deadline, stop_when)
+            with self._lock:
+                self.local_fallbacks += len(items)
+            return results
+
+        data = ctx.text.encode('utf-8')
+        shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        futures: List[concurrent.futures.Future] = []
+        try:
+            shm.buf[:len(data)] = data
+            token = f"{os.getpid()}-{next(self._tokens)}"
+
+            batch_count = min(len(items), self.max_workers * self.batches_per_worker)
+            # Interleave so each batch mixes gates from all modules
+            batches = [list(range(start, len(items), batch_count)) for start in range(batch_count)]
+            # Submitting under the lock keeps start() from retiring the pool midway
+            with self._lock:
+                if self._pool is None:
+                    raise RuntimeError("process executor was shut down")
+                futures = [
+                    self._pool.submit(
+                        _run_gate_batch, token, shm.name, len(data), ctx.document_type,
+                        [(items[i][0], items[i][1]) for i in batch],
+                    )
+                    for batch in batches
+                ]
+
+            results: List[Any] = [None] * len(items)
+            pending = dict(zip(futures, batches))
+            outcome = None
+            try:
+                for future in concurrent.futures.as_completed(futures, timeout=_remaining(deadline)):
+                    batch = pending.pop(future)
+                    for index, result in zip(batch, future.result()):
+                        if isinstance(result, str) and result == self.MISSING:
+                            _, gate_name, gate = items[index]
+                            result = run_gate(gate_name, gate, ctx)[1]
+                            with self._lock:
+                                self.local_fallbacks += 1
+                        results[index] = result
+                        if outcome is None and stop_when is not None and stop_when(result):
+                            outcome = GATE_SKIPPED
+                    if outcome is not None:
+                        break
+            except concurrent.futures.TimeoutError:
+                outcome = GATE_TIMEOUT
+            # Unfinished batches are reported whole; a running one finishes unobserved
+            for future, batch in pending.items():
+                future.cancel()
+                for index in batch:
+                    results[index] = outcome
+        finally:
+            _unlink_when_done(shm, futures)
+
+        with self._lock:
+            self.batches += len(batches)
+            self.gates_run += len(items)
+            self.shared_bytes += len(data)
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'mode': self.mode,
+            'workers': self.max_workers,
+            'modules': list(self._modules),
+            'starts': self.starts,
+            'batches': self.batches,
+            'gates_run': self.gates_run,
+            'local_fallbacks': self.local_fallbacks,
+            'shared_mb': round(self.shared_bytes / 1e6, 2),
+        }
+
+
+class AsyncioGateExecutor:
+    """
+    Runs gates as tasks on a dedicated asyncio event loop.
+
+    The loop lives in its own thread, so synchronous callers are unaffected;
+    each gate is awaited via ``asyncio.to_thread`` on a fixed-size pool and
+    at most ``max_workers`` gates are in flight per validation.
+    """
+
+    mode = 'asyncio'
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.gates_run = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='loki-asyncio'
+                ))
+                self._thread = threading.Thread(target=loop.run_forever, name='loki-asyncio-loop', daemon=True)
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    async def run_gates_async(self, items: Sequence[GateItem], ctx, run_gate: GateRunner,
+                              deadline: Optional[float] = None,
+                              stop_when: Optional[StopCondition] = None) -> List[Any]:
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run_one(gate_name, gate):
+            async with semaphore:
+                return (await asyncio.to_thread(run_gate, gate_name, gate, ctx))[1]
+
+        if deadline is None and stop_when is None:
+            return list(await asyncio.gather(*(run_one(gate_name, gate) for _, gate_name, gate in items)))
+
+        tasks = [asyncio.ensure_future(run_one(gate_name, gate)) for _, gate_name, gate in items]
+        pending = set(tasks)
+        outcome = GATE_TIMEOUT
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=_remaining(deadline), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            if stop_when is not None and any([stop_when(task.result()) for task in tasks if task in done]):
+                outcome = GATE_SKIPPED
+                break
+        for task in pending:
+            task.cancel()
+        return [outcome if task in pending else task.result() for task in tasks]
+
+    def run_gates(self, items: Sequence[GateItem], ctx, run_gate: GateRunner,
+                  deadline: Optional[float] = None, stop_when: Optional[StopCondition] = None) -> List[Any]:
+        if not items:
+            return []
+        loop = self._ensure_loop()
+        results = asyncio.run_coroutine_threadsafe(
+            self.run_gates_async(items, ctx, run_gate, deadline, stop_when), loop
+        ).result()
+        with self._lock:
+            self.batches += 1
+            self.gates_run += len(items)
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            if wait and thread is not None:
+                thread.join()
+                loop.run_until_complete(loop.shutdown_default_executor())
+                loop.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'mode': self.mode, 'workers': self.max_workers, 'batches': self.batches, 'gates_run': self.gates_run}
+
+
+EXECUTION_MODES = ('serial', 'thread', 'process', 'asyncio')
+
+
+def create_gate_executor(mode: str, thread_executor: GateExecutor, max_workers: int = 4,
+                         process_workers: Optional[int] = None):
+    """
+    Build the gate executor for ``mode``.
+
+    'thread' reuses ``thread_executor`` (the engine's shared pool, which also
+    runs the analyzers); the other modes get a dedicated executor.
+    """
+    if mode == 'thread':
+        return thread_executor
+    if mode == 'serial':
+        return SerialGateExecutor()
+    if mode == 'process':
+        return ProcessGateExecutor(max_workers=process_workers)
+    if mode == 'asyncio':
+        return AsyncioGateExecutor(max_workers=max_workers)
+    raise ValueError(f"execution_mode must be one of {', '.join(EXECUTION_MODES)}")
@@ -0,0 +1,452 @@
+"""
+Static introspection of gate source code
+Recovers the regex literals a gate uses without executing it
+"""
+from __future__ import annotations
+
+import ast
+import inspect
+import re
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Module-level helpers whose first argument is a regex pattern
+REGEX_FUNCTIONS = {'search', 'match', 'fullmatch', 'finditer', 'findall', 'sub', 'subn', 'split', 'compile', 'fuse',
+                   'occurs'}
+# Receivers that expose the re-compatible API
+REGEX_RECEIVERS = {'re', 'pattern_registry', 'proximity'}
+# Positional index of the ``flags`` argument per function
+_FLAGS_POSITION = {'compile': 1, 'fuse': 1, 'sub': 4, 'subn': 4, 'split': 3}
+
+_ast_cache: Dict[str, ast.Module] = {}
+_ast_lock = threading.Lock()
+
+
+def _parse_source(path: str) -> Optional[ast.Module]:
+    with _ast_lock:
+        if path not in _ast_cache:
+            try:
+                with open(path, encoding='utf-8') as handle:
+                    _ast_cache[path] = ast.parse(handle.read(), filename=path)
+            except (OSError, SyntaxError, UnicodeDecodeError):
+                _ast_cache[path] = None
+        return _ast_cache[path]
+
+
+def gate_class_node(gate_obj) -> Optional[ast.ClassDef]:
+    """Return the AST node for the class of ``gate_obj`` (None if unavailable)."""
+    cls = type(gate_obj)
+    try:
+        path = inspect.getsourcefile(cls)
+    except TypeError:
+        return None
+    if not path:
+        return None
+    tree = _parse_source(path)
+    if tree is None:
+        return None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name == cls.__name__:
+            return node
+    return None
+
+
+def _eval_flags(node: Optional[ast.AST]) -> Optional[int]:
+    """Evaluate ``re.I | re.M`` style flag expressions; None if not static."""
+    if node is None:
+        return 0
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 're':
+        value = getattr(re, node.attr, None)
+        return int(value) if isinstance(value, (int, re.RegexFlag)) else None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        left, right = _eval_flags(node.left), _eval_flags(node.right)
+        return None if left is None or right is None else left | right
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    return None
+
+
+class _Resolver:
+    """Resolve expressions to the string literals they can evaluate to."""
+
+    def __init__(self, class_node: ast.ClassDef) -> None:
+        self.class_node = class_node
+        self.attributes: Dict[str, List[ast.AST]] = {}
+        for node in ast.walk(class_node):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name)
+                            and target.value.id == 'self'):
+                        self.attributes.setdefault(target.attr, []).append(node.value)
+
+    def strings(self, node: ast.AST, scope: ast.AST, seen: Optional[Set[int]] = None,
+                parents: Optional[Dict[int, ast.AST]] = None) -> List[str]:
+        seen = seen if seen is not None else set()
+        if id(node) in seen:
+            return []
+        seen.add(id(node))
+
+        if isinstance(node, ast.Constant):
+            return [node.value] if isinstance(node.value, str) else []
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            return [s for elt in node.elts for s in self.strings(elt, scope, seen)]
+        if isinstance(node, ast.Dict):
+            return [s for value in node.values for s in self.strings(value, scope, seen)]
+        if isinstance(node, ast.Subscript):
+            return self.strings(node.value, scope, seen)
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr in ('items', 'values')):
+            return self.strings(node.func.value, scope, seen)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'self':
+            return [s for value in self.attributes.get(node.attr, []) for s in self.strings(value, scope, seen)]
+        if isinstance(node, ast.Name):
+            sources = self._loop_source(node, parents) or self._name_sources(node.id, scope)
+            return [s for value in sources for s in self.strings(value, scope, seen)]
+        return []
+
+    @staticmethod
+    def _binds(target: ast.AST, name: str) -> bool:
+        if isinstance(target, ast.Name):
+            return target.id == name
+        if isinstance(target, ast.Tuple):
+            # ``for key, pattern in mapping.items()`` binds the value side
+            names = [elt.id for elt in target.elts if isinstance(elt, ast.Name)]
+            return name in names and names.index(name) > 0
+        return False
+
+    def _loop_source(self, node: ast.Name, parents: Optional[Dict[int, ast.AST]]) -> List[ast.AST]:
+        """Iterable of the innermost loop/comprehension enclosing ``node`` that binds its name."""
+        current = parents.get(id(node)) if parents else None
+        while current is not None:
+            if isinstance(current, ast.For) and self._binds(current.target, node.id):
+                return [current.iter]
+            if isinstance(current, (ast.GeneratorExp, ast.ListComp, ast.SetComp, ast.DictComp)):
+                for generator in current.generators:
+                    if self._binds(generator.target, node.id):
+                        return [generator.iter]
+            current = parents.get(id(current))
+        return []
+
+    def _name_sources(self, name: str, scope: ast.AST) -> List[ast.AST]:
+        sources: List[ast.AST] = []
+        for node in ast.walk(scope):
+            if isinstance(node, ast.Assign):
+                if any(isinstance(t, ast.Name) and t.id == name for t in node.targets):
+                    sources.append(node.value)
+            elif isinstance(node, (ast.For, ast.comprehension)) and self._binds(node.target, name):
+                sources.append(node.iter)
+        return sources
+
+
+def _regex_calls(resolver: _Resolver, scope: ast.AST, found: List[Tuple[str, int]],
+                 seen: Set[Tuple[str, int]]) -> None:
+    """Append the static ``(pattern, flags)`` arguments of regex API calls in ``scope``."""
+    parents = {id(child): parent for parent in ast.walk(scope) for child in ast.iter_child_nodes(parent)}
+    for node in ast.walk(scope):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        receiver = node.func.value
+        if not (isinstance(receiver, ast.Name) and receiver.id in REGEX_RECEIVERS):
+            continue
+        if node.func.attr not in REGEX_FUNCTIONS or not node.args:
+            continue
+
+        flag_node = next((kw.value for kw in node.keywords if kw.arg == 'flags'), None)
+        position = _FLAGS_POSITION.get(node.func.attr, 2)
+        if flag_node is None and len(node.args) > position:
+            flag_node = node.args[position]
+        flags = _eval_flags(flag_node)
+        if flags is None:
+            continue
+
+        for pattern in resolver.strings(node.args[0], scope, parents=parents):
+            for key in _searched(node.func.attr, pattern, flags):
+                if key not in seen:
+                    seen.add(key)
+                    found.append(key)
+
+
+def _searched(function: str, pattern: str, flags: int) -> List[Tuple[str, int]]:
+    """The patterns actually compiled for a call: ``proximity.occurs`` scans the terms of a ``.*`` chain."""
+    if function == 'occurs':
+        from core.proximity import split_chain  # imports the pattern registry, which imports this module
+
+        chains = split_chain(pattern, flags)
+        if chains is not None:
+            return [(term, flags) for terms in chains for term in terms]
+    return [(pattern, flags)]
+
+
+def extract_patterns(gate_obj) -> List[Tuple[str, int]]:
+    """
+    Return the unique ``(pattern, flags)`` pairs a gate passes to the regex API.
+
+    Patterns are recovered statically from the gate's class source: literal
+    arguments, names bound to literal lists/dicts, and ``self`` attributes
+    assigned literals. Dynamically built patterns are not returned; they are
+    compiled lazily on first use instead.
+    """
+    class_node = gate_class_node(gate_obj)
+    if class_node is None:
+        return []
+
+    resolver = _Resolver(class_node)
+    found: List[Tuple[str, int]] = []
+    seen: Set[Tuple[str, int]] = set()
+    for method in class_node.body:
+        if isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            _regex_calls(resolver, method, found, seen)
+    return found
+
+
+def extract_module_patterns(module) -> List[Tuple[str, int]]:
+    """
+    Return the unique ``(pattern, flags)`` pairs a plain module (e.g. an
+    analyzer) passes to the regex API, including module-level ``re.compile``.
+    """
+    try:
+        path = inspect.getsourcefile(module)
+    except TypeError:
+        return []
+    tree = _parse_source(path) if path else None
+    if tree is None:
+        return []
+
+    found: List[Tuple[str, int]] = []
+    _regex_calls(_Resolver(tree), tree, found, set())
+    return found
+
+
+def extract_fused_groups(gate_obj) -> List[Tuple[Dict[str, List[str]], int]]:
+    """
+    Return ``(groups, flags)`` for each ``pattern_registry.fuse`` call in a gate.
+
+    Only calls whose groups are a literal dict (inline or bound to a name)
+    with literal string keys are returned, so they can be planned up front.
+    """
+    class_node = gate_class_node(gate_obj)
+    if class_node is None:
+        return []
+
+    resolver = _Resolver(class_node)
+    found: List[Tuple[Dict[str, List[str]], int]] = []
+    for method in class_node.body:
+        if not isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        parents = {id(child): parent for parent in ast.walk(method) for child in ast.iter_child_nodes(parent)}
+        for node in ast.walk(method):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and node.func.attr == 'fuse' and isinstance(node.func.value, ast.Name)
+                    and node.func.value.id == 'pattern_registry' and node.args):
+                continue
+            flag_node = next((kw.value for kw in node.keywords if kw.arg == 'flags'), None)
+            if flag_node is None and len(node.args) > 1:
+                flag_node = node.args[1]
+            flags = _eval_flags(flag_node)
+
+            groups_node = node.args[0]
+            if isinstance(groups_node, ast.Name):
+                sources = resolver._name_sources(groups_node.id, method)
+                groups_node = sources[0] if len(sources) == 1 else None
+            if flags is None or not isinstance(groups_node, ast.Dict):
+                continue
+            if not all(isinstance(key, ast.Constant) and isinstance(key.value, str) for key in groups_node.keys):
+                continue
+            found.append(({
+                key.value: resolver.strings(value, method, parents=parents)
+                for key, value in zip(groups_node.keys, groups_node.values)
+            }, flags))
+    return found
+
+
+class _RelevanceAnalyzer:
+    """
+    Derive a necessary keyword condition from a gate's ``_is_relevant``.
+
+    The result is a set of keywords such that the method can only return a
+    truthy value when at least one of them occurs in the lower-cased text.
+    ``None`` means no such bound could be proven (regex checks, negations,
+    calls into other helpers, ...); those gates must always be executed.
+    """
+
+    def __init__(self, class_node: ast.ClassDef, method: ast.FunctionDef) -> None:
+        self.resolver = _Resolver(class_node)
+        self.method = method
+        self.params = {arg.arg for arg in method.args.args[1:]}
+        self.parents = {id(child): parent for parent in ast.walk(method) for child in ast.iter_child_nodes(parent)}
+        self.lowered = set()
+        for node in ast.walk(method):
+            if isinstance(node, ast.Assign) and self._is_lowered_text(node.value):
+                self.lowered.update(t.id for t in node.targets if isinstance(t, ast.Name))
+
+    # -- text expressions ------------------------------------------------
+    def _is_text(self, node: ast.AST) -> bool:
+        """``text`` / ``ctx.text`` / ``(text or '')`` as passed to the gate."""
+        if isinstance(node, ast.Name):
+            return node.id in self.params
+        if isinstance(node, ast.Attribute) and node.attr == 'text':
+            return isinstance(node.value, ast.Name) and node.value.id in self.params
+        if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.Or):
+            return self._is_text(node.values[0]) and all(
+                isinstance(v, ast.Constant) and v.value == '' for v in node.values[1:])
+        return False
+
+    def _is_lowered_text(self, node: ast.AST) -> bool:
+        if isinstance(node, ast.Attribute) and node.attr == 'lower':
+            return isinstance(node.value, ast.Name) and node.value.id in self.params
+        return (isinstance(node, ast.Call) and not node.args and isinstance(node.func, ast.Attribute)
+                and node.func.attr == 'lower' and self._is_text(node.func.value))
+
+    def _haystack(self, node: ast.AST) -> Optional[bool]:
+        """True for lowered text, False for raw text, None for anything else."""
+        if isinstance(node, ast.Name) and node.id in self.lowered:
+            return True
+        if self._is_lowered_text(node):
+            return True
+        if self._is_text(node):
+            return False
+        return None
+
+    # -- conditions ------------------------------------------------------
+    def _needles(self, node: ast.AST) -> Optional[Set[str]]:
+        strings = self.resolver.strings(node, self.method, parents=self.parents)
+        if not strings or not self._all_literal(node):
+            return None
+        return set(strings)
+
+    def _all_literal(self, node: ast.AST) -> bool:
+        """Conservatively confirm ``node`` resolves only to literal strings."""
+        if isinstance(node, ast.Constant):
+            return isinstance(node.value, str)
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            return all(self._all_literal(elt) for elt in node.elts)
+        if isinstance(node, ast.Name):
+            sources = self.resolver._loop_source(node, self.parents) or \
+                self.resolver._name_sources(node.id, self.method)
+            return bool(sources) and all(self._all_literal(s) for s in sources)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'self':
+            sources = self.resolver.attributes.get(node.attr, [])
+            return bool(sources) and all(self._all_literal(s) for s in sources)
+        return False
+
+    def _contains(self, node: ast.Compare) -> Optional[Set[str]]:
+        if len(node.ops) != 1 or not isinstance(node.ops[0], ast.In):
+            return None
+        lowered = self._haystack(node.comparators[0])
+        if lowered is None:
+            return None
+        needles = self._needles(node.left)
+        if needles is None:
+            return None
+        # ``kw in text`` implies ``kw.lower() in text.lower()``
+        return needles if lowered else {n.lower() for n in needles}
+
+    def _generator_condition(self, node: ast.AST) -> Optional[Set[str]]:
+        """``any(kw in t for kw in L)`` / ``sum(1 for kw in L if kw in t)``."""
+        if not isinstance(node, ast.GeneratorExp) or len(node.generators) != 1:
+            return None
+        generator = node.generators[0]
+        conditions = list(generator.ifs)
+        if not (isinstance(node.elt, ast.Constant)):
+            conditions.append(node.elt)
+        if len(conditions) != 1:
+            return None
+        return self.condition(conditions[0])
+
+    def condition(self, node: ast.AST, depth: int = 0) -> Optional[Set[str]]:
+        if depth > 20:
+            return None
+        if isinstance(node, ast.Compare):
+            if (len(node.ops) == 1 and isinstance(node.ops[0], (ast.GtE, ast.Gt))
+                    and isinstance(node.comparators[0], ast.Constant)
+                    and isinstance(node.comparators[0].value, int)):
+                # ``matches >= k`` with k >= 1 (or ``> k`` with k >= 0) needs one hit
+                threshold = node.comparators[0].value
+                if threshold >= (1 if isinstance(node.ops[0], ast.GtE) else 0):
+                    return self.condition(node.left, depth + 1)
+                return None
+            return self._contains(node)
+        if isinstance(node, ast.BoolOp):
+            parts = [self.condition(value, depth + 1) for value in node.values]
+            if isinstance(node.op, ast.Or):
+                if any(part is None for part in parts):
+                    return None
+                return set().union(*parts)
+            bounded = [part for part in parts if part is not None]
+            return min(bounded, key=len) if bounded else None
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            if node.func.id == 'any' and len(node.args) == 1 and isinstance(node.args[0], (ast.List, ast.Tuple)):
+                return self.condition(ast.BoolOp(op=ast.Or(), values=list(node.args[0].elts)), depth + 1)
+            if node.func.id in ('any', 'sum') and len(node.args) == 1:
+                return self._generator_condition(node.args[0])
+            if node.func.id == 'bool' and len(node.args) == 1:
+                return self.condition(node.args[0], depth + 1)
+            return None
+        if isinstance(node, ast.Name):
+            sources = self.resolver._name_sources(node.id, self.method)
+            if len(sources) != 1:
+                return None
+            return self.condition(sources[0], depth + 1)
+        return None
+
+    def analyze(self) -> Optional[Set[str]]:
+        body = [s for s in self.method.body
+                if not (isinstance(s, ast.Expr) and isinstance(s.value, ast.Constant))]
+        returns = []
+        for statement in body:
+            if isinstance(statement, ast.Assign):
+                continue
+            if isinstance(statement, ast.If) and not statement.orelse:
+                # Early ``return False`` guards only narrow relevance further
+                if all(isinstance(s, ast.Return) and isinstance(s.value, ast.Constant) and not s.value.value
+                       for s in statement.body):
+                    continue
+                return None
+            if isinstance(statement, ast.Return) and statement.value is not None:
+                returns.append(statement.value)
+                break
+            return None
+        if len(returns) != 1:
+            return None
+        keywords = self.condition(returns[0])
+        if keywords is None or '' in keywords:
+            return None
+        return keywords
+
+
+def relevance_keywords(gate_obj) -> Optional[frozenset]:
+    """
+    Keywords at least one of which must occur for the gate to be relevant.
+
+    Returns None when the gate has no ``_is_relevant`` method, the method
+    cannot be bounded statically, or ``check`` does not return early when
+    it is falsy.
+    """
+    class_node = gate_class_node(gate_obj)
+    if class_node is None:
+        return None
+    methods = {node.name: node for node in class_node.body if isinstance(node, ast.FunctionDef)}
+    method = methods.get('_is_relevant')
+    if method is None or not _returns_early_when_irrelevant(methods):
+        return None
+    keywords = _RelevanceAnalyzer(class_node, method).analyze()
+    return frozenset(keywords) if keywords is not None else None
+
+
+def _returns_early_when_irrelevant(methods: Dict[str, ast.FunctionDef]) -> bool:
+    """True when the entry point bails out with ``if not self._is_relevant(...): return {...}``."""
+    entry = methods.get('check_ctx') or methods.get('check')
+    if entry is None:
+        return False
+    for node in ast.walk(entry):
+        if not (isinstance(node, ast.If) and isinstance(node.test, ast.UnaryOp)
+                and isinstance(node.test.op, ast.Not)):
+            continue
+        call = node.test.operand
+        if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                and call.func.attr == '_is_relevant'
+                and len(node.body) == 1 and isinstance(node.body[0], ast.Return)
+                and isinstance(node.body[0].value, ast.Dict)):
+            return True
+    return False
@@ -3,10 +3,44 @@ import requests
 import json as _json
 from datetime import datetime
 
+from core.result_store import ruleset_fingerprint
+
+
+def _response_cache_key(cache, provider, payload, api_key, modules, mode):
+    """Key under which this request's outcome is cached, or None (no cache, or not deterministic)"""
+    if cache is None:
+        return None
+    return cache.make_key(provider, api_key, payload, [sorted(modules), mode, ruleset_fingerprint(modules)])
+
+
+def _reusable(validation):
+    """True for a complete validation: not partial, no engine or module error, no ERROR gate"""
+    if not isinstance(validation, dict) or validation.get('partial') or 'error' in validation:
+        return False
+    for module in (validation.get('modules') or {}).values():
+        if not isinstance(module, dict) or 'error' in module:
+            return False
+        for gate in (module.get('gates') or {}).values():
+            if isinstance(gate, dict) and (gate.get('status') or '').upper() == 'ERROR':
+                return False
+    return True
+
+
+def _remember(cache, key, result, validation):
+    """Cache an outcome for later identical requests; failed or partial validations are not reused"""
+    if key is not None and _reusable(validation):
+        cache.set(key, dict(result, loki_cached=True))
+
 
 class AnthropicInterceptor:
-    def __init__(self, engine):
+    def __init__(self, engine, budget_ms=None, mode='full', response_cache=None):
         self.engine = engine
+        # Latency budget for LOKI validation on top of the LLM call (None = unbounded)
+        self.budget_ms = budget_ms
+        # check_document mode for the blocking path; 'verdict' stops once CRITICAL is certain
+        self.mode = mode
+        # Optional ProviderResponseCache: temperature-0 requests reuse response and validation
+        self.response_cache = response_cache
 
     def intercept(self, request_data, api_key, active_modules=None):
         """
@@ -36,6 +70,13 @@ class AnthropicInterceptor:
             if missing:
                 raise ValueError(f"Missing required fields: {', '.join(missing)}")
 
+            modules_to_check = active_modules or list(self.engine.modules.keys())
+            cache_key = _response_cache_key(self.response_cache, 'anthropic', payload, api_key,
+                                            modules_to_check, self.mode)
+            cached = self.response_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                return cached
+
             url = 'https://api.anthropic.com/v1/messages'
             headers = {
                 'Content-Type': 'application/json',
@@ -60,33 +101,36 @@ class AnthropicInterceptor:
                 response_text = _json.dumps(response)
 
             # Validate with LOKI
-            modules_to_check = active_modules or list(self.engine.modules.keys())
             validation = self.engine.check_document(
                 text=response_text,
                 document_type='ai_generated',
-                active_modules=modules_to_check
+                active_modules=modules_to_check,
+                budget_ms=self.budget_ms,
+                mode=self.mode
             )
 
             # Check if should block
             if isinstance(validation, dict) and validation.get('overall_risk') == 'CRITICAL':
-                return {
+                result = {
                     'blocked': True,
                     'error': 'LOKI_CRITICAL_ERROR',
                     'message': 'AI response contains critical compliance errors',
                     'validation': validation,
                     'original_response': response_text
                 }
-
-            # Return enhanced response
-            return {
-                'blocked': False,
-                'response': response,
-                'loki': {
-                    'risk': validation.get('overall_risk') if isinstance(validation, dict) else None,
-                    'validation': validation,
-                    'timestamp': datetime.utcnow().isoformat()
+            else:
+                # Return enhanced response
+                result = {
+                    'blocked': False,
+                    'response': response,
+                    'loki': {
+                        'risk': validation.get('overall_risk') if isinstance(validation, dict) else None,
+                        'validation': validation,
+                        'timestamp': datetime.utcnow().isoformat()
+                    }
                 }
-            }
+            _remember(self.response_cache, cache_key, result, validation)
+            return result
 
         except Exception as e:
             return {
@@ -96,9 +140,12 @@ class AnthropicInterceptor:
                 'original_response': f"[Anthropic API Error: {str(e)}]"
             }
 
-    def intercept_and_validate(self, request_data, api_key, modules=None):
+    def intercept_and_validate(self, request_data, api_key, modules=None, budget_ms=None):
         """
         Intercept API call, validate response, block if critical
+
+        ``budget_ms`` overrides the interceptor's validation latency budget;
+        gates cut off by it come back as TIMEOUT with ``partial: true``.
         """
         try:
             if not isinstance(request_data, dict):
@@ -116,6 +163,13 @@ class AnthropicInterceptor:
             if 'max_tokens' not in filtered_request:
                 filtered_request['max_tokens'] = 1024
 
+            modules_to_check = modules or list(self.engine.modules.keys())
+            cache_key = _response_cache_key(self.response_cache, 'anthropic-flag', filtered_request, api_key,
+                                            modules_to_check, 'full')
+            cached = self.response_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                return cached
+
             # Direct HTTP call
             url = 'https://api.anthropic.com/v1/messages'
             headers = {
@@ -147,17 +201,17 @@ class AnthropicInterceptor:
                 response_text = _json.dumps(response)
 
             # Validate using existing engine and all loaded modules by default
-            modules_to_check = modules or list(self.engine.modules.keys())
             validation = self.engine.check_document(
                 text=response_text,
                 document_type='ai_generated',
-                active_modules=modules_to_check
+                active_modules=modules_to_check,
+                budget_ms=budget_ms if budget_ms is not None else self.budget_ms
             )
 
             overall_risk = validation.get('overall_risk', 'LOW') if isinstance(validation, dict) else 'LOW'
 
             # Always return response; flag instead of blocking
-            return {
+            result = {
                 'blocked': False,
                 'response': response,
                 'validation': validation,
@@ -165,9 +219,12 @@ class AnthropicInterceptor:
                     'risk': overall_risk,
                     'flagged': overall_risk != 'LOW',
                     'action': 'FLAGGED' if overall_risk != 'LOW' else 'ALLOWED',
+                    'partial': bool(validation.get('partial')) if isinstance(validation, dict) else False,
                     'gates_checked': list((validation.get('modules') or {}).keys()) if isinstance(validation, dict) else []
                 }
             }
+            _remember(self.response_cache, cache_key, result, validation)
+            return result
         except Exception as e:
             return {
                 'error': str(e),
@@ -177,8 +234,11 @@ class AnthropicInterceptor:
 
 
 class OpenAIInterceptor:
-    def __init__(self, engine):
+    def __init__(self, engine, budget_ms=None, mode='full', response_cache=None):
         self.engine = engine
+        self.budget_ms = budget_ms
+        self.mode = mode
+        self.response_cache = response_cache
 
     def intercept(self, request_data, api_key, active_modules=None):
         import json
@@ -197,6 +257,13 @@ class OpenAIInterceptor:
             if 'model' not in payload or 'messages' not in payload:
                 raise ValueError('Missing required fields: model, messages')
 
+            modules_to_check = active_modules or list(self.engine.modules.keys())
+            cache_key = _response_cache_key(self.response_cache, 'openai', payload, api_key,
+                                            modules_to_check, self.mode)
+            cached = self.response_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                return cached
+
             data = json.dumps(payload).encode('utf-8')
             req = urllib.request.Request(url, data=data, method='POST')
             req.add_header('Content-Type', 'application/json')
@@ -219,26 +286,32 @@ class OpenAIInterceptor:
             except Exception:
                 text = json.dumps(resp_json)
 
-            modules_to_check = active_modules or list(self.engine.modules.keys())
-            validation = self.engine.check_document(text=text, document_type='ai_generated', active_modules=modules_to_check)
+            validation = self.engine.check_document(text=text, document_type='ai_generated',
+                                                    active_modules=modules_to_check, budget_ms=self.budget_ms,
+                                                    mode=self.mode)
             if isinstance(validation, dict) and validation.get('overall_risk') == 'CRITICAL':
-                return {
+                result = {
                     'blocked': True,
                     'error': 'LOKI_CRITICAL_ERROR',
                     'message': 'AI response contains critical compliance errors',
                     'validation': validation,
                     'original_response': text
                 }
+                _remember(self.response_cache, cache_key, result, validation)
+                return result
 
             resp_json['loki_validation'] = validation
+            _remember(self.response_cache, cache_key, resp_json, validation)
             return resp_json
         except Exception as e:
             return {'blocked': True, 'error': 'INTERCEPTOR_ERROR', 'message': str(e), 'original_response': f"[OpenAI Interceptor Error: {str(e)}]"}
 
 
 class GeminiInterceptor:
-    def __init__(self, engine):
+    def __init__(self, engine, budget_ms=None, mode='full'):
         self.engine = engine
+        self.budget_ms = budget_ms
+        self.mode = mode
 
     def intercept(self, request_data, api_key, active_modules=None):
         import json
@@ -286,7 +359,9 @@ class GeminiInterceptor:
                 text = json.dumps(resp_json)
 
             modules_to_check = active_modules or list(self.engine.modules.keys())
-            validation = self.engine.check_document(text=text, document_type='ai_generated', active_modules=modules_to_check)
+            validation = self.engine.check_document(text=text, document_type='ai_generated',
+                                                    active_modules=modules_to_check, budget_ms=self.budget_ms,
+                                                    mode=self.mode)
             if isinstance(validation, dict) and validation.get('overall_risk') == 'CRITICAL':
                 return {
                     'blocked': True,
@@ -0,0 +1,146 @@
+"""
+Near-duplicate detection for validated documents
+Boilerplate resubmitted with whitespace, punctuation or casing changes
+misses the exact content hash; a MinHash sketch over normalized word
+shingles finds the earlier validation instead
+"""
+import heapq
+import re
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+
+_WORD = re.compile(r'[^\W_]+')
+
+
+class NearDuplicate(NamedTuple):
+    """An indexed document similar to the one looked up"""
+    key: str
+    similarity: float
+
+
+def shingles(text, size=5):
+    """
+    Hashes of the overlapping ``size``-word runs of ``text``
+
+    Words are lower-cased runs of letters and digits, so whitespace,
+    punctuation and casing changes do not alter the shingles.
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {hash(tuple(words))} if words else set()
+    return {hash(tuple(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+class NearDuplicateIndex:
+    """
+    Bottom-k MinHash sketches of recently validated documents
+
+    A sketch is the ``num_hashes`` smallest shingle hashes of a document;
+    the Jaccard similarity of two documents is estimated from the
+    smallest ``num_hashes`` hashes of their union. Documents are only
+    compared within the same scope (document type and modules), since a
+    verdict does not carry over between them.
+    """
+
+    def __init__(self, threshold=0.95, num_hashes=128, shingle_size=5, max_size=1000):
+        """
+        Args:
+            threshold: Lowest estimated similarity reported as a near-duplicate
+            num_hashes: Sketch size (larger is more accurate and slower)
+            shingle_size: Words per shingle
+            max_size: Maximum number of indexed documents (least recently added go first)
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Near-duplicate threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.num_hashes = num_hashes
+        self.shingle_size = shingle_size
+        self.max_size = max_size
+        self._sketches = OrderedDict()  # {key: (scope, frozenset of hashes)}
+        self._by_scope = {}  # {scope: {key: sketch}}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.matches = 0
+
+    def sketch(self, text):
+        """The ``num_hashes`` smallest shingle hashes of ``text``"""
+        return frozenset(heapq.nsmallest(self.num_hashes, shingles(text, self.shingle_size)))
+
+    def similarity(self, first, second):
+        """Estimated Jaccard similarity of two documents from their sketches"""
+        union = heapq.nsmallest(self.num_hashes, first | second)
+        if not union:
+            return 0.0
+        return sum(1 for value in union if value in first and value in second) / len(union)
+
+    def add(self, key, text, scope):
+        """Index ``text`` under ``key`` (e.g. its validation cache key)"""
+        sketch = self.sketch(text)
+        if not sketch:
+            return
+        with self._lock:
+            self._discard(key)
+            self._sketches[key] = (scope, sketch)
+            self._by_scope.setdefault(scope, {})[key] = sketch
+            while len(self._sketches) > self.max_size:
+                self._discard(next(iter(self._sketches)))
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._sketches
+
+    def discard(self, key):
+        """Forget ``key`` (e.g. when its cached result is gone)"""
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key):
+        indexed = self._sketches.pop(key, None)
+        if indexed is not None:
+            scope, _ = indexed
+            documents = self._by_scope[scope]
+            del documents[key]
+            if not documents:
+                del self._by_scope[scope]
+
+    def find(self, text, scope):
+        """
+        The most similar indexed document in ``scope`` at or above the threshold
+
+        Returns:
+            NearDuplicate or None
+        """
+        sketch = self.sketch(text)
+        with self._lock:
+            self.lookups += 1
+            candidates = list(self._by_scope.get(scope, {}).items())
+        if not sketch:
+            return None
+
+        # |A & B| / |A| bounds the estimate from above, so most documents are
+        # ruled out with one set intersection
+        floor = self.threshold * len(sketch)
+        best = None
+        for key, other in candidates:
+            if len(sketch & other) < floor:
+                continue
+            similarity = self.similarity(sketch, other)
+            if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                best = NearDuplicate(key, similarity)
+        if best is not None:
+            with self._lock:
+                self.matches += 1
+        return best
+
+    def get_stats(self):
+        """Index size and lookup counters"""
+        with self._lock:
+            return {
+                'documents': len(self._sketches),
+                'max_size': self.max_size,
+                'threshold': self.threshold,
+                'lookups': self.lookups,
+                'matches': self.matches,
+            }
@@ -0,0 +1,191 @@
+"""
+Fused scanning of a gate's pattern lists
+Patterns that open with the same zero-width anchor (typically ``\\b``) are
+combined into one regex of named lookaheads, so a single pass yields the
+``finditer`` spans of every one of them
+"""
+from __future__ import annotations
+
+import re
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from core.regex_parser import sre_constants, sre_parse
+
+
+Span = Tuple[int, int]
+
+# Leading anchors members of one fused scan can share, by parsed AT code
+_ANCHORS = {
+    sre_constants.AT_BOUNDARY: r'\b',
+    sre_constants.AT_NON_BOUNDARY: r'\B',
+    sre_constants.AT_BEGINNING: '^',
+    sre_constants.AT_BEGINNING_STRING: r'\A',
+}
+_REFERENCES = (sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS)
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+# ``(?i)``-style flags only apply at the start of a whole pattern
+_GLOBAL_FLAGS = re.compile(r'\(\?[aiLmsux]+\)')
+
+
+def _first_chars(items) -> Optional[FrozenSet[str]]:
+    """Literal characters a match of ``items`` can start with; None if not a small literal set."""
+    for op, av in items:
+        if op is sre_constants.AT:
+            continue
+        if op is sre_constants.LITERAL:
+            return frozenset(chr(av))
+        if op is sre_constants.IN:
+            if any(item_op is not sre_constants.LITERAL for item_op, _ in av):
+                return None
+            return frozenset(chr(value) for _, value in av)
+        if op is sre_constants.SUBPATTERN:
+            return _first_chars(av[3])
+        if op is sre_constants.BRANCH:
+            chars = set()
+            for branch in av[1]:
+                first = _first_chars(branch)
+                if first is None:
+                    return None
+                chars |= first
+            return frozenset(chars)
+        if op in _REPEATS and av[0] >= 1:
+            return _first_chars(av[2])
+        return None
+    return None
+
+
+def _references(items) -> bool:
+    """True if ``items`` refers back to a group (renumbering would break it)."""
+    for op, av in items:
+        if op in _REFERENCES:
+            return True
+        for value in av if isinstance(av, (tuple, list)) else (av,):
+            nested = value if isinstance(value, list) else [value]
+            if any(isinstance(sub, sre_parse.SubPattern) and _references(sub) for sub in nested):
+                return True
+    return False
+
+
+def fusion_lane(pattern: str, flags: int = 0) -> Optional[Tuple[str, FrozenSet[str]]]:
+    """
+    ``(anchor, first characters)`` if ``pattern`` can join a fused scan
+
+    Candidates open with a zero-width anchor followed by a known set of
+    literal first characters, cannot match the empty string, and have no
+    named groups, backreferences or inline global flags.
+    """
+    if _GLOBAL_FLAGS.match(pattern):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    if parsed.state.groupdict or _references(parsed) or parsed.getwidth()[0] == 0:
+        return None
+    items = list(parsed)
+    if not items or items[0][0] is not sre_constants.AT or items[0][1] not in _ANCHORS:
+        return None
+    first = _first_chars(items[1:])
+    if not first:
+        return None
+    return _ANCHORS[items[0][1]], first
+
+
+class FusedPatterns:
+    """
+    Named pattern groups of a gate, scanned in as few passes as possible
+
+    Members sharing a leading anchor form a lane: one regex made of the
+    anchor, a class of the members' first characters and a named lookahead
+    per member, so most positions are rejected in two opcodes instead of
+    once per pattern. Each lane match reports every member matching at
+    that position, and candidates overlapping a member's previous match are
+    dropped exactly as ``finditer`` drops them. The remaining members (and
+    lanes of one) are scanned on their own: a literal first character lets
+    the engine skip ahead, which a lookahead would defeat.
+    """
+
+    def __init__(self, groups: Dict[str, Sequence[str]], flags: int = 0, registry=None) -> None:
+        """
+        Args:
+            groups: ``{name: [pattern, ...]}``; ``scan`` reports spans in the same shape
+            flags: Regex flags shared by every pattern
+            registry: PatternRegistry to compile and scan with (plain ``re`` if None)
+        """
+        self.groups = {name: tuple(patterns) for name, patterns in groups.items()}
+        self.flags = int(flags)
+        self._compile: Callable = registry.compile if registry is not None else re.compile
+        self._finditer: Callable = registry.finditer if registry is not None else re.finditer
+        self._members = [pattern for patterns in self.groups.values() for pattern in patterns]
+
+        lanes: Dict[str, List[int]] = {}
+        firsts: Dict[int, FrozenSet[str]] = {}
+        for index, pattern in enumerate(self._members):
+            lane = fusion_lane(pattern, self.flags)
+            if lane is not None:
+                lanes.setdefault(lane[0], []).append(index)
+                firsts[index] = lane[1]
+
+        self._lanes: List[Tuple[re.Pattern, List[Tuple[int, int]]]] = []
+        fused = set()
+        for anchor, indexes in lanes.items():
+            if len(indexes) < 2:
+                continue
+            chars = sorted(set().union(*(firsts[index] for index in indexes)))
+            source = anchor + '(?=[' + ''.join(re.escape(char) for char in chars) + '])'
+            source += ''.join(f'(?=(?P<m{index}>{self._members[index]})|)' for index in indexes)
+            # Succeed only where at least one member matched
+            condition = '(?!)'
+            for index in reversed(indexes):
+                condition = f'(?(m{index})|{condition})'
+            try:
+                compiled = self._compile(source + condition, self.flags)
+            except re.error:
+                continue
+            self._lanes.append((compiled, [(index, compiled.groupindex[f'm{index}']) for index in indexes]))
+            fused.update(indexes)
+        self._single = [index for index in range(len(self._members)) if index not in fused]
+
+    @property
+    def passes(self) -> int:
+        """Scans over the text per ``scan`` (one per pattern without fusion)."""
+        return len(self._lanes) + len(self._single)
+
+    def scan(self, text: str) -> Dict[str, List[List[Span]]]:
+        """
+        Spans each pattern's ``finditer`` would yield on ``text``
+
+        Returns:
+            dict: ``{group name: [[(start, end), ...] per pattern]}``
+        """
+        spans: List[Optional[List[Span]]] = [None] * len(self._members)
+        for compiled, members in self._lanes:
+            found: List[List[Span]] = [[] for _ in members]
+            ends = [0] * len(members)
+            for match in self._finditer(compiled, text):
+                for slot, (_, group) in enumerate(members):
+                    start, end = match.span(group)
+                    # start is -1 for members that did not match here
+                    if start >= ends[slot]:
+                        found[slot].append((start, end))
+                        ends[slot] = end
+            for (index, _), member_spans in zip(members, found):
+                spans[index] = member_spans
+        for index in self._single:
+            spans[index] = [m.span() for m in self._finditer(self._members[index], text, self.flags)]
+
+        result: Dict[str, List[List[Span]]] = {}
+        position = 0
+        for name, patterns in self.groups.items():
+            result[name] = spans[position:position + len(patterns)]
+            position += len(patterns)
+        return result
+
+    def get_stats(self):
+        """Pattern and pass counts."""
+        return {
+            'patterns': len(self._members),
+            'fused': len(self._members) - len(self._single),
+            'lanes': len(self._lanes),
+            'passes': self.passes,
+        }
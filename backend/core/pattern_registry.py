@@ -0,0 +1,353 @@
+"""
+Central registry of precompiled gate regexes
+Compiles each unique (pattern, flags) pair once and shares it across gates
+"""
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+from core.block_memo import BlockMatchMemo
+from core.gate_introspection import extract_fused_groups, extract_patterns
+from core.pattern_fusion import FusedPatterns
+from core.regex_backends import BackendPattern, RegexBackend
+
+
+PatternKey = Tuple[str, int]
+
+
+class PatternPlan:
+    """
+    Unique patterns of the gates about to run on one document
+
+    A pattern registered for two or more of those gates is shared: its
+    matches are computed once per bound string and every later search,
+    finditer or findall is answered from that list. Patterns only one gate
+    uses are run directly, since a full match list would cost more than the
+    single ``search`` it may replace.
+    """
+
+    def __init__(self, gate_handles: Dict[str, List[int]], compiled: List[Pattern]) -> None:
+        counts = Counter(handle for handles in gate_handles.values() for handle in set(handles))
+        self.gates = len(gate_handles)
+        self.unique = len(counts)
+        self.references = sum(counts.values())
+        self.shared = frozenset(compiled[handle] for handle, count in counts.items() if count > 1)
+        self.searches = 0
+        self.runs = 0
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[tuple, threading.Event] = {}
+
+    def get_stats(self):
+        """Plan size and how many searches the shared results answered."""
+        with self._lock:
+            return {
+                'gates': self.gates,
+                'unique_patterns': self.unique,
+                'pattern_references': self.references,
+                'shared_patterns': len(self.shared),
+                'searches': self.searches,
+                'shared_runs': self.runs,
+                'searches_avoided': self.hits,
+            }
+
+
+class PatternRegistry:
+    """
+    Deduplicating cache of compiled patterns, addressed by integer handle.
+
+    Unlike the ``re`` module's internal cache it is unbounded, so mixed-module
+    traffic with more unique patterns than ``re._MAXCACHE`` never recompiles.
+    The module-level helpers (``search``, ``finditer``, ...) mirror the ``re``
+    API so gates can switch over without restructuring their pattern lists.
+    ``search``, ``finditer`` and ``findall`` on long documents go through the
+    optional BlockMatchMemo, which reuses matches of unchanged paragraphs.
+    ``fuse`` plans a gate's pattern lists into as few scans as possible.
+    While a DocumentContext is bound with ``bind``, patterns shared by the
+    running gates are matched once and served from ``ctx.matches``.
+    Patterns are compiled by a pluggable ``backend`` (stdlib ``re`` unless
+    one from ``core.regex_backends`` is given or set with ``set_backend``).
+    """
+
+    def __init__(self, block_memo: Optional[BlockMatchMemo] = None,
+                 backend: Optional[RegexBackend] = None) -> None:
+        self.block_memo = block_memo
+        self.backend = backend if backend is not None else RegexBackend()
+        self._handles: Dict[PatternKey, int] = {}
+        self._compiled: List[Pattern] = []
+        self._by_key: Dict[PatternKey, Pattern] = {}
+        self._gate_handles: Dict[str, List[int]] = {}
+        self._fused: Dict[tuple, FusedPatterns] = {}
+        self._bound: Dict[int, tuple] = {}  # {id(string): (string, ctx, plan)}
+        self._lock = threading.Lock()
+
+        self.compiles = 0
+        self.compile_seconds = 0.0
+        self.registrations = 0
+        self.deduplicated = 0
+        self.misses = 0
+        self.errors = 0
+        # Per-thread hit cells: compile() counts a hit without taking the lock
+        self._local = threading.local()
+        self._hit_cells: List[List[int]] = []
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def register(self, pattern: str, flags: int = 0) -> int:
+        """Compile ``pattern`` if unseen and return its handle."""
+        key = (pattern, int(flags))
+        with self._lock:
+            self.registrations += 1
+            handle = self._handles.get(key)
+            if handle is not None:
+                self.deduplicated += 1
+                return handle
+            return self._compile_locked(key)
+
+    def _compile_locked(self, key: PatternKey) -> int:
+        start = time.perf_counter()
+        compiled = self.backend.compile(key[0], key[1])
+        self.compile_seconds += time.perf_counter() - start
+        self.compiles += 1
+
+        handle = len(self._compiled)
+        self._compiled.append(compiled)
+        self._handles[key] = handle
+        self._by_key[key] = compiled
+        return handle
+
+    def set_backend(self, backend: RegexBackend) -> None:
+        """Recompile every registered pattern with ``backend``, keeping their handles."""
+        with self._lock:
+            self.backend = backend
+            for key, handle in self._handles.items():
+                compiled = backend.compile(key[0], key[1])
+                self._compiled[handle] = compiled
+                self._by_key[key] = compiled
+            # Fused scans hold patterns compiled by the previous backend
+            self._fused.clear()
+
+    def register_gate(self, module_id: str, gate_id: str, gate_obj) -> List[int]:
+        """
+        Precompile every regex literal found in a gate's source, and plan its fused scans.
+
+        Returns:
+            list: Handles for the gate's patterns (also kept for ``gate_handles``)
+        """
+        handles = []
+        for pattern, flags in extract_patterns(gate_obj):
+            try:
+                handles.append(self.register(pattern, flags))
+            except re.error:
+                # Literal that is not a regex (e.g. a message string in the same list)
+                self.errors += 1
+        for groups, flags in extract_fused_groups(gate_obj):
+            self.fuse(groups, flags)
+        self._gate_handles[f"{module_id}.{gate_id}"] = handles
+        return handles
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def get(self, handle: int) -> Pattern:
+        """Return the compiled pattern for ``handle``."""
+        return self._compiled[handle]
+
+    def handle(self, pattern: str, flags: int = 0) -> int:
+        """Return the handle for a pattern, registering it on first use."""
+        handle = self._handles.get((pattern, int(flags)))
+        return handle if handle is not None else self.register(pattern, flags)
+
+    def gate_handles(self, full_gate_id: str) -> List[int]:
+        """Handles registered for ``module.gate``."""
+        return list(self._gate_handles.get(full_gate_id, []))
+
+    def compile(self, pattern, flags: int = 0) -> Pattern:
+        """Drop-in for ``re.compile`` backed by the registry."""
+        if isinstance(pattern, (re.Pattern, BackendPattern)):
+            return pattern
+        compiled = self._by_key.get((pattern, flags))
+        if compiled is not None:
+            self._count_hit()
+            return compiled
+        with self._lock:
+            self.misses += 1
+        return self._compiled[self.register(pattern, flags)]
+
+    def _count_hit(self) -> None:
+        cell = getattr(self._local, 'hits', None)
+        if cell is None:
+            cell = self._local.hits = [0]
+            with self._lock:
+                self._hit_cells.append(cell)
+        cell[0] += 1
+
+    @property
+    def hits(self) -> int:
+        """``compile`` lookups answered from the registry, summed over threads."""
+        with self._lock:
+            return sum(cell[0] for cell in self._hit_cells)
+
+    def fuse(self, groups: Dict[str, Sequence[str]], flags: int = 0) -> FusedPatterns:
+        """Fused scanner for named pattern lists, planned once per distinct set."""
+        key = (tuple((name, tuple(patterns)) for name, patterns in groups.items()), int(flags))
+        fused = self._fused.get(key)
+        if fused is None:
+            fused = FusedPatterns(groups, flags, registry=self)
+            with self._lock:
+                fused = self._fused.setdefault(key, fused)
+        return fused
+
+    # ------------------------------------------------------------------
+    # Per-document plans
+    # ------------------------------------------------------------------
+    def plan(self, full_gate_ids) -> PatternPlan:
+        """Execution plan over the registered patterns of ``module.gate`` ids."""
+        return PatternPlan({gate_id: self._gate_handles.get(gate_id, []) for gate_id in full_gate_ids},
+                           self._compiled)
+
+    @contextmanager
+    def bind(self, ctx, plan: PatternPlan):
+        """
+        Share ``plan``'s patterns on ``ctx.text`` and ``ctx.lower`` while active.
+
+        Strings are recognised by identity, so only gates handed this
+        context (or its text) read the shared results. Process workers
+        do not see the binding and search on their own.
+        """
+        strings = [ctx.text, ctx.lower]
+        with self._lock:
+            for string in strings:
+                self._bound[id(string)] = (string, ctx, plan)
+        try:
+            yield plan
+        finally:
+            with self._lock:
+                for string in strings:
+                    bound = self._bound.get(id(string))
+                    if bound is not None and bound[0] is string:
+                        del self._bound[id(string)]
+
+    def bound_context(self, string):
+        """The DocumentContext ``string`` is bound to, if any."""
+        bound = self._bound.get(id(string)) if self._bound else None
+        return bound[1] if bound is not None and bound[0] is string else None
+
+    def _shared_matches(self, compiled: Pattern, string) -> Optional[list]:
+        """Every match of ``compiled`` in a bound string if the plan shares it, else None."""
+        bound = self._bound.get(id(string))
+        if bound is None or bound[0] is not string:
+            return None
+        _, ctx, plan = bound
+        key = (compiled, id(string))
+        with plan._lock:
+            plan.searches += 1
+            if compiled not in plan.shared:
+                return None
+            matches = ctx.matches.get(key)
+            pending = None
+            if matches is None:
+                pending = plan._pending.get(key)
+                if pending is None:
+                    plan._pending[key] = threading.Event()
+            if matches is not None or pending is not None:
+                plan.hits += 1
+        if pending is not None:
+            # Another gate is computing this pattern right now
+            pending.wait()
+            return ctx.matches.get(key)
+        if matches is None:
+            try:
+                matches = list(self._finditer(compiled, string))
+            finally:
+                with plan._lock:
+                    if matches is not None:
+                        ctx.matches[key] = matches
+                        plan.runs += 1
+                    event = plan._pending.pop(key)
+                event.set()
+        return matches
+
+    def _finditer(self, compiled: Pattern, string):
+        if self.block_memo is not None and isinstance(string, str):
+            return self.block_memo.finditer(compiled, string)
+        return compiled.finditer(string)
+
+    def search(self, pattern, string, flags=0):
+        compiled = self.compile(pattern, flags)
+        matches = self._shared_matches(compiled, string) if self._bound else None
+        if matches is not None:
+            return matches[0] if matches else None
+        if self.block_memo is not None and isinstance(string, str):
+            return self.block_memo.search(compiled, string)
+        return compiled.search(string)
+
+    def match(self, pattern, string, flags=0):
+        return self.compile(pattern, flags).match(string)
+
+    def fullmatch(self, pattern, string, flags=0):
+        return self.compile(pattern, flags).fullmatch(string)
+
+    def finditer(self, pattern, string, flags=0):
+        compiled = self.compile(pattern, flags)
+        matches = self._shared_matches(compiled, string) if self._bound else None
+        if matches is not None:
+            return iter(matches)
+        return self._finditer(compiled, string)
+
+    def findall(self, pattern, string, flags=0):
+        compiled = self.compile(pattern, flags)
+        matches = self._shared_matches(compiled, string) if self._bound else None
+        if matches is not None:
+            if compiled.groups == 0:
+                return [m.group() for m in matches]
+            if compiled.groups == 1:
+                return [m.group(1) or '' for m in matches]
+            return [m.groups('') for m in matches]
+        if self.block_memo is not None and isinstance(string, str):
+            return self.block_memo.findall(compiled, string)
+        return compiled.findall(string)
+
+    def split(self, pattern, string, maxsplit=0, flags=0):
+        return self.compile(pattern, flags).split(string, maxsplit)
+
+    def sub(self, pattern, repl, string, count=0, flags=0):
+        return self.compile(pattern, flags).sub(repl, string, count)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def get_stats(self):
+        """Compile and lookup counters."""
+        hits = self.hits
+        lookups = hits + self.misses
+        return {
+            'patterns': len(self._compiled),
+            'gates': len(self._gate_handles),
+            'fused_sets': len(self._fused),
+            'compiles': self.compiles,
+            'compile_ms': round(self.compile_seconds * 1000, 2),
+            'registrations': self.registrations,
+            'deduplicated': self.deduplicated,
+            'invalid_literals': self.errors,
+            'lookups': lookups,
+            'hits': hits,
+            'misses': self.misses,
+            'hit_rate': round(hits / lookups * 100, 2) if lookups else 0,
+            're_cache_limit': getattr(re, '_MAXCACHE', None),
+            'block_memo': self.block_memo.get_stats() if self.block_memo is not None else None,
+            'backend': self.backend.get_stats(),
+        }
+
+
+# Global pattern registry instance
+pattern_registry = PatternRegistry(block_memo=BlockMatchMemo())
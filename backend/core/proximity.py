@@ -0,0 +1,315 @@
+"""
+Proximity matching over per-term position lists
+Answers "term A near term B" from one scan per term instead of backtracking ``A.*B``
+"""
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.document_context import DocumentContext
+from core.pattern_registry import PatternRegistry, pattern_registry
+from core.regex_parser import sre_constants, sre_parse
+
+
+Span = Tuple[int, int]
+
+_INLINE_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+_NEWLINE = ord('\n')
+# Class categories without line breaks
+_LINE_CATEGORIES = frozenset((sre_constants.CATEGORY_DIGIT, sre_constants.CATEGORY_WORD,
+                              sre_constants.CATEGORY_NOT_SPACE))
+_REPEATS = tuple(getattr(sre_constants, name) for name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                 if hasattr(sre_constants, name))
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)  # Python 3.11+
+
+
+def split_chain(pattern: str, flags: int = 0) -> Optional[List[List[str]]]:
+    """
+    Decompose ``A.*B.*C|D`` into its alternatives' term lists.
+
+    Returns ``[['A', 'B', 'C'], ['D']]``, or None when the pattern has no
+    top-level ``.*`` gap or cannot be split safely: verbose mode, inline
+    flags (they would only apply to the first term), possessive gaps, a
+    term that does not compile on its own (e.g. a backreference across
+    terms), a term that can match the empty string, a term with its own
+    unbounded ``.`` repeat, or a term before the last whose matches vary
+    in length (``re`` could backtrack it to a shorter match that leaves
+    room for the next term, as ``hours?.*s`` does on "hours") or, outside
+    DOTALL, can span a line break (a later match could then be the only
+    one on the next term's line).
+    """
+    if not isinstance(pattern, str) or flags & re.VERBOSE or _INLINE_FLAGS.search(pattern):
+        return None
+
+    alternatives: List[List[str]] = [[]]
+    term: List[str] = []
+    depth = 0
+    split = False
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == '\\':
+            term.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if char == '[':
+            # Copy the whole class; a leading ']' (after an optional '^') is literal
+            end = i + 1
+            if end < n and pattern[end] == '^':
+                end += 1
+            if end < n and pattern[end] == ']':
+                end += 1
+            while end < n and pattern[end] != ']':
+                end += 2 if pattern[end] == '\\' else 1
+            term.append(pattern[i:end + 1])
+            i = end + 1
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif depth == 0 and char == '|':
+            alternatives[-1].append(''.join(term))
+            alternatives.append([])
+            term = []
+            i += 1
+            continue
+        elif depth == 0 and pattern.startswith('.*', i):
+            end = i + 3 if pattern.startswith('.*?', i) else i + 2
+            if end < n and pattern[end] in '+*?{':
+                return None
+            alternatives[-1].append(''.join(term))
+            term = []
+            split = True
+            i = end
+            continue
+        term.append(char)
+        i += 1
+    alternatives[-1].append(''.join(term))
+
+    if not split:
+        return None
+    chains = []
+    for terms in alternatives:
+        terms = [t for t in terms if t]
+        for position, t in enumerate(terms, 1):
+            try:
+                parsed = sre_parse.parse(t, flags)
+                re.compile(t, flags)
+            except re.error:
+                return None
+            low, high = parsed.getwidth()
+            if low == 0 or _has_open_wildcard(parsed):
+                return None
+            if position < len(terms) and (low != high or (not flags & re.DOTALL and _may_match_newline(parsed))):
+                return None
+        chains.append(terms)
+    return chains
+
+
+def _has_open_wildcard(subpattern) -> bool:
+    """True if a parsed pattern repeats ``.`` without an upper bound anywhere."""
+    for op, value in subpattern:
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            low, high, body = value
+            if high == sre_constants.MAXREPEAT and any(item[0] == sre_constants.ANY for item in body):
+                return True
+            if _has_open_wildcard(body):
+                return True
+        elif op == sre_constants.BRANCH:
+            if any(_has_open_wildcard(branch) for branch in value[1]):
+                return True
+        elif op in (sre_constants.SUBPATTERN, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if _has_open_wildcard(value[-1]):
+                return True
+    return False
+
+
+def _may_match_newline(subpattern) -> bool:
+    """True if a parsed pattern could consume a line break (erring towards True)."""
+    for op, value in subpattern:
+        if op == sre_constants.LITERAL:
+            if value == _NEWLINE:
+                return True
+        elif op == sre_constants.NOT_LITERAL:
+            if value != _NEWLINE:
+                return True
+        elif op == sre_constants.IN:
+            for item, av in value:
+                if (item in (sre_constants.NEGATE, sre_constants.CATEGORY) and av not in _LINE_CATEGORIES
+                        or item == sre_constants.LITERAL and av == _NEWLINE
+                        or item == sre_constants.RANGE and av[0] <= _NEWLINE <= av[1]):
+                    return True
+        elif op in _REPEATS:
+            if _may_match_newline(value[2]):
+                return True
+        elif op == sre_constants.BRANCH:
+            if any(_may_match_newline(branch) for branch in value[1]):
+                return True
+        elif op == sre_constants.SUBPATTERN:
+            if _may_match_newline(value[-1]):
+                return True
+        elif op == _ATOMIC_GROUP:
+            if _may_match_newline(value):
+                return True
+        elif op in (sre_constants.GROUPREF_EXISTS, sre_constants.CATEGORY):
+            return True
+    return False
+
+
+class Proximity:
+    """
+    Ordered and unordered proximity tests backed by match position lists.
+
+    Each term is scanned once per document (searches through the pattern
+    registry); the span lists are then walked with bisection, so
+    ``A.*B.*C`` costs linear scans plus ``O(|A| log n)`` lookups instead of
+    the regex engine's quadratic-or-worse backtracking on long lines. While
+    a DocumentContext is bound to the registry the lists are kept in
+    ``ctx.matches`` and shared by every gate of the request.
+    """
+
+    def __init__(self, registry: Optional[PatternRegistry] = None) -> None:
+        self.registry = registry if registry is not None else pattern_registry
+        self._chains: Dict[Tuple[str, int], Optional[List[List[str]]]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Position lists
+    # ------------------------------------------------------------------
+    def positions(self, term: str, text: str, flags: int = 0) -> List[Span]:
+        """
+        Spans of every match of ``term`` in ``text`` by start, overlapping ones included.
+
+        ``finditer`` would skip a match starting inside the previous one
+        (``aa`` at 2 in "xaaa"), which may be the one a chain needs.
+        """
+        return self._cached(('proximity', term, int(flags)), text, lambda: self._scan(term, text, flags))
+
+    def _scan(self, term: str, text: str, flags: int) -> List[Span]:
+        compiled = self.registry.compile(term, flags)
+        spans = []
+        match = compiled.search(text)
+        while match is not None:
+            spans.append(match.span())
+            match = compiled.search(text, match.start() + 1)
+        return spans
+
+    def _starts(self, term: str, text: str, flags: int) -> List[int]:
+        return self._cached(('proximity', 'starts', term, int(flags)), text,
+                            lambda: [start for start, _ in self.positions(term, text, flags)])
+
+    def _newlines(self, text: str) -> List[int]:
+        return self._cached(('proximity', '\n'), text,
+                            lambda: [m.start() for m in re.finditer('\n', text)])
+
+    def _sentence_starts(self, text: str) -> List[int]:
+        return self._cached(('proximity', 'sentences'), text,
+                            lambda: [span.start for span in self._context(text).sentences])
+
+    def _context(self, text: str) -> DocumentContext:
+        ctx = self.registry.bound_context(text)
+        return ctx if ctx is not None else DocumentContext(text)
+
+    def _cached(self, key, text: str, compute):
+        ctx = self.registry.bound_context(text)
+        if ctx is None:
+            return compute()
+        key = key + (id(text),)
+        value = ctx.matches.get(key)
+        if value is None:
+            value = ctx.matches[key] = compute()
+        return value
+
+    # ------------------------------------------------------------------
+    # Tests
+    # ------------------------------------------------------------------
+    def follows(self, terms: Sequence[str], text: str, flags: int = 0,
+                within: Optional[int] = None, sentences: Optional[int] = None) -> bool:
+        """
+        True if matches of ``terms`` occur in order without overlapping.
+
+        With no bound this is ``re.search('T1.*T2.*...', text, flags)``
+        provided every term but the last has fixed-width matches (see
+        ``split_chain``): unless ``flags`` has DOTALL, consecutive terms must
+        be on the same line. ``within`` caps each gap in characters and
+        ``sentences`` caps how many sentence boundaries each gap may cross
+        (0 = same sentence).
+        """
+        text = text or ''
+        if not terms:
+            return True
+        spans = []
+        for term in terms:
+            found = self.positions(term, text, flags)
+            if not found:
+                return False
+            spans.append(found)
+        if len(spans) == 1:
+            return True
+
+        starts = [self._starts(term, text, flags) for term in terms]
+        newlines = None if flags & re.DOTALL else self._newlines(text)
+        sentence_starts = self._sentence_starts(text) if sentences is not None else None
+
+        for first in spans[0]:
+            end = first[1]
+            previous_start = first[0]
+            for found, found_starts in zip(spans[1:], starts[1:]):
+                # The earliest next match gives the smallest gap and the earliest end
+                index = bisect.bisect_left(found_starts, end)
+                if index == len(found_starts):
+                    return False
+                start, next_end = found[index]
+                if newlines is not None:
+                    line_break = bisect.bisect_left(newlines, end)
+                    if line_break < len(newlines) and newlines[line_break] < start:
+                        break
+                if within is not None and start - end > within:
+                    break
+                if sentence_starts is not None and (
+                        bisect.bisect_right(sentence_starts, start)
+                        - bisect.bisect_right(sentence_starts, previous_start)) > sentences:
+                    break
+                end, previous_start = next_end, start
+            else:
+                return True
+        return False
+
+    def near(self, first: str, second: str, text: str, flags: int = 0,
+             within: Optional[int] = None, sentences: Optional[int] = None) -> bool:
+        """True if ``first`` and ``second`` match, in either order, within the given distance."""
+        return (self.follows((first, second), text, flags, within, sentences)
+                or self.follows((second, first), text, flags, within, sentences))
+
+    def around(self, term: str, text: str, start: int, end: int, within: int, flags: int = 0) -> bool:
+        """True if a match of ``term`` lies entirely inside ``text[start - within:end + within]``."""
+        found = self.positions(term, text or '', flags)
+        low, high = max(0, start - within), end + within
+        index = bisect.bisect_left(found, (low, -1))
+        return index < len(found) and found[index][1] <= high
+
+    def occurs(self, pattern: str, text: str, flags: int = 0) -> bool:
+        """
+        ``bool(re.search(pattern, text, flags))`` for any pattern.
+
+        Top-level ``A.*B`` chains (and alternations of them) that
+        ``split_chain`` accepts are answered with ``follows``; any other
+        pattern is searched as usual.
+        """
+        key = (pattern, int(flags))
+        chains = self._chains.get(key, False)
+        if chains is False:
+            chains = split_chain(pattern, flags)
+            with self._lock:
+                self._chains[key] = chains
+        if chains is None:
+            return self.registry.search(pattern, text, flags) is not None
+        return any(self.follows(terms, text, flags) for terms in chains)
+
+
+# Global instance sharing the global pattern registry
+proximity = Proximity()
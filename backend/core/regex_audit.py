@@ -0,0 +1,267 @@
+"""
+ReDoS audit of gate and analyzer regexes
+Fuzzes every statically known pattern with long adversarial inputs and ranks worst-case cost
+"""
+from __future__ import annotations
+
+import math
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.gate_introspection import extract_module_patterns, extract_patterns
+from core.regex_parser import sre_constants, sre_parse
+
+
+PatternKey = Tuple[str, int]
+
+# Representative characters for parser categories
+_CATEGORY_CHARS = {
+    sre_constants.CATEGORY_DIGIT: '1',
+    sre_constants.CATEGORY_NOT_DIGIT: 'a',
+    sre_constants.CATEGORY_SPACE: ' ',
+    sre_constants.CATEGORY_NOT_SPACE: 'a',
+    sre_constants.CATEGORY_WORD: 'a',
+    sre_constants.CATEGORY_NOT_WORD: ' ',
+    sre_constants.CATEGORY_LINEBREAK: '\n',
+    sre_constants.CATEGORY_NOT_LINEBREAK: 'a',
+}
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+_REPEATS.update(getattr(sre_constants, name) for name in ('POSSESSIVE_REPEAT',) if hasattr(sre_constants, name))
+_GROUPS = {sre_constants.SUBPATTERN}
+_GROUPS.update(getattr(sre_constants, name) for name in ('ATOMIC_GROUP',) if hasattr(sre_constants, name))
+_FALLBACK_CHARS = ' a1-.,'
+
+
+def collect_patterns(modules: Optional[Dict[str, object]] = None,
+                     analyzers: Iterable = ()) -> Dict[PatternKey, List[str]]:
+    """
+    Map every statically known ``(pattern, flags)`` to the places that use it.
+
+    Args:
+        modules: ``{module_name: module_obj}`` as held by the engine
+        analyzers: Plain Python modules (e.g. ``analyzers.pii_scanner``)
+
+    Returns:
+        dict: ``{(pattern, flags): ['module.gate' | 'analyzers.x', ...]}``;
+        literals that do not compile are left out
+    """
+    sources: Dict[PatternKey, List[str]] = {}
+    found: List[Tuple[str, List[PatternKey]]] = []
+    for module_name, module_obj in (modules or {}).items():
+        for gate_id, gate_obj in getattr(module_obj, 'gates', {}).items():
+            found.append((f"{module_name}.{gate_id}", extract_patterns(gate_obj)))
+    for analyzer in analyzers:
+        found.append((analyzer.__name__, extract_module_patterns(analyzer)))
+
+    for source, patterns in found:
+        for key in patterns:
+            try:
+                re.compile(*key)
+            except re.error:
+                continue
+            users = sources.setdefault(key, [])
+            if source not in users:
+                users.append(source)
+    return sources
+
+
+def _class_char(items) -> Optional[str]:
+    """A character matched by a ``[...]`` class."""
+    if items and items[0][0] == sre_constants.NEGATE:
+        excluded = set()
+        for op, value in items[1:]:
+            if op == sre_constants.LITERAL:
+                excluded.add(chr(value))
+            elif op == sre_constants.RANGE:
+                excluded.update(chr(c) for c in range(value[0], value[1] + 1))
+            elif op == sre_constants.CATEGORY:
+                excluded.add(_CATEGORY_CHARS.get(value, ''))
+        return next((c for c in _FALLBACK_CHARS + 'bxz' if c not in excluded), None)
+    for op, value in items:
+        if op == sre_constants.LITERAL:
+            return chr(value)
+        if op == sre_constants.RANGE:
+            return chr(value[0])
+        if op == sre_constants.CATEGORY and value in _CATEGORY_CHARS:
+            return _CATEGORY_CHARS[value]
+    return None
+
+
+def _emit(subpattern, groups: Dict[int, str]) -> str:
+    """Shortest plausible text for a parsed subpattern (optional parts taken once)."""
+    out = []
+    for op, value in subpattern:
+        if op == sre_constants.LITERAL:
+            out.append(chr(value))
+        elif op == sre_constants.NOT_LITERAL:
+            out.append('a' if chr(value) != 'a' else 'b')
+        elif op == sre_constants.ANY:
+            out.append(' ')
+        elif op == sre_constants.IN:
+            out.append(_class_char(value) or '')
+        elif op == sre_constants.BRANCH:
+            out.append(_emit(value[1][0], groups))
+        elif op in _GROUPS:
+            body = value[-1]
+            text = _emit(body, groups)
+            if op == sre_constants.SUBPATTERN and value[0] is not None:
+                groups[value[0]] = text
+            out.append(text)
+        elif op in _REPEATS:
+            low, high, body = value
+            count = low if high == 0 else max(low, 1)
+            out.append(_emit(body, groups) * min(count, 64))
+        elif op == sre_constants.GROUPREF:
+            out.append(groups.get(value, ''))
+        # AT, ASSERT, ASSERT_NOT and GROUPREF_EXISTS consume nothing
+    return ''.join(out)
+
+
+def witness(pattern: str, flags: int = 0) -> str:
+    """
+    A short string ``pattern`` matches, or '' when none could be built.
+
+    Generated from the parse tree by taking every optional part once and the
+    first branch of each alternation; the result is checked against the
+    compiled pattern rather than trusted.
+    """
+    try:
+        compiled = re.compile(pattern, flags)
+        text = _emit(sre_parse.parse(pattern, flags), {})
+    except (re.error, RecursionError, TypeError, ValueError):
+        return ''
+    return text if text and compiled.search(text) else ''
+
+
+def _fill(unit: str, size: int) -> str:
+    """Repeat ``unit`` on one line (no newlines, so ``.`` keeps running) up to ``size`` characters."""
+    unit = unit.replace('\n', ' ') or ' '
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def adversarial_inputs(pattern: str, flags: int, size: int) -> Dict[str, str]:
+    """
+    Long single-line inputs likely to expose super-linear matching.
+
+    ``repeat`` packs matches back to back; ``truncated`` and ``half`` repeat
+    a witness cut short, so every start position opens a partial match that
+    fails only after scanning on (the ``A.*B`` worst case); the remaining
+    inputs are uniform fills for character-class loops.
+    """
+    inputs = {
+        'letters': _fill('a', size),
+        'digits': _fill('1', size),
+        'spaces': _fill(' ', size),
+        'mixed': _fill('a1 -', size),
+    }
+    sample = witness(pattern, flags)
+    if sample:
+        inputs['repeat'] = _fill(sample + ' ', size)
+        if len(sample) > 1:
+            inputs['truncated'] = _fill(sample[:-1] + ' ', size)
+            inputs['half'] = _fill(sample[:len(sample) // 2] + ' ', size)
+    return inputs
+
+
+def time_pattern(compiled: re.Pattern, text: str, min_time: float = 0.002) -> float:
+    """Fastest of the runs that find every match of ``compiled`` in ``text`` within ``min_time`` seconds."""
+    best, elapsed = math.inf, 0.0
+    while elapsed < min_time:
+        start = time.perf_counter()
+        for _ in compiled.finditer(text):
+            pass
+        run = time.perf_counter() - start
+        best, elapsed = min(best, run), elapsed + run
+    return best
+
+
+class RegexAuditor:
+    """
+    Worst-case latency of patterns on adversarial inputs of a target size.
+
+    Each pattern is probed with every adversarial input at ``probe_size``;
+    the slowest input is then grown by ``growth`` per step up to
+    ``target_size``. Growth between steps (seeded from one smaller run)
+    gives a scaling exponent. A step projected to exceed ``ceiling`` seconds
+    is not run, and once a run takes ``trusted_time`` growth stops as soon as
+    the projection to ``target_size`` exceeds ``ceiling``; the time is then
+    reported as projected, so a cubic pattern costs a second to audit rather
+    than hours.
+    """
+
+    def __init__(self, target_size: int = 1024 * 1024, probe_size: int = 1024,
+                 growth: int = 4, ceiling: float = 1.0) -> None:
+        self.target_size = target_size
+        self.probe_size = min(probe_size, target_size)
+        self.growth = growth
+        self.ceiling = ceiling
+        # Shorter runs are too noisy to project an exponent across many sizes
+        self.trusted_time = ceiling / 100
+
+    def _worst_input(self, compiled: re.Pattern, pattern: str, flags: int) -> Tuple[str, float]:
+        timings = {
+            kind: time_pattern(compiled, text)
+            for kind, text in adversarial_inputs(pattern, flags, self.probe_size).items()
+        }
+        kind = max(timings, key=timings.get)
+        return kind, timings[kind]
+
+    def measure(self, pattern: str, flags: int = 0) -> Dict[str, object]:
+        """
+        Time one pattern's worst input at ``target_size``.
+
+        Returns:
+            dict: input kind, size reached, seconds at target size, ms per KB,
+            scaling exponent and whether the time was projected
+        """
+        compiled = re.compile(pattern, flags)
+        kind, seconds = self._worst_input(compiled, pattern, flags)
+        size, exponent = self.probe_size, 1.0
+        if size >= self.growth:
+            # Seed the exponent from a smaller run so a steep pattern is not grown blindly
+            smaller = time_pattern(compiled, adversarial_inputs(pattern, flags, size // self.growth)[kind])
+            exponent = max(1.0, math.log(seconds / smaller) / math.log(self.growth))
+
+        while size < self.target_size:
+            if seconds >= self.trusted_time and seconds * (self.target_size / size) ** exponent > self.ceiling:
+                break
+            next_size = min(size * self.growth, self.target_size)
+            if seconds * (next_size / size) ** exponent > self.ceiling:
+                break
+            next_seconds = time_pattern(compiled, adversarial_inputs(pattern, flags, next_size)[kind])
+            exponent = max(1.0, math.log(next_seconds / seconds) / math.log(next_size / size))
+            size, seconds = next_size, next_seconds
+
+        projected = size < self.target_size
+        if projected:
+            seconds *= (self.target_size / size) ** exponent
+        return {
+            'pattern': pattern,
+            'flags': flags,
+            'input': kind,
+            'measured_size': size,
+            'seconds': seconds,
+            'ms_per_kb': seconds * 1000 / (self.target_size / 1024),
+            'exponent': round(exponent, 2),
+            'projected': projected,
+        }
+
+    def worst_case(self, pattern: str, flags: int = 0, attempts: int = 3) -> Dict[str, object]:
+        """``measure``, retried while over ``ceiling`` so a scheduler stall is not reported as ReDoS."""
+        row = self.measure(pattern, flags)
+        for _ in range(attempts - 1):
+            if row['seconds'] <= self.ceiling:
+                break
+            row = min(row, self.measure(pattern, flags), key=lambda r: r['seconds'])
+        return row
+
+    def audit(self, patterns: Dict[PatternKey, List[str]]) -> List[Dict[str, object]]:
+        """Measure every pattern and rank them by worst-case ms per KB, slowest first."""
+        report = []
+        for (pattern, flags), sources in patterns.items():
+            row = self.worst_case(pattern, flags)
+            row['sources'] = list(sources)
+            report.append(row)
+        report.sort(key=lambda row: row['ms_per_kb'], reverse=True)
+        return report
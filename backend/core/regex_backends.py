@@ -0,0 +1,293 @@
+"""
+Pluggable regex engines for the pattern registry
+The stdlib ``re`` by default; RE2 (linear time) or the ``regex`` module (per-call timeouts) when installed
+"""
+from __future__ import annotations
+
+import re
+import threading
+import unicodedata
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+try:  # google-re2 (or any binding exposing re2.compile)
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import regex
+except ImportError:
+    regex = None
+
+from core.regex_parser import sre_constants, sre_parse
+
+
+# Non-ASCII characters every engine treats alike: not word, digit or space
+# characters and without case (curly quotes, dashes, currency signs, ...)
+_PORTABLE_CATEGORIES = frozenset(('Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po', 'Sm', 'Sc', 'Sk', 'So'))
+# Escapes whose meaning on non-ASCII text differs between engines
+_UNICODE_CLASSES = re.compile(r'\\[wWdDsSbB]')
+# ASCII controls ``re`` counts as ``\s`` and other engines may not
+_AMBIGUOUS_ASCII = re.compile('[\x0b\x1c-\x1f]')
+_INLINE_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's'}
+_FLAG_NAMES = ('IGNORECASE', 'LOCALE', 'MULTILINE', 'DOTALL', 'UNICODE', 'VERBOSE', 'ASCII')
+
+_last_checked = (None, True)
+
+
+def portable(text) -> bool:
+    """
+    True if no engine can read ``text`` differently from ``re``.
+
+    Every non-ASCII character must be punctuation or a symbol, since
+    letters, digits, spaces and marks fall in or out of ``\\w``/``\\d``/``\\s``
+    and case folding by engine, and the ASCII controls only ``re`` treats as
+    spaces must be absent. The last answer is kept, as every gate asks
+    about the same document.
+    """
+    global _last_checked
+    if not isinstance(text, str):
+        return False
+    checked, answer = _last_checked
+    if checked is text:
+        return answer
+    if text.isascii():
+        answer = _AMBIGUOUS_ASCII.search(text) is None
+    else:
+        answer = _AMBIGUOUS_ASCII.search(text) is None and all(
+            unicodedata.category(char) in _PORTABLE_CATEGORIES for char in set(text) if not char.isascii())
+    _last_checked = (text, answer)
+    return answer
+
+
+def _nodes(parsed):
+    """Every (op, value) of a parsed pattern, nested groups included."""
+    for op, value in parsed:
+        yield op, value
+        for item in value if isinstance(value, (tuple, list)) else (value,):
+            if isinstance(item, sre_parse.SubPattern):
+                yield from _nodes(item)
+            elif isinstance(item, list):
+                for branch in item:
+                    if isinstance(branch, sre_parse.SubPattern):
+                        yield from _nodes(branch)
+
+
+class UnsupportedPattern(Exception):
+    """The backend cannot run this pattern with ``re``'s semantics."""
+
+
+class RegexBackend:
+    """
+    The stdlib ``re`` engine, and the interface alternate engines implement.
+
+    ``compile`` returns an object with ``re.Pattern``'s interface; patterns
+    ``re`` rejects raise ``re.error`` under every backend.
+    """
+
+    name = 'stdlib'
+    available = True
+
+    def compile(self, pattern: str, flags: int = 0):
+        return re.compile(pattern, flags)
+
+    def get_stats(self):
+        """Backend name and how many patterns it runs itself."""
+        return {'backend': self.name}
+
+
+class BackendPattern:
+    """
+    A pattern compiled by an alternate engine, behind ``re.Pattern``'s interface.
+
+    ``pattern``, ``flags``, ``groups`` and ``groupindex`` come from the stdlib
+    compile. Methods the engine does not take over, and text it could read
+    differently (see ``portable``) when the pattern uses ``\\w``-style
+    classes, word boundaries or case folding, go to the stdlib pattern, as
+    do ``pos``/``endpos`` calls when the engine reads the bounds differently.
+    """
+
+    def __init__(self, stdlib: re.Pattern, engine, methods: frozenset, options: Dict[str, object],
+                 bounded: bool = True) -> None:
+        self.stdlib = stdlib
+        self.engine = engine
+        self.methods = methods
+        self.options = options
+        # Whether the engine reads pos/endpos as re does (^, $ and \b at the bounds)
+        self.bounded = bounded
+        self.pattern = stdlib.pattern
+        self.flags = stdlib.flags
+        self.groups = stdlib.groups
+        self.groupindex = stdlib.groupindex
+        self.unicode_sensitive = bool(
+            not stdlib.flags & re.ASCII
+            and (stdlib.flags & re.IGNORECASE or _UNICODE_CLASSES.search(stdlib.pattern)
+                 or not stdlib.pattern.isascii())
+        )
+
+    def __repr__(self) -> str:
+        return f"BackendPattern({self.pattern!r}, {self.flags})"
+
+    def _use_engine(self, method: str, string, bounds: bool = False) -> bool:
+        return (method in self.methods and (self.bounded or not bounds)
+                and (not self.unicode_sensitive or portable(string)))
+
+    def _call(self, method: str, string, *args):
+        if self._use_engine(method, string, bool(args)):
+            return getattr(self.engine, method)(string, *args, **self.options)
+        return getattr(self.stdlib, method)(string, *args)
+
+    def search(self, string, *args):
+        return self._call('search', string, *args)
+
+    def match(self, string, *args):
+        return self._call('match', string, *args)
+
+    def fullmatch(self, string, *args):
+        return self._call('fullmatch', string, *args)
+
+    def finditer(self, string, *args):
+        return self._call('finditer', string, *args)
+
+    def findall(self, string, *args):
+        return self._call('findall', string, *args)
+
+    def split(self, string, maxsplit=0):
+        return self._call('split', string, maxsplit)
+
+    def sub(self, repl, string, count=0):
+        if self._use_engine('sub', string):
+            return self.engine.sub(repl, string, count, **self.options)
+        return self.stdlib.sub(repl, string, count)
+
+
+class _EngineBackend(RegexBackend, ABC):
+    """An installed engine, used per pattern where it can match ``re`` exactly."""
+
+    methods = frozenset()
+    bounded = True
+
+    def __init__(self) -> None:
+        self.engine_patterns = 0
+        self.fallbacks = 0
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _engine_compile(self, stdlib: re.Pattern, flags: int):
+        """
+        Compile ``stdlib``'s pattern with the engine.
+
+        Raises:
+            UnsupportedPattern (or the engine's own error): the pattern stays on ``re``
+        """
+
+    def _options(self) -> Dict[str, object]:
+        return {}
+
+    def compile(self, pattern: str, flags: int = 0):
+        stdlib = re.compile(pattern, flags)
+        if not isinstance(pattern, str):
+            return stdlib
+        try:
+            engine = self._engine_compile(stdlib, flags)
+        except Exception:
+            # Construct the engine lacks (lookaround, backreference, ...): per-pattern fallback
+            with self._lock:
+                self.fallbacks += 1
+            return stdlib
+        with self._lock:
+            self.engine_patterns += 1
+        return BackendPattern(stdlib, engine, self.methods, self._options(), self.bounded)
+
+    def get_stats(self):
+        with self._lock:
+            return {'backend': self.name, 'engine_patterns': self.engine_patterns, 'fallbacks': self.fallbacks}
+
+
+class RE2Backend(_EngineBackend):
+    """
+    RE2: guaranteed linear-time matching, no backtracking constructs.
+
+    Patterns with lookaround, backreferences, conditionals, possessive or
+    atomic groups, verbose or locale flags, ``\\Z``, or ``$`` outside
+    multiline mode (RE2's ``$`` ignores a final newline) stay on ``re``.
+    Only searches without ``pos``/``endpos`` take the engine (RE2 keeps
+    the text outside the bounds as context); ``sub`` and ``split`` keep
+    ``re``'s replacement-template semantics.
+    """
+
+    name = 're2'
+    available = re2 is not None
+    methods = frozenset(('search', 'match', 'fullmatch', 'finditer', 'findall'))
+    bounded = False
+
+    def _engine_compile(self, stdlib: re.Pattern, flags: int):
+        if stdlib.flags & (re.VERBOSE | re.LOCALE) or '{,' in stdlib.pattern:
+            raise UnsupportedPattern(stdlib.pattern)
+        multiline = stdlib.flags & re.MULTILINE
+        for op, value in _nodes(sre_parse.parse(stdlib.pattern, flags)):
+            if op == sre_constants.AT and value == sre_constants.AT_END and not multiline:
+                raise UnsupportedPattern(stdlib.pattern)
+        prefix = ''.join(letter for flag, letter in _INLINE_FLAGS.items() if flags & flag)
+        return re2.compile(f"(?{prefix}){stdlib.pattern}" if prefix else stdlib.pattern)
+
+
+class RegexModuleBackend(_EngineBackend):
+    """
+    The ``regex`` module (``re``-compatible VERSION0) with a per-call timeout.
+
+    Matching still backtracks, but a call running past ``timeout`` seconds
+    raises ``TimeoutError`` instead of holding a worker; the engine reports
+    the gate as ERROR and the rest of the document proceeds.
+    """
+
+    name = 'regex'
+    available = regex is not None
+    methods = frozenset(('search', 'match', 'fullmatch', 'finditer', 'findall', 'split', 'sub'))
+
+    def __init__(self, timeout: Optional[float] = 1.0) -> None:
+        super().__init__()
+        self.timeout = timeout
+
+    def _engine_compile(self, stdlib: re.Pattern, flags: int):
+        # Flag bits differ between the modules (regex.ASCII is re.DEBUG's bit)
+        translated = regex.VERSION0
+        for name in _FLAG_NAMES:
+            if flags & getattr(re, name):
+                translated |= getattr(regex, name)
+        return regex.compile(stdlib.pattern, translated)
+
+    def _options(self) -> Dict[str, object]:
+        return {'timeout': self.timeout} if self.timeout is not None else {}
+
+
+BACKENDS = {backend.name: backend for backend in (RegexBackend, RE2Backend, RegexModuleBackend)}
+# Preference order for 'auto'
+_AUTO_ORDER = ('re2', 'regex', 'stdlib')
+
+
+def available_backends() -> List[str]:
+    """Names of the backends whose engine is installed."""
+    return [name for name, backend in BACKENDS.items() if backend.available]
+
+
+def create_backend(name: str = 'stdlib', timeout: Optional[float] = 1.0) -> RegexBackend:
+    """
+    Instantiate a backend by name.
+
+    Args:
+        name: 'stdlib', 're2', 'regex', or 'auto' for the first installed of re2, regex, stdlib
+        timeout: Per-call limit in seconds for the ``regex`` backend (None disables it)
+
+    Raises:
+        ValueError: Unknown backend, or its engine is not installed
+    """
+    if name == 'auto':
+        name = next(candidate for candidate in _AUTO_ORDER if BACKENDS[candidate].available)
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"regex backend must be one of auto, {', '.join(BACKENDS)}")
+    if not backend.available:
+        raise ValueError(f"regex backend '{name}' is not installed")
+    return backend(timeout=timeout) if backend is RegexModuleBackend else backend()
@@ -0,0 +1,11 @@
+"""
+The stdlib regex parser on every supported Python
+``re`` moved ``sre_parse`` and ``sre_constants`` to private submodules in 3.11
+"""
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+__all__ = ['sre_constants', 'sre_parse']
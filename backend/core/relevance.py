@@ -0,0 +1,175 @@
+"""
+One-pass gate relevance prefilter
+Scans a document once for every gate's relevance keywords
+"""
+from __future__ import annotations
+
+import re
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from core.document_context import DocumentContext
+from core.gate_introspection import relevance_keywords
+
+
+class KeywordAutomaton:
+    """
+    Multi-keyword matcher in the style of Aho-Corasick.
+
+    Keywords are merged into a trie which is compiled into a single regular
+    expression, so the scan runs in the ``re`` engine's C loop rather than a
+    Python per-character loop. A zero-width lookahead tries the trie at every
+    offset and captures the longest keyword starting there; the shorter
+    keywords sharing that start are recovered from the trie's prefix closure.
+    The result equals ``{kw for kw in keywords if kw in text}``.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: FrozenSet[str] = frozenset(kw for kw in keywords if kw)
+        self._prefixes: Dict[str, FrozenSet[str]] = {
+            kw: frozenset(kw[:i] for i in range(1, len(kw) + 1) if kw[:i] in self.keywords)
+            for kw in self.keywords
+        }
+        self._regex = re.compile(f'(?=({self._trie_pattern()}))') if self.keywords else None
+
+    def _trie_pattern(self) -> str:
+        root: Dict[str, dict] = {}
+        for keyword in self.keywords:
+            node = root
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def build(node: Dict[str, dict]) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            if '' in node:
+                # Keyword ends here: the longer continuation is optional (greedy, so longest wins)
+                body = f'(?:{body})?' if len(branches) == 1 else f'{body}?'
+            return body
+
+        return build(root)
+
+    def scan(self, text: str) -> Set[str]:
+        """Return every keyword occurring in ``text``."""
+        if self._regex is None or not text:
+            return set()
+        found: Set[str] = set()
+        for longest in set(self._regex.findall(text)):
+            found.update(self._prefixes[longest])
+        return found
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+class RelevanceScan:
+    """Relevance of every registered gate for one document."""
+
+    def __init__(self, index: 'RelevanceIndex', matched: Set[str]) -> None:
+        self._index = index
+        self.matched = matched
+
+    def is_relevant(self, module_id: str, gate_id: str) -> bool:
+        """False only when the gate is provably N/A for this document."""
+        keywords = self._index.keywords_for(f"{module_id}.{gate_id}")
+        return keywords is None or not self.matched.isdisjoint(keywords)
+
+    def relevant_gates(self, module_id: str, gate_ids: Iterable[str]) -> List[str]:
+        return [gate_id for gate_id in gate_ids if self.is_relevant(module_id, gate_id)]
+
+    def summary(self, modules: Dict[str, object]) -> Dict[str, object]:
+        """Relevant modules and the number of gates that can be skipped."""
+        relevant_modules = []
+        skipped = 0
+        for module_id, module in modules.items():
+            gate_ids = list(getattr(module, 'gates', {}))
+            relevant = self.relevant_gates(module_id, gate_ids)
+            skipped += len(gate_ids) - len(relevant)
+            if relevant:
+                relevant_modules.append(module_id)
+        return {
+            'keywords_matched': len(self.matched),
+            'relevant_modules': relevant_modules,
+            'gates_skipped': skipped,
+        }
+
+
+class RelevanceIndex:
+    """
+    Union keyword automaton over the relevance checks of all loaded gates.
+
+    Each gate's ``_is_relevant`` is analysed statically (see
+    ``gate_introspection.relevance_keywords``) for a set of keywords at least
+    one of which must appear for the gate to apply. Gates whose relevance
+    cannot be bounded that way are always executed.
+    """
+
+    def __init__(self) -> None:
+        self._keywords: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._payloads: Dict[Tuple[str, str], Optional[dict]] = {}
+        self._automaton: Optional[KeywordAutomaton] = None
+        self._lock = threading.Lock()
+
+    def register_gate(self, module_id: str, gate_id: str, gate_obj) -> Optional[FrozenSet[str]]:
+        """Record a gate's relevance keywords (None if it must always run)."""
+        keywords = relevance_keywords(gate_obj)
+        with self._lock:
+            self._keywords[f"{module_id}.{gate_id}"] = keywords
+            self._automaton = None
+        return keywords
+
+    def keywords_for(self, full_gate_id: str) -> Optional[FrozenSet[str]]:
+        return self._keywords.get(full_gate_id)
+
+    @property
+    def automaton(self) -> KeywordAutomaton:
+        automaton = self._automaton
+        if automaton is None:
+            with self._lock:
+                if self._automaton is None:
+                    self._automaton = KeywordAutomaton(
+                        kw for keywords in self._keywords.values() if keywords for kw in keywords
+                    )
+                automaton = self._automaton
+        return automaton
+
+    def scan(self, ctx: DocumentContext) -> RelevanceScan:
+        """One pass over the lower-cased document for all gates' keywords."""
+        return RelevanceScan(self, self.automaton.scan(ctx.lower))
+
+    def not_applicable(self, module_id: str, gate_id: str, gate_obj, document_type: str) -> Optional[dict]:
+        """
+        The N/A payload the gate itself returns when it is not relevant.
+
+        Obtained once per document type by running the gate on empty text,
+        which cannot contain any relevance keyword. Returns None (and stops
+        skipping the gate) if the gate does not answer N/A.
+        """
+        key = (f"{module_id}.{gate_id}", document_type)
+        if key not in self._payloads:
+            try:
+                payload = gate_obj.check('', document_type)
+            except Exception:
+                payload = None
+            if not (isinstance(payload, dict) and str(payload.get('status', '')).upper() in ('N/A', 'NA')):
+                payload = None
+                with self._lock:
+                    self._keywords[key[0]] = None
+            self._payloads[key] = payload
+        payload = self._payloads[key]
+        return dict(payload) if payload is not None else None
+
+    def get_stats(self) -> Dict[str, int]:
+        bounded = sum(1 for keywords in self._keywords.values() if keywords is not None)
+        return {
+            'gates': len(self._keywords),
+            'prefiltered_gates': bounded,
+            'keywords': len(self.automaton),
+        }
+
+
+# Global relevance index instance
+relevance_index = RelevanceIndex()
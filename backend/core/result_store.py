@@ -0,0 +1,188 @@
+"""
+Persistent store of validation results
+Keeps encoded results across restarts so ValidationCache can be warmed
+with the most requested documents at boot
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from core.cache import CachedResult
+from core.gate_registry import gate_registry
+
+
+def ruleset_fingerprint(active_modules):
+    """
+    Digest of the registered gate versions of ``active_modules``
+
+    A stored result is only reused while this matches, so bumping a gate
+    version retires every result that gate contributed to.
+    """
+    gates = sorted(
+        f"{gate_id}@{info.version}"
+        for module_id in sorted(active_modules or [])
+        for gate_id, info in gate_registry.get_module_gates(module_id).items()
+        if info.active
+    )
+    return hashlib.sha256('\n'.join(gates).encode()).hexdigest()[:16]
+
+
+class ResultStore:
+    """
+    SQLite table of encoded validation results, keyed like ValidationCache
+
+    Rows carry the document hash, document type and module set they were
+    validated with, how often they were requested (validated or served
+    from the cache), and the gate-version fingerprint of those modules.
+    ``hottest`` yields the most requested rows whose fingerprint still
+    matches the loaded gates.
+    """
+
+    def __init__(self, db_path='data/results.db', max_entries=5000, touch_batch=100):
+        """
+        Args:
+            db_path: SQLite file (created if missing)
+            max_entries: Rows kept; the least requested (then least recent) are dropped
+            touch_batch: Buffered ``touch`` calls written together
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.touch_batch = touch_batch
+        self._touched = Counter()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5.0)
+
+    def _init_db(self):
+        conn = self._connect()
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS results (
+                    cache_key TEXT PRIMARY KEY,
+                    document_hash TEXT NOT NULL,
+                    document_type TEXT,
+                    modules TEXT,
+                    ruleset TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    risk TEXT,
+                    gzipped INTEGER NOT NULL DEFAULT 0,
+                    hits INTEGER NOT NULL DEFAULT 1,
+                    last_seen REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_results_heat ON results(hits DESC, last_seen DESC)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def record(self, cache_key, text, document_type, active_modules, entry):
+        """
+        Store (or refresh) the result ``entry`` for ``cache_key``
+
+        Recording an existing key replaces its body and counts one more hit.
+        """
+        self.flush()
+        modules = sorted(active_modules or [])
+        document_hash = hashlib.sha256((text or '').encode()).hexdigest()
+        conn = self._connect()
+        try:
+            conn.execute('''
+                INSERT INTO results
+                (cache_key, document_hash, document_type, modules, ruleset, body, risk, gzipped, hits, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    ruleset = excluded.ruleset, body = excluded.body, risk = excluded.risk,
+                    gzipped = excluded.gzipped, hits = hits + 1, last_seen = excluded.last_seen
+            ''', (cache_key, document_hash, document_type, json.dumps(modules), ruleset_fingerprint(modules),
+                  entry.body, entry.risk, int(entry.gzipped), time.time()))
+            count = conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+            if count > self.max_entries:
+                conn.execute('''
+                    DELETE FROM results WHERE cache_key IN (
+                        SELECT cache_key FROM results ORDER BY hits ASC, last_seen ASC LIMIT ?
+                    )
+                ''', (count - self.max_entries,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def touch(self, cache_key):
+        """
+        Count one more hit for ``cache_key``, served without validating it again
+
+        Cache hits are the hot path, so counts are buffered and written
+        every ``touch_batch`` calls, and before the table is read or
+        written here; a crash loses at most one batch.
+        """
+        with self._lock:
+            self._touched[cache_key] += 1
+            self._pending += 1
+            due = self._pending >= self.touch_batch
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered ``touch`` counts"""
+        with self._lock:
+            touched, self._touched, self._pending = self._touched, Counter(), 0
+        if not touched:
+            return
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.executemany('UPDATE results SET hits = hits + ?, last_seen = ? WHERE cache_key = ?',
+                             [(count, now, cache_key) for cache_key, count in touched.items()])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def hottest(self, limit):
+        """
+        Yield ``(cache_key, CachedResult)`` for up to ``limit`` hottest current rows
+
+        Rows validated under other gate versions are skipped.
+        """
+        self.flush()
+        fingerprints = {}
+        conn = self._connect()
+        try:
+            rows = conn.execute('''
+                SELECT cache_key, modules, ruleset, body, risk, gzipped
+                FROM results ORDER BY hits DESC, last_seen DESC
+            ''')
+            yielded = 0
+            for cache_key, modules, ruleset, body, risk, gzipped in rows:
+                if yielded >= limit:
+                    break
+                if modules not in fingerprints:
+                    fingerprints[modules] = ruleset_fingerprint(json.loads(modules or '[]'))
+                if fingerprints[modules] != ruleset:
+                    continue
+                yielded += 1
+                yield cache_key, CachedResult(bytes(body), risk, bool(gzipped))
+        finally:
+            conn.close()
+
+    def get_stats(self):
+        """Row count and total recorded hits"""
+        self.flush()
+        conn = self._connect()
+        try:
+            entries, hits = conn.execute('SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM results').fetchone()
+        finally:
+            conn.close()
+        return {
+            'path': str(self.db_path),
+            'entries': entries,
+            'hits': hits,
+            'max_entries': self.max_entries,
+        }
@@ -3,10 +3,14 @@ Advanced deterministic synthesis engine leveraging universal sanitizer and snipp
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from ..cache import result_signature
+from ..result_store import ruleset_fingerprint
 from .sanitizer import TextSanitizer
 from .snippet_mapper import UniversalSnippetMapper, SnippetPlan
 from .snippets import SnippetRegistry
@@ -33,6 +37,7 @@ class SynthesisEngine:
         validation_engine,
         snippet_registry: Optional[SnippetRegistry] = None,
         audit_logger=None,
+        result_cache=None,
     ) -> None:
         self.engine = validation_engine
         self.registry = snippet_registry or SnippetRegistry()
@@ -40,6 +45,9 @@ class SynthesisEngine:
         self.mapper = UniversalSnippetMapper(self.registry)
         self.max_retries = 5
         self.audit_logger = audit_logger
+        # Synthesis is deterministic: results are cached by everything they depend on
+        self.result_cache = result_cache
+        self._snippets_version = None
 
     def synthesize(
         self,
@@ -54,6 +62,59 @@ class SynthesisEngine:
         start_time = time.time()
         original_text = base_text or ""
         initial_failures = self._extract_failures(validation)
+
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self._result_key(original_text, validation, context, modules)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                self._log_synthesis('synthesize', cached, modules, (time.time() - start_time) * 1000)
+                return cached
+        result = self._synthesize(original_text, validation, initial_failures, context, modules, start_time)
+        if cache_key is not None:
+            self.result_cache.set(cache_key, result)
+        return result
+
+    def _result_key(
+        self,
+        original_text: str,
+        validation: Dict[str, Any],
+        context: Dict[str, Any],
+        modules: List[str],
+    ) -> str:
+        """
+        Cache key: text hash, validation signature, context, modules and versions
+
+        The whole validation (less timestamps) is signed rather than only its
+        failing gates, since a result may return it as ``final_validation``.
+        Re-validation depends on the gate versions of ``modules`` and the
+        drafts on the snippet catalogue, so both are part of the key.
+        """
+        if self._snippets_version is None:
+            catalogue = json.dumps(
+                [getattr(self.registry, 'domain_templates', None), getattr(self.registry, 'module_catalog', None)],
+                sort_keys=True, default=str,
+            )
+            self._snippets_version = hashlib.sha256(catalogue.encode('utf-8')).hexdigest()[:16]
+        return result_signature(
+            hashlib.sha256(original_text.encode('utf-8')).hexdigest(),
+            validation,
+            context,
+            sorted(modules),
+            ruleset_fingerprint(modules),
+            self._snippets_version,
+            self.max_retries,
+        )
+
+    def _synthesize(
+        self,
+        original_text: str,
+        validation: Dict[str, Any],
+        initial_failures: List[Dict[str, Any]],
+        context: Dict[str, Any],
+        modules: List[str],
+        start_time: float,
+    ) -> Dict[str, Any]:
         sanitization_result = self.sanitizer.sanitize(original_text, initial_failures)
         working_text = sanitization_result['sanitized_text']
 
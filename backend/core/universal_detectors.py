@@ -1,15 +1,14 @@
 import re
 import hashlib
+from bisect import bisect_right
+from collections import defaultdict
+
+from analyzers.pii_scanner import find_pii_entities
 
 
 class UniversalDetectors:
     def __init__(self):
         # Precompile patterns that are reused frequently
-        self._ni_pattern = re.compile(r"\b[A-Z]{2}\d{6}[A-Z]\b")
-        self._cc_pattern = re.compile(r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b")
-        self._nhs_pattern = re.compile(r"\b\d{3}[\s-]?\d{3}[\s-]?\d{4}\b")
-        self._email_pattern = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
-
         self._hate_targets = {
             'race': ['black', 'white', 'asian', 'latino', 'jew', 'muslim', 'christian', 'hindu'],
             'gender': ['women', 'men', 'trans', 'transgender', 'non-binary'],
@@ -33,64 +32,84 @@ class UniversalDetectors:
         ]
         self._illegal_patterns = [re.compile(rf"{kw}", re.IGNORECASE) for kw in illegal_keywords]
 
-    def detect_pii(self, text, document_type='unknown'):
-        """Context-aware PII with span locations for highlighting"""
+        # (negation, assertion) pairs; a sentence matching the first contradicts
+        # a later sentence matching the second when both share a subject term
+        contradiction_patterns = [
+            (r"is\s+(?:not|n't)", r"is\s+(?:a|an|the)"),
+            (r"must\s+not", r"must\s+"),
+            (r"never", r"always"),
+            (r"impossible", r"possible"),
+            (r"cannot", r"can\s+")
+        ]
+        self._contradiction_patterns = [
+            (re.compile(neg, re.IGNORECASE), re.compile(pos, re.IGNORECASE))
+            for neg, pos in contradiction_patterns
+        ]
+        self._term_pattern = re.compile(r"[a-z][a-z'-]{2,}")
+        self._term_stopwords = frozenset(
+            'the and for are but not was were has have had this that these those with from into '
+            'than then they them their there what when which while who whom will would shall should '
+            'could can cannot must never always possible impossible any all its our your you his her '
+            'she him been being also may might does did such each other some more most very only just '
+            'over under about after before upon'.split()
+        )
+        self.max_contradictions = 50
+
+    def detect_pii(self, text, document_type='unknown', text_lower=None, entities=None):
+        """
+        Context-aware PII with span locations for highlighting
+
+        Built from the matches of ``analyzers.pii_scanner.find_pii_entities``;
+        a caller that already scanned the text (see core.analysis) passes them
+        as ``entities``, along with ``text_lower``, so the text is scanned once.
+        """
         content = text or ''
+        if entities is None:
+            entities = find_pii_entities(content)
         findings = []
         spans = []
         severity = 'none'
 
-        # National Insurance numbers (ALWAYS CRITICAL)
-        for match in self._ni_pattern.finditer(content):
-            findings.append('National Insurance number detected')
+        def matches(entity_type):
+            return [entity for entity in entities if entity['type'] == entity_type]
+
+        def add(entity, severity_level):
             spans.append({
-                'type': 'ni_number',
-                'start': match.start(),
-                'end': match.end(),
-                'text': match.group(),
-                'severity': 'critical'
+                'type': entity['type'],
+                'start': entity['start'],
+                'end': entity['end'],
+                'text': entity['match'],
+                'severity': severity_level
             })
+
+        # National Insurance numbers (ALWAYS CRITICAL)
+        for entity in matches('ni_number'):
+            findings.append('National Insurance number detected')
+            add(entity, 'critical')
             severity = 'critical'
 
         # Credit card patterns (ALWAYS CRITICAL)
-        for match in self._cc_pattern.finditer(content):
+        for entity in matches('credit_card'):
             findings.append('Credit card-like pattern detected')
-            spans.append({
-                'type': 'credit_card',
-                'start': match.start(),
-                'end': match.end(),
-                'text': match.group(),
-                'severity': 'critical'
-            })
+            add(entity, 'critical')
             severity = 'critical'
 
         # NHS numbers (HIGH)
-        for match in self._nhs_pattern.finditer(content):
+        for entity in matches('nhs_number'):
             findings.append('NHS number-like pattern')
-            spans.append({
-                'type': 'nhs_number',
-                'start': match.start(),
-                'end': match.end(),
-                'text': match.group(),
-                'severity': 'high'
-            })
+            add(entity, 'high')
             if severity == 'none':
                 severity = 'high'
 
         # Context-aware emails (only flag if unexpected)
         expected_contexts = ['privacy_notice', 'contact', 'dpo', 'data protection officer', 'disciplinary', 'hr']
-        is_expected = any(ctx in (document_type or '').lower() or ctx in content.lower()[:200] for ctx in expected_contexts)
+        head_lower = (text_lower if text_lower is not None else content.lower())[:200]
+        is_expected = any(ctx in (document_type or '').lower() or ctx in head_lower for ctx in expected_contexts)
 
         if not is_expected:
-            for match in self._email_pattern.finditer(content):
+            for entity in matches('email'):
                 findings.append('Email address detected')
-                spans.append({
-                    'type': 'email',
-                    'start': match.start(),
-                    'end': match.end(),
-                    'text': match.group(),
-                    'severity': 'medium'
-                })
+                add(entity, 'medium')
                 if severity == 'none':
                     severity = 'medium'
 
@@ -110,34 +129,74 @@ class UniversalDetectors:
             'suggestion': 'Remove or redact sensitive personal information.'
         }
 
+    def _subject_terms(self, sentence):
+        return {
+            term for term in self._term_pattern.findall(sentence.lower())
+            if term not in self._term_stopwords
+        }
+
     def detect_contradictions(self, text):
-        """Basic contradiction detection via negation patterns"""
+        """
+        Contradiction detection via negation patterns
+
+        Each sentence is classified once against the compiled negation and
+        assertion patterns. Candidate pairs come from an index of assertion
+        sentences keyed by subject term, so only sentences that talk about the
+        same thing are compared and the work stays linear in the number of
+        sentences. At most ``max_contradictions`` pairs are reported.
+        """
         content = text or ""
         sentences = content.split('.')
-        contradictions = []
-
-        # Look for explicit contradictions
-        contradiction_patterns = [
-            (r"is\s+(?:not|n't)", r"is\s+(?:a|an|the)"),
-            (r"must\s+not", r"must\s+"),
-            (r"never", r"always"),
-            (r"impossible", r"possible"),
-            (r"cannot", r"can\s+")
+        limit = self.max_contradictions
+
+        negations = []
+        # pattern index -> subject term -> ascending sentence indices
+        assertions = defaultdict(lambda: defaultdict(list))
+        for index, sentence in enumerate(sentences):
+            negated = [k for k, (neg, _) in enumerate(self._contradiction_patterns) if neg.search(sentence)]
+            asserted = [k for k, (_, pos) in enumerate(self._contradiction_patterns) if pos.search(sentence)]
+            if not negated and not asserted:
+                continue
+            terms = self._subject_terms(sentence)
+            if negated and terms:
+                negations.append((index, negated, terms))
+            for k in asserted:
+                for term in terms:
+                    assertions[k][term].append(index)
+
+        pairs = []
+        truncated = False
+        for index, negated, terms in negations:
+            remaining = limit - len(pairs)
+            candidates = set()
+            for k in negated:
+                by_term = assertions.get(k)
+                if not by_term:
+                    continue
+                for term in terms:
+                    postings = by_term.get(term)
+                    if postings:
+                        # Only later sentences; the first `remaining` of each list suffice
+                        start = bisect_right(postings, index)
+                        candidates.update(postings[start:start + remaining + 1])
+            if not candidates:
+                continue
+            if len(candidates) > remaining:
+                truncated = True
+                pairs.extend((index, other) for other in sorted(candidates)[:remaining])
+                break
+            pairs.extend((index, other) for other in sorted(candidates))
+
+        contradictions = [
+            {'sentence_1': sentences[i].strip(), 'sentence_2': sentences[j].strip()}
+            for i, j in pairs
         ]
 
-        for i, sent1 in enumerate(sentences):
-            for sent2 in sentences[i + 1:]:
-                for neg_pattern, pos_pattern in contradiction_patterns:
-                    if re.search(neg_pattern, sent1, re.IGNORECASE) and re.search(pos_pattern, sent2, re.IGNORECASE):
-                        contradictions.append({
-                            'sentence_1': sent1.strip(),
-                            'sentence_2': sent2.strip()
-                        })
-
         return {
             'status': 'FAIL' if contradictions else 'PASS',
             'severity': 'high' if contradictions else 'none',
             'contradictions': contradictions,
+            'truncated': truncated,
             'message': f"Found {len(contradictions)} potential contradictions" if contradictions else 'No contradictions detected'
         }
 
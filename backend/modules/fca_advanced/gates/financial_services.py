@@ -1,5 +1,8 @@
 import re
 
+from core.pattern_registry import pattern_registry
+from core.proximity import proximity
+
 
 class FinancialServicesGate:
     """
@@ -44,10 +47,10 @@ class FinancialServicesGate:
             r'register\.fca\.org\.uk'
         ]
 
-        has_authorisation = any(re.search(p, text, re.IGNORECASE) for p in authorisation_patterns)
+        has_authorisation = any(proximity.occurs(p, text, re.IGNORECASE) for p in authorisation_patterns)
 
         # Check for FRN (should be 6 digits)
-        frn_match = re.search(r'(?:FRN|firm\s+reference\s+number)[:\s]*(\d+)', text, re.IGNORECASE)
+        frn_match = pattern_registry.search(r'(?:FRN|firm\s+reference\s+number)[:\s]*(\d+)', text, re.IGNORECASE)
         if frn_match:
             frn = frn_match.group(1)
             if len(frn) != 6:
@@ -71,7 +74,7 @@ class FinancialServicesGate:
             'relations_regulators': r'relations?\s+(?:with|between).*(?:FCA|regulator)'
         }
 
-        principles_found = sum(1 for p in principles.values() if re.search(p, text, re.IGNORECASE))
+        principles_found = sum(1 for p in principles.values() if proximity.occurs(p, text, re.IGNORECASE))
 
         # Good practice to reference principles
 
@@ -84,7 +87,7 @@ class FinancialServicesGate:
             r'vulnerable\s+customers?'
         ]
 
-        has_consumer_duty = any(re.search(p, text, re.IGNORECASE) for p in consumer_duty_patterns)
+        has_consumer_duty = any(proximity.occurs(p, text, re.IGNORECASE) for p in consumer_duty_patterns)
 
         if has_consumer_duty:
             # Check for four outcomes
@@ -95,7 +98,7 @@ class FinancialServicesGate:
                 'consumer_support': r'(?:consumer\s+)?support\s+outcome'
             }
 
-            outcomes_mentioned = sum(1 for p in four_outcomes.values() if re.search(p, text, re.IGNORECASE))
+            outcomes_mentioned = sum(1 for p in four_outcomes.values() if proximity.occurs(p, text, re.IGNORECASE))
 
             if outcomes_mentioned < 2:
                 warnings.append('Consumer Duty: should address four outcomes - products/services, price/value, understanding, support')
@@ -113,7 +116,7 @@ class FinancialServicesGate:
             r'(?:hold|holding)\s+(?:your\s+)?(?:money|funds)'
         ]
 
-        has_client_money = any(re.search(p, text, re.IGNORECASE) for p in client_money_patterns)
+        has_client_money = any(proximity.occurs(p, text, re.IGNORECASE) for p in client_money_patterns)
 
         if has_client_money:
             # Check for segregation
@@ -124,7 +127,7 @@ class FinancialServicesGate:
                 r'client\s+(?:money|bank)\s+account'
             ]
 
-            has_segregation = any(re.search(p, text, re.IGNORECASE) for p in segregation_patterns)
+            has_segregation = any(proximity.occurs(p, text, re.IGNORECASE) for p in segregation_patterns)
 
             if not has_segregation:
                 issues.append('CRITICAL: Client money must be segregated in separate client bank accounts (CASS 7)')
@@ -136,7 +139,7 @@ class FinancialServicesGate:
                 r'(?:internal|external)\s+reconciliation'
             ]
 
-            has_reconciliation = any(re.search(p, text, re.IGNORECASE) for p in reconciliation_patterns)
+            has_reconciliation = any(proximity.occurs(p, text, re.IGNORECASE) for p in reconciliation_patterns)
 
             if not has_reconciliation:
                 warnings.append('CASS 7: daily reconciliation of client money required')
@@ -149,7 +152,7 @@ class FinancialServicesGate:
                 r'deposit\s+protection'
             ]
 
-            has_fscs = any(re.search(p, text, re.IGNORECASE) for p in fscs_patterns)
+            has_fscs = any(proximity.occurs(p, text, re.IGNORECASE) for p in fscs_patterns)
 
             if not has_fscs:
                 warnings.append('Should inform clients about FSCS protection (up to £85,000 per person per firm)')
@@ -161,7 +164,7 @@ class FinancialServicesGate:
                 r'(?:no\s+longer|not)\s+client\s+money'
             ]
 
-            has_title_transfer = any(re.search(p, text, re.IGNORECASE) for p in title_transfer_patterns)
+            has_title_transfer = any(proximity.occurs(p, text, re.IGNORECASE) for p in title_transfer_patterns)
             # If title transfer, different rules apply
 
         # 5. COMPLAINTS HANDLING (DISP)
@@ -172,7 +175,7 @@ class FinancialServicesGate:
             r'dissatisfied'
         ]
 
-        has_complaints = any(re.search(p, text, re.IGNORECASE) for p in complaints_patterns)
+        has_complaints = any(proximity.occurs(p, text, re.IGNORECASE) for p in complaints_patterns)
 
         if has_complaints:
             # Check for 8-week timeframe
@@ -183,7 +186,7 @@ class FinancialServicesGate:
                 r'final\s+response'
             ]
 
-            has_timeframe = any(re.search(p, text, re.IGNORECASE) for p in timeframe_patterns)
+            has_timeframe = any(proximity.occurs(p, text, re.IGNORECASE) for p in timeframe_patterns)
 
             if not has_timeframe:
                 warnings.append('Complaints: must provide final response within 8 weeks (or explain why not)')
@@ -197,7 +200,7 @@ class FinancialServicesGate:
                 r'0800\s+023\s+4567'
             ]
 
-            has_fos = any(re.search(p, text, re.IGNORECASE) for p in fos_patterns)
+            has_fos = any(proximity.occurs(p, text, re.IGNORECASE) for p in fos_patterns)
 
             if not has_fos:
                 issues.append('CRITICAL: Must inform customers of right to refer complaint to Financial Ombudsman Service')
@@ -209,7 +212,7 @@ class FinancialServicesGate:
                 r'within\s+6\s+months\s+(?:of|from).*final\s+response'
             ]
 
-            has_fos_timeframe = any(re.search(p, text, re.IGNORECASE) for p in fos_timeframe_patterns)
+            has_fos_timeframe = any(proximity.occurs(p, text, re.IGNORECASE) for p in fos_timeframe_patterns)
 
             if has_fos and not has_fos_timeframe:
                 warnings.append('Should inform customers: 6 months to refer to FOS from date of final response')
@@ -229,7 +232,7 @@ class FinancialServicesGate:
             r'capability'
         ]
 
-        has_vulnerable = any(re.search(p, text, re.IGNORECASE) for p in vulnerable_patterns)
+        has_vulnerable = any(proximity.occurs(p, text, re.IGNORECASE) for p in vulnerable_patterns)
 
         if has_vulnerable:
             # Check for four drivers of vulnerability (FG21/1)
@@ -240,7 +243,8 @@ class FinancialServicesGate:
                 'capability': r'(?:low\s+)?(?:financial\s+)?capability'
             }
 
-            drivers_mentioned = sum(1 for p in vulnerability_drivers.values() if re.search(p, text, re.IGNORECASE))
+            drivers_mentioned = sum(1 for p in vulnerability_drivers.values()
+                                    if proximity.occurs(p, text, re.IGNORECASE))
 
             if drivers_mentioned < 2:
                 warnings.append('Vulnerability guidance FG21/1: consider four drivers - health, life events, resilience, capability')
@@ -254,7 +258,7 @@ class FinancialServicesGate:
                 r'flexible\s+(?:approach|arrangements?)'
             ]
 
-            has_adjustments = any(re.search(p, text, re.IGNORECASE) for p in adjustments_patterns)
+            has_adjustments = any(proximity.occurs(p, text, re.IGNORECASE) for p in adjustments_patterns)
 
             if not has_adjustments:
                 warnings.append('Should provide reasonable adjustments and additional support for vulnerable customers')
@@ -271,7 +275,7 @@ class FinancialServicesGate:
             r'inducements?'
         ]
 
-        has_conflicts = any(re.search(p, text, re.IGNORECASE) for p in conflicts_patterns)
+        has_conflicts = any(proximity.occurs(p, text, re.IGNORECASE) for p in conflicts_patterns)
 
         if has_conflicts:
             # Check for management/disclosure
@@ -282,7 +286,7 @@ class FinancialServicesGate:
                 r'declare.*conflicts?'
             ]
 
-            has_management = any(re.search(p, text, re.IGNORECASE) for p in management_patterns)
+            has_management = any(proximity.occurs(p, text, re.IGNORECASE) for p in management_patterns)
 
             if not has_management:
                 warnings.append('Conflicts of interest must be managed and disclosed to clients')
@@ -294,7 +298,7 @@ class FinancialServicesGate:
             r'(?:investment|product)\s+(?:advertis|promotion)'
         ]
 
-        has_promotion = any(re.search(p, text, re.IGNORECASE) for p in promotion_patterns)
+        has_promotion = any(proximity.occurs(p, text, re.IGNORECASE) for p in promotion_patterns)
 
         if has_promotion:
             # Check for fair, clear, not misleading
@@ -305,7 +309,7 @@ class FinancialServicesGate:
                 r'not\s+misleading'
             ]
 
-            has_fcnm = any(re.search(p, text, re.IGNORECASE) for p in fcnm_patterns)
+            has_fcnm = any(proximity.occurs(p, text, re.IGNORECASE) for p in fcnm_patterns)
 
             if not has_fcnm:
                 warnings.append('Financial promotions must be fair, clear and not misleading (COBS 4.2)')
@@ -319,7 +323,7 @@ class FinancialServicesGate:
                 r'not\s+guaranteed'
             ]
 
-            has_risk_warning = any(re.search(p, text, re.IGNORECASE) for p in risk_warnings)
+            has_risk_warning = any(proximity.occurs(p, text, re.IGNORECASE) for p in risk_warnings)
 
             if not has_risk_warning:
                 warnings.append('Financial promotions should include appropriate risk warnings')
@@ -332,7 +336,7 @@ class FinancialServicesGate:
             r'customers?.*(?:fairly|fair\s+outcomes?)'
         ]
 
-        has_tcf = any(re.search(p, text, re.IGNORECASE) for p in tcf_patterns)
+        has_tcf = any(proximity.occurs(p, text, re.IGNORECASE) for p in tcf_patterns)
 
         # TCF is now largely superseded by Consumer Duty
 
@@ -348,7 +352,7 @@ class FinancialServicesGate:
             r'proof\s+of\s+(?:identity|address)'
         ]
 
-        has_kyc = any(re.search(p, text, re.IGNORECASE) for p in kyc_patterns)
+        has_kyc = any(proximity.occurs(p, text, re.IGNORECASE) for p in kyc_patterns)
 
         if has_kyc:
             # Check for documentation requirements
@@ -359,7 +363,7 @@ class FinancialServicesGate:
                 r'verification\s+(?:documents?|checks?)'
             ]
 
-            has_docs = any(re.search(p, text, re.IGNORECASE) for p in docs_patterns)
+            has_docs = any(proximity.occurs(p, text, re.IGNORECASE) for p in docs_patterns)
             # Good to specify required documents
 
         # 11. SUITABILITY AND APPROPRIATENESS (COBS 9 & 10)
@@ -371,7 +375,7 @@ class FinancialServicesGate:
             r'assess.*(?:needs|circumstances|objectives?|risk\s+tolerance)'
         ]
 
-        has_suitability = any(re.search(p, text, re.IGNORECASE) for p in suitability_patterns)
+        has_suitability = any(proximity.occurs(p, text, re.IGNORECASE) for p in suitability_patterns)
 
         if has_suitability:
             # Check for suitability assessment
@@ -383,7 +387,7 @@ class FinancialServicesGate:
                 r'investment\s+(?:objectives?|goals?|time\s+horizon)'
             ]
 
-            assessment_coverage = sum(1 for p in assessment_patterns if re.search(p, text, re.IGNORECASE))
+            assessment_coverage = sum(1 for p in assessment_patterns if proximity.occurs(p, text, re.IGNORECASE))
 
             if assessment_coverage < 2:
                 warnings.append('Suitability assessment should cover: needs, knowledge/experience, financial situation, risk tolerance, objectives')
@@ -397,7 +401,7 @@ class FinancialServicesGate:
             r'product\s+(?:design|approval|review)'
         ]
 
-        has_product_governance = any(re.search(p, text, re.IGNORECASE) for p in product_governance_patterns)
+        has_product_governance = any(proximity.occurs(p, text, re.IGNORECASE) for p in product_governance_patterns)
 
         if has_product_governance:
             # Check for target market definition
@@ -408,7 +412,7 @@ class FinancialServicesGate:
                 r'not\s+suitable\s+for'
             ]
 
-            has_target_market = any(re.search(p, text, re.IGNORECASE) for p in target_market_patterns)
+            has_target_market = any(proximity.occurs(p, text, re.IGNORECASE) for p in target_market_patterns)
 
             if not has_target_market:
                 warnings.append('Product governance: should define target market and who product is/isn\'t suitable for')
@@ -421,7 +425,7 @@ class FinancialServicesGate:
             r'(?:5|five)\s+years?.*(?:records?|documents?)'
         ]
 
-        has_records = any(re.search(p, text, re.IGNORECASE) for p in records_patterns)
+        has_records = any(proximity.occurs(p, text, re.IGNORECASE) for p in records_patterns)
 
         if not has_records:
             warnings.append('FCA requires adequate record-keeping (typically 5+ years)')
@@ -1,5 +1,7 @@
 import re
 
+from core.proximity import proximity
+
 
 class OperationalResilienceGate:
     """
@@ -45,7 +47,7 @@ class OperationalResilienceGate:
             r'key\s+business\s+services?'
         ]
 
-        has_ibs = any(re.search(p, text, re.IGNORECASE) for p in ibs_patterns)
+        has_ibs = any(proximity.occurs(p, text, re.IGNORECASE) for p in ibs_patterns)
 
         if has_ibs:
             # Check for identification/mapping
@@ -56,7 +58,7 @@ class OperationalResilienceGate:
                 r'assessment.*(?:important|critical)'
             ]
 
-            has_identification = any(re.search(p, text, re.IGNORECASE) for p in identification_patterns)
+            has_identification = any(proximity.occurs(p, text, re.IGNORECASE) for p in identification_patterns)
 
             if not has_identification:
                 warnings.append('Must identify and map Important Business Services (IBS) that customers rely on')
@@ -73,7 +75,7 @@ class OperationalResilienceGate:
                 r'portfolio\s+management'
             ]
 
-            has_examples = any(re.search(p, text, re.IGNORECASE) for p in ibs_examples)
+            has_examples = any(proximity.occurs(p, text, re.IGNORECASE) for p in ibs_examples)
             # Good to specify which services are important
 
         else:
@@ -87,7 +89,7 @@ class OperationalResilienceGate:
             r'(?:maximum\s+)?(?:outage|downtime)\s+(?:tolerance|duration)'
         ]
 
-        has_impact_tolerance = any(re.search(p, text, re.IGNORECASE) for p in impact_tolerance_patterns)
+        has_impact_tolerance = any(proximity.occurs(p, text, re.IGNORECASE) for p in impact_tolerance_patterns)
 
         if has_impact_tolerance:
             # Check for time-based tolerances
@@ -98,7 +100,7 @@ class OperationalResilienceGate:
                 r'resume.*within\s+(\d+)'
             ]
 
-            has_time_tolerance = any(re.search(p, text, re.IGNORECASE) for p in time_tolerance_patterns)
+            has_time_tolerance = any(proximity.occurs(p, text, re.IGNORECASE) for p in time_tolerance_patterns)
 
             if not has_time_tolerance:
                 warnings.append('Impact tolerances should specify maximum tolerable disruption time for each IBS')
@@ -111,7 +113,7 @@ class OperationalResilienceGate:
                 r'customer\s+outcomes?'
             ]
 
-            has_customer_impact = any(re.search(p, text, re.IGNORECASE) for p in customer_impact_patterns)
+            has_customer_impact = any(proximity.occurs(p, text, re.IGNORECASE) for p in customer_impact_patterns)
 
             if not has_customer_impact:
                 warnings.append('Impact tolerances must be set with reference to impact on customers')
@@ -128,7 +130,7 @@ class OperationalResilienceGate:
             r'extreme\s+(?:but\s+plausible|events?)'
         ]
 
-        has_scenarios = any(re.search(p, text, re.IGNORECASE) for p in scenario_patterns)
+        has_scenarios = any(proximity.occurs(p, text, re.IGNORECASE) for p in scenario_patterns)
 
         if has_scenarios:
             # Check for types of scenarios
@@ -142,7 +144,7 @@ class OperationalResilienceGate:
                 'data_loss': r'data\s+(?:loss|breach|corruption)'
             }
 
-            scenario_coverage = sum(1 for p in scenario_types.values() if re.search(p, text, re.IGNORECASE))
+            scenario_coverage = sum(1 for p in scenario_types.values() if proximity.occurs(p, text, re.IGNORECASE))
 
             if scenario_coverage < 3:
                 warnings.append('Severe but plausible scenarios should cover: cyber, technology, third parties, people, sites, data loss')
@@ -159,7 +161,7 @@ class OperationalResilienceGate:
             r'disaster\s+recovery\s+test'
         ]
 
-        has_testing = any(re.search(p, text, re.IGNORECASE) for p in testing_patterns)
+        has_testing = any(proximity.occurs(p, text, re.IGNORECASE) for p in testing_patterns)
 
         if has_testing:
             # Check for regular/periodic testing
@@ -170,7 +172,7 @@ class OperationalResilienceGate:
                 r'test\s+(?:schedule|plan|programme)'
             ]
 
-            has_regular_testing = any(re.search(p, text, re.IGNORECASE) for p in regular_testing_patterns)
+            has_regular_testing = any(proximity.occurs(p, text, re.IGNORECASE) for p in regular_testing_patterns)
 
             if not has_regular_testing:
                 warnings.append('Must test operational resilience at least annually')
@@ -184,7 +186,7 @@ class OperationalResilienceGate:
                 r'root\s+cause\s+analysis'
             ]
 
-            has_improvement = any(re.search(p, text, re.IGNORECASE) for p in improvement_patterns)
+            has_improvement = any(proximity.occurs(p, text, re.IGNORECASE) for p in improvement_patterns)
 
             if not has_improvement:
                 warnings.append('Testing should include lessons learned and continuous improvement process')
@@ -201,7 +203,7 @@ class OperationalResilienceGate:
             r'MI\b.*resilience'
         ]
 
-        has_governance = any(re.search(p, text, re.IGNORECASE) for p in governance_patterns)
+        has_governance = any(proximity.occurs(p, text, re.IGNORECASE) for p in governance_patterns)
 
         if has_governance:
             # Check for board-level responsibility
@@ -212,7 +214,7 @@ class OperationalResilienceGate:
                 r'executive\s+(?:sponsor|owner|responsibility)'
             ]
 
-            has_board_responsibility = any(re.search(p, text, re.IGNORECASE) for p in board_patterns)
+            has_board_responsibility = any(proximity.occurs(p, text, re.IGNORECASE) for p in board_patterns)
 
             if not has_board_responsibility:
                 warnings.append('Board and senior management must take accountability for operational resilience')
@@ -228,7 +230,7 @@ class OperationalResilienceGate:
             r'(?:crisis|emergency)\s+(?:management|response)'
         ]
 
-        has_incident = any(re.search(p, text, re.IGNORECASE) for p in incident_patterns)
+        has_incident = any(proximity.occurs(p, text, re.IGNORECASE) for p in incident_patterns)
 
         if has_incident:
             # Check for key components
@@ -241,7 +243,7 @@ class OperationalResilienceGate:
                 'notification': r'notif(?:y|ication).*(?:FCA|regulator)'
             }
 
-            incident_coverage = sum(1 for p in incident_components.values() if re.search(p, text, re.IGNORECASE))
+            incident_coverage = sum(1 for p in incident_components.values() if proximity.occurs(p, text, re.IGNORECASE))
 
             if incident_coverage < 3:
                 warnings.append('Incident management should cover: detection, escalation, communication, response, recovery, regulatory notification')
@@ -259,7 +261,7 @@ class OperationalResilienceGate:
             r'supply\s+chain'
         ]
 
-        has_third_party = any(re.search(p, text, re.IGNORECASE) for p in third_party_patterns)
+        has_third_party = any(proximity.occurs(p, text, re.IGNORECASE) for p in third_party_patterns)
 
         if has_third_party:
             # Check for risk assessment
@@ -270,7 +272,7 @@ class OperationalResilienceGate:
                 r'concentration\s+risk'
             ]
 
-            has_risk_assessment = any(re.search(p, text, re.IGNORECASE) for p in third_party_risk_patterns)
+            has_risk_assessment = any(proximity.occurs(p, text, re.IGNORECASE) for p in third_party_risk_patterns)
 
             if not has_risk_assessment:
                 warnings.append('Must assess and manage third-party and outsourcing risks')
@@ -284,7 +286,7 @@ class OperationalResilienceGate:
                 r'right\s+to\s+audit'
             ]
 
-            has_contracts = any(re.search(p, text, re.IGNORECASE) for p in contract_patterns)
+            has_contracts = any(proximity.occurs(p, text, re.IGNORECASE) for p in contract_patterns)
 
             if not has_contracts:
                 warnings.append('Third-party contracts should include SLAs, audit rights, and exit strategies')
@@ -298,7 +300,7 @@ class OperationalResilienceGate:
                 r'failover'
             ]
 
-            has_substitution = any(re.search(p, text, re.IGNORECASE) for p in substitution_patterns)
+            has_substitution = any(proximity.occurs(p, text, re.IGNORECASE) for p in substitution_patterns)
 
             if not has_substitution:
                 warnings.append('Should consider alternative providers/substitutability for critical third parties')
@@ -315,7 +317,7 @@ class OperationalResilienceGate:
             r'(?:website|social\s+media|email).*(?:update|notification)'
         ]
 
-        has_communication = any(re.search(p, text, re.IGNORECASE) for p in communication_patterns)
+        has_communication = any(proximity.occurs(p, text, re.IGNORECASE) for p in communication_patterns)
 
         if has_communication:
             # Check for timely communication
@@ -326,7 +328,7 @@ class OperationalResilienceGate:
                 r'regular\s+updates?'
             ]
 
-            has_timely = any(re.search(p, text, re.IGNORECASE) for p in timely_patterns)
+            has_timely = any(proximity.occurs(p, text, re.IGNORECASE) for p in timely_patterns)
 
             if not has_timely:
                 warnings.append('Communication plans should emphasize timely customer notification during disruptions')
@@ -343,7 +345,7 @@ class OperationalResilienceGate:
             r'IT\s+security'
         ]
 
-        has_cyber = any(re.search(p, text, re.IGNORECASE) for p in cyber_patterns)
+        has_cyber = any(proximity.occurs(p, text, re.IGNORECASE) for p in cyber_patterns)
 
         if has_cyber:
             # Check for cyber-specific measures
@@ -356,7 +358,7 @@ class OperationalResilienceGate:
                 'patching': r'(?:patch|update).*(?:systems?|software)'
             }
 
-            cyber_coverage = sum(1 for p in cyber_measures.values() if re.search(p, text, re.IGNORECASE))
+            cyber_coverage = sum(1 for p in cyber_measures.values() if proximity.occurs(p, text, re.IGNORECASE))
 
             if cyber_coverage < 3:
                 warnings.append('Cyber resilience should cover: prevention, detection, response, recovery, backups, patching')
@@ -374,7 +376,7 @@ class OperationalResilienceGate:
             r'(?:failover|fail[\s-]over)'
         ]
 
-        has_data_tech = any(re.search(p, text, re.IGNORECASE) for p in data_tech_patterns)
+        has_data_tech = any(proximity.occurs(p, text, re.IGNORECASE) for p in data_tech_patterns)
 
         if has_data_tech:
             # Check for RTO/RPO
@@ -385,7 +387,7 @@ class OperationalResilienceGate:
                 r'Recovery\s+Point\s+Objective[:\s]*(\d+)'
             ]
 
-            has_rto_rpo = any(re.search(p, text, re.IGNORECASE) for p in rto_rpo_patterns)
+            has_rto_rpo = any(proximity.occurs(p, text, re.IGNORECASE) for p in rto_rpo_patterns)
             # Good practice to define RTO/RPO
 
         # 11. MAPPING AND DOCUMENTATION
@@ -396,7 +398,7 @@ class OperationalResilienceGate:
             r'(?:resource|asset)\s+(?:inventory|register)'
         ]
 
-        has_mapping = any(re.search(p, text, re.IGNORECASE) for p in mapping_patterns)
+        has_mapping = any(proximity.occurs(p, text, re.IGNORECASE) for p in mapping_patterns)
 
         if not has_mapping:
             warnings.append('Should map and document processes, dependencies, and resources for each IBS')
@@ -410,7 +412,7 @@ class OperationalResilienceGate:
             r'(?:annual|regular)\s+(?:review|report)'
         ]
 
-        has_reporting = any(re.search(p, text, re.IGNORECASE) for p in reporting_patterns)
+        has_reporting = any(proximity.occurs(p, text, re.IGNORECASE) for p in reporting_patterns)
 
         if not has_reporting:
             warnings.append('Must conduct self-assessment and report to FCA on operational resilience (March 2025)')
@@ -423,7 +425,7 @@ class OperationalResilienceGate:
             r'business\s+recovery'
         ]
 
-        has_bcp = any(re.search(p, text, re.IGNORECASE) for p in bcp_patterns)
+        has_bcp = any(proximity.occurs(p, text, re.IGNORECASE) for p in bcp_patterns)
 
         if has_bcp:
             # Check for key components
@@ -436,7 +438,7 @@ class OperationalResilienceGate:
                 'maintenance': r'(?:maintain|maintenance|review|update)'
             }
 
-            bcp_coverage = sum(1 for p in bcp_components.values() if re.search(p, text, re.IGNORECASE))
+            bcp_coverage = sum(1 for p in bcp_components.values() if proximity.occurs(p, text, re.IGNORECASE))
 
             if bcp_coverage < 3:
                 warnings.append('BCP should cover: risk assessment, recovery strategy, alternative sites, key personnel, testing, maintenance')
@@ -452,7 +454,7 @@ class OperationalResilienceGate:
             r'2025\s+(?:deadline|implementation|compliance)'
         ]
 
-        has_deadline_ref = any(re.search(p, text, re.IGNORECASE) for p in deadline_patterns)
+        has_deadline_ref = any(proximity.occurs(p, text, re.IGNORECASE) for p in deadline_patterns)
 
         if not has_deadline_ref:
             warnings.append('REMINDER: Full operational resilience implementation deadline is 31 March 2025')
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class ClientMoneySegregationGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class ClientMoneySegregationGate:
         self.severity = "critical"
         self.legal_source = "FCA CASS 7 (Client Money Rules)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions holding client money"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'client money', 'client fund', 'customer money', 'deposit',
             'hold', 'holding', 'segregate', 'separate', 'account'
@@ -17,14 +20,18 @@ class ClientMoneySegregationGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not mention holding or handling client money',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         negative_indicators = [
@@ -38,7 +45,7 @@ class ClientMoneySegregationGate:
         ]
 
         for pattern in negative_indicators:
-            match = re.search(pattern, text_lower)
+            match = pattern_registry.search(pattern, text_lower)
             if match:
                 spans.append({
                     'type': 'cass_violation',
@@ -66,7 +73,7 @@ class ClientMoneySegregationGate:
 
         holds_client_money = False
         for pattern in holding_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 holds_client_money = True
                 for m in matches:
@@ -93,7 +100,7 @@ class ClientMoneySegregationGate:
 
         has_segregation = False
         for pattern in segregation_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_segregation = True
                 for m in matches:
@@ -115,7 +122,7 @@ class ClientMoneySegregationGate:
 
         has_cass_ref = False
         for pattern in cass_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_cass_ref = True
                 for m in matches:
@@ -138,7 +145,7 @@ class ClientMoneySegregationGate:
 
         has_protection = False
         for pattern in protection_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_protection = True
                 for m in matches:
@@ -160,7 +167,7 @@ class ClientMoneySegregationGate:
 
         has_reconciliation = False
         for pattern in reconciliation_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_reconciliation = True
                 for m in matches:
@@ -182,7 +189,7 @@ class ClientMoneySegregationGate:
 
         has_violations = []
         for pattern in negative_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 for m in matches:
                     has_violations.append(m.group())
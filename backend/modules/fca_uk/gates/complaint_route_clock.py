@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class ComplaintRouteClockGate:
     def __init__(self):
@@ -7,20 +10,24 @@ class ComplaintRouteClockGate:
         self.severity = "critical"
         self.legal_source = "FCA DISP 1.6 (Complaints Time Limits)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions complaints"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         return 'complaint' in text_lower or 'complain' in text_lower or 'dissatisfied' in text_lower
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not contain complaint handling procedures',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for 8-week time limit mention
@@ -34,7 +41,7 @@ class ComplaintRouteClockGate:
 
         has_eight_week_limit = False
         for pattern in eight_week_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 # Check if it's in context of complaints/response
                 for m in matches:
@@ -62,7 +69,7 @@ class ComplaintRouteClockGate:
 
         has_final_response = False
         for pattern in final_response_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_final_response = True
                 for m in matches:
@@ -87,7 +94,7 @@ class ComplaintRouteClockGate:
 
         has_complaint_method = False
         for pattern in complaint_method_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_complaint_method = True
                 for m in matches:
@@ -100,7 +107,7 @@ class ComplaintRouteClockGate:
                     })
 
         # Check for contact details for complaints
-        has_complaint_contact = any(re.search(pattern, text, re.IGNORECASE) for pattern in [
+        has_complaint_contact = any(pattern_registry.search(pattern, text, re.IGNORECASE) for pattern in [
             r'complaints?\s+(?:department|team|handler)',
             r'(?:email|write\s+to|call).*complaint',
             r'complaint.*(?:@|tel|phone)',
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class ComprehensionAidsGate:
     def __init__(self):
@@ -7,26 +10,30 @@ class ComprehensionAidsGate:
         self.severity = "medium"
         self.legal_source = "FCA PRIN 2A.5 (Consumer Understanding Outcome)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document contains complex information"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         # Look for complex financial terms or lengthy documents
         complex_terms = [
             'derivative', 'leverage', 'portfolio', 'bond', 'equity',
             'maturity', 'yield', 'premium', 'liability', 'covenant',
             'subordinated', 'counterparty', 'collateral'
         ]
-        return any(term in text_lower for term in complex_terms) or len(text) > 1000
+        return any(term in text_lower for term in complex_terms) or len(ctx.text) > 1000
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not contain complex financial information requiring comprehension aids',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
 
         # Check for comprehension aids
         aids = {
@@ -64,7 +71,7 @@ class ComprehensionAidsGate:
 
         for aid_type, patterns in aids.items():
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     if aid_type not in found_aids:
                         found_aids.append(aid_type)
@@ -79,7 +86,7 @@ class ComprehensionAidsGate:
 
         # Check for jargon without explanation
         jargon_pattern = r'\b(?:derivative|amortisation|subordinated|covenant|counterparty|collateral|basis\s+points?|bps)\b'
-        jargon_matches = list(re.finditer(jargon_pattern, text, re.IGNORECASE))
+        jargon_matches = list(pattern_registry.finditer(jargon_pattern, text, re.IGNORECASE))
 
         unexplained_jargon = []
         for m in jargon_matches:
@@ -104,7 +111,7 @@ class ComprehensionAidsGate:
                 })
 
         # Check for overly long sentences (potential comprehension barrier)
-        sentences = re.split(r'[.!?]+', text)
+        sentences = pattern_registry.split(r'[.!?]+', text)
         long_sentences = 0
         for sentence in sentences:
             words = len(sentence.split())
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class ConflictsDeclarationGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class ConflictsDeclarationGate:
         self.severity = "high"
         self.legal_source = "FCA SYSC 10 (Conflicts of Interest)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document involves advice, recommendations, or arrangements"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'advice', 'recommend', 'arrange', 'facilitate', 'introduce',
             'conflict', 'interest', 'impartial', 'independent', 'commission',
@@ -18,14 +21,18 @@ class ConflictsDeclarationGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not provide advice or recommendations requiring conflict disclosure',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check if advice/recommendation is being provided
@@ -39,7 +46,7 @@ class ConflictsDeclarationGate:
 
         provides_advice = False
         for pattern in advice_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 provides_advice = True
                 for m in matches:
@@ -73,7 +80,7 @@ class ConflictsDeclarationGate:
 
         has_conflict_disclosure = False
         for pattern in conflict_disclosure_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_conflict_disclosure = True
                 for m in matches:
@@ -95,7 +102,7 @@ class ConflictsDeclarationGate:
 
         has_policy_reference = False
         for pattern in policy_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_policy_reference = True
                 for m in matches:
@@ -134,7 +141,7 @@ class ConflictsDeclarationGate:
         disclosed_conflicts = {}
         for conflict_type, patterns in specific_conflicts.items():
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     if conflict_type not in disclosed_conflicts:
                         disclosed_conflicts[conflict_type] = []
@@ -157,7 +164,7 @@ class ConflictsDeclarationGate:
 
         claims_independence = False
         for pattern in independence_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 claims_independence = True
                 for m in matches:
@@ -172,7 +179,7 @@ class ConflictsDeclarationGate:
         # Determine status
         issues = []
 
-        priority_allocation = re.search(r'priority\s+allocation', text, re.IGNORECASE)
+        priority_allocation = pattern_registry.search(r'priority\s+allocation', text, re.IGNORECASE)
 
         # Critical: Claims independence but has undisclosed conflicts
         if claims_independence and disclosed_conflicts and not has_conflict_disclosure:
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class CrossCuttingRulesGate:
     def __init__(self):
@@ -7,15 +10,15 @@ class CrossCuttingRulesGate:
         self.severity = "critical"
         self.legal_source = "FCA PRIN 2A.2 (Consumer Duty Cross-Cutting Rules)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """
         Check if document is substantial enough for Consumer Duty cross-cutting rules
         Only applies to full product/service communications with customer impact
         """
-        text_lower = text.lower()
+        text_lower = ctx.lower
 
         # ENHANCED: Reduced minimum length from 200 to 100 chars to catch more cases
-        if len(text) < 100:  # Too short for cross-cutting rules assessment
+        if len(ctx.text) < 100:  # Too short for cross-cutting rules assessment
             return False
 
         # Must be about regulated products/services
@@ -41,14 +44,18 @@ class CrossCuttingRulesGate:
         return has_product and has_decision
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document is too short or does not involve substantial product/customer decisions',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
 
         # Check for the 3 cross-cutting rules
         rules = {
@@ -80,7 +87,7 @@ class CrossCuttingRulesGate:
         for rule_name, patterns in rules.items():
             found = False
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     found = True
                     covered.append(rule_name)
@@ -106,7 +113,7 @@ class CrossCuttingRulesGate:
 
         violations = []
         for pattern, viol_type in negative_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 violations.append(viol_type)
                 for m in matches:
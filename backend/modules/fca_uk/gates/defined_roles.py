@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class DefinedRolesGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class DefinedRolesGate:
         self.severity = "medium"
         self.legal_source = "FCA SYSC 4 & 5 (Senior Management Arrangements)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document describes processes or procedures"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'process', 'procedure', 'responsible', 'accountability',
             'role', 'oversight', 'approve', 'review', 'decision'
@@ -17,14 +20,18 @@ class DefinedRolesGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not describe processes, procedures, or accountability structures',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for Senior Management Function (SMF) references
@@ -39,7 +46,7 @@ class DefinedRolesGate:
 
         has_smf = False
         for pattern in smf_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_smf = True
                 for m in matches:
@@ -62,7 +69,7 @@ class DefinedRolesGate:
 
         has_responsibility = False
         for pattern in responsibility_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_responsibility = True
                 for m in matches:
@@ -85,7 +92,7 @@ class DefinedRolesGate:
 
         has_role_titles = False
         for pattern in role_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_role_titles = True
                 for m in matches:
@@ -107,7 +114,7 @@ class DefinedRolesGate:
 
         has_approval = False
         for pattern in approval_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_approval = True
                 for m in matches:
@@ -130,7 +137,7 @@ class DefinedRolesGate:
 
         has_governance = False
         for pattern in governance_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_governance = True
                 for m in matches:
@@ -158,7 +165,7 @@ class DefinedRolesGate:
 
         has_vague_responsibility = False
         for pattern in vague_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 # Check if it's about responsibility/approval
                 for m in matches:
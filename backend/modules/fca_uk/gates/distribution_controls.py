@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class DistributionControlsGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class DistributionControlsGate:
         self.severity = "medium"
         self.legal_source = "FCA PROD 4 (Product Governance - Distribution)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions distribution or intermediaries"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'distribute', 'distribution', 'intermediary', 'intermediaries',
             'adviser', 'advisor', 'broker', 'agent', 'third party',
@@ -18,14 +21,18 @@ class DistributionControlsGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not describe intermediary or third-party distribution arrangements',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for distribution channel mentions
@@ -39,7 +46,7 @@ class DistributionControlsGate:
 
         has_intermediaries = False
         for pattern in channel_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_intermediaries = True
                 for m in matches:
@@ -92,7 +99,7 @@ class DistributionControlsGate:
         controls_present = {}
         for control_type, patterns in control_patterns.items():
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     if control_type not in controls_present:
                         controls_present[control_type] = []
@@ -119,7 +126,7 @@ class DistributionControlsGate:
 
         has_negative_indicators = False
         for pattern in negative_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_negative_indicators = True
                 for m in matches:
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class FairClearNotMisleadingGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class FairClearNotMisleadingGate:
         self.severity = "critical"
         self.legal_source = "FCA COBS 4.2 (Fair, Clear and Not Misleading)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document is promotional material"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         promo_keywords = [
             'invest', 'return', 'profit', 'gain', 'growth', 'performance',
             'benefit', 'advantage', 'opportunity', 'offer', 'special',
@@ -18,14 +21,18 @@ class FairClearNotMisleadingGate:
         return any(kw in text_lower for kw in promo_keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document is not promotional or does not make financial claims',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for unsubstantiated superlatives
@@ -38,38 +45,57 @@ class FairClearNotMisleadingGate:
             r'\b(?:always|never\s+lose|cannot\s+lose|can\'t\s+lose|zero\s+chance\s+of\s+loss)\b'
         ]
 
+        # Check for emphasis on benefits without risks
+        benefit_patterns = [
+            r'(?:high|significant|attractive|exceptional|outstanding)\s+(?:return|yield|profit|gain|growth|performance)',
+            r'\d+%\s+(?:return|yield|gain|profit)',
+            r'(?:up\s+to|as\s+much\s+as)\s+\d+%'
+        ]
+
+        # Check for misleading comparisons
+        misleading_comparisons = [
+            r'(?:better|more|higher)\s+than\s+(?:bank|savings|deposit)',
+            r'outperform(?:s|ed|ing)?\s+(?:the\s+)?market',
+            r'beat(?:s|ing)?\s+(?:the\s+)?(?:market|index|average)'
+        ]
+
+        # Check for hidden disclaimers (small text indicators)
+        hidden_disclaimer_patterns = [
+            r'(?:\*{1,3}|†|‡)(?:.*?)(?:terms|conditions|apply|details)',
+            r'see\s+(?:footnote|below|terms|conditions|website)'
+        ]
+
+        # One scan per shared leading anchor rather than one per pattern
+        found = pattern_registry.fuse({
+            'superlatives': superlatives,
+            'benefits': benefit_patterns,
+            'comparisons': misleading_comparisons,
+            'hidden_disclaimers': hidden_disclaimer_patterns,
+        }, re.IGNORECASE).scan(text)
+
         violations = []
-        for pattern in superlatives:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for matches in found['superlatives']:
             if matches:
                 violations.append('unsubstantiated_claims')
-                for m in matches:
+                for start, end in matches:
                     spans.append({
                         'type': 'unsubstantiated_superlative',
-                        'start': m.start(),
-                        'end': m.end(),
-                        'text': m.group(),
+                        'start': start,
+                        'end': end,
+                        'text': text[start:end],
                         'severity': 'critical'
                     })
 
-        # Check for emphasis on benefits without risks
-        benefit_patterns = [
-            r'(?:high|significant|attractive|exceptional|outstanding)\s+(?:return|yield|profit|gain|growth|performance)',
-            r'\d+%\s+(?:return|yield|gain|profit)',
-            r'(?:up\s+to|as\s+much\s+as)\s+\d+%'
-        ]
-
         has_benefits = False
-        for pattern in benefit_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for matches in found['benefits']:
             if matches:
                 has_benefits = True
-                for m in matches:
+                for start, end in matches:
                     spans.append({
                         'type': 'benefit_claim',
-                        'start': m.start(),
-                        'end': m.end(),
-                        'text': m.group(),
+                        'start': start,
+                        'end': end,
+                        'text': text[start:end],
                         'severity': 'medium'
                     })
 
@@ -83,47 +109,32 @@ class FairClearNotMisleadingGate:
             r'no\s+guarantee'
         ]
 
-        has_risks = any(re.search(pattern, text, re.IGNORECASE) for pattern in risk_patterns)
-
-        # Check for misleading comparisons
-        misleading_comparisons = [
-            r'(?:better|more|higher)\s+than\s+(?:bank|savings|deposit)',
-            r'outperform(?:s|ed|ing)?\s+(?:the\s+)?market',
-            r'beat(?:s|ing)?\s+(?:the\s+)?(?:market|index|average)'
-        ]
+        has_risks = any(pattern_registry.search(pattern, text, re.IGNORECASE) for pattern in risk_patterns)
 
         has_misleading_comparison = False
-        for pattern in misleading_comparisons:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for matches in found['comparisons']:
             if matches:
                 has_misleading_comparison = True
                 violations.append('misleading_comparison')
-                for m in matches:
+                for start, end in matches:
                     spans.append({
                         'type': 'misleading_comparison',
-                        'start': m.start(),
-                        'end': m.end(),
-                        'text': m.group(),
+                        'start': start,
+                        'end': end,
+                        'text': text[start:end],
                         'severity': 'critical'
                     })
 
-        # Check for hidden disclaimers (small text indicators)
-        hidden_disclaimer_patterns = [
-            r'(?:\*{1,3}|†|‡)(?:.*?)(?:terms|conditions|apply|details)',
-            r'see\s+(?:footnote|below|terms|conditions|website)'
-        ]
-
         has_hidden_disclaimers = False
-        for pattern in hidden_disclaimer_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for matches in found['hidden_disclaimers']:
             if matches:
                 has_hidden_disclaimers = True
-                for m in matches:
+                for start, end in matches:
                     spans.append({
                         'type': 'potential_hidden_disclaimer',
-                        'start': m.start(),
-                        'end': m.end(),
-                        'text': m.group(),
+                        'start': start,
+                        'end': end,
+                        'text': text[start:end],
                         'severity': 'medium'
                     })
 
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class FairValueGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class FairValueGate:
         self.severity = "high"
         self.legal_source = "FCA PRIN 2A.4 (Price and Value Outcome)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions pricing or value"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'price', 'fee', 'charge', 'cost', 'premium', 'rate',
             'value', 'benefit', 'product', 'service'
@@ -17,17 +20,21 @@ class FairValueGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not discuss pricing or fees',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
 
         # Check if pricing is mentioned
-        has_pricing = any(re.search(pattern, text, re.IGNORECASE) for pattern in [
+        has_pricing = any(pattern_registry.search(pattern, text, re.IGNORECASE) for pattern in [
             r'£\s*\d+',
             r'\d+(?:\.\d+)?%',
             r'(?:fee|charge|cost|price|premium)s?\s*:?\s*(?:£|\d)',
@@ -52,7 +59,7 @@ class FairValueGate:
         has_value_justification = False
 
         for pattern in value_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_value_justification = True
                 for m in matches:
@@ -65,7 +72,7 @@ class FairValueGate:
                     })
 
         # Check for benefits mentioned alongside fees
-        has_benefits = any(re.search(pattern, text, re.IGNORECASE) for pattern in [
+        has_benefits = any(pattern_registry.search(pattern, text, re.IGNORECASE) for pattern in [
             r'benefit(?:s)?\s+include',
             r'you\s+(?:will\s+)?(?:get|receive)',
             r'includes?(?:\s+access\s+to)?',
@@ -82,7 +89,7 @@ class FairValueGate:
 
         high_fees_found = []
         for pattern, fee_type in high_fee_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 high_fees_found.append(fee_type)
                 for m in matches:
@@ -105,7 +112,7 @@ class FairValueGate:
                 'spans': spans
             }
 
-        if has_pricing and not has_value_justification and re.search(r'guaranteed|no\s+risk', text_lower):
+        if has_pricing and not has_value_justification and pattern_registry.search(r'guaranteed|no\s+risk', text_lower):
             return {
                 'status': 'FAIL',
                 'severity': 'high',
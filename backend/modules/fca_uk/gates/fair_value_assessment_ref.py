@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class FairValueAssessmentRefGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class FairValueAssessmentRefGate:
         self.severity = "medium"
         self.legal_source = "FCA PROD 4.2.17 (Fair Value Assessment Reviews)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document discusses products or value assessments"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'product', 'value', 'assessment', 'review', 'price',
             'fee', 'charge', 'cost', 'governance', 'monitoring'
@@ -17,18 +20,22 @@ class FairValueAssessmentRefGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not discuss pricing or product value',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check if product pricing/value is mentioned
-        has_pricing = any(re.search(pattern, text, re.IGNORECASE) for pattern in [
+        has_pricing = any(pattern_registry.search(pattern, text, re.IGNORECASE) for pattern in [
             r'price|fee|charge|cost|premium',
             r'value\s+for\s+money',
             r'fair\s+value'
@@ -48,7 +55,7 @@ class FairValueAssessmentRefGate:
 
         has_assessment = False
         for pattern in assessment_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_assessment = True
                 for m in matches:
@@ -71,7 +78,7 @@ class FairValueAssessmentRefGate:
 
         has_periodic = False
         for pattern in periodic_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 # Check if in context of value/price/product
                 for m in matches:
@@ -99,7 +106,7 @@ class FairValueAssessmentRefGate:
 
         has_governance = False
         for pattern in governance_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_governance = True
                 for m in matches:
@@ -122,7 +129,7 @@ class FairValueAssessmentRefGate:
 
         has_factors = False
         for pattern in factor_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_factors = True
                 for m in matches:
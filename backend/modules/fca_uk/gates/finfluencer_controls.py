@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class FinfluencerControlsGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class FinfluencerControlsGate:
         self.severity = "critical"
         self.legal_source = "FCA Financial Promotions via Social Media & Influencers"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document references social media or influencers"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'social media', 'influencer', 'instagram', 'tiktok', 'youtube',
             'facebook', 'twitter', 'linkedin', 'post', 'tweet', 'share',
@@ -18,14 +21,18 @@ class FinfluencerControlsGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not reference social media or influencer marketing',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Detect social media platform mentions
@@ -37,7 +44,7 @@ class FinfluencerControlsGate:
 
         platforms_mentioned = []
         for pattern in platform_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 for m in matches:
                     platforms_mentioned.append(m.group())
@@ -60,7 +67,7 @@ class FinfluencerControlsGate:
 
         has_influencer_ref = False
         for pattern in influencer_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_influencer_ref = True
                 for m in matches:
@@ -100,7 +107,7 @@ class FinfluencerControlsGate:
         for control_name, patterns in control_indicators.items():
             controls_present[control_name] = False
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     controls_present[control_name] = True
                     for m in matches:
@@ -122,7 +129,7 @@ class FinfluencerControlsGate:
 
         is_promotional = False
         for pattern in promotional_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 is_promotional = True
                 break
 
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class FosSignpostingGate:
     def __init__(self):
@@ -7,22 +10,26 @@ class FosSignpostingGate:
         self.severity = "critical"
         self.legal_source = "FCA DISP 1.6.2 (Financial Ombudsman Service Signposting)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions complaints or final response"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         return any(kw in text_lower for kw in [
             'complaint', 'final response', 'dissatisfied', 'unhappy with'
         ])
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not discuss complaint procedures (FOS signposting required in complaint contexts)',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         discourage_patterns = [
@@ -34,7 +41,7 @@ class FosSignpostingGate:
         ]
 
         for pattern in discourage_patterns:
-            match = re.search(pattern, text_lower)
+            match = pattern_registry.search(pattern, text_lower)
             if match:
                 spans.append({
                     'type': 'fos_discouraged',
@@ -62,7 +69,7 @@ class FosSignpostingGate:
 
         has_fos_reference = False
         for pattern in fos_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_fos_reference = True
                 for m in matches:
@@ -84,7 +91,7 @@ class FosSignpostingGate:
 
         has_six_month_limit = False
         for pattern in six_month_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 # Check context for FOS/ombudsman/complaint
                 for m in matches:
@@ -113,7 +120,7 @@ class FosSignpostingGate:
 
         has_fos_contact = False
         for pattern in fos_contact_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_fos_contact = True
                 for m in matches:
@@ -136,7 +143,7 @@ class FosSignpostingGate:
 
         has_refer_language = False
         for pattern in refer_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_refer_language = True
                 for m in matches:
@@ -157,7 +164,7 @@ class FosSignpostingGate:
 
         has_free_mention = False
         for pattern in free_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_free_mention = True
                 for m in matches:
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class InducementsReferralsGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class InducementsReferralsGate:
         self.severity = "high"
         self.legal_source = "FCA COBS 2.3 (Inducements)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions referrals, commissions, or third parties"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'referral', 'refer', 'commission', 'fee', 'payment',
             'introduce', 'third party', 'partner', 'arrangement'
@@ -17,14 +20,18 @@ class InducementsReferralsGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not mention commissions, referrals, or inducement arrangements',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Detect referral arrangements
@@ -38,7 +45,7 @@ class InducementsReferralsGate:
 
         has_referral = False
         for pattern in referral_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_referral = True
                 for m in matches:
@@ -60,7 +67,7 @@ class InducementsReferralsGate:
 
         has_commission = False
         for pattern in commission_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_commission = True
                 for m in matches:
@@ -87,7 +94,7 @@ class InducementsReferralsGate:
 
         has_disclosure = False
         for pattern in disclosure_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_disclosure = True
                 for m in matches:
@@ -109,7 +116,7 @@ class InducementsReferralsGate:
 
         has_amount = False
         for pattern in amount_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_amount = True
                 for m in matches:
@@ -130,7 +137,7 @@ class InducementsReferralsGate:
 
         has_payer = False
         for pattern in payer_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_payer = True
                 for m in matches:
@@ -152,7 +159,7 @@ class InducementsReferralsGate:
 
         has_benefit_statement = False
         for pattern in benefit_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_benefit_statement = True
                 for m in matches:
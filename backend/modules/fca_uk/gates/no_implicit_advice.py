@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class NoImplicitAdviceGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class NoImplicitAdviceGate:
         self.severity = "critical"
         self.legal_source = "FCA COBS 2.1 & 9 (Acting Honestly, Fairly and Professionally / Suitability)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document contains recommendations or suggestions"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         universal_patterns = [
             r'suits?\s+everyone',
             r'everyone\s+qualif(?:y|ies)',
@@ -24,17 +27,22 @@ class NoImplicitAdviceGate:
             'suitable', 'appropriate', 'right for you', 'best',
             'invest', 'buy', 'apply', 'choose', 'everyone qualifies'
         ]
-        return any(kw in text_lower for kw in keywords) or any(re.search(p, text_lower) for p in universal_patterns)
+        return (any(kw in text_lower for kw in keywords)
+                or any(pattern_registry.search(p, text_lower) for p in universal_patterns))
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not contain recommendation or advisory language',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for advice/recommendation language
@@ -57,7 +65,7 @@ class NoImplicitAdviceGate:
 
         gives_advice = False
         for pattern in advice_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 gives_advice = True
                 for m in matches:
@@ -86,7 +94,8 @@ class NoImplicitAdviceGate:
             r'window\s+(?:closes|closing)'
         ]
 
-        has_universal_claims = any(re.search(pattern, text_lower) for pattern in universal_claims_patterns)
+        has_universal_claims = any(pattern_registry.search(pattern, text_lower)
+                                   for pattern in universal_claims_patterns)
 
         if not gives_advice and has_universal_claims:
             gives_advice = True
@@ -104,7 +113,7 @@ class NoImplicitAdviceGate:
 
         has_kyc = False
         for pattern in kyc_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_kyc = True
                 for m in matches:
@@ -129,7 +138,7 @@ class NoImplicitAdviceGate:
 
         has_disclaimer = False
         for pattern in disclaimer_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_disclaimer = True
                 for m in matches:
@@ -152,7 +161,7 @@ class NoImplicitAdviceGate:
 
         is_execution_only = False
         for pattern in execution_only_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 is_execution_only = True
                 for m in matches:
@@ -174,7 +183,7 @@ class NoImplicitAdviceGate:
 
         is_authorized = False
         for pattern in authorization_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 is_authorized = True
                 for m in matches:
@@ -187,7 +196,7 @@ class NoImplicitAdviceGate:
                     })
 
         # Determine status
-        has_urgency = any(re.search(pattern, text_lower) for pattern in [
+        has_urgency = any(pattern_registry.search(pattern, text_lower) for pattern in [
             r'act\s+now',
             r'before\s+\w+\s+end',
             r'move\s+existing\s+clients',
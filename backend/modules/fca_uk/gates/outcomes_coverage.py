@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class OutcomesCoverageGate:
     def __init__(self):
@@ -7,16 +10,16 @@ class OutcomesCoverageGate:
         self.severity = "critical"
         self.legal_source = "FCA PRIN 2A (Consumer Duty)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """
         Check if document is a full product/service communication
         Only apply Consumer Duty outcomes to substantial product documents,
         not simple contact info or brief snippets
         """
-        text_lower = text.lower()
+        text_lower = ctx.lower
 
         # Minimum length check - Consumer Duty applies to full communications
-        if len(text) < 150:  # Less than ~150 chars = too short for full product comms
+        if len(ctx.text) < 150:  # Less than ~150 chars = too short for full product comms
             return False
 
         # Must contain product/service indicators AND communication intent
@@ -37,14 +40,18 @@ class OutcomesCoverageGate:
         return has_product and has_communication
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document is not a full product/service communication requiring Consumer Duty outcomes',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
 
         # Check for all 4 Consumer Duty outcomes
         outcomes = {
@@ -80,7 +87,7 @@ class OutcomesCoverageGate:
         for outcome_name, patterns in outcomes.items():
             found = False
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     found = True
                     covered.append(outcome_name)
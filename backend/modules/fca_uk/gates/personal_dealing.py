@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class PersonalDealingGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class PersonalDealingGate:
         self.severity = "medium"
         self.legal_source = "FCA SYSC 10.1.11 (Personal Account Dealing)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions employee trading or personal dealing"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'employee', 'staff', 'personal', 'own account', 'trading',
             'deal', 'transaction', 'investment', 'share', 'security'
@@ -19,14 +22,18 @@ class PersonalDealingGate:
         return matches >= 2
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not address employee or staff personal trading/dealing',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Detect personal dealing/trading references
@@ -40,7 +47,7 @@ class PersonalDealingGate:
 
         has_personal_dealing = False
         for pattern in personal_dealing_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_personal_dealing = True
                 for m in matches:
@@ -67,7 +74,7 @@ class PersonalDealingGate:
 
         has_preclearance = False
         for pattern in preclearance_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_preclearance = True
                 for m in matches:
@@ -90,7 +97,7 @@ class PersonalDealingGate:
 
         has_restrictions = False
         for pattern in restriction_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_restrictions = True
                 for m in matches:
@@ -112,7 +119,7 @@ class PersonalDealingGate:
 
         has_policy = False
         for pattern in policy_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_policy = True
                 for m in matches:
@@ -134,7 +141,7 @@ class PersonalDealingGate:
 
         has_disclosure = False
         for pattern in disclosure_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_disclosure = True
                 for m in matches:
@@ -157,7 +164,7 @@ class PersonalDealingGate:
 
         has_insider_ref = False
         for pattern in insider_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_insider_ref = True
                 for m in matches:
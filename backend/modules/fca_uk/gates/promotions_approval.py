@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class PromotionsApprovalGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class PromotionsApprovalGate:
         self.severity = "critical"
         self.legal_source = "FCA FSMA s.21 & s.24 (Financial Promotion Approval)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document is promotional material"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         # ENHANCED: Expanded keywords and lowered threshold
         promo_keywords = [
             'invest', 'offer', 'promotion', 'apply', 'sign up',
@@ -24,14 +27,18 @@ class PromotionsApprovalGate:
         return matches >= 1
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document is not a financial promotion or lacks promotional content',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         bypass_patterns = [
@@ -43,7 +50,7 @@ class PromotionsApprovalGate:
         ]
 
         for pattern in bypass_patterns:
-            match = re.search(pattern, text_lower)
+            match = pattern_registry.search(pattern, text_lower)
             if match:
                 spans.append({
                     'type': 'approval_bypass',
@@ -74,7 +81,7 @@ class PromotionsApprovalGate:
 
         is_promotional = False
         for pattern in promotional_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 is_promotional = True
                 for m in matches:
@@ -100,7 +107,7 @@ class PromotionsApprovalGate:
 
         is_financial_promotion = False
         for pattern in financial_promotion_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 is_financial_promotion = True
                 break
 
@@ -110,7 +117,7 @@ class PromotionsApprovalGate:
             r'(?:exempt|exemption)\s+(?:from|under|applies)',
             r'(?:certified|sophisticated|high\s+net\s+worth)\s+investor'
         ]
-        has_exemption_early = any(re.search(p, text, re.IGNORECASE) for p in exemption_early_check)
+        has_exemption_early = any(pattern_registry.search(p, text, re.IGNORECASE) for p in exemption_early_check)
 
         # If exemption claim exists, treat as financial promotion
         if has_exemption_early:
@@ -133,7 +140,7 @@ class PromotionsApprovalGate:
 
         has_approval = False
         for pattern in approval_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_approval = True
                 for m in matches:
@@ -156,7 +163,7 @@ class PromotionsApprovalGate:
 
         has_approver = False
         for pattern in approver_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_approver = True
                 for m in matches:
@@ -176,7 +183,7 @@ class PromotionsApprovalGate:
 
         has_fca_number = False
         for pattern in fca_number_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_fca_number = True
                 for m in matches:
@@ -200,7 +207,7 @@ class PromotionsApprovalGate:
 
         has_exemption = False
         for pattern in exemption_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_exemption = True
                 for m in matches:
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class ReasonableAdjustmentsGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class ReasonableAdjustmentsGate:
         self.severity = "medium"
         self.legal_source = "FCA FG21/1 & Equality Act 2010 (Reasonable Adjustments)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions disability, vulnerability, or accessibility"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'disability', 'disabled', 'vulnerable', 'accessibility',
             'impairment', 'adjustment', 'support', 'accommodate',
@@ -18,14 +21,18 @@ class ReasonableAdjustmentsGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not address disability, accessibility, or customer support accommodations',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for reasonable adjustments offered
@@ -64,7 +71,7 @@ class ReasonableAdjustmentsGate:
         offered_adjustments = {}
         for adjustment_type, patterns in adjustment_types.items():
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     if adjustment_type not in offered_adjustments:
                         offered_adjustments[adjustment_type] = []
@@ -89,7 +96,7 @@ class ReasonableAdjustmentsGate:
 
         has_explicit_ra = False
         for pattern in reasonable_adjustment_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_explicit_ra = True
                 for m in matches:
@@ -111,7 +118,7 @@ class ReasonableAdjustmentsGate:
 
         has_invitation = False
         for pattern in invitation_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_invitation = True
                 for m in matches:
@@ -133,7 +140,7 @@ class ReasonableAdjustmentsGate:
 
         barriers_found = []
         for pattern in barrier_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 for m in matches:
                     barriers_found.append(m.group())
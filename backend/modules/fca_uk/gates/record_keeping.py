@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class RecordKeepingGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class RecordKeepingGate:
         self.severity = "medium"
         self.legal_source = "FCA SYSC 9 (Record Keeping)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions records, documentation, or retention"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'record', 'document', 'retain', 'keep', 'store', 'maintain',
             'evidence', 'proof', 'log', 'register', 'file'
@@ -17,14 +20,18 @@ class RecordKeepingGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not discuss record retention or documentation policies',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for record-keeping mentions
@@ -37,7 +44,7 @@ class RecordKeepingGate:
 
         has_record_keeping = False
         for pattern in record_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_record_keeping = True
                 for m in matches:
@@ -63,7 +70,7 @@ class RecordKeepingGate:
 
         has_what = False
         for pattern in what_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_what = True
                 for m in matches:
@@ -86,7 +93,7 @@ class RecordKeepingGate:
 
         has_where = False
         for pattern in where_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_where = True
                 for m in matches:
@@ -110,7 +117,7 @@ class RecordKeepingGate:
 
         has_retention = False
         for pattern in retention_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 # Check if in context of records/documents
                 for m in matches:
@@ -137,7 +144,7 @@ class RecordKeepingGate:
 
         has_fca_compliant = False
         for pattern in fca_retention_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_fca_compliant = True
                 for m in matches:
@@ -160,7 +167,7 @@ class RecordKeepingGate:
 
         has_security = False
         for pattern in security_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_security = True
                 for m in matches:
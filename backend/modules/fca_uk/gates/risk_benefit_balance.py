@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class RiskBenefitBalanceGate:
     def __init__(self):
@@ -7,23 +10,27 @@ class RiskBenefitBalanceGate:
         self.severity = "high"
         self.legal_source = "FCA COBS 4.2.3 (Risk Warnings Equally Prominent)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions investment benefits or returns"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         return any(kw in text_lower for kw in [
             'return', 'profit', 'gain', 'growth', 'performance',
             'yield', 'benefit', 'invest', 'opportunity'
         ])
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not present product benefits or features',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Count benefit mentions
@@ -39,7 +46,7 @@ class RiskBenefitBalanceGate:
 
         benefit_count = 0
         for pattern in benefit_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             benefit_count += len(matches)
             for m in matches:
                 spans.append({
@@ -64,7 +71,7 @@ class RiskBenefitBalanceGate:
 
         risk_count = 0
         for pattern in risk_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             risk_count += len(matches)
             for m in matches:
                 spans.append({
@@ -85,7 +92,7 @@ class RiskBenefitBalanceGate:
 
         missing_warnings = []
         for warning_name, pattern in required_warnings.items():
-            if not re.search(pattern, text, re.IGNORECASE):
+            if not pattern_registry.search(pattern, text, re.IGNORECASE):
                 missing_warnings.append(warning_name)
 
         # Check prominence (rough heuristic - risks should appear early if benefits mentioned)
@@ -93,12 +100,12 @@ class RiskBenefitBalanceGate:
         first_risk_pos = float('inf')
 
         for pattern in benefit_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern_registry.search(pattern, text, re.IGNORECASE)
             if match:
                 first_benefit_pos = min(first_benefit_pos, match.start())
 
         for pattern in risk_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern_registry.search(pattern, text, re.IGNORECASE)
             if match:
                 first_risk_pos = min(first_risk_pos, match.start())
 
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class SupportJourneyGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class SupportJourneyGate:
         self.severity = "high"
         self.legal_source = "FCA PRIN 2A.6 (Consumer Support Outcome)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document involves customer journey or actions"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'contact', 'support', 'help', 'cancel', 'complaint',
             'withdraw', 'exit', 'close', 'terminate', 'change',
@@ -18,14 +21,18 @@ class SupportJourneyGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not describe customer support, cancellation, or service processes',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for contact routes
@@ -39,7 +46,7 @@ class SupportJourneyGate:
         found_contact = []
         for method, patterns in contact_methods.items():
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     if method not in found_contact:
                         found_contact.append(method)
@@ -63,7 +70,7 @@ class SupportJourneyGate:
 
         dark_pattern_found = []
         for pattern, dp_type in dark_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 dark_pattern_found.append(dp_type)
                 for m in matches:
@@ -86,7 +93,7 @@ class SupportJourneyGate:
 
         has_easy_support = False
         for pattern in easy_support:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_easy_support = True
                 for m in matches:
@@ -121,7 +128,7 @@ class SupportJourneyGate:
 
         # Check if cancellation mentioned without clear process
         has_cancel_mention = any(word in text_lower for word in ['cancel', 'exit', 'withdraw', 'close account', 'terminate'])
-        has_cancel_process = any(re.search(pattern, text, re.IGNORECASE) for pattern in [
+        has_cancel_process = any(pattern_registry.search(pattern, text, re.IGNORECASE) for pattern in [
             r'to\s+cancel.*(?:contact|call|email|visit)',
             r'cancel(?:lation)?\s+(?:process|procedure|steps?)',
             r'how\s+to\s+cancel'
@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class TargetAudienceGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class TargetAudienceGate:
         self.severity = "high"
         self.legal_source = "FCA COBS 4.7 (Direct Offer Financial Promotions)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document is promotional or product-related"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'product', 'service', 'offer', 'invest', 'policy',
             'account', 'fund', 'suitable', 'appropriate', 'designed for'
@@ -17,14 +20,18 @@ class TargetAudienceGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document is not a financial promotion or does not specify audience',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for target market/audience statements
@@ -39,7 +46,7 @@ class TargetAudienceGate:
 
         has_target_market = False
         for pattern in target_market_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_target_market = True
                 for m in matches:
@@ -61,7 +68,7 @@ class TargetAudienceGate:
 
         is_generic = False
         for pattern in generic_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 is_generic = True
                 for m in matches:
@@ -87,7 +94,7 @@ class TargetAudienceGate:
 
         has_specific_criteria = False
         for pattern in specific_characteristics:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_specific_criteria = True
                 for m in matches:
@@ -109,7 +116,7 @@ class TargetAudienceGate:
 
         has_exclusions = False
         for pattern in exclusion_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_exclusions = True
                 for m in matches:
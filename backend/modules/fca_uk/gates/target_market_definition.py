@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class TargetMarketDefinitionGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class TargetMarketDefinitionGate:
         self.severity = "high"
         self.legal_source = "FCA PROD 1.4 & PROD 3 (Product Governance - Target Market)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document discusses products or product design"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'product', 'service', 'designed', 'target', 'customer',
             'suitable', 'appropriate', 'market', 'distribution'
@@ -17,14 +20,18 @@ class TargetMarketDefinitionGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not discuss product design or target markets',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Check for target market definition
@@ -40,7 +47,7 @@ class TargetMarketDefinitionGate:
 
         has_target_market = False
         for pattern in target_market_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_target_market = True
                 for m in matches:
@@ -94,7 +101,7 @@ class TargetMarketDefinitionGate:
         defined_criteria = {}
         for category, patterns in criteria_categories.items():
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     if category not in defined_criteria:
                         defined_criteria[category] = []
@@ -119,7 +126,7 @@ class TargetMarketDefinitionGate:
 
         is_generic = False
         for pattern in generic_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 is_generic = True
                 for m in matches:
@@ -141,7 +148,7 @@ class TargetMarketDefinitionGate:
 
         has_negative_target = False
         for pattern in negative_target_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_negative_target = True
                 for m in matches:
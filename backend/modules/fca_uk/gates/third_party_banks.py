@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class ThirdPartyBanksGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class ThirdPartyBanksGate:
         self.severity = "high"
         self.legal_source = "FCA CASS 7.13 (Selection and Monitoring of Third Party Banks)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document mentions banks or where money is held"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'bank', 'banking', 'third party', 'deposit', 'account',
             'financial institution', 'held with', 'held at'
@@ -17,14 +20,18 @@ class ThirdPartyBanksGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not reference third-party banking arrangements',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         negative_indicators = [
@@ -36,7 +43,7 @@ class ThirdPartyBanksGate:
         ]
 
         for pattern in negative_indicators:
-            match = re.search(pattern, text_lower)
+            match = pattern_registry.search(pattern, text_lower)
             if match:
                 spans.append({
                     'type': 'cass_713_violation',
@@ -64,7 +71,7 @@ class ThirdPartyBanksGate:
 
         uses_third_party_banks = False
         for pattern in third_party_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 uses_third_party_banks = True
                 for m in matches:
@@ -83,7 +90,7 @@ class ThirdPartyBanksGate:
         ]
 
         for pattern in bank_name_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 # Check if in context of client money
                 for m in matches:
@@ -116,7 +123,7 @@ class ThirdPartyBanksGate:
 
         has_due_diligence = False
         for pattern in due_diligence_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_due_diligence = True
                 for m in matches:
@@ -139,7 +146,7 @@ class ThirdPartyBanksGate:
 
         has_authorization = False
         for pattern in authorization_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_authorization = True
                 for m in matches:
@@ -161,7 +168,7 @@ class ThirdPartyBanksGate:
 
         has_monitoring = False
         for pattern in monitoring_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 # Check if in context of banks
                 for m in matches:
@@ -189,7 +196,7 @@ class ThirdPartyBanksGate:
 
         has_diversification = False
         for pattern in diversification_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_diversification = True
                 for m in matches:
@@ -211,7 +218,7 @@ class ThirdPartyBanksGate:
 
         has_fscs = False
         for pattern in fscs_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_fscs = True
                 for m in matches:
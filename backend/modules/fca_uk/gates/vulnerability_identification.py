@@ -1,5 +1,8 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
 
 class VulnerabilityIdentificationGate:
     def __init__(self):
@@ -7,9 +10,9 @@ class VulnerabilityIdentificationGate:
         self.severity = "high"
         self.legal_source = "FCA FG21/1 (Guidance for Firms on the Fair Treatment of Vulnerable Customers)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document involves customer interactions or sensitive situations"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         # ENHANCED: Expanded keywords to catch first-person vulnerability indicators
         keywords = [
             'customer', 'client', 'consumer', 'vulnerable', 'support',
@@ -26,14 +29,18 @@ class VulnerabilityIdentificationGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not contain vulnerability indicators or customer support context',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
 
         # Detect vulnerability drivers (FCA's 4 categories)
@@ -67,20 +74,22 @@ class VulnerabilityIdentificationGate:
             ]
         }
 
+        # The \b-anchored drivers share one scan
+        found = pattern_registry.fuse(vulnerability_drivers, re.IGNORECASE).scan(text)
+
         detected_vulnerabilities = {}
-        for category, patterns in vulnerability_drivers.items():
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for category, pattern_spans in found.items():
+            for matches in pattern_spans:
                 if matches:
                     if category not in detected_vulnerabilities:
                         detected_vulnerabilities[category] = []
-                    for m in matches:
-                        detected_vulnerabilities[category].append(m.group())
+                    for start, end in matches:
+                        detected_vulnerabilities[category].append(text[start:end])
                         spans.append({
                             'type': f'vulnerability_{category}',
-                            'start': m.start(),
-                            'end': m.end(),
-                            'text': m.group(),
+                            'start': start,
+                            'end': end,
+                            'text': text[start:end],
                             'severity': 'medium'
                         })
 
@@ -96,7 +105,7 @@ class VulnerabilityIdentificationGate:
 
         has_identification = False
         for pattern in identification_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_identification = True
                 for m in matches:
@@ -120,7 +129,7 @@ class VulnerabilityIdentificationGate:
 
         has_support_offer = False
         for pattern in support_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 has_support_offer = True
                 for m in matches:
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class AutomatedDecisionsGate:
     """
@@ -44,7 +46,7 @@ class AutomatedDecisionsGate:
             r'system.*(?:automatically|decides?)\s+(?:whether|to)'
         ]
 
-        has_solely_automated = any(re.search(p, text, re.IGNORECASE) for p in automated_decision_patterns)
+        has_solely_automated = any(pattern_registry.search(p, text, re.IGNORECASE) for p in automated_decision_patterns)
 
         if has_solely_automated:
             # Check for legal effects or significant effects
@@ -57,7 +59,7 @@ class AutomatedDecisionsGate:
                 r'accept(?:ance|ed)|reject(?:ion|ed)|refus(?:e|al)'
             ]
 
-            has_significant_effects = any(re.search(p, text, re.IGNORECASE) for p in effects_patterns)
+            has_significant_effects = any(pattern_registry.search(p, text, re.IGNORECASE) for p in effects_patterns)
 
             if has_significant_effects:
                 # Check for exceptions (consent, contract, legal authorization)
@@ -69,7 +71,7 @@ class AutomatedDecisionsGate:
                     r'statutory\s+(?:provision|authority)'
                 ]
 
-                has_exception = any(re.search(p, text, re.IGNORECASE) for p in exception_patterns)
+                has_exception = any(pattern_registry.search(p, text, re.IGNORECASE) for p in exception_patterns)
 
                 if not has_exception:
                     issues.append('CRITICAL: Solely automated decisions with legal/significant effects prohibited unless: explicit consent, necessary for contract, or authorized by law (Article 22)')
@@ -83,7 +85,7 @@ class AutomatedDecisionsGate:
                     r'challenge.*decision'
                 ]
 
-                has_safeguards = any(re.search(p, text, re.IGNORECASE) for p in safeguard_patterns)
+                has_safeguards = any(pattern_registry.search(p, text, re.IGNORECASE) for p in safeguard_patterns)
 
                 if has_exception and not has_safeguards:
                     issues.append('CRITICAL: Automated decisions require safeguards - right to human intervention, express views, and contest decision')
@@ -97,7 +99,7 @@ class AutomatedDecisionsGate:
             r'categoris[ez].*(?:individuals?|people|users?|customers?)'
         ]
 
-        has_profiling = any(re.search(p, text, re.IGNORECASE) for p in profiling_patterns)
+        has_profiling = any(pattern_registry.search(p, text, re.IGNORECASE) for p in profiling_patterns)
 
         if has_profiling:
             # Check for information about profiling logic
@@ -109,7 +111,7 @@ class AutomatedDecisionsGate:
                 r'criteria.*(?:used|considered)'
             ]
 
-            has_logic_explanation = any(re.search(p, text, re.IGNORECASE) for p in logic_patterns)
+            has_logic_explanation = any(pattern_registry.search(p, text, re.IGNORECASE) for p in logic_patterns)
 
             if not has_logic_explanation:
                 warnings.append('Must provide meaningful information about profiling logic, significance and consequences (2025 transparency requirements)')
@@ -125,7 +127,8 @@ class AutomatedDecisionsGate:
                 r'special\s+categor(?:y|ies)'
             ]
 
-            uses_special_category = any(re.search(p, text, re.IGNORECASE) for p in special_category_patterns)
+            uses_special_category = any(pattern_registry.search(p, text, re.IGNORECASE)
+                                        for p in special_category_patterns)
 
             if uses_special_category and has_profiling:
                 warnings.append('Profiling using special category data requires explicit consent or substantial public interest (Article 9)')
@@ -139,7 +142,7 @@ class AutomatedDecisionsGate:
             r'human[\s-]in[\s-]the[\s-]loop'
         ]
 
-        has_human_review = any(re.search(p, text, re.IGNORECASE) for p in human_review_patterns)
+        has_human_review = any(pattern_registry.search(p, text, re.IGNORECASE) for p in human_review_patterns)
 
         if has_solely_automated and not has_human_review:
             warnings.append('2025 best practice: implement human review for high-stakes automated decisions')
@@ -154,7 +157,7 @@ class AutomatedDecisionsGate:
                 r'competent.*(?:review|assess)'
             ]
 
-            has_meaningful = any(re.search(p, text, re.IGNORECASE) for p in meaningful_review_patterns)
+            has_meaningful = any(pattern_registry.search(p, text, re.IGNORECASE) for p in meaningful_review_patterns)
 
             if not has_meaningful:
                 warnings.append('2025 emphasis: human review must be meaningful - reviewer must have authority to change decision, not rubber-stamp')
@@ -168,7 +171,7 @@ class AutomatedDecisionsGate:
             r'transparent.*(?:decision[\s-]making|processing)'
         ]
 
-        has_explanation = any(re.search(p, text, re.IGNORECASE) for p in explanation_patterns)
+        has_explanation = any(pattern_registry.search(p, text, re.IGNORECASE) for p in explanation_patterns)
 
         if (has_solely_automated or has_profiling) and not has_explanation:
             warnings.append('2025 expansion: individuals have right to explanation of automated decision logic and significance')
@@ -183,7 +186,7 @@ class AutomatedDecisionsGate:
                 r'factors.*(?:considered|influenced)'
             ]
 
-            has_quality = any(re.search(p, text, re.IGNORECASE) for p in quality_patterns)
+            has_quality = any(pattern_registry.search(p, text, re.IGNORECASE) for p in quality_patterns)
 
             if not has_quality:
                 warnings.append('Explanations must be in clear language, meaningful, and specific to individual case (not generic)')
@@ -200,7 +203,7 @@ class AutomatedDecisionsGate:
             r'training\s+data'
         ]
 
-        has_ai = any(re.search(p, text, re.IGNORECASE) for p in ai_patterns)
+        has_ai = any(pattern_registry.search(p, text, re.IGNORECASE) for p in ai_patterns)
 
         if has_ai:
             # Check for AI-specific disclosures (2025 Data Use and Access Act)
@@ -212,7 +215,8 @@ class AutomatedDecisionsGate:
                 'human_oversight': r'human\s+(?:oversight|supervision|monitoring)'
             }
 
-            disclosures_made = sum(1 for p in ai_disclosures.values() if re.search(p, text, re.IGNORECASE))
+            disclosures_made = sum(1 for p in ai_disclosures.values()
+                                   if pattern_registry.search(p, text, re.IGNORECASE))
 
             if disclosures_made < 3:
                 warnings.append('2025 AI provisions: disclose AI use, training data sources, accuracy rates, limitations, and human oversight')
@@ -225,7 +229,7 @@ class AutomatedDecisionsGate:
                 r'equality\s+(?:impact|assessment)'
             ]
 
-            has_bias_mitigation = any(re.search(p, text, re.IGNORECASE) for p in bias_patterns)
+            has_bias_mitigation = any(pattern_registry.search(p, text, re.IGNORECASE) for p in bias_patterns)
 
             if not has_bias_mitigation:
                 warnings.append('2025 requirement: AI systems must be tested for bias and discrimination')
@@ -239,7 +243,7 @@ class AutomatedDecisionsGate:
             r'financial\s+(?:assessment|decision|profiling)'
         ]
 
-        has_credit = any(re.search(p, text, re.IGNORECASE) for p in credit_patterns)
+        has_credit = any(pattern_registry.search(p, text, re.IGNORECASE) for p in credit_patterns)
 
         if has_credit:
             # Credit decisions are high-stakes - extra scrutiny
@@ -251,7 +255,8 @@ class AutomatedDecisionsGate:
                 'human_review': r'human\s+(?:review|intervention)'
             }
 
-            credit_coverage = sum(1 for p in credit_requirements.values() if re.search(p, text, re.IGNORECASE))
+            credit_coverage = sum(1 for p in credit_requirements.values()
+                                  if pattern_registry.search(p, text, re.IGNORECASE))
 
             if credit_coverage < 3:
                 warnings.append('Credit scoring must disclose: factors considered, how to improve score, right to review, and human oversight')
@@ -265,7 +270,7 @@ class AutomatedDecisionsGate:
             r'applicant\s+tracking\s+system'
         ]
 
-        has_employment = any(re.search(p, text, re.IGNORECASE) for p in employment_patterns)
+        has_employment = any(pattern_registry.search(p, text, re.IGNORECASE) for p in employment_patterns)
 
         if has_employment:
             # Employment decisions are high-stakes
@@ -277,7 +282,8 @@ class AutomatedDecisionsGate:
                 'challenge': r'(?:challenge|appeal|contest)'
             }
 
-            employment_coverage = sum(1 for p in employment_requirements.values() if re.search(p, text, re.IGNORECASE))
+            employment_coverage = sum(1 for p in employment_requirements.values()
+                                      if pattern_registry.search(p, text, re.IGNORECASE))
 
             if employment_coverage < 3:
                 warnings.append('Employment decisions must: test for discrimination, involve human review, disclose criteria, provide feedback')
@@ -291,7 +297,7 @@ class AutomatedDecisionsGate:
             r'dispute.*outcome'
         ]
 
-        has_contest = any(re.search(p, text, re.IGNORECASE) for p in contest_patterns)
+        has_contest = any(pattern_registry.search(p, text, re.IGNORECASE) for p in contest_patterns)
 
         if has_solely_automated and not has_contest:
             warnings.append('Must provide clear process to contest automated decisions')
@@ -304,7 +310,7 @@ class AutomatedDecisionsGate:
                 r'as\s+soon\s+as\s+(?:possible|practicable)'
             ]
 
-            has_timeframe = any(re.search(p, text, re.IGNORECASE) for p in contest_timeframe_patterns)
+            has_timeframe = any(pattern_registry.search(p, text, re.IGNORECASE) for p in contest_timeframe_patterns)
             # Good practice to specify timeframe
 
         # 9. TRANSPARENCY AND INFORMATION (Article 13-15)
@@ -315,7 +321,8 @@ class AutomatedDecisionsGate:
             'consequences': r'(?:envisaged\s+)?consequences?'
         }
 
-        transparency_score = sum(1 for p in transparency_info.values() if re.search(p, text, re.IGNORECASE))
+        transparency_score = sum(1 for p in transparency_info.values()
+                                 if pattern_registry.search(p, text, re.IGNORECASE))
 
         if (has_solely_automated or has_profiling) and transparency_score < 2:
             warnings.append('Must provide: existence of automated decision-making, logic involved, significance and consequences')
@@ -329,7 +336,7 @@ class AutomatedDecisionsGate:
             r'documentation.*(?:decision[\s-]making|processing)'
         ]
 
-        has_audit = any(re.search(p, text, re.IGNORECASE) for p in audit_patterns)
+        has_audit = any(pattern_registry.search(p, text, re.IGNORECASE) for p in audit_patterns)
 
         if has_ai and not has_audit:
             warnings.append('2025 requirement: regular auditing and monitoring of automated decision systems')
@@ -341,7 +348,8 @@ class AutomatedDecisionsGate:
             r'minor.*(?:automated\s+decision|profiling)'
         ]
 
-        has_children_automated = any(re.search(p, text, re.IGNORECASE) for p in children_automated_patterns)
+        has_children_automated = any(pattern_registry.search(p, text, re.IGNORECASE)
+                                     for p in children_automated_patterns)
 
         if has_children_automated:
             warnings.append('2025 enhanced protection: generally prohibited to use automated decisions/profiling on children unless explicit consent and child\'s best interests')
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ChildrenDataAdvancedGate:
     """
@@ -44,9 +46,9 @@ class ChildrenDataAdvancedGate:
 
         ages_mentioned = []
         for pattern in age_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern_registry.findall(pattern, text, re.IGNORECASE)
             for match in matches:
-                age_num = re.search(r'\d+', match)
+                age_num = pattern_registry.search(r'\d+', match)
                 if age_num:
                     ages_mentioned.append(int(age_num.group()))
 
@@ -66,7 +68,7 @@ class ChildrenDataAdvancedGate:
             r'age\s+assurance'
         ]
 
-        has_age_verification = any(re.search(p, text, re.IGNORECASE) for p in age_verification_patterns)
+        has_age_verification = any(pattern_registry.search(p, text, re.IGNORECASE) for p in age_verification_patterns)
 
         if has_age_threshold and not has_age_verification:
             issues.append('CRITICAL: Must implement age verification to ensure children under 13 do not provide consent (2025 strengthened)')
@@ -82,10 +84,11 @@ class ChildrenDataAdvancedGate:
                 'email': r'email\s+verification'
             }
 
-            methods_mentioned = sum(1 for p in verification_methods.values() if re.search(p, text, re.IGNORECASE))
+            methods_mentioned = sum(1 for p in verification_methods.values()
+                                    if pattern_registry.search(p, text, re.IGNORECASE))
 
             # Self-declaration alone is insufficient (2025 requirement)
-            if re.search(r'self[\s-]declar(?:e|ation)', text, re.IGNORECASE) and methods_mentioned == 1:
+            if pattern_registry.search(r'self[\s-]declar(?:e|ation)', text, re.IGNORECASE) and methods_mentioned == 1:
                 warnings.append('2025 requirement: self-declaration alone insufficient for age verification - use more robust methods')
 
         # 3. PARENTAL CONSENT (Required for under 13s)
@@ -97,7 +100,7 @@ class ChildrenDataAdvancedGate:
             r'holder\s+of\s+parental\s+responsibility'
         ]
 
-        has_parental_consent = any(re.search(p, text, re.IGNORECASE) for p in parental_consent_patterns)
+        has_parental_consent = any(pattern_registry.search(p, text, re.IGNORECASE) for p in parental_consent_patterns)
 
         if has_age_threshold and any(age < 13 for age in ages_mentioned) and not has_parental_consent:
             issues.append('CRITICAL: Parental consent required for processing data of children under 13')
@@ -111,7 +114,8 @@ class ChildrenDataAdvancedGate:
                 r'parent.*(?:email|phone|contact)\s+(?:verification|confirmation)'
             ]
 
-            has_parent_verification = any(re.search(p, text, re.IGNORECASE) for p in parent_verification_patterns)
+            has_parent_verification = any(pattern_registry.search(p, text, re.IGNORECASE)
+                                          for p in parent_verification_patterns)
 
             if not has_parent_verification:
                 warnings.append('2025 requirement: must make reasonable efforts to verify holder of parental responsibility')
@@ -125,7 +129,7 @@ class ChildrenDataAdvancedGate:
             r'age[\s-]appropriate'
         ]
 
-        has_best_interests = any(re.search(p, text, re.IGNORECASE) for p in best_interests_patterns)
+        has_best_interests = any(pattern_registry.search(p, text, re.IGNORECASE) for p in best_interests_patterns)
 
         if not has_best_interests:
             warnings.append('2025 emphasis: processing children\'s data must consider child\'s best interests')
@@ -149,7 +153,7 @@ class ChildrenDataAdvancedGate:
             'standards': r'(?:high|appropriate)\s+standards?.*(?:privacy|data\s+protection)'
         }
 
-        aadc_compliance = sum(1 for p in aadc_principles.values() if re.search(p, text, re.IGNORECASE))
+        aadc_compliance = sum(1 for p in aadc_principles.values() if pattern_registry.search(p, text, re.IGNORECASE))
 
         if aadc_compliance < 5:
             warnings.append('2025 Age Appropriate Design Code: apply 15 standards including best interests, data minimisation, privacy by default, transparency')
@@ -161,7 +165,7 @@ class ChildrenDataAdvancedGate:
             r'child(?:ren)?.*(?:personaliz|personalis)(?:e|ation|ed)'
         ]
 
-        has_child_profiling = any(re.search(p, text, re.IGNORECASE) for p in child_profiling_patterns)
+        has_child_profiling = any(pattern_registry.search(p, text, re.IGNORECASE) for p in child_profiling_patterns)
 
         if has_child_profiling:
             # Check if turned off by default
@@ -173,7 +177,7 @@ class ChildrenDataAdvancedGate:
                 r'not\s+(?:enabled|active|on)\s+(?:by\s+default|automatically)'
             ]
 
-            is_off_by_default = any(re.search(p, text, re.IGNORECASE) for p in off_by_default_patterns)
+            is_off_by_default = any(pattern_registry.search(p, text, re.IGNORECASE) for p in off_by_default_patterns)
 
             if not is_off_by_default:
                 issues.append('CRITICAL: Profiling of children must be off by default (2025 requirement)')
@@ -187,7 +191,7 @@ class ChildrenDataAdvancedGate:
             r'where\s+(?:you\s+)?are'
         ]
 
-        has_geolocation = any(re.search(p, text, re.IGNORECASE) for p in geolocation_patterns)
+        has_geolocation = any(pattern_registry.search(p, text, re.IGNORECASE) for p in geolocation_patterns)
 
         if has_geolocation:
             # Check if off by default
@@ -197,7 +201,7 @@ class ChildrenDataAdvancedGate:
                 r'opt[\s-]in.*(?:location|geolocation)'
             ]
 
-            is_geo_off = any(re.search(p, text, re.IGNORECASE) for p in geo_off_patterns)
+            is_geo_off = any(pattern_registry.search(p, text, re.IGNORECASE) for p in geo_off_patterns)
 
             if not is_geo_off:
                 warnings.append('Geolocation must be off by default for children (unless integral to service)')
@@ -211,7 +215,7 @@ class ChildrenDataAdvancedGate:
             r'(?:encourage|prompt|push).*(?:share|disclose|provide)\s+(?:more\s+)?data'
         ]
 
-        has_nudge = any(re.search(p, text, re.IGNORECASE) for p in nudge_patterns)
+        has_nudge = any(pattern_registry.search(p, text, re.IGNORECASE) for p in nudge_patterns)
 
         if has_nudge:
             warnings.append('2025 prohibition: do not use nudge techniques to encourage children to provide unnecessary personal data')
@@ -223,7 +227,8 @@ class ChildrenDataAdvancedGate:
             r'child(?:ren)?\'?s?\s+data.*(?:third[\s-]part|partner|other)'
         ]
 
-        has_child_data_sharing = any(re.search(p, text, re.IGNORECASE) for p in child_data_sharing_patterns)
+        has_child_data_sharing = any(pattern_registry.search(p, text, re.IGNORECASE)
+                                     for p in child_data_sharing_patterns)
 
         if has_child_data_sharing:
             # Check if minimised/disclosed
@@ -234,7 +239,7 @@ class ChildrenDataAdvancedGate:
                 r'essential\s+(?:partners|services)\s+only'
             ]
 
-            is_minimised = any(re.search(p, text, re.IGNORECASE) for p in minimisation_patterns)
+            is_minimised = any(pattern_registry.search(p, text, re.IGNORECASE) for p in minimisation_patterns)
 
             if not is_minimised:
                 warnings.append('Data sharing with third parties should be minimised for children\'s data')
@@ -246,7 +251,7 @@ class ChildrenDataAdvancedGate:
             r'written\s+for\s+child(?:ren)?'
         ]
 
-        has_child_friendly = any(re.search(p, text, re.IGNORECASE) for p in transparency_patterns)
+        has_child_friendly = any(pattern_registry.search(p, text, re.IGNORECASE) for p in transparency_patterns)
 
         if not has_child_friendly:
             warnings.append('Privacy information for children must be in child-friendly, age-appropriate language')
@@ -259,7 +264,7 @@ class ChildrenDataAdvancedGate:
             r'parent.*(?:access|view|manage).*child\'?s?\s+(?:account|data|information)'
         ]
 
-        has_parental_tools = any(re.search(p, text, re.IGNORECASE) for p in parental_tools_patterns)
+        has_parental_tools = any(pattern_registry.search(p, text, re.IGNORECASE) for p in parental_tools_patterns)
 
         if has_parental_consent and not has_parental_tools:
             warnings.append('2025 best practice: provide parental controls and tools to monitor/manage child\'s data')
@@ -272,7 +277,7 @@ class ChildrenDataAdvancedGate:
             r'(?:report|complain)\s+(?:button|option|link)'
         ]
 
-        has_safety_tools = any(re.search(p, text, re.IGNORECASE) for p in safety_tools_patterns)
+        has_safety_tools = any(pattern_registry.search(p, text, re.IGNORECASE) for p in safety_tools_patterns)
 
         if not has_safety_tools:
             warnings.append('Provide online safety tools for children: reporting, blocking, flagging inappropriate content')
@@ -285,7 +290,7 @@ class ChildrenDataAdvancedGate:
             r'voice[\s-]activated.*(?:toy|device)'
         ]
 
-        has_connected_toy = any(re.search(p, text, re.IGNORECASE) for p in connected_toy_patterns)
+        has_connected_toy = any(pattern_registry.search(p, text, re.IGNORECASE) for p in connected_toy_patterns)
 
         if has_connected_toy:
             # Check for security measures
@@ -297,7 +302,7 @@ class ChildrenDataAdvancedGate:
                 r'default\s+(?:password|credentials).*(?:changed|unique)'
             ]
 
-            has_toy_security = any(re.search(p, text, re.IGNORECASE) for p in toy_security_patterns)
+            has_toy_security = any(pattern_registry.search(p, text, re.IGNORECASE) for p in toy_security_patterns)
 
             if not has_toy_security:
                 warnings.append('Connected toys must have strong security: encryption, unique passwords, secure by design')
@@ -312,7 +317,7 @@ class ChildrenDataAdvancedGate:
             r'classroom'
         ]
 
-        is_school_context = any(re.search(p, text, re.IGNORECASE) for p in school_patterns)
+        is_school_context = any(pattern_registry.search(p, text, re.IGNORECASE) for p in school_patterns)
 
         if is_school_context:
             # Check for appropriate basis (not consent)
@@ -322,7 +327,7 @@ class ChildrenDataAdvancedGate:
                 r'educational\s+purposes?'
             ]
 
-            has_appropriate_basis = any(re.search(p, text, re.IGNORECASE) for p in school_basis_patterns)
+            has_appropriate_basis = any(pattern_registry.search(p, text, re.IGNORECASE) for p in school_basis_patterns)
 
             if not has_appropriate_basis:
                 warnings.append('School context: should rely on public task or legitimate interests, not children\'s consent')
@@ -334,7 +339,7 @@ class ChildrenDataAdvancedGate:
             r'parent.*(?:access|delete|manage).*child\'?s?\s+data'
         ]
 
-        has_childrens_rights = any(re.search(p, text, re.IGNORECASE) for p in childrens_rights_patterns)
+        has_childrens_rights = any(pattern_registry.search(p, text, re.IGNORECASE) for p in childrens_rights_patterns)
 
         if not has_childrens_rights:
             warnings.append('Clarify how children (or parents) can exercise data subject rights: access, rectification, erasure')
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class DataProtectionAdvancedGate:
     """
@@ -44,7 +46,7 @@ class DataProtectionAdvancedGate:
             r'right\s+(?:to\s+)?access'
         ]
 
-        has_dsar = any(re.search(p, text, re.IGNORECASE) for p in dsar_patterns)
+        has_dsar = any(pattern_registry.search(p, text, re.IGNORECASE) for p in dsar_patterns)
 
         if has_dsar:
             # Check for 1-month timeframe (2025: extended to 3 months for complex requests)
@@ -55,7 +57,7 @@ class DataProtectionAdvancedGate:
                 r'(?:3|three)\s+months?.*(?:complex|additional\s+time)'
             ]
 
-            has_timeframe = any(re.search(p, text, re.IGNORECASE) for p in timeframe_patterns)
+            has_timeframe = any(pattern_registry.search(p, text, re.IGNORECASE) for p in timeframe_patterns)
             if not has_timeframe:
                 warnings.append('DSAR response deadline: 1 month (extendable to 3 months for complex requests under 2025 Act)')
 
@@ -67,7 +69,7 @@ class DataProtectionAdvancedGate:
                 r'at\s+no\s+cost'
             ]
 
-            has_free = any(re.search(p, text, re.IGNORECASE) for p in free_patterns)
+            has_free = any(pattern_registry.search(p, text, re.IGNORECASE) for p in free_patterns)
             if not has_free:
                 warnings.append('DSARs must be provided free of charge (unless manifestly unfounded or excessive)')
 
@@ -79,7 +81,7 @@ class DataProtectionAdvancedGate:
                 r'refuse.*(?:unfounded|excessive)'
             ]
 
-            has_unfounded_provision = any(re.search(p, text, re.IGNORECASE) for p in unfounded_patterns)
+            has_unfounded_provision = any(pattern_registry.search(p, text, re.IGNORECASE) for p in unfounded_patterns)
             # Good practice to include
 
             # Check for identity verification (2025 strengthened requirements)
@@ -91,7 +93,7 @@ class DataProtectionAdvancedGate:
                 r'reasonable\s+doubt'
             ]
 
-            has_identity = any(re.search(p, text, re.IGNORECASE) for p in identity_patterns)
+            has_identity = any(pattern_registry.search(p, text, re.IGNORECASE) for p in identity_patterns)
             if not has_identity:
                 warnings.append('2025 Act: strengthen identity verification before responding to DSARs')
 
@@ -103,7 +105,7 @@ class DataProtectionAdvancedGate:
                 r'(?:cannot|must\s+not)\s+disclose.*(?:other|another)'
             ]
 
-            has_third_party = any(re.search(p, text, re.IGNORECASE) for p in third_party_patterns)
+            has_third_party = any(pattern_registry.search(p, text, re.IGNORECASE) for p in third_party_patterns)
             # Good practice to clarify
 
             # Check for information to be provided (2025 expanded)
@@ -117,7 +119,8 @@ class DataProtectionAdvancedGate:
                 'safeguards': r'safeguards?.*(?:transfer|international)'
             }
 
-            info_provided = sum(1 for p in info_requirements.values() if re.search(p, text, re.IGNORECASE))
+            info_provided = sum(1 for p in info_requirements.values()
+                                if pattern_registry.search(p, text, re.IGNORECASE))
             if info_provided < 4:
                 warnings.append('DSAR response should include: data held, purposes, recipients, retention, source, automated decisions, transfer safeguards')
 
@@ -129,7 +132,7 @@ class DataProtectionAdvancedGate:
             r'amend.*(?:data|information)'
         ]
 
-        has_rectification = any(re.search(p, text, re.IGNORECASE) for p in rectification_patterns)
+        has_rectification = any(pattern_registry.search(p, text, re.IGNORECASE) for p in rectification_patterns)
 
         if has_rectification:
             # Check for timeframe
@@ -140,7 +143,7 @@ class DataProtectionAdvancedGate:
                 r'as\s+soon\s+as\s+(?:possible|practicable)'
             ]
 
-            has_rect_timeframe = any(re.search(p, text, re.IGNORECASE) for p in rect_timeframe_patterns)
+            has_rect_timeframe = any(pattern_registry.search(p, text, re.IGNORECASE) for p in rect_timeframe_patterns)
             if not has_rect_timeframe:
                 warnings.append('Right to rectification must be actioned without undue delay (within 1 month)')
 
@@ -151,7 +154,7 @@ class DataProtectionAdvancedGate:
                 r'tell.*(?:who.*shared|recipients?)'
             ]
 
-            has_notification = any(re.search(p, text, re.IGNORECASE) for p in notification_patterns)
+            has_notification = any(pattern_registry.search(p, text, re.IGNORECASE) for p in notification_patterns)
             if not has_notification:
                 warnings.append('2025 Act: must notify third parties when data is rectified unless impossible or disproportionate')
 
@@ -163,7 +166,7 @@ class DataProtectionAdvancedGate:
             r'removal\s+of\s+(?:personal\s+)?data'
         ]
 
-        has_erasure = any(re.search(p, text, re.IGNORECASE) for p in erasure_patterns)
+        has_erasure = any(pattern_registry.search(p, text, re.IGNORECASE) for p in erasure_patterns)
 
         if has_erasure:
             # Check for valid grounds for erasure
@@ -176,7 +179,7 @@ class DataProtectionAdvancedGate:
                 r'child.*online\s+services'
             ]
 
-            has_grounds = any(re.search(p, text, re.IGNORECASE) for p in grounds_patterns)
+            has_grounds = any(pattern_registry.search(p, text, re.IGNORECASE) for p in grounds_patterns)
             if not has_grounds:
                 warnings.append('Right to erasure applies when: no longer necessary, consent withdrawn, objection, unlawful processing, legal obligation, or child data')
 
@@ -189,7 +192,7 @@ class DataProtectionAdvancedGate:
                 r'freedom\s+of\s+expression'
             ]
 
-            has_exceptions = any(re.search(p, text, re.IGNORECASE) for p in exceptions_patterns)
+            has_exceptions = any(pattern_registry.search(p, text, re.IGNORECASE) for p in exceptions_patterns)
             if not has_exceptions:
                 warnings.append('Right to erasure exceptions: legal obligations, public interest, legal claims, research, freedom of expression')
 
@@ -201,7 +204,7 @@ class DataProtectionAdvancedGate:
             r'machine[\s-]readable\s+format'
         ]
 
-        has_portability = any(re.search(p, text, re.IGNORECASE) for p in portability_patterns)
+        has_portability = any(pattern_registry.search(p, text, re.IGNORECASE) for p in portability_patterns)
 
         if has_portability:
             # Check for conditions
@@ -211,7 +214,8 @@ class DataProtectionAdvancedGate:
                 'provided_by_subject': r'(?:provided|supplied)\s+by.*data\s+subject'
             }
 
-            conditions_met = sum(1 for p in portability_conditions.values() if re.search(p, text, re.IGNORECASE))
+            conditions_met = sum(1 for p in portability_conditions.values()
+                                 if pattern_registry.search(p, text, re.IGNORECASE))
             if conditions_met < 2:
                 warnings.append('Data portability applies when: based on consent/contract, automated processing, data provided by data subject')
 
@@ -224,7 +228,7 @@ class DataProtectionAdvancedGate:
                 r'interoperable\s+format'
             ]
 
-            has_format = any(re.search(p, text, re.IGNORECASE) for p in format_patterns)
+            has_format = any(pattern_registry.search(p, text, re.IGNORECASE) for p in format_patterns)
             if not has_format:
                 warnings.append('Data portability: provide in structured, commonly used, machine-readable format (e.g., JSON, CSV)')
 
@@ -236,7 +240,7 @@ class DataProtectionAdvancedGate:
             r'stop.*(?:processing|using)\s+(?:my\s+)?data'
         ]
 
-        has_objection = any(re.search(p, text, re.IGNORECASE) for p in objection_patterns)
+        has_objection = any(pattern_registry.search(p, text, re.IGNORECASE) for p in objection_patterns)
 
         if has_objection:
             # Check for direct marketing (absolute right - 2025 strengthened)
@@ -247,7 +251,7 @@ class DataProtectionAdvancedGate:
                 r'profiling.*marketing'
             ]
 
-            has_marketing = any(re.search(p, text, re.IGNORECASE) for p in marketing_patterns)
+            has_marketing = any(pattern_registry.search(p, text, re.IGNORECASE) for p in marketing_patterns)
 
             if has_marketing:
                 absolute_patterns = [
@@ -257,7 +261,7 @@ class DataProtectionAdvancedGate:
                     r'without\s+(?:exception|delay)'
                 ]
 
-                has_absolute = any(re.search(p, text, re.IGNORECASE) for p in absolute_patterns)
+                has_absolute = any(pattern_registry.search(p, text, re.IGNORECASE) for p in absolute_patterns)
                 if not has_absolute:
                     warnings.append('2025 strengthening: absolute right to object to direct marketing - must stop immediately')
 
@@ -269,7 +273,7 @@ class DataProtectionAdvancedGate:
             r'data\s+protection\s+(?:officer|concern)'
         ]
 
-        has_complaint = any(re.search(p, text, re.IGNORECASE) for p in complaint_patterns)
+        has_complaint = any(pattern_registry.search(p, text, re.IGNORECASE) for p in complaint_patterns)
 
         if has_complaint:
             # Check for internal complaint process (2025 requirement)
@@ -280,7 +284,7 @@ class DataProtectionAdvancedGate:
                 r'(?:within\s+)?(?:\d+)\s+(?:days?|weeks?).*respond'
             ]
 
-            has_internal = any(re.search(p, text, re.IGNORECASE) for p in internal_patterns)
+            has_internal = any(pattern_registry.search(p, text, re.IGNORECASE) for p in internal_patterns)
             if not has_internal:
                 warnings.append('2025 Act: must provide clear internal complaint procedure with response timeframe')
 
@@ -293,7 +297,7 @@ class DataProtectionAdvancedGate:
                 r'casework@ico\.org\.uk'
             ]
 
-            has_ico = any(re.search(p, text, re.IGNORECASE) for p in ico_patterns)
+            has_ico = any(pattern_registry.search(p, text, re.IGNORECASE) for p in ico_patterns)
             if not has_ico:
                 issues.append('CRITICAL: Must inform data subjects of right to complain to ICO (Information Commissioner\'s Office)')
 
@@ -311,7 +315,7 @@ class DataProtectionAdvancedGate:
             r'ico\.org\.uk'
         ]
 
-        ico_mentions = sum(1 for p in ico_details_patterns if re.search(p, text, re.IGNORECASE))
+        ico_mentions = sum(1 for p in ico_details_patterns if pattern_registry.search(p, text, re.IGNORECASE))
 
         if has_complaint and ico_mentions < 2:
             warnings.append('Should provide full ICO contact details: casework@ico.org.uk, 0303 123 1113, ico.org.uk')
@@ -325,7 +329,7 @@ class DataProtectionAdvancedGate:
             r'breach.*(?:may\s+result|penalties?)'
         ]
 
-        has_enforcement = any(re.search(p, text, re.IGNORECASE) for p in enforcement_patterns)
+        has_enforcement = any(pattern_registry.search(p, text, re.IGNORECASE) for p in enforcement_patterns)
 
         if has_enforcement:
             # Check for updated 2025 penalty amounts
@@ -336,7 +340,7 @@ class DataProtectionAdvancedGate:
                 r'2%.*(?:global|annual|worldwide)\s+(?:turnover|revenue)'
             ]
 
-            has_penalties = any(re.search(p, text, re.IGNORECASE) for p in penalty_patterns)
+            has_penalties = any(pattern_registry.search(p, text, re.IGNORECASE) for p in penalty_patterns)
             # Good practice to mention severity
 
         # 9. DATA PROTECTION OFFICER (DPO) - 2025 expanded obligations
@@ -346,7 +350,7 @@ class DataProtectionAdvancedGate:
             r'privacy\s+officer'
         ]
 
-        has_dpo = any(re.search(p, text, re.IGNORECASE) for p in dpo_patterns)
+        has_dpo = any(pattern_registry.search(p, text, re.IGNORECASE) for p in dpo_patterns)
 
         if has_dpo:
             # Check for DPO contact details
@@ -356,7 +360,7 @@ class DataProtectionAdvancedGate:
                 r'(?:address|phone).*DPO'
             ]
 
-            has_dpo_contact = any(re.search(p, text, re.IGNORECASE) for p in dpo_contact_patterns)
+            has_dpo_contact = any(pattern_registry.search(p, text, re.IGNORECASE) for p in dpo_contact_patterns)
             if not has_dpo_contact:
                 warnings.append('Must provide DPO contact details for data protection queries')
 
@@ -368,7 +372,7 @@ class DataProtectionAdvancedGate:
                 r'autonomous'
             ]
 
-            has_independence = any(re.search(p, text, re.IGNORECASE) for p in independence_patterns)
+            has_independence = any(pattern_registry.search(p, text, re.IGNORECASE) for p in independence_patterns)
             if not has_independence:
                 warnings.append('2025 emphasis: DPO must operate independently without instructions regarding their tasks')
 
@@ -380,7 +384,7 @@ class DataProtectionAdvancedGate:
             r'adequacy\s+(?:decision|regulation)'
         ]
 
-        has_transfers = any(re.search(p, text, re.IGNORECASE) for p in transfer_patterns)
+        has_transfers = any(pattern_registry.search(p, text, re.IGNORECASE) for p in transfer_patterns)
 
         if has_transfers:
             # Check for transfer mechanisms (2025 UK-specific)
@@ -393,7 +397,7 @@ class DataProtectionAdvancedGate:
                 r'\bBCRs?\b'
             ]
 
-            has_mechanism = any(re.search(p, text, re.IGNORECASE) for p in mechanism_patterns)
+            has_mechanism = any(pattern_registry.search(p, text, re.IGNORECASE) for p in mechanism_patterns)
             if not has_mechanism:
                 warnings.append('2025: International transfers require: adequacy decision, UK IDTA, UK Addendum to SCCs, or BCRs')
 
@@ -405,7 +409,7 @@ class DataProtectionAdvancedGate:
                 r'effective\s+(?:remedies|legal\s+remedies)'
             ]
 
-            has_safeguards = any(re.search(p, text, re.IGNORECASE) for p in safeguards_patterns)
+            has_safeguards = any(pattern_registry.search(p, text, re.IGNORECASE) for p in safeguards_patterns)
             if not has_safeguards:
                 warnings.append('International transfers must have appropriate safeguards and enforceable data subject rights')
 
@@ -418,7 +422,7 @@ class DataProtectionAdvancedGate:
             r'layered\s+(?:approach|notice)'
         ]
 
-        has_transparency = any(re.search(p, text, re.IGNORECASE) for p in transparency_patterns)
+        has_transparency = any(pattern_registry.search(p, text, re.IGNORECASE) for p in transparency_patterns)
 
         if not has_transparency and has_dsar:
             warnings.append('2025 Act: information must be in clear, plain language, easily accessible and understandable')
@@ -431,7 +435,7 @@ class DataProtectionAdvancedGate:
             r'parental\s+(?:consent|permission)'
         ]
 
-        has_children = any(re.search(p, text, re.IGNORECASE) for p in children_patterns)
+        has_children = any(pattern_registry.search(p, text, re.IGNORECASE) for p in children_patterns)
 
         if has_children:
             children_protection_patterns = [
@@ -442,7 +446,8 @@ class DataProtectionAdvancedGate:
                 r'child[\s-]friendly'
             ]
 
-            has_children_protection = any(re.search(p, text, re.IGNORECASE) for p in children_protection_patterns)
+            has_children_protection = any(pattern_registry.search(p, text, re.IGNORECASE)
+                                          for p in children_protection_patterns)
             if not has_children_protection:
                 warnings.append('2025 enhanced: special protections for children\'s data - age verification, parental consent, best interests')
 
@@ -456,7 +461,7 @@ class DataProtectionAdvancedGate:
             r'\bDPIA\b'
         ]
 
-        has_accountability = any(re.search(p, text, re.IGNORECASE) for p in accountability_patterns)
+        has_accountability = any(pattern_registry.search(p, text, re.IGNORECASE) for p in accountability_patterns)
 
         if not has_accountability:
             warnings.append('Must demonstrate accountability - maintain records of processing, DPIAs, policies')
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class AccountabilityGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class AccountabilityGate:
             }
 
         patterns = [r'controller', r'who we are', r'contact details', r'registered address']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Controller/accountability information provided'}
         return {'status': 'FAIL', 'severity': 'high', 'message': 'No controller/accountability information provided'}
 
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class AccuracyGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class AccuracyGate:
             }
 
         patterns = [r'keep.*data.*accurate', r'update (?:your )?information', r'how to request corrections?']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Accuracy and correction mechanisms described'}
         return {'status': 'FAIL', 'severity': 'high', 'message': 'No reference to maintaining accuracy or rectification process'}
 
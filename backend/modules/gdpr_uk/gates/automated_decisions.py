@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class AutomatedDecisionsGate:
     def __init__(self):
@@ -35,7 +37,8 @@ class AutomatedDecisionsGate:
             r'no\s+appeal'
         ]
 
-        has_automated_decision = any(re.search(p, text, re.IGNORECASE) for p in automated_decision_indicators)
+        has_automated_decision = any(pattern_registry.search(p, text, re.IGNORECASE)
+                                     for p in automated_decision_indicators)
 
         # Check for right to human review/intervention
         human_review_patterns = [
@@ -46,7 +49,7 @@ class AutomatedDecisionsGate:
             r'appeal'
         ]
 
-        has_human_review = any(re.search(p, text, re.IGNORECASE) for p in human_review_patterns)
+        has_human_review = any(pattern_registry.search(p, text, re.IGNORECASE) for p in human_review_patterns)
 
         anti_review_patterns = [
             r'no\s+human\s+(?:override|review|intervention)',
@@ -54,7 +57,7 @@ class AutomatedDecisionsGate:
             r'decision\s+is\s+final'
         ]
 
-        if any(re.search(p, text, re.IGNORECASE) for p in anti_review_patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in anti_review_patterns):
             has_human_review = False
             has_automated_decision = True
 
@@ -62,7 +65,7 @@ class AutomatedDecisionsGate:
         if has_automated_decision and not has_human_review:
             spans = []
             for p in automated_decision_indicators:
-                for m in re.finditer(p, text, re.IGNORECASE):
+                for m in pattern_registry.finditer(p, text, re.IGNORECASE):
                     spans.append({
                         'type': 'automated_decision_no_review',
                         'start': m.start(),
@@ -80,13 +83,15 @@ class AutomatedDecisionsGate:
                 'suggestion': 'Add: "You have the right to request human review of this decision, obtain an explanation, and challenge it."'
             }
 
-        risk_children = bool(re.search(r'\bchild|teen|under\s+1[36-8]|parental\s+consent', text_lower))
-        risk_special = bool(re.search(r'special\s+category|health\s+data|biometric|genetic|lifestyle|medical', text_lower))
-        risk_international = bool(re.search(r'singapore|dubai|united\s+states|uae|outside\s+the\s+uk|overseas|international\s+transfer', text_lower))
+        risk_children = bool(pattern_registry.search(r'\bchild|teen|under\s+1[36-8]|parental\s+consent', text_lower))
+        risk_special = bool(pattern_registry.search(
+            r'special\s+category|health\s+data|biometric|genetic|lifestyle|medical', text_lower))
+        risk_international = bool(pattern_registry.search(
+            r'singapore|dubai|united\s+states|uae|outside\s+the\s+uk|overseas|international\s+transfer', text_lower))
         risk_automated = has_automated_decision
 
         high_risk_factors = sum([risk_children, risk_special, risk_international, risk_automated])
-        has_dpia_reference = bool(re.search(r'data\s+protection\s+impact\s+assessment|dpia', text_lower))
+        has_dpia_reference = bool(pattern_registry.search(r'data\s+protection\s+impact\s+assessment|dpia', text_lower))
 
         if high_risk_factors >= 2 and not has_dpia_reference:
             return {
@@ -105,7 +110,7 @@ class AutomatedDecisionsGate:
         indicator_terms = ['ai', 'algorithm', 'automated', 'profiling', 'machine learning']
         spans = []
         for term in indicator_terms:
-            for m in re.finditer(rf"\b{re.escape(term)}\b", text, re.IGNORECASE):
+            for m in pattern_registry.finditer(rf"\b{re.escape(term)}\b", text, re.IGNORECASE):
                 spans.append({
                     'type': 'automation_indicator',
                     'start': m.start(),
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class BreachNotificationGate:
     def __init__(self):
@@ -26,7 +28,7 @@ class BreachNotificationGate:
             r'breach.*notification'
         ]
         
-        if any(re.search(p, text, re.IGNORECASE) for p in breach_patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in breach_patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Breach notification process mentioned'}
         
         return {
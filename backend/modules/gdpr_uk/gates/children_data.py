@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ChildrenDataGate:
     def __init__(self):
@@ -26,7 +28,7 @@ class ChildrenDataGate:
             r'guardian.*permission'
         ]
         
-        if any(re.search(p, text, re.IGNORECASE) for p in child_safeguards):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in child_safeguards):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Child data safeguards mentioned'}
         
         return {
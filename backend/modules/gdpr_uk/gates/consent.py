@@ -1,5 +1,9 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+from core.proximity import proximity
+
 
 class ConsentGate:
     def __init__(self):
@@ -21,17 +25,20 @@ class ConsentGate:
             r'lawful basis'
         ]
 
-    def _is_relevant(self, text: str) -> bool:
+    def _is_relevant(self, ctx: DocumentContext) -> bool:
         """Check if content contains indicators this gate applies"""
-        t = (text or '').lower()
+        t = ctx.lower
         return any(keyword in t for keyword in self.relevance_keywords)
 
     def check(self, text, document_type):
-        content = text or ''
-        content_lower = content.lower()
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        content = ctx.text
+        content_lower = ctx.lower
 
         # 1. Content detection - does this text actually need this gate?
-        if not self._is_relevant(content):
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not involve data collection or consent for processing',
@@ -55,7 +62,7 @@ class ConsentGate:
             r'sexual\s+orientation'
         ]
 
-        has_special_category = any(re.search(pattern, content_lower) for pattern in special_category_patterns)
+        has_special_category = any(proximity.occurs(pattern, content_lower) for pattern in special_category_patterns)
 
         article9_patterns = [
             r'article\s+9',
@@ -65,7 +72,7 @@ class ConsentGate:
             r'legal\s+basis\s+under\s+article\s+9'
         ]
 
-        has_article9_basis = any(re.search(pattern, content_lower) for pattern in article9_patterns)
+        has_article9_basis = any(proximity.occurs(pattern, content_lower) for pattern in article9_patterns)
 
         if has_special_category and not has_article9_basis:
             return {
@@ -87,7 +94,7 @@ class ConsentGate:
         ]
 
         for pattern in forced_consent_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
+            for match in pattern_registry.finditer(pattern, content, re.IGNORECASE):
                 spans.append({
                     'type': 'forced_consent',
                     'start': match.start(),
@@ -105,8 +112,7 @@ class ConsentGate:
         ]
 
         for pattern in bundled_patterns:
-            match = re.search(pattern, content_lower)
-            if match:
+            if proximity.occurs(pattern, content_lower):
                 issues.append("Bundled consent detected - must be separate for each purpose")
 
         # Check for pre-selected/default consent
@@ -119,8 +125,7 @@ class ConsentGate:
         ]
 
         for pattern in pre_selected_patterns:
-            match = re.search(pattern, content_lower)
-            if match:
+            if proximity.occurs(pattern, content_lower):
                 issues.append("Pre-selected/opt-out consent - must be opt-in")
 
         # Check for vague consent language
@@ -131,8 +136,7 @@ class ConsentGate:
         ]
 
         for pattern in vague_patterns:
-            match = re.search(pattern, content_lower)
-            if match:
+            if proximity.occurs(pattern, content_lower):
                 issues.append("Vague consent scope - must be specific and granular")
 
         # Check for conditional service
@@ -144,10 +148,11 @@ class ConsentGate:
 
         has_conditional = False
         for pattern in conditional_patterns:
-            if re.search(pattern, content_lower):
+            if proximity.occurs(pattern, content_lower):
                 has_conditional = True
                 # This is only OK if it's strictly necessary for the service
-                if not re.search(r'(?:strictly\s+)?necessary|essential|required\s+for\s+the\s+service', content_lower):
+                if not proximity.occurs(r'(?:strictly\s+)?necessary|essential|required\s+for\s+the\s+service',
+                                        content_lower):
                     issues.append("Consent tied to service without showing it's strictly necessary")
 
         if spans or len(issues) > 0:
@@ -165,7 +170,7 @@ class ConsentGate:
         # 3. Check if proper consent mechanism is present
         has_consent_mechanism = False
         for pattern in self.patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if proximity.occurs(pattern, content, re.IGNORECASE):
                 has_consent_mechanism = True
                 break
 
@@ -178,7 +183,7 @@ class ConsentGate:
             r'revoke.*consent'
         ]
 
-        has_withdrawal = any(re.search(p, content_lower) for p in withdrawal_patterns)
+        has_withdrawal = any(proximity.occurs(p, content_lower) for p in withdrawal_patterns)
 
         if has_consent_mechanism:
             if not has_withdrawal:
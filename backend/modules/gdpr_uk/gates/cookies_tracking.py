@@ -1,5 +1,8 @@
 import re
 
+from core.pattern_registry import pattern_registry
+from core.proximity import proximity
+
 
 class CookiesTrackingGate:
     def __init__(self):
@@ -27,7 +30,7 @@ class CookiesTrackingGate:
             r'similar.*technolog'
         ]
 
-        mentions_cookies = any(re.search(p, text, re.IGNORECASE) for p in cookie_disclosure)
+        mentions_cookies = any(proximity.occurs(p, text, re.IGNORECASE) for p in cookie_disclosure)
 
         if not mentions_cookies:
             return {'status': 'PASS', 'severity': 'none', 'message': 'No cookies/tracking mentioned', 'spans': []}
@@ -45,7 +48,7 @@ class CookiesTrackingGate:
         ]
 
         for pattern, issue_text in problematic_patterns:
-            if re.search(pattern, text_lower):
+            if proximity.occurs(pattern, text_lower):
                 issues.append(issue_text)
 
         # Check for consent/control mechanism
@@ -59,10 +62,10 @@ class CookiesTrackingGate:
             r'reject.*all.*cookie'
         ]
 
-        has_controls = any(re.search(p, text_lower) for p in control_patterns)
+        has_controls = any(proximity.occurs(p, text_lower) for p in control_patterns)
 
         # Check if mentions granular control
-        has_granular = bool(re.search(r'(?:choose|select|customize).*(?:cookie|preference)', text_lower))
+        has_granular = proximity.occurs(r'(?:choose|select|customize).*(?:cookie|preference)', text_lower)
 
         if not has_controls:
             issues.append("No cookie control/opt-out mechanism mentioned")
@@ -71,12 +74,12 @@ class CookiesTrackingGate:
             warnings.append("Cookie controls mentioned but no granular choice (accept/reject by category)")
 
         # Check for essential vs non-essential distinction
-        mentions_essential = bool(re.search(r'essential.*cookie|strictly.*necessary', text_lower))
+        mentions_essential = proximity.occurs(r'essential.*cookie|strictly.*necessary', text_lower)
         if mentions_essential and not has_granular:
             warnings.append("Mentions essential cookies but doesn't distinguish from non-essential")
 
         for p in cookie_disclosure:
-            for m in re.finditer(p, text, re.IGNORECASE):
+            for m in pattern_registry.finditer(p, text, re.IGNORECASE):
                 spans.append({'type': 'cookie_tracking', 'start': m.start(), 'end': m.end(), 'text': m.group(), 'severity': 'medium' if issues else 'low'})
 
         if issues:
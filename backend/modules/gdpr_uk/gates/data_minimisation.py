@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class DataMinimisationGate:
     def __init__(self):
@@ -27,7 +29,7 @@ class DataMinimisationGate:
         ]
         
         for pattern in minimisation_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {'status': 'PASS', 'severity': 'none', 'message': 'Data minimisation principle stated'}
         
         return {
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class DpoContactGate:
     def __init__(self):
@@ -26,7 +28,7 @@ class DpoContactGate:
             r'dpo@'
         ]
         
-        if any(re.search(p, text, re.IGNORECASE) for p in dpo_patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in dpo_patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'DPO contact information present'}
         
         return {
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class InternationalTransferGate:
     def __init__(self):
@@ -19,7 +21,8 @@ class InternationalTransferGate:
                 'legal_source': self.legal_source
             }
         
-        transfer_mentions = re.search(r'outside.*(?:uk|eu|eea)|international.*transfer|third countr', text, re.IGNORECASE)
+        transfer_mentions = pattern_registry.search(r'outside.*(?:uk|eu|eea)|international.*transfer|third countr',
+                                                    text, re.IGNORECASE)
         
         if not transfer_mentions:
             return {'status': 'PASS', 'severity': 'none', 'message': 'No international transfers mentioned'}
@@ -32,7 +35,7 @@ class InternationalTransferGate:
             r'safeguards.*in place'
         ]
         
-        if any(re.search(p, text, re.IGNORECASE) for p in safeguard_patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in safeguard_patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'International transfer safeguards stated'}
         
         return {
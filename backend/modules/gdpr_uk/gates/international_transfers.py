@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class InternationalTransfersGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class InternationalTransfersGate:
             }
 
         patterns = [r'adequac(y|ies)', r'standard contractual clauses|sccs?', r'appropriate safeguards', r'transfer risk assessment']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'International transfers and safeguards described'}
         return {'status': 'FAIL', 'severity': 'high', 'message': 'International transfers not accompanied by safeguards (adequacy, SCCs)'}
 
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class LawfulBasisGate:
     def __init__(self):
@@ -29,7 +31,7 @@ class LawfulBasisGate:
         ]
         
         for pattern in lawful_bases:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {'status': 'PASS', 'severity': 'none', 'message': 'Lawful basis for processing stated'}
         
         return {
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ProcessorsGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class ProcessorsGate:
             }
 
         patterns = [r'third part(y|ies)', r'processors?', r'service providers?', r'share (?:your )?data']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Third parties/processors and sharing referenced'}
         return {'status': 'FAIL', 'severity': 'high', 'message': 'No information about processors/third parties and data sharing'}
 
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class PurposeGate:
     def __init__(self):
@@ -49,7 +51,7 @@ class PurposeGate:
 
         spans = []
         for pattern in vague_purposes:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
+            for match in pattern_registry.finditer(pattern, content, re.IGNORECASE):
                 spans.append({
                     'type': 'vague_purpose',
                     'start': match.start(),
@@ -70,7 +72,7 @@ class PurposeGate:
 
         # 3. Check if proper purpose limitation is present
         for pattern in self.patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if pattern_registry.search(pattern, content, re.IGNORECASE):
                 return {
                     'status': 'PASS',
                     'severity': 'none',
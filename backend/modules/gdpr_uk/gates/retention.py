@@ -1,5 +1,8 @@
 import re
 
+from core.pattern_registry import pattern_registry
+from core.proximity import proximity
+
 
 class RetentionGate:
     def __init__(self):
@@ -47,7 +50,7 @@ class RetentionGate:
 
         spans = []
         for pattern in indefinite_patterns:
-            for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+            for match in pattern_registry.finditer(pattern, text_lower, re.IGNORECASE):
                 spans.append({
                     'type': 'indefinite_retention',
                     'start': match.start(),
@@ -68,7 +71,7 @@ class RetentionGate:
 
         # 3. Check if proper retention period is specified
         for pattern in self.patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+            if proximity.occurs(pattern, text_lower, re.IGNORECASE):
                 return {
                     'status': 'PASS',
                     'severity': 'none',
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class RightsGate:
     def __init__(self):
@@ -47,7 +49,7 @@ class RightsGate:
         # Count how many rights are mentioned
         rights_found = 0
         for pattern in self.key_rights:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+            if pattern_registry.search(pattern, text_lower, re.IGNORECASE):
                 rights_found += 1
         
         # Need at least 4 different rights mentioned
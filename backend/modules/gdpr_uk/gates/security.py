@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class SecurityGate:
     def __init__(self):
@@ -36,7 +38,7 @@ class SecurityGate:
 
         # 2. Run the actual validation logic
         for pattern in self.patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if pattern_registry.search(pattern, content, re.IGNORECASE):
                 return {
                     'status': 'PASS',
                     'severity': 'none',
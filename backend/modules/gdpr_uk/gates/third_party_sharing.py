@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ThirdPartySharingGate:
     def __init__(self):
@@ -28,7 +30,7 @@ class ThirdPartySharingGate:
             r'service provider'
         ]
 
-        mentions_third_party = any(re.search(p, text, re.IGNORECASE) for p in third_party_patterns)
+        mentions_third_party = any(pattern_registry.search(p, text, re.IGNORECASE) for p in third_party_patterns)
 
         if not mentions_third_party:
             return {'status': 'PASS', 'severity': 'none', 'message': 'No third party sharing mentioned', 'spans': []}
@@ -40,7 +42,7 @@ class ThirdPartySharingGate:
             r'third\s+part(?:y|ies).*marketing'
         ]
 
-        has_marketing = any(re.search(p, text, re.IGNORECASE) for p in marketing_patterns)
+        has_marketing = any(pattern_registry.search(p, text, re.IGNORECASE) for p in marketing_patterns)
 
         # Check if explicit consent is mentioned
         consent_patterns = [
@@ -50,13 +52,13 @@ class ThirdPartySharingGate:
             r'opt.?in'
         ]
 
-        has_consent = any(re.search(p, text, re.IGNORECASE) for p in consent_patterns)
+        has_consent = any(pattern_registry.search(p, text, re.IGNORECASE) for p in consent_patterns)
 
         # Marketing sharing without clear consent = violation
         if has_marketing and not has_consent:
             spans = []
             for p in marketing_patterns:
-                for m in re.finditer(p, text, re.IGNORECASE):
+                for m in pattern_registry.finditer(p, text, re.IGNORECASE):
                     spans.append({'type': 'marketing_without_consent', 'start': m.start(), 'end': m.end(), 'text': m.group(), 'severity': 'critical'})
 
             return {
@@ -71,13 +73,13 @@ class ThirdPartySharingGate:
         # If third parties mentioned, check for disclosure details
         disclosure_patterns = [r'listed below', r'including:', r'such as', r'specifically', r'named']
 
-        if any(re.search(p, text, re.IGNORECASE) for p in disclosure_patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in disclosure_patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Third party sharing disclosed', 'spans': []}
 
         # Collect spans for third-party mentions if disclosure is missing
         spans = []
         for p in third_party_patterns:
-            for m in re.finditer(p, text, re.IGNORECASE):
+            for m in pattern_registry.finditer(p, text, re.IGNORECASE):
                 spans.append({'type': 'third_party_mention', 'start': m.start(), 'end': m.end(), 'text': m.group(), 'severity': 'high'})
 
         return {
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class WithdrawalConsentGate:
     def __init__(self):
@@ -25,7 +27,7 @@ class WithdrawalConsentGate:
             r'revoke.*consent'
         ]
         
-        if any(re.search(p, text, re.IGNORECASE) for p in withdrawal_patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in withdrawal_patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Consent withdrawal mechanism stated'}
         
         return {
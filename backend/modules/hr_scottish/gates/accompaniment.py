@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 class AccompanimentGate:
     def __init__(self):
         self.name = "accompaniment"
@@ -49,7 +51,7 @@ class AccompanimentGate:
         # Check for proper accompaniment rights
         has_accompaniment = False
         for pattern in self.patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 has_accompaniment = True
                 break
 
@@ -68,25 +70,27 @@ class AccompanimentGate:
 
         restrictions_found = []
         for pattern in restriction_patterns:
-            match = re.search(pattern, text_lower)
+            match = pattern_registry.search(pattern, text_lower)
             if match:
                 restrictions_found.append(match.group())
                 issues.append(f"Potentially unlawful restriction: '{match.group()}'")
 
         # Check for specific qui can accompany
-        mentions_colleague = bool(re.search(r'colleague|co-worker|work.?mate', text_lower))
-        mentions_union = bool(re.search(r'trade union|union rep', text_lower))
+        mentions_colleague = bool(pattern_registry.search(r'colleague|co-worker|work.?mate', text_lower))
+        mentions_union = bool(pattern_registry.search(r'trade union|union rep', text_lower))
 
         if has_accompaniment and not (mentions_colleague or mentions_union):
             warnings.append("Right mentioned but doesn't specify colleague or trade union representative")
 
         # Check for advance notice requirement for companion
-        has_advance_notice = bool(re.search(r'(?:inform|notify|tell).*(?:in advance|beforehand|prior)', text_lower))
+        has_advance_notice = bool(pattern_registry.search(r'(?:inform|notify|tell).*(?:in advance|beforehand|prior)',
+                                                          text_lower))
         if has_accompaniment and not has_advance_notice:
             warnings.append("Should mention employee must give advance notice of companion's name")
 
         # Check for inappropriately restrictive wording
-        if re.search(r'you may bring one person', text_lower) and not re.search(r'colleague|trade union', text_lower):
+        if (pattern_registry.search(r'you may bring one person', text_lower)
+                and not pattern_registry.search(r'colleague|trade union', text_lower)):
             warnings.append("Wording too vague - should specify 'colleague or trade union rep'")
 
         # Determine status
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class AllegationsGate:
     def __init__(self):
@@ -28,8 +30,8 @@ class AllegationsGate:
         text_lower = text.lower()
 
         # Check for specific dates/details
-        has_dates = bool(re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', text, re.IGNORECASE))
-        has_times = bool(re.search(r'\d{1,2}:\d{2}|(?:\d+\s*(?:am|pm))', text, re.IGNORECASE))
+        has_dates = bool(pattern_registry.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', text, re.IGNORECASE))
+        has_times = bool(pattern_registry.search(r'\d{1,2}:\d{2}|(?:\d+\s*(?:am|pm))', text, re.IGNORECASE))
 
         # Extended vague terms that AI commonly generates
         vague_terms = [
@@ -41,7 +43,7 @@ class AllegationsGate:
         ]
 
         for term in vague_terms:
-            for match in re.finditer(re.escape(term), text, re.IGNORECASE):
+            for match in pattern_registry.finditer(re.escape(term), text, re.IGNORECASE):
                 vague_spans.append({
                     'type': 'vague_allegation',
                     'start': match.start(),
@@ -51,9 +53,10 @@ class AllegationsGate:
                 })
 
         # Check for specific incident descriptions
-        has_who = bool(re.search(r'(?:witness|present|reported by|complained by)', text_lower))
-        has_where = bool(re.search(r'(?:in|at|on)\s+(?:the\s+)?(?:office|workplace|room|site|location)', text_lower))
-        has_what_happened = bool(re.search(r'(?:said|did|failed to|refused to|was seen)', text_lower))
+        has_who = bool(pattern_registry.search(r'(?:witness|present|reported by|complained by)', text_lower))
+        has_where = bool(pattern_registry.search(r'(?:in|at|on)\s+(?:the\s+)?(?:office|workplace|room|site|location)',
+                                                 text_lower))
+        has_what_happened = bool(pattern_registry.search(r'(?:said|did|failed to|refused to|was seen)', text_lower))
 
         # Analyze specificity
         if vague_spans:
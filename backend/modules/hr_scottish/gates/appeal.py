@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class AppealGate:
     def __init__(self):
@@ -28,7 +30,7 @@ class AppealGate:
         ]
         
         for pattern in appeal_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {
                     'status': 'PASS',
                     'severity': 'none',
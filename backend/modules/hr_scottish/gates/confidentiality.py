@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ConfidentialityGate:
     def __init__(self):
@@ -20,6 +22,6 @@ class ConfidentialityGate:
                 'legal_source': self.legal_source
             }
 
-        if re.search(r'confidential', text, re.IGNORECASE):
+        if pattern_registry.search(r'confidential', text, re.IGNORECASE):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Confidentiality of the process is stated', 'legal_source': self.legal_source}
         return {'status': 'FAIL', 'severity': 'high', 'message': 'No statement about confidentiality of the process', 'legal_source': self.legal_source}
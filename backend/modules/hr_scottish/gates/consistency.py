@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ConsistencyGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class ConsistencyGate:
         policy_refs = [r'in accordance with', r'company policy', r'procedure', r'handbook']
         
         for pattern in policy_refs:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {'status': 'PASS', 'severity': 'none', 'message': 'Policy/procedure referenced', 'legal_source': self.legal_source}
         
         return {
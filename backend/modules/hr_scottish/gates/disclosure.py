@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class DisclosureGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class DisclosureGate:
             }
 
         patterns = [r'document(s|ation)', r'bundle', r'evidence', r'witness statements?', r'investigation report', r'provided (?:in advance|before the hearing)']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Disclosure of documents referenced', 'legal_source': self.legal_source}
         return {
             'status': 'FAIL',
@@ -1,4 +1,4 @@
-import re
+from core.pattern_registry import pattern_registry
 
 
 class DismissalGate:
@@ -22,7 +22,7 @@ class DismissalGate:
             return {'status': 'PASS', 'severity': 'none', 'message': 'No serious misconduct referenced.', 'legal_source': self.legal_source}
         
         # If serious misconduct mentioned, check for dismissal warning
-        has_warning = bool(re.search(r'(?:dismissal|termination|summary dismissal)', text_lower))
+        has_warning = bool(pattern_registry.search(r'(?:dismissal|termination|summary dismissal)', text_lower))
         
         if has_warning:
             return {
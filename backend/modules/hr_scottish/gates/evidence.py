@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class EvidenceGate:
     def __init__(self):
@@ -33,7 +35,7 @@ class EvidenceGate:
             }
         
         for pattern in self.patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {
                     'status': 'PASS',
                     'severity': 'none',
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ImpartialChairGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class ImpartialChairGate:
             }
 
         patterns = [r'(?:impartial|independent) (?:chair|manager)', r'not previously involved', r'fair and unbiased']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Impartial chair/manager referenced', 'legal_source': self.legal_source}
         return {
             'status': 'FAIL',
@@ -1,4 +1,4 @@
-import re
+from core.pattern_registry import pattern_registry
 
 
 class InformalThreatsGate:
@@ -44,7 +44,7 @@ class InformalThreatsGate:
             r'discuss\s+(?:this|your)',
         ]
 
-        has_action = any(re.search(p, text_lower) for p in action_patterns)
+        has_action = any(pattern_registry.search(p, text_lower) for p in action_patterns)
 
         return has_informal or has_action
 
@@ -70,7 +70,7 @@ class InformalThreatsGate:
             r'following\s+investigation'
         ]
 
-        has_formal_process = any(re.search(p, text_lower) for p in formal_indicators)
+        has_formal_process = any(pattern_registry.search(p, text_lower) for p in formal_indicators)
 
         if has_formal_process:
             return {
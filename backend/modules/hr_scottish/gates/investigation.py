@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class InvestigationGate:
     def __init__(self):
@@ -24,7 +26,7 @@ class InvestigationGate:
         investigation_patterns = [r'investigation', r'investigated', r'enquiry', r'findings', r'investigation report']
         
         for pattern in investigation_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {'status': 'PASS', 'severity': 'none', 'message': 'Investigation process referenced'}
         
         return {
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class MeetingDetailsGate:
     def __init__(self):
@@ -20,8 +22,10 @@ class MeetingDetailsGate:
                 'legal_source': self.legal_source
             }
 
-        has_date = bool(re.search(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b", text, re.IGNORECASE))
-        has_time = bool(re.search(r"\b(?:\d{1,2}:[0-5]\d|\d{1,2}\s?(?:am|pm))\b", text, re.IGNORECASE))
+        has_date = bool(pattern_registry.search(
+            r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b",
+            text, re.IGNORECASE))
+        has_time = bool(pattern_registry.search(r"\b(?:\d{1,2}:[0-5]\d|\d{1,2}\s?(?:am|pm))\b", text, re.IGNORECASE))
         has_location = any(w in text.lower() for w in ['location', 'venue', 'address', 'meeting room', 'place'])
 
         if has_date and has_time and has_location:
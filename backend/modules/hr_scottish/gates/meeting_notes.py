@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class MeetingNotesGate:
     def __init__(self):
@@ -22,7 +24,7 @@ class MeetingNotesGate:
         notes_patterns = [r'minutes', r'notes.*meeting', r'record.*meeting', r'noted']
         
         for pattern in notes_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {'status': 'PASS', 'severity': 'none', 'message': 'Meeting recording mentioned', 'legal_source': self.legal_source}
         
         return {
@@ -1,6 +1,8 @@
 import re
 from datetime import datetime, timedelta
 
+from core.pattern_registry import pattern_registry
+
 
 class MeetingNoticeGate:
     def __init__(self):
@@ -32,7 +34,7 @@ class MeetingNoticeGate:
         ]
 
         for ind in urgent_indicators:
-            for m in re.finditer(re.escape(ind), lower, re.IGNORECASE):
+            for m in pattern_registry.finditer(re.escape(ind), lower, re.IGNORECASE):
                 matches.append({
                     'type': 'short_notice',
                     'start': m.start(),
@@ -50,14 +52,15 @@ class MeetingNoticeGate:
         ]
 
         for pattern in date_patterns:
-            if re.search(pattern, lower):
+            if pattern_registry.search(pattern, lower):
                 if 'tomorrow' in lower or 'today' in lower:
                     issues.append("Same-day or next-day meeting scheduling")
 
         # Check for lack of meeting details
-        has_date = bool(re.search(r'\d{1,2}[/-]\d{1,2}|(?:monday|tuesday|wednesday|thursday|friday)', lower))
-        has_time = bool(re.search(r'\d{1,2}:\d{2}|(?:\d+\s*(?:am|pm))', lower))
-        has_location = bool(re.search(r'(?:room|office|location|venue|teams|zoom|address)', lower))
+        has_date = bool(pattern_registry.search(r'\d{1,2}[/-]\d{1,2}|(?:monday|tuesday|wednesday|thursday|friday)',
+                                                lower))
+        has_time = bool(pattern_registry.search(r'\d{1,2}:\d{2}|(?:\d+\s*(?:am|pm))', lower))
+        has_location = bool(pattern_registry.search(r'(?:room|office|location|venue|teams|zoom|address)', lower))
 
         if not has_date and 'meeting' in lower:
             issues.append("No specific date provided for meeting")
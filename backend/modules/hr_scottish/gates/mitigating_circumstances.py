@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class MitigatingCircumstancesGate:
     def __init__(self):
@@ -21,6 +23,6 @@ class MitigatingCircumstancesGate:
             }
 
         patterns = [r'mitigating circumstances', r'consider(?:ation)? of (?:mitigating|personal) factors', r'length of service', r'previous record']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Mitigating/personal circumstances considered', 'legal_source': self.legal_source}
         return {'status': 'FAIL', 'severity': 'high', 'message': 'No reference to considering mitigating circumstances', 'legal_source': self.legal_source}
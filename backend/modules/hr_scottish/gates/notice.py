@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class NoticePeriodGate:
     def __init__(self):
@@ -21,8 +23,10 @@ class NoticePeriodGate:
             }
 
         # Look for date/time indicators suggesting notice was provided
-        has_date = bool(re.search(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b", text, re.IGNORECASE))
-        has_time = bool(re.search(r"\b(?:\d{1,2}:[0-5]\d|\d{1,2}\s?(?:am|pm))\b", text, re.IGNORECASE))
+        has_date = bool(pattern_registry.search(
+            r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b",
+            text, re.IGNORECASE))
+        has_time = bool(pattern_registry.search(r"\b(?:\d{1,2}:[0-5]\d|\d{1,2}\s?(?:am|pm))\b", text, re.IGNORECASE))
         if has_date or has_time:
             return {'status': 'PASS', 'severity': 'none', 'message': 'Meeting date/time provided', 'legal_source': self.legal_source}
         return {
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class OutcomeReasonsGate:
     def __init__(self):
@@ -23,7 +25,7 @@ class OutcomeReasonsGate:
         reason_patterns = [r'following.*investigation', r'reason.*decision', r'found that', r'concluded that']
         
         for pattern in reason_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {'status': 'PASS', 'severity': 'none', 'message': 'Reasons for decision stated', 'legal_source': self.legal_source}
         
         return {
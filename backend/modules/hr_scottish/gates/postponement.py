@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class PostponementGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class PostponementGate:
             }
 
         patterns = [r'postpone', r'rearrange', r'reschedule', r'adjourn', r'if.*(companion|representative).*unavailable']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Right to reasonable postponement mentioned', 'legal_source': self.legal_source}
         return {
             'status': 'FAIL',
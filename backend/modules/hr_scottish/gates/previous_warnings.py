@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class PreviousWarningsGate:
     def __init__(self):
@@ -27,7 +29,7 @@ class PreviousWarningsGate:
         warning_refs = [r'previous warning', r'final warning', r'earlier warning', r'warned on']
         
         for pattern in warning_refs:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {'status': 'PASS', 'severity': 'none', 'message': 'Previous warnings referenced', 'legal_source': self.legal_source}
         
         return {
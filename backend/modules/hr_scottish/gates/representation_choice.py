@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class RepresentationChoiceGate:
     def __init__(self):
@@ -27,7 +29,7 @@ class RepresentationChoiceGate:
         ]
         
         for pattern in restrictive_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {
                     'status': 'WARNING',
                     'severity': 'medium',
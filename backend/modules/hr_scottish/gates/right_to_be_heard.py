@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class RightToBeHeardGate:
     def __init__(self):
@@ -21,6 +23,6 @@ class RightToBeHeardGate:
             }
 
         patterns = [r'opportunit(y|ies) to respond', r'present (?:your )?evidence', r'call witnesses', r'ask questions']
-        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+        if any(pattern_registry.search(p, text, re.IGNORECASE) for p in patterns):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Employee’s opportunity to be heard is stated', 'legal_source': self.legal_source}
         return {'status': 'FAIL', 'severity': 'critical', 'message': 'No clear opportunity stated to present evidence or respond', 'legal_source': self.legal_source}
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class SanctionGraduationGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class SanctionGraduationGate:
             }
 
         patterns = [r'outcomes? may include', r'written warning', r'final written warning', r'dismissal']
-        hits = sum(1 for p in patterns if re.search(p, text, re.IGNORECASE))
+        hits = sum(1 for p in patterns if pattern_registry.search(p, text, re.IGNORECASE))
         if hits >= 2:
             return {'status': 'PASS', 'severity': 'none', 'message': 'Graduated sanctions referenced (warnings through dismissal)', 'legal_source': self.legal_source}
         return {'status': 'FAIL', 'severity': 'high', 'message': 'No reference to graduated sanctions (warnings, dismissal)', 'legal_source': self.legal_source}
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class SuspensionGate:
     def __init__(self):
@@ -19,14 +21,14 @@ class SuspensionGate:
             }
         
         # Check if suspension is stated as paid
-        if re.search(r'(?:paid|full pay).*suspen|suspen.*(?:paid|full pay)', text, re.IGNORECASE):
+        if pattern_registry.search(r'(?:paid|full pay).*suspen|suspen.*(?:paid|full pay)', text, re.IGNORECASE):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Suspension stated as paid', 'spans': [], 'legal_source': self.legal_source}
         
         # Check for unpaid suspension (problematic)
         unpaid_rx = r'unpaid.*suspen|suspen.*without pay'
-        if re.search(unpaid_rx, text, re.IGNORECASE):
+        if pattern_registry.search(unpaid_rx, text, re.IGNORECASE):
             spans = []
-            for m in re.finditer(unpaid_rx, text, re.IGNORECASE):
+            for m in pattern_registry.finditer(unpaid_rx, text, re.IGNORECASE):
                 spans.append({
                     'type': 'unpaid_suspension',
                     'start': m.start(),
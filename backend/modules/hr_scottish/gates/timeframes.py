@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class TimeframesGate:
     def __init__(self):
@@ -29,9 +31,9 @@ class TimeframesGate:
 
         # Check for unreasonably short appeal timeframes
         short_rx = r'within\s+(?:1|2|24|48)\s+(?:hours?|days?)'
-        if re.search(short_rx, text, re.IGNORECASE):
+        if pattern_registry.search(short_rx, text, re.IGNORECASE):
             spans = []
-            for m in re.finditer(short_rx, text, re.IGNORECASE):
+            for m in pattern_registry.finditer(short_rx, text, re.IGNORECASE):
                 spans.append({'type': 'short_timeframe', 'start': m.start(), 'end': m.end(), 'text': m.group(), 'severity': 'medium'})
             return {
                 'status': 'WARNING',
@@ -45,7 +47,9 @@ class TimeframesGate:
         # If it's an outcome letter, check for warning expiry timeframe
         if is_outcome and 'warning' in text_lower:
             # Missing timeframe for warning
-            has_expiry = re.search(r'(?:for|valid for|remain.*for|expire|removed after)\s+(?:\d+)\s+(?:months?|years?)', text, re.IGNORECASE)
+            has_expiry = pattern_registry.search(
+                r'(?:for|valid for|remain.*for|expire|removed after)\s+(?:\d+)\s+(?:months?|years?)',
+                text, re.IGNORECASE)
             if not has_expiry and 'remain' in text_lower:
                 return {
                     'status': 'FAIL',
@@ -56,7 +60,7 @@ class TimeframesGate:
                 }
 
         # Check for reasonable appeal timeframe
-        if re.search(r'within\s+(?:[5-9]|1[0-4])\s+(?:working\s+)?days?', text, re.IGNORECASE):
+        if pattern_registry.search(r'within\s+(?:[5-9]|1[0-4])\s+(?:working\s+)?days?', text, re.IGNORECASE):
             return {'status': 'PASS', 'severity': 'none', 'message': 'Reasonable timeframe specified', 'spans': [], 'legal_source': self.legal_source}
 
         return {'status': 'PASS', 'severity': 'none', 'message': 'No timeframe issues detected', 'spans': [], 'legal_source': self.legal_source}
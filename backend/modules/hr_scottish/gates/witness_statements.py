@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class WitnessStatementsGate:
     def __init__(self):
@@ -25,7 +27,7 @@ class WitnessStatementsGate:
         statement_patterns = [r'witness statement', r'statement from', r'testimony', r'account from']
         
         for pattern in statement_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 return {'status': 'PASS', 'severity': 'none', 'message': 'Witness evidence mentioned', 'legal_source': self.legal_source}
         
         return {
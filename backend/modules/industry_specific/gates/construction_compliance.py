@@ -13,6 +13,8 @@ Legal Sources:
 import re
 from typing import Dict, Any, List
 
+from core.pattern_registry import pattern_registry
+
 
 class ConstructionComplianceGate:
     """
@@ -126,7 +128,7 @@ class ConstructionComplianceGate:
     def _is_relevant(self, text: str) -> bool:
         """Check if document relates to construction."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self.construction_terms)
+        return any(pattern_registry.search(pattern, text_lower) for pattern in self.construction_terms)
 
     def _check_cdm_compliance(self, text: str) -> Dict[str, Any]:
         """Check CDM 2015 compliance."""
@@ -134,12 +136,12 @@ class ConstructionComplianceGate:
         issues = []
         found_requirements = []
 
-        has_cdm_context = re.search(r'CDM|construction.*(?:design|management)|principal\s+(?:designer|contractor)',
-                                    text_lower)
+        has_cdm_context = pattern_registry.search(
+            r'CDM|construction.*(?:design|management)|principal\s+(?:designer|contractor)', text_lower)
 
         if has_cdm_context:
             for requirement, pattern in self.cdm_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             # Check for duty holders
@@ -189,7 +191,7 @@ class ConstructionComplianceGate:
                 })
 
             # Check F10 notification for notifiable projects
-            if re.search(r'(?:30\s+day|500\s+person\s+day)', text_lower):
+            if pattern_registry.search(r'(?:30\s+day|500\s+person\s+day)', text_lower):
                 if 'f10_notification' not in found_requirements:
                     issues.append({
                         'issue': 'F10 notification to HSE not mentioned',
@@ -210,11 +212,12 @@ class ConstructionComplianceGate:
         issues = []
         found_parts = []
 
-        has_building_regs = re.search(r'building\s+regulation|approved\s+document|Part\s+[A-S]', text, re.IGNORECASE)
+        has_building_regs = pattern_registry.search(r'building\s+regulation|approved\s+document|Part\s+[A-S]', text,
+                                                    re.IGNORECASE)
 
         if has_building_regs:
             for part, pattern in self.building_regulations.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_parts.append(part)
 
             # Check critical parts for typical construction
@@ -238,7 +241,7 @@ class ConstructionComplianceGate:
                 })
 
             # Check energy efficiency (Part L) - often missed
-            if re.search(r'(?:extension|new\s+build|conversion)', text_lower):
+            if pattern_registry.search(r'(?:extension|new\s+build|conversion)', text_lower):
                 if 'part_l_conservation' not in found_parts:
                     issues.append({
                         'issue': 'Energy efficiency (Part L) not addressed',
@@ -259,15 +262,16 @@ class ConstructionComplianceGate:
         issues = []
         found_requirements = []
 
-        has_planning_context = re.search(r'planning|development|local\s+authority|planning\s+permission', text_lower)
+        has_planning_context = pattern_registry.search(r'planning|development|local\s+authority|planning\s+permission',
+                                                       text_lower)
 
         if has_planning_context:
             for requirement, pattern in self.planning_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             # Check planning permission
-            if re.search(r'development|construction|building', text_lower):
+            if pattern_registry.search(r'development|construction|building', text_lower):
                 if 'planning_permission' not in found_requirements and 'permitted_development' not in found_requirements:
                     issues.append({
                         'issue': 'Planning permission status not clarified',
@@ -299,11 +303,11 @@ class ConstructionComplianceGate:
         issues = []
         found_measures = []
 
-        has_safety_context = re.search(r'health.*safety|H&S|HSE|risk|safety', text_lower)
+        has_safety_context = pattern_registry.search(r'health.*safety|H&S|HSE|risk|safety', text_lower)
 
         if has_safety_context:
             for measure, pattern in self.health_safety_construction.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_measures.append(measure)
 
             # Critical safety requirements
@@ -317,7 +321,7 @@ class ConstructionComplianceGate:
                 })
 
             # Check specific hazard management
-            if re.search(r'scaffold|roof|height', text_lower):
+            if pattern_registry.search(r'scaffold|roof|height', text_lower):
                 if 'working_at_height' not in found_measures:
                     issues.append({
                         'issue': 'Working at height controls not specified',
@@ -356,11 +360,11 @@ class ConstructionComplianceGate:
         found_requirements = []
 
         # Check if this is a higher-risk building (18m+ or 7+ storeys with 2+ residential units)
-        is_higher_risk = re.search(r'(?:higher[- ]risk|18\s+metre|7\s+storey|high[- ]rise)', text_lower)
+        is_higher_risk = pattern_registry.search(r'(?:higher[- ]risk|18\s+metre|7\s+storey|high[- ]rise)', text_lower)
 
         if is_higher_risk:
             for requirement, pattern in self.building_safety_act.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             if 'accountable_person' not in found_requirements:
@@ -12,9 +12,10 @@ Legal Sources:
 - Data Protection Act 2018 (children's data)
 """
 
-import re
 from typing import Dict, Any, List
 
+from core.pattern_registry import pattern_registry
+
 
 class EducationComplianceGate:
     """
@@ -106,7 +107,7 @@ class EducationComplianceGate:
     def _is_relevant(self, text: str) -> bool:
         """Check if document relates to education sector."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self.education_terms)
+        return any(pattern_registry.search(pattern, text_lower) for pattern in self.education_terms)
 
     def _check_safeguarding(self, text: str) -> Dict[str, Any]:
         """Check KCSIE safeguarding compliance."""
@@ -115,11 +116,11 @@ class EducationComplianceGate:
         found_requirements = []
 
         # Check if safeguarding is mentioned
-        has_safeguarding = re.search(r'safeguard|child\s+protection|KCSIE', text_lower)
+        has_safeguarding = pattern_registry.search(r'safeguard|child\s+protection|KCSIE', text_lower)
 
         if has_safeguarding:
             for requirement, pattern in self.safeguarding_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             # Critical requirements
@@ -132,7 +133,8 @@ class EducationComplianceGate:
                     'legal_source': 'KCSIE 2024 Part 2'
                 })
 
-            if 'dbs_checks' not in found_requirements and re.search(r'(?:staff|recruit|employ)', text_lower):
+            if ('dbs_checks' not in found_requirements
+                    and pattern_registry.search(r'(?:staff|recruit|employ)', text_lower)):
                 issues.append({
                     'issue': 'DBS checking procedures not specified',
                     'severity': 'critical',
@@ -170,11 +172,11 @@ class EducationComplianceGate:
         issues = []
         found_requirements = []
 
-        has_send = re.search(r'SEND|SEN\b|special\s+educational\s+needs', text_lower)
+        has_send = pattern_registry.search(r'SEND|SEN\b|special\s+educational\s+needs', text_lower)
 
         if has_send:
             for requirement, pattern in self.send_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             # Check critical SEND requirements
@@ -216,11 +218,11 @@ class EducationComplianceGate:
         issues = []
         found_provisions = []
 
-        has_equality_context = re.search(r'equality|equal|discriminat|inclusive|diversity', text_lower)
+        has_equality_context = pattern_registry.search(r'equality|equal|discriminat|inclusive|diversity', text_lower)
 
         if has_equality_context:
             for provision, pattern in self.equality_provisions.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_provisions.append(provision)
 
             # Check public sector equality duty for schools
@@ -234,7 +236,7 @@ class EducationComplianceGate:
                 })
 
             # Check accessibility for disability
-            if re.search(r'disabilit', text_lower) and 'accessibility_plan' not in found_provisions:
+            if pattern_registry.search(r'disabilit', text_lower) and 'accessibility_plan' not in found_provisions:
                 issues.append({
                     'issue': 'Accessibility plan not referenced',
                     'severity': 'medium',
@@ -253,10 +255,10 @@ class EducationComplianceGate:
         text_lower = text.lower()
         issues = []
 
-        has_prevent_context = any(re.search(pattern, text_lower) for pattern in self.prevent_requirements)
+        has_prevent_context = any(pattern_registry.search(pattern, text_lower) for pattern in self.prevent_requirements)
 
         # Schools and colleges have a statutory PREVENT duty
-        is_school_policy = re.search(r'(?:safeguard|behaviour|policy|welfare)', text_lower)
+        is_school_policy = pattern_registry.search(r'(?:safeguard|behaviour|policy|welfare)', text_lower)
 
         if is_school_policy and not has_prevent_context:
             issues.append({
@@ -269,7 +271,7 @@ class EducationComplianceGate:
 
         if has_prevent_context:
             # Check for British values
-            if not re.search(r'British\s+values|fundamental.*British', text_lower):
+            if not pattern_registry.search(r'British\s+values|fundamental.*British', text_lower):
                 issues.append({
                     'issue': 'Fundamental British values not mentioned',
                     'severity': 'low',
@@ -286,8 +288,8 @@ class EducationComplianceGate:
         issues = []
 
         # Check biometric data (special requirements in education)
-        if re.search(r'biometric', text_lower):
-            if not re.search(r'(?:written\s+consent|parent.*consent|biometric.*consent)', text_lower):
+        if pattern_registry.search(r'biometric', text_lower):
+            if not pattern_registry.search(r'(?:written\s+consent|parent.*consent|biometric.*consent)', text_lower):
                 issues.append({
                     'issue': 'Biometric data consent requirements not specified',
                     'severity': 'critical',
@@ -297,8 +299,9 @@ class EducationComplianceGate:
                 })
 
         # Check pupil photography/video consent
-        if re.search(r'(?:photo|image|video|film|camera)', text_lower) and re.search(r'pupil|student|child', text_lower):
-            if not re.search(r'consent|permission|opt-out', text_lower):
+        if (pattern_registry.search(r'(?:photo|image|video|film|camera)', text_lower)
+                and pattern_registry.search(r'pupil|student|child', text_lower)):
+            if not pattern_registry.search(r'consent|permission|opt-out', text_lower):
                 issues.append({
                     'issue': 'Photo/video consent procedures not specified',
                     'severity': 'medium',
@@ -308,8 +311,8 @@ class EducationComplianceGate:
                 })
 
         # Check data sharing with local authorities
-        if re.search(r'(?:pupil\s+data|student\s+data).*(?:shar|transfer|disclos)', text_lower):
-            if not re.search(r'(?:local\s+authority|DfE|school\s+census)', text_lower):
+        if pattern_registry.search(r'(?:pupil\s+data|student\s+data).*(?:shar|transfer|disclos)', text_lower):
+            if not pattern_registry.search(r'(?:local\s+authority|DfE|school\s+census)', text_lower):
                 issues.append({
                     'issue': 'Statutory data sharing obligations not mentioned',
                     'severity': 'low',
@@ -11,9 +11,10 @@ Legal Sources:
 - Proceeds of Crime Act 2002
 """
 
-import re
 from typing import Dict, Any, List
 
+from core.pattern_registry import pattern_registry
+
 
 class FinanceComplianceGate:
     """
@@ -105,7 +106,7 @@ class FinanceComplianceGate:
     def _is_relevant(self, text: str) -> bool:
         """Check if document relates to financial services."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self.finance_terms)
+        return any(pattern_registry.search(pattern, text_lower) for pattern in self.finance_terms)
 
     def _check_aml_kyc(self, text: str) -> Dict[str, Any]:
         """Check AML/KYC compliance."""
@@ -113,11 +114,12 @@ class FinanceComplianceGate:
         issues = []
         found_requirements = []
 
-        has_aml_context = re.search(r'(?:AML|KYC|money\s+laundering|customer\s+due\s+diligence)', text_lower)
+        has_aml_context = pattern_registry.search(r'(?:AML|KYC|money\s+laundering|customer\s+due\s+diligence)',
+                                                  text_lower)
 
         if has_aml_context:
             for requirement, pattern in self.aml_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             # Critical requirements
@@ -186,12 +188,12 @@ class FinanceComplianceGate:
         issues = []
         found_requirements = []
 
-        has_psd2_context = re.search(r'(?:PSD2|payment\s+service|payment\s+initiation|'
+        has_psd2_context = pattern_registry.search(r'(?:PSD2|payment\s+service|payment\s+initiation|'
                                      r'account\s+information|strong\s+customer\s+authentication)', text_lower)
 
         if has_psd2_context:
             for requirement, pattern in self.psd2_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             # Check SCA requirement
@@ -235,11 +237,11 @@ class FinanceComplianceGate:
         issues = []
         found_requirements = []
 
-        has_open_banking = re.search(r'open\s+banking|CMA\s+order|OBIE', text_lower)
+        has_open_banking = pattern_registry.search(r'open\s+banking|CMA\s+order|OBIE', text_lower)
 
         if has_open_banking:
             for requirement, pattern in self.open_banking_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             if 'data_sharing' in found_requirements and 'consent_dashboard' not in found_requirements:
@@ -271,11 +273,12 @@ class FinanceComplianceGate:
         issues = []
         found_requirements = []
 
-        has_smcr_context = re.search(r'(?:SMCR|Senior\s+Manager|Certification\s+Regime|conduct\s+rule)', text_lower)
+        has_smcr_context = pattern_registry.search(r'(?:SMCR|Senior\s+Manager|Certification\s+Regime|conduct\s+rule)',
+                                                   text_lower)
 
         if has_smcr_context:
             for requirement, pattern in self.smcr_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             if 'senior_manager' in found_requirements:
@@ -319,11 +322,12 @@ class FinanceComplianceGate:
         issues = []
         found_measures = []
 
-        has_crime_context = re.search(r'(?:financial\s+crime|fraud|sanction|terrorist\s+financing)', text_lower)
+        has_crime_context = pattern_registry.search(r'(?:financial\s+crime|fraud|sanction|terrorist\s+financing)',
+                                                    text_lower)
 
         if has_crime_context:
             for measure, pattern in self.financial_crime.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_measures.append(measure)
 
             if 'fraud_prevention' in found_measures:
@@ -13,6 +13,8 @@ Legal Sources:
 import re
 from typing import Dict, Any, List
 
+from core.pattern_registry import pattern_registry
+
 
 class HealthcareComplianceGate:
     """
@@ -86,7 +88,7 @@ class HealthcareComplianceGate:
     def _is_relevant(self, text: str) -> bool:
         """Check if document relates to healthcare."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self.nhs_terms)
+        return any(pattern_registry.search(pattern, text_lower) for pattern in self.nhs_terms)
 
     def _check_caldicott_compliance(self, text: str) -> Dict[str, Any]:
         """Check for Caldicott principles in patient information handling."""
@@ -95,7 +97,7 @@ class HealthcareComplianceGate:
         found_principles = []
 
         for principle, pattern in self.caldicott_principles.items():
-            if re.search(pattern, text_lower):
+            if pattern_registry.search(pattern, text_lower):
                 found_principles.append(principle)
 
         if not found_principles and 'patient' in text_lower:
@@ -118,11 +120,11 @@ class HealthcareComplianceGate:
         found_standards = []
 
         for standard, pattern in self.cqc_standards.items():
-            if re.search(pattern, text_lower):
+            if pattern_registry.search(pattern, text_lower):
                 found_standards.append(standard)
 
         issues = []
-        if re.search(r'CQC|Care\s+Quality\s+Commission', text, re.IGNORECASE):
+        if pattern_registry.search(r'CQC|Care\s+Quality\s+Commission', text, re.IGNORECASE):
             if len(found_standards) < 2:
                 issues.append({
                     'issue': 'Limited CQC fundamental standards coverage',
@@ -141,12 +143,12 @@ class HealthcareComplianceGate:
         text_lower = text.lower()
         issues = []
 
-        has_medical_records = any(re.search(pattern, text_lower)
+        has_medical_records = any(pattern_registry.search(pattern, text_lower)
                                  for pattern in self.medical_records_requirements[:1])
 
         if has_medical_records:
             # Check retention period
-            if not re.search(r'(?:8\s+years?|eight\s+years?|retention\s+period)', text_lower):
+            if not pattern_registry.search(r'(?:8\s+years?|eight\s+years?|retention\s+period)', text_lower):
                 issues.append({
                     'issue': 'Medical records retention period not specified',
                     'severity': 'high',
@@ -156,7 +158,7 @@ class HealthcareComplianceGate:
                 })
 
             # Check secure storage
-            if not re.search(r'(?:secure|confidential|encrypted|access\s+control)', text_lower):
+            if not pattern_registry.search(r'(?:secure|confidential|encrypted|access\s+control)', text_lower):
                 issues.append({
                     'issue': 'Medical records security measures not specified',
                     'severity': 'high',
@@ -172,11 +174,12 @@ class HealthcareComplianceGate:
         text_lower = text.lower()
         issues = []
 
-        has_health_data = re.search(r'(?:health\s+data|medical\s+data|patient\s+(?:data|information))', text_lower)
+        has_health_data = pattern_registry.search(r'(?:health\s+data|medical\s+data|patient\s+(?:data|information))',
+                                                  text_lower)
 
         if has_health_data:
             # Check for special category acknowledgment
-            if not re.search(r'(?:special\s+category|Article\s+9|explicit\s+consent)', text_lower):
+            if not pattern_registry.search(r'(?:special\s+category|Article\s+9|explicit\s+consent)', text_lower):
                 issues.append({
                     'issue': 'Health data not recognized as special category data',
                     'severity': 'critical',
@@ -186,7 +189,7 @@ class HealthcareComplianceGate:
                 })
 
             # Check for DPIA mention (likely required for health data)
-            if not re.search(r'(?:DPIA|data\s+protection\s+impact|privacy\s+impact)', text_lower):
+            if not pattern_registry.search(r'(?:DPIA|data\s+protection\s+impact|privacy\s+impact)', text_lower):
                 issues.append({
                     'issue': 'Data Protection Impact Assessment (DPIA) not mentioned',
                     'severity': 'high',
@@ -201,12 +204,12 @@ class HealthcareComplianceGate:
         text_lower = text.lower()
         issues = []
 
-        is_nhs_document = re.search(r'\bNHS\b|National\s+Health\s+Service', text, re.IGNORECASE)
+        is_nhs_document = pattern_registry.search(r'\bNHS\b|National\s+Health\s+Service', text, re.IGNORECASE)
 
         if is_nhs_document:
             # Check for NHS number handling
-            if re.search(r'NHS\s+number', text_lower):
-                if not re.search(r'(?:secure|protect|confidential|encrypt)', text_lower):
+            if pattern_registry.search(r'NHS\s+number', text_lower):
+                if not pattern_registry.search(r'(?:secure|protect|confidential|encrypt)', text_lower):
                     issues.append({
                         'issue': 'NHS number security not addressed',
                         'severity': 'high',
@@ -216,7 +219,7 @@ class HealthcareComplianceGate:
                     })
 
             # Check for information governance
-            if not re.search(r'(?:information\s+governance|IG|data\s+security|Caldicott)', text_lower):
+            if not pattern_registry.search(r'(?:information\s+governance|IG|data\s+security|Caldicott)', text_lower):
                 issues.append({
                     'issue': 'Information Governance framework not referenced',
                     'severity': 'medium',
@@ -13,6 +13,8 @@ Legal Sources:
 import re
 from typing import Dict, Any, List
 
+from core.pattern_registry import pattern_registry
+
 
 class TechnologyComplianceGate:
     """
@@ -151,7 +153,7 @@ class TechnologyComplianceGate:
     def _is_relevant(self, text: str) -> bool:
         """Check if document relates to technology/software."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self.technology_terms)
+        return any(pattern_registry.search(pattern, text_lower) for pattern in self.technology_terms)
 
     def _check_open_source_licenses(self, text: str) -> Dict[str, Any]:
         """Detect and check open source license compliance."""
@@ -160,7 +162,7 @@ class TechnologyComplianceGate:
         detected_licenses = []
 
         for license_name, license_info in self.open_source_licenses.items():
-            if re.search(license_info['pattern'], text, re.IGNORECASE):
+            if pattern_registry.search(license_info['pattern'], text, re.IGNORECASE):
                 detected_licenses.append({
                     'name': license_name,
                     'type': license_info['type'],
@@ -169,7 +171,7 @@ class TechnologyComplianceGate:
 
                 # Check for copyleft compliance
                 if license_info['type'] in ['copyleft', 'network_copyleft']:
-                    if not re.search(r'(?:source\s+code|provide.*source|make.*available)', text_lower):
+                    if not pattern_registry.search(r'(?:source\s+code|provide.*source|make.*available)', text_lower):
                         issues.append({
                             'issue': f'{license_name.upper()} copyleft license detected - source code disclosure required',
                             'severity': 'critical',
@@ -181,7 +183,7 @@ class TechnologyComplianceGate:
 
                 # Check for patent grant compliance (Apache, GPL v3)
                 if 'patent_grant' in license_info['requirements']:
-                    if not re.search(r'patent', text_lower):
+                    if not pattern_registry.search(r'patent', text_lower):
                         issues.append({
                             'issue': f'{license_name} includes patent grant provisions',
                             'severity': 'medium',
@@ -192,7 +194,8 @@ class TechnologyComplianceGate:
 
                 # Check for license preservation
                 if 'license_preservation' in license_info['requirements']:
-                    if not re.search(r'(?:copyright\s+notice|license\s+notice|retain.*notice)', text_lower):
+                    if not pattern_registry.search(r'(?:copyright\s+notice|license\s+notice|retain.*notice)',
+                                                   text_lower):
                         issues.append({
                             'issue': f'{license_name} license notice not mentioned',
                             'severity': 'high',
@@ -204,7 +207,7 @@ class TechnologyComplianceGate:
         # Check for potential GPL contamination
         gpl_licenses = [l for l in detected_licenses if 'gpl' in l['name'] or l['type'] == 'copyleft']
         if gpl_licenses:
-            if re.search(r'proprietar|commercial|closed\s+source', text_lower):
+            if pattern_registry.search(r'proprietar|commercial|closed\s+source', text_lower):
                 issues.append({
                     'issue': 'GPL licensed code detected in potentially proprietary software',
                     'severity': 'critical',
@@ -225,12 +228,12 @@ class TechnologyComplianceGate:
         issues = []
         found_terms = []
 
-        is_license_agreement = re.search(r'license\s+agreement|software\s+license|end\s+user\s+license|EULA',
-                                         text, re.IGNORECASE)
+        is_license_agreement = pattern_registry.search(
+            r'license\s+agreement|software\s+license|end\s+user\s+license|EULA', text, re.IGNORECASE)
 
         if is_license_agreement:
             for term, pattern in self.software_licensing.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_terms.append(term)
 
             # Critical terms
@@ -290,11 +293,12 @@ class TechnologyComplianceGate:
         issues = []
         found_requirements = []
 
-        is_saas = re.search(r'SaaS|software\s+as\s+a\s+service|cloud\s+service|hosted\s+service', text, re.IGNORECASE)
+        is_saas = pattern_registry.search(r'SaaS|software\s+as\s+a\s+service|cloud\s+service|hosted\s+service', text,
+                                          re.IGNORECASE)
 
         if is_saas:
             for requirement, pattern in self.saas_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             # Critical SaaS terms
@@ -361,11 +365,12 @@ class TechnologyComplianceGate:
         issues = []
         found_terms = []
 
-        is_cloud = re.search(r'cloud|hosted|infrastructure\s+as\s+a\s+service|IaaS|PaaS', text, re.IGNORECASE)
+        is_cloud = pattern_registry.search(r'cloud|hosted|infrastructure\s+as\s+a\s+service|IaaS|PaaS', text,
+                                           re.IGNORECASE)
 
         if is_cloud:
             for term, pattern in self.cloud_computing.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_terms.append(term)
 
             if 'data_processing' not in found_terms:
@@ -415,11 +420,11 @@ class TechnologyComplianceGate:
         issues = []
         found_requirements = []
 
-        is_aup = re.search(r'acceptable\s+use|usage\s+policy|AUP|terms\s+of\s+use', text, re.IGNORECASE)
+        is_aup = pattern_registry.search(r'acceptable\s+use|usage\s+policy|AUP|terms\s+of\s+use', text, re.IGNORECASE)
 
         if is_aup:
             for requirement, pattern in self.aup_requirements.items():
-                if re.search(pattern, text_lower):
+                if pattern_registry.search(pattern, text_lower):
                     found_requirements.append(requirement)
 
             if 'prohibited_activities' not in found_requirements:
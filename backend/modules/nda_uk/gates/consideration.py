@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ConsiderationGate:
     def __init__(self):
@@ -17,7 +19,7 @@ class ConsiderationGate:
             return False
         
         # Check if unilateral (one-way)
-        is_mutual = bool(re.search(r'both parties|each party|mutual', text_lower))
+        is_mutual = bool(pattern_registry.search(r'both parties|each party|mutual', text_lower))
         
         return is_english and not is_mutual
     
@@ -32,10 +34,10 @@ class ConsiderationGate:
             r'signed in the presence of.*witness'
         ]
         
-        is_deed = any(re.search(p, text, re.IGNORECASE) for p in deed_indicators)
+        is_deed = any(pattern_registry.search(p, text, re.IGNORECASE) for p in deed_indicators)
         
         # Check for stated consideration
-        has_consideration = bool(re.search(r'in consideration of', text, re.IGNORECASE))
+        has_consideration = bool(pattern_registry.search(r'in consideration of', text, re.IGNORECASE))
         
         if is_deed or has_consideration:
             return {'status': 'PASS', 'severity': 'none', 'message': 'Consideration present or executed as deed'}
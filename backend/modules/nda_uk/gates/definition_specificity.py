@@ -1,5 +1,8 @@
 import re
 
+from core.pattern_registry import pattern_registry
+from core.proximity import proximity
+
 
 class DefinitionSpecificityGate:
     def __init__(self):
@@ -19,7 +22,8 @@ class DefinitionSpecificityGate:
             }
         
         # Check for definition
-        has_definition = bool(re.search(r'"?confidential information"?.*(?:means|shall mean|includes)', text, re.IGNORECASE))
+        has_definition = proximity.occurs(r'"?confidential information"?.*(?:means|shall mean|includes)', text,
+                                          re.IGNORECASE)
         
         if not has_definition:
             return {
@@ -45,7 +49,7 @@ class DefinitionSpecificityGate:
         issues = []
         spans = []
         for pattern in overbroad_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern_registry.finditer(pattern, text, re.IGNORECASE):
                 spans.append({
                     'type': 'overbroad_definition',
                     'start': match.start(),
@@ -56,8 +60,10 @@ class DefinitionSpecificityGate:
                 issues.append(f"Overbroad term: '{match.group()}'")
 
         # Check for missing exclusions (things that shouldn't be confidential)
-        has_exclusions = bool(re.search(r'(?:does not|shall not|excludes?).*(?:include|apply to|cover)', text, re.IGNORECASE))
-        public_domain_exclusion = bool(re.search(r'(?:public|publicly available|in the public domain)', text, re.IGNORECASE))
+        has_exclusions = proximity.occurs(r'(?:does not|shall not|excludes?).*(?:include|apply to|cover)', text,
+                                          re.IGNORECASE)
+        public_domain_exclusion = proximity.occurs(r'(?:public|publicly available|in the public domain)', text,
+                                                   re.IGNORECASE)
 
         if not has_exclusions:
             issues.append("No exclusions defined (should exclude public domain, prior knowledge, etc.)")
@@ -65,7 +71,8 @@ class DefinitionSpecificityGate:
             issues.append("No public domain exclusion")
 
         # Check for specific categories
-        has_categories = bool(re.search(r'(?:including|such as|but not limited to|specifically).*(?:,|;|:)', text, re.IGNORECASE))
+        has_categories = proximity.occurs(r'(?:including|such as|but not limited to|specifically).*(?:,|;|:)', text,
+                                          re.IGNORECASE)
         category_examples = ['trade secret', 'financial', 'technical', 'customer', 'business plan', 'strategy', 'pricing']
         categories_found = sum(1 for cat in category_examples if cat in text.lower())
 
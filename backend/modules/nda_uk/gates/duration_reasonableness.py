@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class DurationReasonablenessGate:
     def __init__(self):
@@ -25,7 +27,7 @@ class DurationReasonablenessGate:
             r'term.*agreement'
         ]
         
-        has_duration = any(re.search(p, text, re.IGNORECASE) for p in duration_patterns)
+        has_duration = any(pattern_registry.search(p, text, re.IGNORECASE) for p in duration_patterns)
         
         if not has_duration:
             perpetuity_patterns = [
@@ -37,7 +39,7 @@ class DurationReasonablenessGate:
                 r'survives.*termination'  # Without timeframe
             ]
 
-            perpetuity = any(re.search(p, text, re.IGNORECASE) for p in perpetuity_patterns)
+            perpetuity = any(pattern_registry.search(p, text, re.IGNORECASE) for p in perpetuity_patterns)
 
             if perpetuity:
                 return {
@@ -56,7 +58,7 @@ class DurationReasonablenessGate:
             }
         
         # Check for unreasonably long duration
-        long_duration = re.search(r'([1-9]\d+)\s*years?', text, re.IGNORECASE)
+        long_duration = pattern_registry.search(r'([1-9]\d+)\s*years?', text, re.IGNORECASE)
         if long_duration and int(long_duration.group(1)) > 10:
             return {
                 'status': 'WARNING',
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class GdprComplianceGate:
     def __init__(self):
@@ -27,7 +29,7 @@ class GdprComplianceGate:
             r'data controller.*processor'
         ]
         
-        has_gdpr = any(re.search(p, text, re.IGNORECASE) for p in gdpr_patterns)
+        has_gdpr = any(pattern_registry.search(p, text, re.IGNORECASE) for p in gdpr_patterns)
         
         if has_gdpr:
             return {'status': 'PASS', 'severity': 'none', 'message': 'GDPR/data protection provisions present', 'legal_source': self.legal_source}
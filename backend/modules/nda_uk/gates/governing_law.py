@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class GoverningLawGate:
     def __init__(self):
@@ -25,7 +27,7 @@ class GoverningLawGate:
             r'northern.*ireland'
         ]
         
-        has_uk_law = any(re.search(p, text, re.IGNORECASE) for p in uk_jurisdictions)
+        has_uk_law = any(pattern_registry.search(p, text, re.IGNORECASE) for p in uk_jurisdictions)
         
         if has_uk_law:
             return {'status': 'PASS', 'severity': 'none', 'message': 'UK governing law specified', 'legal_source': self.legal_source}
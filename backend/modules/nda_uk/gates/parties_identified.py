@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class PartiesIdentifiedGate:
     def __init__(self):
@@ -26,7 +28,7 @@ class PartiesIdentifiedGate:
             r'recipient.*\('
         ]
         
-        has_parties = any(re.search(p, text, re.IGNORECASE) for p in party_patterns)
+        has_parties = any(pattern_registry.search(p, text, re.IGNORECASE) for p in party_patterns)
         
         if has_parties:
             return {'status': 'PASS', 'severity': 'none', 'message': 'Parties clearly identified', 'legal_source': self.legal_source}
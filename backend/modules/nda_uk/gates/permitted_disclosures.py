@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class PermittedDisclosuresGate:
     def __init__(self):
@@ -25,7 +27,7 @@ class PermittedDisclosuresGate:
             r'legal.*(?:obligation|requirement)'
         ]
         
-        has_permitted = any(re.search(p, text, re.IGNORECASE) for p in permitted_patterns)
+        has_permitted = any(pattern_registry.search(p, text, re.IGNORECASE) for p in permitted_patterns)
         
         if has_permitted:
             return {'status': 'PASS', 'severity': 'none', 'message': 'Permitted legal/regulatory disclosures stated', 'legal_source': self.legal_source}
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class PermittedPurposeGate:
     def __init__(self):
@@ -24,11 +26,12 @@ class PermittedPurposeGate:
             r'purpose.*(?:evaluating|discussing|negotiating)'
         ]
         
-        has_purpose = any(re.search(p, text, re.IGNORECASE) for p in purpose_patterns)
+        has_purpose = any(pattern_registry.search(p, text, re.IGNORECASE) for p in purpose_patterns)
         
         if has_purpose:
             # Check if purpose is overly broad
-            if re.search(r'for.*(?:general|any|all).*(?:business|commercial).*purpose', text, re.IGNORECASE):
+            if pattern_registry.search(r'for.*(?:general|any|all).*(?:business|commercial).*purpose', text,
+                                       re.IGNORECASE):
                 return {
                     'status': 'WARNING',
                     'severity': 'medium',
@@ -1,5 +1,7 @@
 import re
 
+from core.proximity import proximity
+
 
 class PriorKnowledgeExclusionGate:
     def __init__(self):
@@ -24,7 +26,7 @@ class PriorKnowledgeExclusionGate:
             r'independently developed'
         ]
         
-        has_exclusion = any(re.search(p, text, re.IGNORECASE) for p in prior_knowledge_patterns)
+        has_exclusion = any(proximity.occurs(p, text, re.IGNORECASE) for p in prior_knowledge_patterns)
         
         if has_exclusion:
             return {'status': 'PASS', 'severity': 'none', 'message': 'Prior knowledge/independent development exclusions present', 'legal_source': self.legal_source}
@@ -1,5 +1,7 @@
 import re
 
+from core.proximity import proximity
+
 
 class ProtectedCrimeReportingGate:
     def __init__(self):
@@ -26,7 +28,7 @@ class ProtectedCrimeReportingGate:
             r'shall not disclose.*to any.*(?:third party|one)'  # Catches blanket bans
         ]
         
-        has_prohibition = any(re.search(p, text, re.IGNORECASE) for p in crime_prohibition)
+        has_prohibition = any(proximity.occurs(p, text, re.IGNORECASE) for p in crime_prohibition)
         
         # Check for crime reporting exception
         crime_exception = [
@@ -36,7 +38,7 @@ class ProtectedCrimeReportingGate:
             r'disclose.*(?:lawyer|medical|family).*for.*support'
         ]
         
-        has_exception = any(re.search(p, text, re.IGNORECASE) for p in crime_exception)
+        has_exception = any(proximity.occurs(p, text, re.IGNORECASE) for p in crime_exception)
         
         if has_prohibition:
             return {
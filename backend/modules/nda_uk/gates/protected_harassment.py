@@ -1,5 +1,7 @@
 import re
 
+from core.proximity import proximity
+
 
 class ProtectedHarassmentGate:
     def __init__(self):
@@ -28,7 +30,7 @@ class ProtectedHarassmentGate:
             r'not.*disclose.*(?:allegations|information).*(?:harassment|discrimination)'
         ]
         
-        has_silencing = any(re.search(p, text, re.IGNORECASE) for p in silencing_patterns)
+        has_silencing = any(proximity.occurs(p, text, re.IGNORECASE) for p in silencing_patterns)
         
         # Check for harassment exception
         harassment_exception = [
@@ -38,7 +40,7 @@ class ProtectedHarassmentGate:
             r'protected.*characteristic'
         ]
         
-        has_exception = any(re.search(p, text, re.IGNORECASE) for p in harassment_exception)
+        has_exception = any(proximity.occurs(p, text, re.IGNORECASE) for p in harassment_exception)
         
         if has_silencing and not has_exception:
             return {
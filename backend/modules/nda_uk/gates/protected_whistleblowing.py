@@ -1,5 +1,7 @@
 import re
 
+from core.proximity import proximity
+
 
 class ProtectedWhistleblowingGate:
     def __init__(self):
@@ -28,7 +30,7 @@ class ProtectedWhistleblowingGate:
             r'shall not disclose any information'
         ]
         
-        has_blanket_ban = any(re.search(p, text, re.IGNORECASE) for p in prohibition_patterns)
+        has_blanket_ban = any(proximity.occurs(p, text, re.IGNORECASE) for p in prohibition_patterns)
         
         # Check for whistleblowing carve-out
         carveout_patterns = [
@@ -38,7 +40,7 @@ class ProtectedWhistleblowingGate:
             r'whistleblow'
         ]
         
-        has_carveout = any(re.search(p, text, re.IGNORECASE) for p in carveout_patterns)
+        has_carveout = any(proximity.occurs(p, text, re.IGNORECASE) for p in carveout_patterns)
         
         if has_blanket_ban and not has_carveout:
             return {
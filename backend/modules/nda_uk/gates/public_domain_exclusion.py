@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class PublicDomainExclusionGate:
     def __init__(self):
@@ -24,7 +26,7 @@ class PublicDomainExclusionGate:
             r'generally available to the public'
         ]
         
-        has_exclusion = any(re.search(p, text, re.IGNORECASE) for p in public_domain_patterns)
+        has_exclusion = any(pattern_registry.search(p, text, re.IGNORECASE) for p in public_domain_patterns)
         
         if has_exclusion:
             return {'status': 'PASS', 'severity': 'none', 'message': 'Public domain exclusion present', 'legal_source': self.legal_source}
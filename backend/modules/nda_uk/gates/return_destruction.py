@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ReturnDestructionGate:
     def __init__(self):
@@ -24,7 +26,7 @@ class ReturnDestructionGate:
             r'upon.*(?:request|termination).*return'
         ]
         
-        has_return = any(re.search(p, text, re.IGNORECASE) for p in return_patterns)
+        has_return = any(pattern_registry.search(p, text, re.IGNORECASE) for p in return_patterns)
         
         if has_return:
             return {'status': 'PASS', 'severity': 'none', 'message': 'Return/destruction obligations stated'}
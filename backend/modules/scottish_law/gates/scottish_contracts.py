@@ -10,6 +10,8 @@ Checks for Scotland-specific contract law differences:
 
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ScottishContractsGate:
     def __init__(self):
@@ -23,7 +25,7 @@ class ScottishContractsGate:
         is_scottish = any([
             'scots law' in text_lower,
             'law of scotland' in text_lower,
-            re.search(r'governed\s+by.*\bscot(?:s|tish|land)\b', text_lower),
+            pattern_registry.search(r'governed\s+by.*\bscot(?:s|tish|land)\b', text_lower),
             'scottish law' in text_lower
         ])
         is_contract = any([
@@ -53,7 +55,7 @@ class ScottishContractsGate:
         ]
 
         for pattern in consideration_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 issues.append("English law 'consideration' language used in Scottish contract")
                 corrections.append({
                     'type': 'consideration_not_required',
@@ -64,7 +66,8 @@ class ScottishContractsGate:
                 break
 
         # 2. Check for "subject to contract" warnings
-        subject_to_contract = re.search(r'subject\s+to\s+(?:contract|formal\s+contract)', text, re.IGNORECASE)
+        subject_to_contract = pattern_registry.search(r'subject\s+to\s+(?:contract|formal\s+contract)', text,
+                                                      re.IGNORECASE)
         if subject_to_contract:
             issues.append("'Subject to contract' used in Scottish context")
             corrections.append({
@@ -75,9 +78,10 @@ class ScottishContractsGate:
             })
 
         # 3. Check for strict "offer and acceptance" terminology
-        if re.search(r'offer\s+and\s+acceptance', text, re.IGNORECASE):
+        if pattern_registry.search(r'offer\s+and\s+acceptance', text, re.IGNORECASE):
             # Check if consensus in idem is mentioned
-            if not re.search(r'consensus\s+in\s+idem|meeting\s+of\s+(?:the\s+)?minds', text, re.IGNORECASE):
+            if not pattern_registry.search(r'consensus\s+in\s+idem|meeting\s+of\s+(?:the\s+)?minds', text,
+                                           re.IGNORECASE):
                 corrections.append({
                     'type': 'contract_formation_principle',
                     'suggestion': 'Scots law focuses on "consensus in idem" (meeting of minds) rather than strict offer and acceptance',
@@ -86,8 +90,9 @@ class ScottishContractsGate:
                 })
 
         # 4. Check for third-party rights (Jus quaesitum tertio)
-        third_party_mentioned = re.search(r'third[\s-]part(?:y|ies)', text, re.IGNORECASE)
-        contracts_act_mentioned = re.search(r'contracts.*rights.*third\s+parties.*act\s+1999', text, re.IGNORECASE)
+        third_party_mentioned = pattern_registry.search(r'third[\s-]part(?:y|ies)', text, re.IGNORECASE)
+        contracts_act_mentioned = pattern_registry.search(r'contracts.*rights.*third\s+parties.*act\s+1999', text,
+                                                          re.IGNORECASE)
 
         if third_party_mentioned and contracts_act_mentioned:
             issues.append("English Contracts (Rights of Third Parties) Act 1999 referenced in Scottish contract")
@@ -99,8 +104,9 @@ class ScottishContractsGate:
             })
 
         # 5. Check for jus quaesitum tertio concepts
-        if third_party_mentioned and re.search(r'enforce|right|benefit', text, re.IGNORECASE):
-            if not re.search(r'jus\s+quaesitum\s+tertio|Contract.*Third\s+Party.*Scotland.*2017', text, re.IGNORECASE):
+        if third_party_mentioned and pattern_registry.search(r'enforce|right|benefit', text, re.IGNORECASE):
+            if not pattern_registry.search(r'jus\s+quaesitum\s+tertio|Contract.*Third\s+Party.*Scotland.*2017', text,
+                                           re.IGNORECASE):
                 corrections.append({
                     'type': 'jus_quaesitum_tertio_suggestion',
                     'suggestion': 'For third-party rights in Scotland, reference jus quaesitum tertio or the Contract (Third Party Rights) (Scotland) Act 2017',
@@ -108,7 +114,7 @@ class ScottishContractsGate:
                 })
 
         # 6. Check for "executed as a deed" language
-        if re.search(r'executed\s+as\s+a\s+deed|signed.*sealed.*delivered', text, re.IGNORECASE):
+        if pattern_registry.search(r'executed\s+as\s+a\s+deed|signed.*sealed.*delivered', text, re.IGNORECASE):
             corrections.append({
                 'type': 'deed_execution',
                 'suggestion': 'Scots law does not have the same concept of "deeds" as English law. Contracts are valid without deed formalities.',
@@ -117,10 +123,11 @@ class ScottishContractsGate:
             })
 
         # 7. Check for "entire agreement" clauses
-        entire_agreement = re.search(r'entire\s+agreement', text, re.IGNORECASE)
+        entire_agreement = pattern_registry.search(r'entire\s+agreement', text, re.IGNORECASE)
         if entire_agreement:
             # Check if it acknowledges Scots law limitations
-            if not re.search(r'(?:subject\s+to|except\s+for|save\s+for).*fraud|misrepresentation', text, re.IGNORECASE):
+            if not pattern_registry.search(r'(?:subject\s+to|except\s+for|save\s+for).*fraud|misrepresentation', text,
+                                           re.IGNORECASE):
                 corrections.append({
                     'type': 'entire_agreement_clause',
                     'suggestion': 'Entire agreement clauses in Scots law cannot exclude liability for fraud or fraudulent misrepresentation',
@@ -128,7 +135,7 @@ class ScottishContractsGate:
                 })
 
         # 8. Check for contract formation timing issues
-        if re.search(r'binding.*(?:upon|when|once).*sign(?:ed|ature)', text, re.IGNORECASE):
+        if pattern_registry.search(r'binding.*(?:upon|when|once).*sign(?:ed|ature)', text, re.IGNORECASE):
             corrections.append({
                 'type': 'contract_formation_timing',
                 'suggestion': 'In Scots law, contracts may be binding earlier than signature if consensus in idem is reached',
@@ -137,7 +144,7 @@ class ScottishContractsGate:
             })
 
         # 9. Check for "without prejudice" usage
-        if re.search(r'without\s+prejudice', text, re.IGNORECASE):
+        if pattern_registry.search(r'without\s+prejudice', text, re.IGNORECASE):
             corrections.append({
                 'type': 'without_prejudice_scots_law',
                 'suggestion': '"Without prejudice" communications in Scots law follow similar principles to English law but are applied under Scots privilege rules',
@@ -145,7 +152,7 @@ class ScottishContractsGate:
             })
 
         # 10. Check for rectification references
-        if re.search(r'rectif(?:y|ication)', text, re.IGNORECASE):
+        if pattern_registry.search(r'rectif(?:y|ication)', text, re.IGNORECASE):
             corrections.append({
                 'type': 'rectification',
                 'suggestion': 'Contract rectification in Scots law requires proof of common error or unilateral error with knowledge',
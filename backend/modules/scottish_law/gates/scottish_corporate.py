@@ -10,6 +10,8 @@ Checks for Scotland-specific corporate law differences:
 
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ScottishCorporateGate:
     def __init__(self):
@@ -52,10 +54,11 @@ class ScottishCorporateGate:
         corrections = []
 
         # 1. Check for Companies House references
-        companies_house = re.search(r'Companies\s+House', text, re.IGNORECASE)
+        companies_house = pattern_registry.search(r'Companies\s+House', text, re.IGNORECASE)
         if companies_house:
             # Check if Scottish context is specified
-            scottish_office = re.search(r'Companies\s+House.*Scotland|Edinburgh.*Companies\s+House', text, re.IGNORECASE)
+            scottish_office = pattern_registry.search(r'Companies\s+House.*Scotland|Edinburgh.*Companies\s+House', text,
+                                                      re.IGNORECASE)
             if not scottish_office:
                 corrections.append({
                     'type': 'companies_house_scotland',
@@ -64,8 +67,8 @@ class ScottishCorporateGate:
                 })
 
         # 2. Check for charity references
-        charity_mentioned = re.search(r'\bcharit(?:y|ies|able)\b', text, re.IGNORECASE)
-        charity_commission = re.search(r'Charity\s+Commission', text, re.IGNORECASE)
+        charity_mentioned = pattern_registry.search(r'\bcharit(?:y|ies|able)\b', text, re.IGNORECASE)
+        charity_commission = pattern_registry.search(r'Charity\s+Commission', text, re.IGNORECASE)
 
         if charity_mentioned and charity_commission:
             issues.append("English Charity Commission referenced in Scottish charity context")
@@ -77,7 +80,8 @@ class ScottishCorporateGate:
             })
 
         # 3. Check for OSCR references in Scottish charity context
-        if charity_mentioned and not re.search(r'\bOSCR\b|Office\s+of\s+the\s+Scottish\s+Charity\s+Regulator', text, re.IGNORECASE):
+        if charity_mentioned and not pattern_registry.search(
+                r'\bOSCR\b|Office\s+of\s+the\s+Scottish\s+Charity\s+Regulator', text, re.IGNORECASE):
             corrections.append({
                 'type': 'oscr_reference',
                 'suggestion': 'Scottish charities must be registered with OSCR and display their Scottish Charity Number (SC number)',
@@ -85,8 +89,10 @@ class ScottishCorporateGate:
             })
 
         # 4. Check for charity number format
-        charity_number = re.search(r'Charity\s+(?:Number|No\.?|Registration)\s*:?\s*(\d+)', text, re.IGNORECASE)
-        scottish_charity_number = re.search(r'Scottish\s+Charity\s+(?:Number|No\.?)\s*:?\s*(SC\d{6})', text, re.IGNORECASE)
+        charity_number = pattern_registry.search(r'Charity\s+(?:Number|No\.?|Registration)\s*:?\s*(\d+)', text,
+                                                 re.IGNORECASE)
+        scottish_charity_number = pattern_registry.search(r'Scottish\s+Charity\s+(?:Number|No\.?)\s*:?\s*(SC\d{6})',
+                                                          text, re.IGNORECASE)
 
         if charity_number and not scottish_charity_number:
             corrections.append({
@@ -96,9 +102,9 @@ class ScottishCorporateGate:
             })
 
         # 5. Check for Community Interest Company (CIC) references
-        cic_mentioned = re.search(r'Community\s+Interest\s+Compan(?:y|ies)|CIC', text, re.IGNORECASE)
+        cic_mentioned = pattern_registry.search(r'Community\s+Interest\s+Compan(?:y|ies)|CIC', text, re.IGNORECASE)
         if cic_mentioned:
-            cic_regulator = re.search(r'CIC\s+Regulator', text, re.IGNORECASE)
+            cic_regulator = pattern_registry.search(r'CIC\s+Regulator', text, re.IGNORECASE)
             if not cic_regulator:
                 corrections.append({
                     'type': 'cic_regulator',
@@ -107,7 +113,7 @@ class ScottishCorporateGate:
                 })
 
         # 6. Check for Scottish Limited Partnership (SLP) references
-        limited_partnership = re.search(r'Limited\s+Partnership|L\.?P\.?(?!\s+Act)', text, re.IGNORECASE)
+        limited_partnership = pattern_registry.search(r'Limited\s+Partnership|L\.?P\.?(?!\s+Act)', text, re.IGNORECASE)
         if limited_partnership:
             corrections.append({
                 'type': 'scottish_limited_partnership',
@@ -116,9 +122,10 @@ class ScottishCorporateGate:
             })
 
         # 7. Check for registered office location
-        registered_office = re.search(r'registered\s+office', text, re.IGNORECASE)
+        registered_office = pattern_registry.search(r'registered\s+office', text, re.IGNORECASE)
         if registered_office:
-            scotland_office = re.search(r'(?:registered\s+office|located|situated).*(?:Scotland|Scottish\s+address)', text, re.IGNORECASE)
+            scotland_office = pattern_registry.search(
+                r'(?:registered\s+office|located|situated).*(?:Scotland|Scottish\s+address)', text, re.IGNORECASE)
             if scotland_office:
                 corrections.append({
                     'type': 'scottish_registered_office',
@@ -127,7 +134,8 @@ class ScottishCorporateGate:
                 })
 
         # 8. Check for directors' duties references
-        directors_duties = re.search(r'director(?:s\'?)?.*(?:dut(?:y|ies)|obligation|responsibility)', text, re.IGNORECASE)
+        directors_duties = pattern_registry.search(r'director(?:s\'?)?.*(?:dut(?:y|ies)|obligation|responsibility)',
+                                                   text, re.IGNORECASE)
         if directors_duties:
             corrections.append({
                 'type': 'directors_duties_uk_wide',
@@ -136,9 +144,11 @@ class ScottishCorporateGate:
             })
 
         # 9. Check for insolvency references
-        insolvency_mentioned = re.search(r'insolvenc(?:y|ies)|liquidation|administration|receivership', text, re.IGNORECASE)
+        insolvency_mentioned = pattern_registry.search(r'insolvenc(?:y|ies)|liquidation|administration|receivership',
+                                                       text, re.IGNORECASE)
         if insolvency_mentioned:
-            scots_insolvency = re.search(r'Scots\s+(?:insolvency|bankruptcy)|Insolvency\s+\(Scotland\)', text, re.IGNORECASE)
+            scots_insolvency = pattern_registry.search(r'Scots\s+(?:insolvency|bankruptcy)|Insolvency\s+\(Scotland\)',
+                                                       text, re.IGNORECASE)
             if not scots_insolvency:
                 corrections.append({
                     'type': 'scottish_insolvency',
@@ -147,7 +157,8 @@ class ScottishCorporateGate:
                 })
 
         # 10. Check for articles of association references
-        articles = re.search(r'[Aa]rticles\s+of\s+[Aa]ssociation|[Mm]emorandum\s+and\s+[Aa]rticles', text, re.IGNORECASE)
+        articles = pattern_registry.search(r'[Aa]rticles\s+of\s+[Aa]ssociation|[Mm]emorandum\s+and\s+[Aa]rticles', text,
+                                           re.IGNORECASE)
         if articles:
             corrections.append({
                 'type': 'articles_uk_wide',
@@ -156,7 +167,8 @@ class ScottishCorporateGate:
             })
 
         # 11. Check for SCIO (Scottish Charitable Incorporated Organisation)
-        scio_mentioned = re.search(r'\bSCIO\b|Scottish\s+Charitable\s+Incorporated\s+Organisation', text, re.IGNORECASE)
+        scio_mentioned = pattern_registry.search(r'\bSCIO\b|Scottish\s+Charitable\s+Incorporated\s+Organisation', text,
+                                                 re.IGNORECASE)
         if scio_mentioned:
             corrections.append({
                 'type': 'scio_reference',
@@ -171,7 +183,7 @@ class ScottishCorporateGate:
             })
 
         # 12. Check for charitable purposes references
-        charitable_purposes = re.search(r'charitable\s+purpose', text, re.IGNORECASE)
+        charitable_purposes = pattern_registry.search(r'charitable\s+purpose', text, re.IGNORECASE)
         if charitable_purposes:
             corrections.append({
                 'type': 'charitable_purposes_scotland',
@@ -180,9 +192,9 @@ class ScottishCorporateGate:
             })
 
         # 13. Check for company secretary references
-        company_secretary = re.search(r'company\s+secretary', text, re.IGNORECASE)
+        company_secretary = pattern_registry.search(r'company\s+secretary', text, re.IGNORECASE)
         if company_secretary:
-            private_company = re.search(r'private\s+(?:limited\s+)?compan(?:y|ies)', text, re.IGNORECASE)
+            private_company = pattern_registry.search(r'private\s+(?:limited\s+)?compan(?:y|ies)', text, re.IGNORECASE)
             if private_company:
                 corrections.append({
                     'type': 'company_secretary_optional',
@@ -191,7 +203,7 @@ class ScottishCorporateGate:
                 })
 
         # 14. Check for Scottish partnership references
-        partnership = re.search(r'partnership(?!.*limited)', text, re.IGNORECASE)
+        partnership = pattern_registry.search(r'partnership(?!.*limited)', text, re.IGNORECASE)
         if partnership:
             corrections.append({
                 'type': 'scottish_partnership',
@@ -200,7 +212,8 @@ class ScottishCorporateGate:
             })
 
         # 15. Check for cross-border trading references
-        cross_border = re.search(r'(?:England|Wales|Northern\s+Ireland).*(?:trad(?:e|ing)|business|operation)', text, re.IGNORECASE)
+        cross_border = pattern_registry.search(
+            r'(?:England|Wales|Northern\s+Ireland).*(?:trad(?:e|ing)|business|operation)', text, re.IGNORECASE)
         if cross_border and registered_office:
             corrections.append({
                 'type': 'cross_border_operations',
@@ -10,6 +10,8 @@ Checks for Scotland-specific data protection differences:
 
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ScottishDataProtectionGate:
     def __init__(self):
@@ -48,12 +50,13 @@ class ScottishDataProtectionGate:
         corrections = []
 
         # 1. Check for Scottish Information Commissioner references
-        ico_mentioned = re.search(r'\bICO\b|Information\s+Commissioner', text, re.IGNORECASE)
-        scottish_ico_mentioned = re.search(r'Scottish\s+Information\s+Commissioner', text, re.IGNORECASE)
+        ico_mentioned = pattern_registry.search(r'\bICO\b|Information\s+Commissioner', text, re.IGNORECASE)
+        scottish_ico_mentioned = pattern_registry.search(r'Scottish\s+Information\s+Commissioner', text, re.IGNORECASE)
 
         if ico_mentioned and not scottish_ico_mentioned:
             # Check if it's a public authority context
-            public_sector = re.search(r'public\s+(?:authority|body|sector)|(?:council|NHS|government)', text, re.IGNORECASE)
+            public_sector = pattern_registry.search(r'public\s+(?:authority|body|sector)|(?:council|NHS|government)',
+                                                    text, re.IGNORECASE)
             if public_sector:
                 corrections.append({
                     'type': 'scottish_information_commissioner',
@@ -63,8 +66,9 @@ class ScottishDataProtectionGate:
                 })
 
         # 2. Check for Freedom of Information Act references
-        foi_uk_act = re.search(r'Freedom\s+of\s+Information\s+Act\s+2000', text, re.IGNORECASE)
-        foi_scotland_act = re.search(r'Freedom\s+of\s+Information\s+\(Scotland\)\s+Act\s+2002', text, re.IGNORECASE)
+        foi_uk_act = pattern_registry.search(r'Freedom\s+of\s+Information\s+Act\s+2000', text, re.IGNORECASE)
+        foi_scotland_act = pattern_registry.search(r'Freedom\s+of\s+Information\s+\(Scotland\)\s+Act\s+2002', text,
+                                                   re.IGNORECASE)
 
         if foi_uk_act and not foi_scotland_act:
             issues.append("FOI Act 2000 (UK) referenced instead of FOI (Scotland) Act 2002")
@@ -76,8 +80,9 @@ class ScottishDataProtectionGate:
             })
 
         # 3. Check for Environmental Information Regulations
-        eir_mentioned = re.search(r'Environmental\s+Information\s+Regulations', text, re.IGNORECASE)
-        eir_scotland_mentioned = re.search(r'Environmental\s+Information\s+\(Scotland\)\s+Regulations', text, re.IGNORECASE)
+        eir_mentioned = pattern_registry.search(r'Environmental\s+Information\s+Regulations', text, re.IGNORECASE)
+        eir_scotland_mentioned = pattern_registry.search(r'Environmental\s+Information\s+\(Scotland\)\s+Regulations',
+                                                         text, re.IGNORECASE)
 
         if eir_mentioned and not eir_scotland_mentioned:
             corrections.append({
@@ -88,8 +93,8 @@ class ScottishDataProtectionGate:
             })
 
         # 4. Check for ICO UK references in Scottish public sector context
-        if re.search(r'(?:report\s+to|contact).*\bICO\b', text, re.IGNORECASE):
-            if re.search(r'scottish.*(?:public|authority|body|council|nhs)', text, re.IGNORECASE):
+        if pattern_registry.search(r'(?:report\s+to|contact).*\bICO\b', text, re.IGNORECASE):
+            if pattern_registry.search(r'scottish.*(?:public|authority|body|council|nhs)', text, re.IGNORECASE):
                 corrections.append({
                     'type': 'dual_commissioner_jurisdiction',
                     'suggestion': 'Scottish public authorities: UK ICO for data protection (UK GDPR/DPA 2018); Scottish Information Commissioner for FOI Scotland',
@@ -98,8 +103,9 @@ class ScottishDataProtectionGate:
                 })
 
         # 5. Check for Public Records Act references
-        if re.search(r'public\s+records?', text, re.IGNORECASE):
-            public_records_scotland = re.search(r'Public\s+Records\s+\(Scotland\)\s+Act\s+2011', text, re.IGNORECASE)
+        if pattern_registry.search(r'public\s+records?', text, re.IGNORECASE):
+            public_records_scotland = pattern_registry.search(r'Public\s+Records\s+\(Scotland\)\s+Act\s+2011', text,
+                                                              re.IGNORECASE)
             if not public_records_scotland:
                 corrections.append({
                     'type': 'public_records_scotland',
@@ -108,10 +114,10 @@ class ScottishDataProtectionGate:
                 })
 
         # 6. Check for Data Protection Officer references
-        dpo_mentioned = re.search(r'Data\s+Protection\s+Officer|DPO', text, re.IGNORECASE)
+        dpo_mentioned = pattern_registry.search(r'Data\s+Protection\s+Officer|DPO', text, re.IGNORECASE)
         if dpo_mentioned:
             # Verify UK GDPR is referenced (applies equally in Scotland)
-            if not re.search(r'UK\s+GDPR|Data\s+Protection\s+Act\s+2018', text, re.IGNORECASE):
+            if not pattern_registry.search(r'UK\s+GDPR|Data\s+Protection\s+Act\s+2018', text, re.IGNORECASE):
                 corrections.append({
                     'type': 'uk_gdpr_reference',
                     'suggestion': 'Ensure UK GDPR and Data Protection Act 2018 are referenced (apply throughout UK including Scotland)',
@@ -119,10 +125,11 @@ class ScottishDataProtectionGate:
                 })
 
         # 7. Check for Scottish public authority obligations
-        scottish_public_body = re.search(r'scottish.*(?:public\s+authority|public\s+body|council|nhs|government|parliament)', text, re.IGNORECASE)
+        scottish_public_body = pattern_registry.search(
+            r'scottish.*(?:public\s+authority|public\s+body|council|nhs|government|parliament)', text, re.IGNORECASE)
         if scottish_public_body:
             # Check for records management plan mention
-            if not re.search(r'records?\s+management\s+plan|RMP', text, re.IGNORECASE):
+            if not pattern_registry.search(r'records?\s+management\s+plan|RMP', text, re.IGNORECASE):
                 corrections.append({
                     'type': 'records_management_plan',
                     'suggestion': 'Scottish public authorities must have a Records Management Plan approved by Keeper of the Records of Scotland',
@@ -130,8 +137,8 @@ class ScottishDataProtectionGate:
                 })
 
         # 8. Check for FOI request timescales
-        if re.search(r'(?:foi|freedom\s+of\s+information).*request', text, re.IGNORECASE):
-            if re.search(r'(?:20|twenty)[\s-]working[\s-]day', text, re.IGNORECASE):
+        if pattern_registry.search(r'(?:foi|freedom\s+of\s+information).*request', text, re.IGNORECASE):
+            if pattern_registry.search(r'(?:20|twenty)[\s-]working[\s-]day', text, re.IGNORECASE):
                 # Correct - both UK and Scotland use 20 working days
                 pass
             else:
@@ -142,7 +149,7 @@ class ScottishDataProtectionGate:
                 })
 
         # 9. Check for Scottish Parliament and government references
-        if re.search(r'scottish\s+(?:parliament|government|ministers)', text, re.IGNORECASE):
+        if pattern_registry.search(r'scottish\s+(?:parliament|government|ministers)', text, re.IGNORECASE):
             corrections.append({
                 'type': 'devolved_data_protection',
                 'suggestion': 'Scottish Parliament and Government are subject to both FOI (Scotland) Act 2002 and UK data protection law',
@@ -150,7 +157,7 @@ class ScottishDataProtectionGate:
             })
 
         # 10. Check for vexatious or repeated requests language
-        if re.search(r'vexatious|repeated.*request', text, re.IGNORECASE):
+        if pattern_registry.search(r'vexatious|repeated.*request', text, re.IGNORECASE):
             corrections.append({
                 'type': 'vexatious_requests_scotland',
                 'suggestion': 'FOI (Scotland) Act 2002, s.14: Scottish public authorities can refuse vexatious or repeated requests',
@@ -158,8 +165,8 @@ class ScottishDataProtectionGate:
             })
 
         # 11. Check for National Records of Scotland
-        if re.search(r'national\s+archives|public\s+records', text, re.IGNORECASE):
-            if not re.search(r'National\s+Records\s+of\s+Scotland|NRS', text, re.IGNORECASE):
+        if pattern_registry.search(r'national\s+archives|public\s+records', text, re.IGNORECASE):
+            if not pattern_registry.search(r'National\s+Records\s+of\s+Scotland|NRS', text, re.IGNORECASE):
                 corrections.append({
                     'type': 'nrs_reference',
                     'suggestion': 'In Scotland, reference National Records of Scotland (NRS) and the Keeper of the Records of Scotland',
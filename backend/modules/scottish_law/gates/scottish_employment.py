@@ -10,6 +10,8 @@ Checks for Scotland-specific employment law differences:
 
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ScottishEmploymentGate:
     def __init__(self):
@@ -24,7 +26,7 @@ class ScottishEmploymentGate:
             'scotland' in text_lower,
             'scots law' in text_lower,
             'scottish' in text_lower,
-            re.search(r'\bscot(?:land|tish)\b', text_lower)
+            pattern_registry.search(r'\bscot(?:land|tish)\b', text_lower)
         ])
         is_employment = any([
             'employment' in text_lower,
@@ -55,7 +57,7 @@ class ScottishEmploymentGate:
         ]
 
         for pattern in english_tribunal_refs:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 issues.append("Document references Employment Tribunal without Scotland specification")
                 corrections.append({
                     'type': 'tribunal_reference',
@@ -65,8 +67,8 @@ class ScottishEmploymentGate:
                 break
 
         # 2. Check for ACAS references without Scotland specification
-        if re.search(r'\bACAS\b(?!\s+scotland)', text, re.IGNORECASE):
-            acas_scotland_mentioned = re.search(r'acas\s+scotland', text, re.IGNORECASE)
+        if pattern_registry.search(r'\bACAS\b(?!\s+scotland)', text, re.IGNORECASE):
+            acas_scotland_mentioned = pattern_registry.search(r'acas\s+scotland', text, re.IGNORECASE)
             if not acas_scotland_mentioned:
                 issues.append("ACAS referenced without Scotland specification")
                 corrections.append({
@@ -77,8 +79,8 @@ class ScottishEmploymentGate:
 
         # 3. Check for 6-year limitation period (incorrect in Scotland)
         six_year_pattern = r'(?:within\s+)?(?:six|6)[\s-]year(?:s)?(?:\s+(?:period|limitation|time\s+limit))'
-        if re.search(six_year_pattern, text, re.IGNORECASE):
-            context = re.search(r'.{0,50}' + six_year_pattern + r'.{0,50}', text, re.IGNORECASE)
+        if pattern_registry.search(six_year_pattern, text, re.IGNORECASE):
+            context = pattern_registry.search(r'.{0,50}' + six_year_pattern + r'.{0,50}', text, re.IGNORECASE)
             if context and 'contract' in context.group().lower():
                 issues.append("Six-year limitation period stated (incorrect for Scotland)")
                 corrections.append({
@@ -89,7 +91,7 @@ class ScottishEmploymentGate:
                 })
 
         # 4. Check for incorrect prescription terminology
-        if re.search(r'\blimitation\s+(?:period|act)\b', text, re.IGNORECASE):
+        if pattern_registry.search(r'\blimitation\s+(?:period|act)\b', text, re.IGNORECASE):
             issues.append("English 'limitation' terminology used instead of Scots 'prescription'")
             corrections.append({
                 'type': 'terminology',
@@ -99,9 +101,9 @@ class ScottishEmploymentGate:
             })
 
         # 5. Check for constructive dismissal references
-        if re.search(r'constructive\s+dismissal', text, re.IGNORECASE):
+        if pattern_registry.search(r'constructive\s+dismissal', text, re.IGNORECASE):
             # Check if Scottish case law is referenced
-            scottish_case_law = re.search(r'(?:west\s+midlands|scottish\s+coal)', text, re.IGNORECASE)
+            scottish_case_law = pattern_registry.search(r'(?:west\s+midlands|scottish\s+coal)', text, re.IGNORECASE)
             if not scottish_case_law:
                 corrections.append({
                     'type': 'case_law_suggestion',
@@ -110,7 +112,7 @@ class ScottishEmploymentGate:
                 })
 
         # 6. Check for employment contract formation terms
-        if re.search(r'offer\s+and\s+acceptance', text, re.IGNORECASE):
+        if pattern_registry.search(r'offer\s+and\s+acceptance', text, re.IGNORECASE):
             issues.append("English contract formation terminology may not apply in Scotland")
             corrections.append({
                 'type': 'contract_formation',
@@ -119,8 +121,8 @@ class ScottishEmploymentGate:
             })
 
         # 7. Check for Early Conciliation requirements
-        if re.search(r'early\s+conciliation', text, re.IGNORECASE):
-            if not re.search(r'acas\s+scotland', text, re.IGNORECASE):
+        if pattern_registry.search(r'early\s+conciliation', text, re.IGNORECASE):
+            if not pattern_registry.search(r'acas\s+scotland', text, re.IGNORECASE):
                 corrections.append({
                     'type': 'early_conciliation',
                     'suggestion': 'Early Conciliation in Scotland is handled by ACAS Scotland, not ACAS England & Wales',
@@ -128,8 +130,9 @@ class ScottishEmploymentGate:
                 })
 
         # 8. Check for unfair dismissal time limits
-        unfair_dismissal_mentioned = re.search(r'unfair\s+dismissal', text, re.IGNORECASE)
-        three_months_mentioned = re.search(r'(?:three|3)\s+months?(?:\s+less\s+one\s+day)?', text, re.IGNORECASE)
+        unfair_dismissal_mentioned = pattern_registry.search(r'unfair\s+dismissal', text, re.IGNORECASE)
+        three_months_mentioned = pattern_registry.search(r'(?:three|3)\s+months?(?:\s+less\s+one\s+day)?', text,
+                                                         re.IGNORECASE)
 
         if unfair_dismissal_mentioned and not three_months_mentioned:
             corrections.append({
@@ -139,8 +142,8 @@ class ScottishEmploymentGate:
             })
 
         # 9. Scottish-specific employment protections
-        if re.search(r'zero[\s-]hours?\s+contract', text, re.IGNORECASE):
-            if not re.search(r'exclusivity|exclusive\s+services', text, re.IGNORECASE):
+        if pattern_registry.search(r'zero[\s-]hours?\s+contract', text, re.IGNORECASE):
+            if not pattern_registry.search(r'exclusivity|exclusive\s+services', text, re.IGNORECASE):
                 corrections.append({
                     'type': 'zero_hours_protection',
                     'suggestion': 'Zero-hours contracts in Scotland: exclusivity clauses are unenforceable',
@@ -10,6 +10,8 @@ Checks for Scotland-specific property law differences:
 
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ScottishPropertyGate:
     def __init__(self):
@@ -24,7 +26,7 @@ class ScottishPropertyGate:
             'scotland' in text_lower,
             'scottish' in text_lower,
             'scots law' in text_lower,
-            re.search(r'governed\s+by.*scots?\s+law', text_lower)
+            pattern_registry.search(r'governed\s+by.*scots?\s+law', text_lower)
         ])
         is_property = any([
             'property' in text_lower,
@@ -52,7 +54,7 @@ class ScottishPropertyGate:
         corrections = []
 
         # 1. Check for "freehold" terminology (not used in Scotland)
-        if re.search(r'\bfreehold\b', text, re.IGNORECASE):
+        if pattern_registry.search(r'\bfreehold\b', text, re.IGNORECASE):
             issues.append("English 'freehold' terminology used in Scottish property context")
             corrections.append({
                 'type': 'property_terminology',
@@ -62,7 +64,7 @@ class ScottishPropertyGate:
             })
 
         # 2. Check for "leasehold" terminology
-        if re.search(r'\bleasehold\b', text, re.IGNORECASE):
+        if pattern_registry.search(r'\bleasehold\b', text, re.IGNORECASE):
             issues.append("English 'leasehold' terminology used in Scottish property context")
             corrections.append({
                 'type': 'leasehold_terminology',
@@ -72,7 +74,7 @@ class ScottishPropertyGate:
             })
 
         # 3. Check for Land Registry references (should be Registers of Scotland)
-        if re.search(r'Land\s+Registry|HM\s+Land\s+Registry|HMLR', text, re.IGNORECASE):
+        if pattern_registry.search(r'Land\s+Registry|HM\s+Land\s+Registry|HMLR', text, re.IGNORECASE):
             issues.append("English Land Registry referenced instead of Registers of Scotland")
             corrections.append({
                 'type': 'land_registry',
@@ -82,7 +84,7 @@ class ScottishPropertyGate:
             })
 
         # 4. Check for Assured Shorthold Tenancy (AST) - English concept
-        if re.search(r'Assured\s+Shorthold\s+Tenancy|AST', text, re.IGNORECASE):
+        if pattern_registry.search(r'Assured\s+Shorthold\s+Tenancy|AST', text, re.IGNORECASE):
             issues.append("English Assured Shorthold Tenancy (AST) referenced in Scottish context")
             corrections.append({
                 'type': 'tenancy_type',
@@ -92,8 +94,8 @@ class ScottishPropertyGate:
             })
 
         # 5. Check for Private Residential Tenancy references
-        residential_tenancy = re.search(r'residential\s+tenanc(?:y|ies)', text, re.IGNORECASE)
-        prt_mentioned = re.search(r'Private\s+Residential\s+Tenancy|PRT', text, re.IGNORECASE)
+        residential_tenancy = pattern_registry.search(r'residential\s+tenanc(?:y|ies)', text, re.IGNORECASE)
+        prt_mentioned = pattern_registry.search(r'Private\s+Residential\s+Tenancy|PRT', text, re.IGNORECASE)
 
         if residential_tenancy and not prt_mentioned:
             corrections.append({
@@ -103,8 +105,8 @@ class ScottishPropertyGate:
             })
 
         # 6. Check for Section 21 eviction references (English only)
-        if re.search(r'Section\s+21|s\.?\s*21|s21', text, re.IGNORECASE):
-            context = re.search(r'(?:Housing\s+Act|evict|notice|possess)', text, re.IGNORECASE)
+        if pattern_registry.search(r'Section\s+21|s\.?\s*21|s21', text, re.IGNORECASE):
+            context = pattern_registry.search(r'(?:Housing\s+Act|evict|notice|possess)', text, re.IGNORECASE)
             if context:
                 issues.append("Section 21 eviction (English law) referenced in Scottish context")
                 corrections.append({
@@ -115,8 +117,11 @@ class ScottishPropertyGate:
                 })
 
         # 7. Check for deposit protection schemes
-        deposit_mentioned = re.search(r'deposit.*(?:protection|scheme)|tenancy\s+deposit', text, re.IGNORECASE)
-        scottish_schemes = re.search(r'(?:SafeDeposits\s+Scotland|Letting\s+Protection\s+Service\s+Scotland|MyDeposits\s+Scotland)', text, re.IGNORECASE)
+        deposit_mentioned = pattern_registry.search(r'deposit.*(?:protection|scheme)|tenancy\s+deposit', text,
+                                                    re.IGNORECASE)
+        scottish_schemes = pattern_registry.search(
+            r'(?:SafeDeposits\s+Scotland|Letting\s+Protection\s+Service\s+Scotland|MyDeposits\s+Scotland)',
+            text, re.IGNORECASE)
 
         if deposit_mentioned and not scottish_schemes:
             corrections.append({
@@ -126,8 +131,9 @@ class ScottishPropertyGate:
             })
 
         # 8. Check for First-tier Tribunal references
-        tribunal_mentioned = re.search(r'tribunal|dispute\s+resolution', text, re.IGNORECASE)
-        scottish_tribunal = re.search(r'First-tier\s+Tribunal\s+for\s+Scotland|Housing\s+and\s+Property\s+Chamber', text, re.IGNORECASE)
+        tribunal_mentioned = pattern_registry.search(r'tribunal|dispute\s+resolution', text, re.IGNORECASE)
+        scottish_tribunal = pattern_registry.search(
+            r'First-tier\s+Tribunal\s+for\s+Scotland|Housing\s+and\s+Property\s+Chamber', text, re.IGNORECASE)
 
         if tribunal_mentioned and not scottish_tribunal:
             corrections.append({
@@ -137,8 +143,8 @@ class ScottishPropertyGate:
             })
 
         # 9. Check for "conveyancing" and missives
-        if re.search(r'conveyance|conveyancing', text, re.IGNORECASE):
-            if not re.search(r'missives', text, re.IGNORECASE):
+        if pattern_registry.search(r'conveyance|conveyancing', text, re.IGNORECASE):
+            if not pattern_registry.search(r'missives', text, re.IGNORECASE):
                 corrections.append({
                     'type': 'conveyancing_process',
                     'suggestion': 'Scottish property conveyancing uses "missives" (exchange of letters forming the contract)',
@@ -146,7 +152,7 @@ class ScottishPropertyGate:
                 })
 
         # 10. Check for "exchange of contracts"
-        if re.search(r'exchange\s+of\s+contracts', text, re.IGNORECASE):
+        if pattern_registry.search(r'exchange\s+of\s+contracts', text, re.IGNORECASE):
             issues.append("English 'exchange of contracts' terminology used in Scottish context")
             corrections.append({
                 'type': 'contract_exchange',
@@ -156,7 +162,7 @@ class ScottishPropertyGate:
             })
 
         # 11. Check for Right to Buy references
-        if re.search(r'Right\s+to\s+Buy', text, re.IGNORECASE):
+        if pattern_registry.search(r'Right\s+to\s+Buy', text, re.IGNORECASE):
             corrections.append({
                 'type': 'right_to_buy',
                 'suggestion': 'Right to Buy was abolished in Scotland from 1 August 2016 (ended earlier than in England)',
@@ -164,7 +170,7 @@ class ScottishPropertyGate:
             })
 
         # 12. Check for leasehold reform references
-        if re.search(r'leasehold\s+reform|commonhold', text, re.IGNORECASE):
+        if pattern_registry.search(r'leasehold\s+reform|commonhold', text, re.IGNORECASE):
             corrections.append({
                 'type': 'leasehold_reform',
                 'suggestion': 'English leasehold reform and commonhold do not apply in Scotland - Scotland has different property ownership structures',
@@ -172,7 +178,7 @@ class ScottishPropertyGate:
             })
 
         # 13. Check for "gazumping" references
-        if re.search(r'gazump(?:ing)?', text, re.IGNORECASE):
+        if pattern_registry.search(r'gazump(?:ing)?', text, re.IGNORECASE):
             corrections.append({
                 'type': 'gazumping',
                 'suggestion': 'Gazumping is much rarer in Scotland due to binding missives concluded earlier in the process',
@@ -180,8 +186,8 @@ class ScottishPropertyGate:
             })
 
         # 14. Check for Home Report requirements
-        if re.search(r'(?:selling|sale\s+of).*(?:property|house|flat)', text, re.IGNORECASE):
-            if not re.search(r'Home\s+Report', text, re.IGNORECASE):
+        if pattern_registry.search(r'(?:selling|sale\s+of).*(?:property|house|flat)', text, re.IGNORECASE):
+            if not pattern_registry.search(r'Home\s+Report', text, re.IGNORECASE):
                 corrections.append({
                     'type': 'home_report',
                     'suggestion': 'Scottish residential property sellers must provide a Home Report before marketing (not required in England)',
@@ -189,7 +195,7 @@ class ScottishPropertyGate:
                 })
 
         # 15. Check for commercial lease references
-        commercial_lease = re.search(r'commercial\s+(?:lease|property|letting)', text, re.IGNORECASE)
+        commercial_lease = pattern_registry.search(r'commercial\s+(?:lease|property|letting)', text, re.IGNORECASE)
         if commercial_lease:
             corrections.append({
                 'type': 'commercial_lease_scots',
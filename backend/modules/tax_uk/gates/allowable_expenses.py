@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class AllowableExpensesGate:
     def __init__(self):
@@ -41,7 +43,7 @@ class AllowableExpensesGate:
         spans = []
         
         for expense_type, pattern in non_allowable.items():
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern_registry.finditer(pattern, text, re.IGNORECASE):
                 # Check if it's being claimed as allowable
                 context_start = max(0, match.start() - 50)
                 context_end = min(len(text), match.end() + 50)
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class BusinessStructureConsistencyGate:
     def __init__(self):
@@ -24,17 +26,17 @@ class BusinessStructureConsistencyGate:
         
         # Sole traders called "directors" or "companies"
         sole_trader_pattern = r'sole trader.*(?:director|company|corporation tax)'
-        if re.search(sole_trader_pattern, text, re.IGNORECASE):
+        if pattern_registry.search(sole_trader_pattern, text, re.IGNORECASE):
             errors.append('Sole traders are not directors and do not pay corporation tax')
         
         # Directors called "self-employed"
         director_pattern = r'director.*self[- ]?employed'
-        if re.search(director_pattern, text, re.IGNORECASE):
+        if pattern_registry.search(director_pattern, text, re.IGNORECASE):
             errors.append('Directors are not self-employed; they are officers of the company')
         
         # Company owners taking "drawings" (should be salary/dividends)
         drawings_pattern = r'(?:limited company|director).*drawings'
-        if re.search(drawings_pattern, text, re.IGNORECASE):
+        if pattern_registry.search(drawings_pattern, text, re.IGNORECASE):
             errors.append('Limited companies use salaries/dividends, not drawings')
         
         if errors:
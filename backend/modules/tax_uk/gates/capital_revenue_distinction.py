@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class CapitalRevenueDistinctionGate:
     def __init__(self):
@@ -31,7 +33,7 @@ class CapitalRevenueDistinctionGate:
         spans = []
         
         for item_type, pattern in capital_items.items():
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern_registry.finditer(pattern, text, re.IGNORECASE):
                 # Check if being expensed immediately or listed as claimable
                 context_start = max(0, match.start() - 80)
                 context_end = min(len(text), match.end() + 80)
@@ -52,7 +54,7 @@ class CapitalRevenueDistinctionGate:
                     })
         
         # Check for depreciation mentions (not tax-deductible)
-        if re.search(r'depreciation.*(?:deduct|expense|claim)', text, re.IGNORECASE):
+        if pattern_registry.search(r'depreciation.*(?:deduct|expense|claim)', text, re.IGNORECASE):
             errors.append('Depreciation is not tax-deductible')
         
         if errors:
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class CompanyLimitedSuffixGate:
     def __init__(self):
@@ -24,7 +26,7 @@ class CompanyLimitedSuffixGate:
         company_pattern = r'\b([A-Z][A-Za-z]*(?:\s+[A-Z][A-Za-z]*)*)\s+(?:Invoice|Company|Business)'
         
         spans = []
-        for match in re.finditer(company_pattern, text):
+        for match in pattern_registry.finditer(company_pattern, text):
             company_text = match.group(1)
             
             # Check if it has proper suffix nearby
@@ -32,7 +34,7 @@ class CompanyLimitedSuffixGate:
             context_end = min(len(text), match.end() + 20)
             context = text[context_start:context_end]
             
-            has_suffix = bool(re.search(r'\b(?:limited|ltd|llp|plc)\b', context, re.IGNORECASE))
+            has_suffix = bool(pattern_registry.search(r'\b(?:limited|ltd|llp|plc)\b', context, re.IGNORECASE))
             
             if not has_suffix and len(company_text.split()) > 1:
                 spans.append({
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class HmrcScamDetectionGate:
     def __init__(self):
@@ -41,7 +43,7 @@ class HmrcScamDetectionGate:
         spans = []
         
         for scam_type, pattern in scam_indicators.items():
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern_registry.finditer(pattern, text, re.IGNORECASE):
                 errors.append(f'SCAM INDICATOR: {scam_type}')
                 spans.append({
                     'type': 'hmrc_scam_indicator',
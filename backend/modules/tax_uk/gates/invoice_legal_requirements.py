@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class InvoiceLegalRequirementsGate:
     def __init__(self):
@@ -30,7 +32,7 @@ class InvoiceLegalRequirementsGate:
         
         missing = []
         for field, pattern in required.items():
-            if not re.search(pattern, text, re.IGNORECASE):
+            if not pattern_registry.search(pattern, text, re.IGNORECASE):
                 missing.append(field.replace('_', ' '))
         
         if not missing:
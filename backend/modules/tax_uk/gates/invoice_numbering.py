@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class InvoiceNumberingGate:
     def __init__(self):
@@ -29,14 +31,14 @@ class InvoiceNumberingGate:
         ids = []
         seen_positions = set()
         for pat in patterns:
-            for m in re.finditer(pat, text, re.IGNORECASE):
+            for m in pattern_registry.finditer(pat, text, re.IGNORECASE):
                 rng = (m.start(1), m.end(1))
                 if rng in seen_positions:
                     continue
                 seen_positions.add(rng)
                 full = m.group(1)
                 # Normalize: split prefix and numeric tail
-                prefix_match = re.match(r'([A-Z]{2,5})-?(\d+)$', full, re.IGNORECASE)
+                prefix_match = pattern_registry.match(r'([A-Z]{2,5})-?(\d+)$', full, re.IGNORECASE)
                 if prefix_match:
                     prefix = prefix_match.group(1).upper()
                     num = int(prefix_match.group(2))
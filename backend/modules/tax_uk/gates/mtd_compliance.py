@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class MtdComplianceGate:
     def __init__(self):
@@ -23,11 +25,11 @@ class MtdComplianceGate:
         errors = []
         
         # MTD for VAT is mandatory for ALL VAT-registered businesses
-        if re.search(r'mtd.*(?:optional|voluntary|not required)', text, re.IGNORECASE):
+        if pattern_registry.search(r'mtd.*(?:optional|voluntary|not required)', text, re.IGNORECASE):
             errors.append('MTD for VAT is mandatory for ALL VAT-registered businesses')
         
         # Check for paper/manual filing claims
-        if re.search(r'(?:paper|manual).*vat.*(?:return|filing)', text, re.IGNORECASE):
+        if pattern_registry.search(r'(?:paper|manual).*vat.*(?:return|filing)', text, re.IGNORECASE):
             errors.append('Paper VAT returns no longer accepted - must use MTD software')
         
         if errors:
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class PaymentMethodValidationGate:
     def __init__(self):
@@ -37,7 +39,7 @@ class PaymentMethodValidationGate:
         spans = []
         flags = []
         for label, pat in suspicious.items():
-            for m in re.finditer(pat, text, re.IGNORECASE):
+            for m in pattern_registry.finditer(pat, text, re.IGNORECASE):
                 flags.append(label)
                 spans.append({
                     'type': 'suspicious_payment_request',
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class ScottishTaxSpecificsGate:
     def __init__(self):
@@ -20,9 +22,9 @@ class ScottishTaxSpecificsGate:
             }
         
         # Check for Scottish income tax mentions
-        if re.search(r'scottish.*(?:income tax|tax rate|tax band)', text, re.IGNORECASE):
+        if pattern_registry.search(r'scottish.*(?:income tax|tax rate|tax band)', text, re.IGNORECASE):
             # Verify it mentions different rates from rUK
-            if not re.search(r'different.*(?:rate|band)|starter.*rate|intermediate', text, re.IGNORECASE):
+            if not pattern_registry.search(r'different.*(?:rate|band)|starter.*rate|intermediate', text, re.IGNORECASE):
                 return {
                     'status': 'WARNING',
                     'severity': 'medium',
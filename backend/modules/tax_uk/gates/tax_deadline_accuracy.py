@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class TaxDeadlineAccuracyGate:
     def __init__(self):
@@ -27,7 +29,7 @@ class TaxDeadlineAccuracyGate:
 
         # Self-assessment online - should be 31 January
         sa_online_pattern = r'online.*(?:return|filing|file).*?(?:by|deadline|due).*?(\d{1,2})(?:st|nd|rd|th)?\s+(january|february|march|april|may|june|july|august|september|october|november|december)'
-        for match in re.finditer(sa_online_pattern, text, re.IGNORECASE):
+        for match in pattern_registry.finditer(sa_online_pattern, text, re.IGNORECASE):
             day = int(match.group(1))
             month = match.group(2).lower()
             if month == 'january' and day == 31:
@@ -45,7 +47,7 @@ class TaxDeadlineAccuracyGate:
 
         # Self-assessment paper - should be 31 October
         sa_paper_pattern = r'paper.*(?:return|filing|file).*?(?:by|deadline|due).*?(\d{1,2})(?:st|nd|rd|th)?\s+(january|february|march|april|may|june|july|august|september|october|november|december)'
-        for match in re.finditer(sa_paper_pattern, text, re.IGNORECASE):
+        for match in pattern_registry.finditer(sa_paper_pattern, text, re.IGNORECASE):
             day = int(match.group(1))
             month = match.group(2).lower()
             if month == 'october' and day == 31:
@@ -63,7 +65,7 @@ class TaxDeadlineAccuracyGate:
 
         # Payment deadline - should be 31 January for SA
         payment_pattern = r'payment.*(?:is\s+)?due.*?(?:by)?\s*(\d{1,2})(?:st|nd|rd|th)?\s+(january|february|march|april|may|june|july|august|september|october|november|december)'
-        for match in re.finditer(payment_pattern, text, re.IGNORECASE):
+        for match in pattern_registry.finditer(payment_pattern, text, re.IGNORECASE):
             day = int(match.group(1))
             month = match.group(2).lower()
             if month == 'january' and day == 31:
@@ -82,7 +84,7 @@ class TaxDeadlineAccuracyGate:
 
         # Corporation Tax payment - 9 months + 1 day
         ct_pattern = r'corporation tax.*(?:payment|due).*?(\d+\s+months?)'
-        for match in re.finditer(ct_pattern, text, re.IGNORECASE):
+        for match in pattern_registry.finditer(ct_pattern, text, re.IGNORECASE):
             months_str = match.group(1)
             if '9' not in months_str and '12' not in months_str:
                 errors.append('Corporation Tax payment due 9 months + 1 day after year-end')
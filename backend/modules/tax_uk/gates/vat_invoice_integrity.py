@@ -1,14 +1,18 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+
+
 class VatInvoiceIntegrityGate:
     def __init__(self):
         self.name = "vat_invoice_integrity"
         self.severity = "critical"
         self.legal_source = "VAT Regulations 1995 (Regulation 14); HMRC VAT Notice 700/21"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if the text is likely a VAT invoice."""
-        text_lower = (text or '').lower()
+        text_lower = ctx.lower
         return 'invoice' in text_lower or 'vat' in text_lower
 
     def check(self, text, document_type):
@@ -16,21 +20,24 @@ class VatInvoiceIntegrityGate:
         Apply the gate logic to check for VAT invoice integrity per HMRC requirements.
         A valid VAT invoice MUST include all mandatory fields.
         """
+        if text is not None and not isinstance(text, str):
+            return {
+                'status': 'ERROR',
+                'message': 'Invalid input type for VAT integrity check.'
+            }
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
         try:
-            if not self._is_relevant(text):
+            if not self._is_relevant(ctx):
                 return {
                 'status': 'N/A',
                 'message': 'Not applicable - document is not a VAT invoice',
                 'legal_source': self.legal_source
             }
 
-            if not isinstance(text, str):
-                return {
-                    'status': 'ERROR',
-                    'message': 'Invalid input type for VAT integrity check.'
-                }
-
-            text_lower = text.lower()
+            text_lower = ctx.lower
 
             # Mandatory fields per VAT Regulation 14
             # BUG FIX: Enhanced regex patterns to handle more format variations
@@ -50,7 +57,7 @@ class VatInvoiceIntegrityGate:
 
             missing_fields = []
             for field, pattern in mandatory_fields.items():
-                if not re.search(pattern, text, re.IGNORECASE):
+                if not pattern_registry.search(pattern, text, re.IGNORECASE):
                     missing_fields.append(field.replace('_', ' ').title())
 
             # FAIL if ANY mandatory field is missing
@@ -66,9 +73,10 @@ class VatInvoiceIntegrityGate:
                 }
 
             # Check VAT calculation accuracy
-            net_match = re.search(r'(?:net|subtotal)\s*:?\s*£?([0-9,]+\.[0-9]{2})', text, re.IGNORECASE)
-            vat_match = re.search(r'vat\s*(?:\([^)]+\))?\s*:?\s*£?([0-9,]+\.[0-9]{2})', text, re.IGNORECASE)
-            total_match = re.search(r'total\s*(?:due)?\s*:?\s*£?([0-9,]+\.[0-9]{2})', text, re.IGNORECASE)
+            net_match = pattern_registry.search(r'(?:net|subtotal)\s*:?\s*£?([0-9,]+\.[0-9]{2})', text, re.IGNORECASE)
+            vat_match = pattern_registry.search(r'vat\s*(?:\([^)]+\))?\s*:?\s*£?([0-9,]+\.[0-9]{2})', text,
+                                                re.IGNORECASE)
+            total_match = pattern_registry.search(r'total\s*(?:due)?\s*:?\s*£?([0-9,]+\.[0-9]{2})', text, re.IGNORECASE)
 
             if net_match and vat_match and total_match:
                 try:
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class VatNumberFormatGate:
     def __init__(self):
@@ -21,7 +23,7 @@ class VatNumberFormatGate:
         # Find VAT number patterns
         vat_pattern = r'vat\s*(?:reg|registration)?\s*(?:no|number)?\s*:?\s*([A-Z]{2}?\d{9,12}|XI\d{9})'
         
-        matches = list(re.finditer(vat_pattern, text, re.IGNORECASE))
+        matches = list(pattern_registry.finditer(vat_pattern, text, re.IGNORECASE))
         
         if not matches:
             # VAT mentioned but no valid number found → FAIL
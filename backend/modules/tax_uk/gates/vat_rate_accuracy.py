@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class VatRateAccuracyGate:
     def __init__(self):
@@ -22,7 +24,7 @@ class VatRateAccuracyGate:
         rate_pattern = r'vat.*?(\d+(?:\.\d+)?)%|(\d+(?:\.\d+)?)%.*?vat'
         
         spans = []
-        for match in re.finditer(rate_pattern, text, re.IGNORECASE):
+        for match in pattern_registry.finditer(rate_pattern, text, re.IGNORECASE):
             rate_str = match.group(1) or match.group(2)
             try:
                 rate = float(rate_str)
@@ -1,4 +1,4 @@
-import re
+from core.pattern_registry import pattern_registry
 
 
 class VatThresholdGate:
@@ -23,7 +23,7 @@ class VatThresholdGate:
         threshold_pattern = r'£?(\d{2,3}),?(\d{3})'
         
         spans = []
-        for match in re.finditer(threshold_pattern, text):
+        for match in pattern_registry.finditer(threshold_pattern, text):
             amount_str = match.group(1) + match.group(2)
             try:
                 amount = int(amount_str)
@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class DiscriminationLawGate:
     """
@@ -51,7 +53,7 @@ class DiscriminationLawGate:
         # 1. DETECT MENTIONS OF PROTECTED CHARACTERISTICS
         characteristics_found = []
         for char_name, pattern in self.protected_characteristics.items():
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern_registry.search(pattern, text, re.IGNORECASE):
                 characteristics_found.append(char_name.replace('_', ' '))
 
         # 2. DIRECT DISCRIMINATION - Treating someone less favourably because of protected characteristic
@@ -64,7 +66,7 @@ class DiscriminationLawGate:
         ]
 
         for pattern in direct_discrimination_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 for m in matches:
                     spans.append({
@@ -87,7 +89,7 @@ class DiscriminationLawGate:
         ]
 
         for pattern in indirect_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             if matches:
                 for m in matches:
                     # Check if justified
@@ -122,7 +124,7 @@ class DiscriminationLawGate:
             r'sexual\s+harassment'
         ]
 
-        has_harassment_ref = any(re.search(p, text, re.IGNORECASE) for p in harassment_patterns)
+        has_harassment_ref = any(pattern_registry.search(p, text, re.IGNORECASE) for p in harassment_patterns)
 
         if has_harassment_ref:
             # Check for policy against harassment
@@ -133,7 +135,7 @@ class DiscriminationLawGate:
                 r'(?:investigation|disciplinary\s+action)'
             ]
 
-            has_policy = any(re.search(p, text, re.IGNORECASE) for p in policy_patterns)
+            has_policy = any(pattern_registry.search(p, text, re.IGNORECASE) for p in policy_patterns)
             if not has_policy:
                 warnings.append('Harassment mentioned - should include clear policy and reporting procedures')
 
@@ -154,7 +156,7 @@ class DiscriminationLawGate:
             r'detriment.*(?:complaint|allegation|proceedings)'
         ]
 
-        has_victimisation = any(re.search(p, text, re.IGNORECASE) for p in victimisation_patterns)
+        has_victimisation = any(pattern_registry.search(p, text, re.IGNORECASE) for p in victimisation_patterns)
 
         if has_victimisation:
             # Check for protection statement
@@ -164,7 +166,7 @@ class DiscriminationLawGate:
                 r'without\s+fear\s+of\s+(?:reprisal|retaliation)'
             ]
 
-            has_protection = any(re.search(p, text, re.IGNORECASE) for p in protection_patterns)
+            has_protection = any(pattern_registry.search(p, text, re.IGNORECASE) for p in protection_patterns)
             if not has_protection:
                 warnings.append('Should clarify that employees are protected from victimisation for raising concerns')
 
@@ -177,7 +179,7 @@ class DiscriminationLawGate:
             r'workplace\s+modification'
         ]
 
-        has_adjustments = any(re.search(p, text, re.IGNORECASE) for p in adjustment_patterns)
+        has_adjustments = any(pattern_registry.search(p, text, re.IGNORECASE) for p in adjustment_patterns)
 
         if 'disability' in characteristics_found and not has_adjustments:
             warnings.append('Disability mentioned - should reference duty to make reasonable adjustments')
@@ -192,7 +194,7 @@ class DiscriminationLawGate:
                 r'additional\s+(?:breaks|support|training)'
             ]
 
-            has_examples = any(re.search(p, text, re.IGNORECASE) for p in examples_patterns)
+            has_examples = any(pattern_registry.search(p, text, re.IGNORECASE) for p in examples_patterns)
             if not has_examples:
                 warnings.append('Good practice to provide examples of reasonable adjustments')
 
@@ -204,7 +206,7 @@ class DiscriminationLawGate:
                 r'work\s+(?:with|together)'
             ]
 
-            has_interactive = any(re.search(p, text, re.IGNORECASE) for p in interactive_patterns)
+            has_interactive = any(pattern_registry.search(p, text, re.IGNORECASE) for p in interactive_patterns)
             if not has_interactive:
                 warnings.append('Reasonable adjustments should involve discussion with disabled person')
 
@@ -216,7 +218,7 @@ class DiscriminationLawGate:
             r'proportionate\s+means'
         ]
 
-        has_positive_action = any(re.search(p, text, re.IGNORECASE) for p in positive_action_patterns)
+        has_positive_action = any(pattern_registry.search(p, text, re.IGNORECASE) for p in positive_action_patterns)
 
         if has_positive_action:
             # Check not positive discrimination (illegal)
@@ -226,7 +228,8 @@ class DiscriminationLawGate:
                 r'automatically\s+(?:selected|appointed)'
             ]
 
-            has_discrimination_language = any(re.search(p, text, re.IGNORECASE) for p in discrimination_indicators)
+            has_discrimination_language = any(pattern_registry.search(p, text, re.IGNORECASE)
+                                              for p in discrimination_indicators)
             if has_discrimination_language:
                 warnings.append('Positive action must not become positive discrimination - merit must remain the deciding factor')
 
@@ -238,7 +241,7 @@ class DiscriminationLawGate:
             r'essential\s+(?:for\s+the\s+)?(?:nature|purposes?)\s+of\s+the\s+(?:job|role|work)'
         ]
 
-        has_gor = any(re.search(p, text, re.IGNORECASE) for p in gor_patterns)
+        has_gor = any(pattern_registry.search(p, text, re.IGNORECASE) for p in gor_patterns)
 
         if has_gor:
             # Check for proportionality and legitimate aim
@@ -250,7 +253,7 @@ class DiscriminationLawGate:
                 r'determining\s+factor'
             ]
 
-            has_justification = any(re.search(p, text, re.IGNORECASE) for p in justification_patterns)
+            has_justification = any(pattern_registry.search(p, text, re.IGNORECASE) for p in justification_patterns)
             if not has_justification:
                 warnings.append('Genuine Occupational Requirement must be proportionate means of achieving legitimate aim')
 
@@ -262,7 +265,7 @@ class DiscriminationLawGate:
             r'pay\s+(?:equality|parity|equity)'
         ]
 
-        has_equal_pay = any(re.search(p, text, re.IGNORECASE) for p in equal_pay_patterns)
+        has_equal_pay = any(pattern_registry.search(p, text, re.IGNORECASE) for p in equal_pay_patterns)
 
         if has_equal_pay:
             # Check for material factor defence if different pay mentioned
@@ -279,8 +282,8 @@ class DiscriminationLawGate:
                 r'pay\s+(?:difference|disparity)'
             ]
 
-            has_pay_difference = any(re.search(p, text, re.IGNORECASE) for p in pay_difference_patterns)
-            has_justification = any(re.search(p, text, re.IGNORECASE) for p in material_factor_patterns)
+            has_pay_difference = any(pattern_registry.search(p, text, re.IGNORECASE) for p in pay_difference_patterns)
+            has_justification = any(pattern_registry.search(p, text, re.IGNORECASE) for p in material_factor_patterns)
 
             if has_pay_difference and not has_justification:
                 warnings.append('Pay differences between sexes must be objectively justified by material factors')
@@ -296,7 +299,7 @@ class DiscriminationLawGate:
                 r'(?:suspend|alternative\s+work)'
             ]
 
-            has_pregnancy_protection = any(re.search(p, text, re.IGNORECASE) for p in protection_patterns)
+            has_pregnancy_protection = any(pattern_registry.search(p, text, re.IGNORECASE) for p in protection_patterns)
             if not has_pregnancy_protection:
                 warnings.append('Pregnancy/maternity mentioned - should reference protection rights and risk assessment')
 
@@ -310,7 +313,7 @@ class DiscriminationLawGate:
             r'foster\s+good\s+relations'
         ]
 
-        has_psed = any(re.search(p, text, re.IGNORECASE) for p in psed_patterns)
+        has_psed = any(pattern_registry.search(p, text, re.IGNORECASE) for p in psed_patterns)
 
         public_sector_indicators = [
             r'(?:local\s+)?(?:authority|council)',
@@ -319,7 +322,7 @@ class DiscriminationLawGate:
             r'statutory\s+(?:body|duty)'
         ]
 
-        is_public_sector = any(re.search(p, text, re.IGNORECASE) for p in public_sector_indicators)
+        is_public_sector = any(pattern_registry.search(p, text, re.IGNORECASE) for p in public_sector_indicators)
 
         if is_public_sector and not has_psed:
             warnings.append('Public sector bodies must have due regard to Public Sector Equality Duty')
@@ -332,7 +335,7 @@ class DiscriminationLawGate:
             r'protected\s+characteristics?\s+(?:assessment|analysis)'
         ]
 
-        has_eia = any(re.search(p, text, re.IGNORECASE) for p in eia_patterns)
+        has_eia = any(pattern_registry.search(p, text, re.IGNORECASE) for p in eia_patterns)
 
         # 13. TRAINING AND AWARENESS
         training_patterns = [
@@ -341,7 +344,7 @@ class DiscriminationLawGate:
             r'education.*(?:equality|diversity|inclusion)'
         ]
 
-        has_training = any(re.search(p, text, re.IGNORECASE) for p in training_patterns)
+        has_training = any(pattern_registry.search(p, text, re.IGNORECASE) for p in training_patterns)
 
         # 14. MONITORING AND DATA
         monitoring_patterns = [
@@ -351,7 +354,7 @@ class DiscriminationLawGate:
             r'diversity\s+(?:metrics|statistics|reporting)'
         ]
 
-        has_monitoring = any(re.search(p, text, re.IGNORECASE) for p in monitoring_patterns)
+        has_monitoring = any(pattern_registry.search(p, text, re.IGNORECASE) for p in monitoring_patterns)
 
         # Determine overall status
         if issues:
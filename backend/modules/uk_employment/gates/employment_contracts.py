@@ -1,5 +1,7 @@
 import re
 
+from core.pattern_registry import pattern_registry
+
 
 class EmploymentContractsGate:
     """
@@ -43,7 +45,7 @@ class EmploymentContractsGate:
             r'as\s+and\s+when\s+(?:required|needed)'
         ]
 
-        has_zero_hours = any(re.search(p, text, re.IGNORECASE) for p in zero_hours_patterns)
+        has_zero_hours = any(pattern_registry.search(p, text, re.IGNORECASE) for p in zero_hours_patterns)
 
         if has_zero_hours:
             # Check for prohibited exclusivity clauses (banned under 2025 reforms)
@@ -56,7 +58,7 @@ class EmploymentContractsGate:
 
             has_exclusivity = False
             for pattern in exclusivity_patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     has_exclusivity = True
                     for m in matches:
@@ -78,7 +80,7 @@ class EmploymentContractsGate:
                 r'(?:at\s+least|minimum\s+of)\s+\d+\s+hours'
             ]
 
-            has_min_hours = any(re.search(p, text, re.IGNORECASE) for p in minimum_hours_patterns)
+            has_min_hours = any(pattern_registry.search(p, text, re.IGNORECASE) for p in minimum_hours_patterns)
             if not has_min_hours:
                 warnings.append('Zero-hours contract should specify minimum hours guarantee (2025 requirement)')
 
@@ -89,7 +91,7 @@ class EmploymentContractsGate:
                 r'reasonable\s+notice\s+of\s+(?:shifts?|work)'
             ]
 
-            has_shift_notice = any(re.search(p, text, re.IGNORECASE) for p in notice_shift_patterns)
+            has_shift_notice = any(pattern_registry.search(p, text, re.IGNORECASE) for p in notice_shift_patterns)
             if not has_shift_notice:
                 warnings.append('Must provide reasonable notice of shifts (minimum 4 days under 2025 reforms)')
 
@@ -101,7 +103,7 @@ class EmploymentContractsGate:
             r'temporary\s+contract'
         ]
 
-        has_fixed_term = any(re.search(p, text, re.IGNORECASE) for p in fixed_term_patterns)
+        has_fixed_term = any(pattern_registry.search(p, text, re.IGNORECASE) for p in fixed_term_patterns)
 
         if has_fixed_term:
             # Check for end date
@@ -111,7 +113,7 @@ class EmploymentContractsGate:
                 r'(?:for\s+a\s+period\s+of|duration\s+of)\s+\d+\s+(?:months?|years?|weeks?)'
             ]
 
-            has_end_date = any(re.search(p, text, re.IGNORECASE) for p in end_date_patterns)
+            has_end_date = any(pattern_registry.search(p, text, re.IGNORECASE) for p in end_date_patterns)
             if not has_end_date:
                 issues.append('Fixed-term contract must specify clear end date or duration')
 
@@ -123,7 +125,7 @@ class EmploymentContractsGate:
                 r'subsequent\s+fixed[\s-]term'
             ]
 
-            has_renewal_terms = any(re.search(p, text, re.IGNORECASE) for p in renewal_patterns)
+            has_renewal_terms = any(pattern_registry.search(p, text, re.IGNORECASE) for p in renewal_patterns)
 
             # Check for 4-year rule (automatic permanent status)
             four_year_patterns = [
@@ -132,7 +134,7 @@ class EmploymentContractsGate:
                 r'continuous\s+(?:fixed[\s-]term\s+)?contracts'
             ]
 
-            has_four_year_rule = any(re.search(p, text, re.IGNORECASE) for p in four_year_patterns)
+            has_four_year_rule = any(pattern_registry.search(p, text, re.IGNORECASE) for p in four_year_patterns)
             if not has_four_year_rule and has_renewal_terms:
                 warnings.append('Should reference 4-year rule: employees on successive fixed-term contracts become permanent')
 
@@ -143,11 +145,12 @@ class EmploymentContractsGate:
             r'initial\s+(?:\d+\s+)?(?:months?|weeks?)\s+(?:period|employment)'
         ]
 
-        has_probation = any(re.search(p, text, re.IGNORECASE) for p in probation_patterns)
+        has_probation = any(pattern_registry.search(p, text, re.IGNORECASE) for p in probation_patterns)
 
         if has_probation:
             # Check probation duration (max 6 months recommended)
-            duration_match = re.search(r'(?:probation|trial)\s+(?:period\s+(?:of\s+)?)?(\d+)\s+(months?|weeks?)', text, re.IGNORECASE)
+            duration_match = pattern_registry.search(
+                r'(?:probation|trial)\s+(?:period\s+(?:of\s+)?)?(\d+)\s+(months?|weeks?)', text, re.IGNORECASE)
             if duration_match:
                 duration = int(duration_match.group(1))
                 unit = duration_match.group(2).lower()
@@ -165,7 +168,7 @@ class EmploymentContractsGate:
                 r'probation\s+meeting'
             ]
 
-            has_review = any(re.search(p, text, re.IGNORECASE) for p in review_patterns)
+            has_review = any(pattern_registry.search(p, text, re.IGNORECASE) for p in review_patterns)
             if not has_review:
                 warnings.append('Probation period should include review process and assessment criteria')
 
@@ -176,7 +179,7 @@ class EmploymentContractsGate:
                 r'further\s+probation(?:ary)?\s+period'
             ]
 
-            has_extension = any(re.search(p, text, re.IGNORECASE) for p in extension_patterns)
+            has_extension = any(pattern_registry.search(p, text, re.IGNORECASE) for p in extension_patterns)
             if has_extension:
                 # Check for maximum extended duration
                 max_extension_patterns = [
@@ -184,7 +187,7 @@ class EmploymentContractsGate:
                     r'extended\s+(?:by\s+)?(?:up\s+to\s+)?(\d+)\s+(months?|weeks?)'
                 ]
 
-                has_max_extension = any(re.search(p, text, re.IGNORECASE) for p in max_extension_patterns)
+                has_max_extension = any(pattern_registry.search(p, text, re.IGNORECASE) for p in max_extension_patterns)
                 if not has_max_extension:
                     warnings.append('If probation can be extended, specify maximum total duration')
 
@@ -196,7 +199,7 @@ class EmploymentContractsGate:
             r'termination\s+notice'
         ]
 
-        has_notice = any(re.search(p, text, re.IGNORECASE) for p in notice_patterns)
+        has_notice = any(pattern_registry.search(p, text, re.IGNORECASE) for p in notice_patterns)
 
         if has_notice:
             # Check for statutory minimum compliance
@@ -207,7 +210,7 @@ class EmploymentContractsGate:
             ]
 
             for pattern in notice_duration_patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 for m in matches:
                     spans.append({
                         'type': 'notice_period_specified',
@@ -224,7 +227,7 @@ class EmploymentContractsGate:
                 r'one\s+week\s+(?:for\s+)?(?:each|per)\s+year\s+(?:of\s+)?(?:service|employment)'
             ]
 
-            has_statutory_ref = any(re.search(p, text, re.IGNORECASE) for p in statutory_patterns)
+            has_statutory_ref = any(pattern_registry.search(p, text, re.IGNORECASE) for p in statutory_patterns)
             if not has_statutory_ref:
                 warnings.append('Should reference statutory minimum notice requirements (ERA 1996 s.86)')
 
@@ -236,7 +239,7 @@ class EmploymentContractsGate:
                 r'(?:employer\s+)?may\s+(?:elect\s+to\s+)?pay.*instead\s+of\s+notice'
             ]
 
-            has_pil = any(re.search(p, text, re.IGNORECASE) for p in pil_patterns)
+            has_pil = any(pattern_registry.search(p, text, re.IGNORECASE) for p in pil_patterns)
             # Payment in lieu is optional but should be clear if mentioned
 
         # 5. GARDEN LEAVE
@@ -247,7 +250,7 @@ class EmploymentContractsGate:
             r'exclude.*from\s+(?:workplace|premises)\s+during\s+notice'
         ]
 
-        has_garden_leave = any(re.search(p, text, re.IGNORECASE) for p in garden_leave_patterns)
+        has_garden_leave = any(pattern_registry.search(p, text, re.IGNORECASE) for p in garden_leave_patterns)
 
         if has_garden_leave:
             # Check for continued pay confirmation
@@ -257,7 +260,7 @@ class EmploymentContractsGate:
                 r'normal\s+(?:salary|pay|remuneration)\s+during'
             ]
 
-            has_continued_pay = any(re.search(p, text, re.IGNORECASE) for p in pay_patterns)
+            has_continued_pay = any(pattern_registry.search(p, text, re.IGNORECASE) for p in pay_patterns)
             if not has_continued_pay:
                 issues.append('Garden leave must confirm continued full pay and benefits')
 
@@ -269,7 +272,7 @@ class EmploymentContractsGate:
                 r'confidentiality\s+(?:obligations|duties)\s+(?:continue|remain)'
             ]
 
-            has_restrictions = any(re.search(p, text, re.IGNORECASE) for p in restriction_patterns)
+            has_restrictions = any(pattern_registry.search(p, text, re.IGNORECASE) for p in restriction_patterns)
             # Note: Restrictions should be reasonable and clearly stated
 
             # Check for maximum garden leave period
@@ -278,7 +281,7 @@ class EmploymentContractsGate:
                 r'(?:up\s+to\s+)?(\d+)\s+(months?|weeks?)\s+garden\s+leave'
             ]
 
-            has_max_period = any(re.search(p, text, re.IGNORECASE) for p in max_period_patterns)
+            has_max_period = any(pattern_registry.search(p, text, re.IGNORECASE) for p in max_period_patterns)
             if not has_max_period:
                 warnings.append('Should specify maximum garden leave duration (typically matches notice period)')
 
@@ -289,7 +292,7 @@ class EmploymentContractsGate:
             r'(?:provided|issued|given)\s+(?:on|by|within)\s+(?:day\s+one|day\s+1|first\s+day)'
         ]
 
-        has_particulars_ref = any(re.search(p, text, re.IGNORECASE) for p in particulars_patterns)
+        has_particulars_ref = any(pattern_registry.search(p, text, re.IGNORECASE) for p in particulars_patterns)
 
         # Check for mandatory items (2025 requirements)
         mandatory_items = {
@@ -304,7 +307,7 @@ class EmploymentContractsGate:
 
         missing_items = []
         for item, pattern in mandatory_items.items():
-            if not re.search(pattern, text, re.IGNORECASE):
+            if not pattern_registry.search(pattern, text, re.IGNORECASE):
                 missing_items.append(item.replace('_', ' '))
 
         if missing_items and has_particulars_ref:
@@ -318,7 +321,7 @@ class EmploymentContractsGate:
             r'hybrid\s+working'
         ]
 
-        has_flexible_working = any(re.search(p, text, re.IGNORECASE) for p in flexible_working_patterns)
+        has_flexible_working = any(pattern_registry.search(p, text, re.IGNORECASE) for p in flexible_working_patterns)
 
         if has_flexible_working:
             # Check for day 1 right mention
@@ -329,7 +332,7 @@ class EmploymentContractsGate:
                 r'no\s+qualifying\s+period'
             ]
 
-            has_day_one_right = any(re.search(p, text, re.IGNORECASE) for p in day_one_patterns)
+            has_day_one_right = any(pattern_registry.search(p, text, re.IGNORECASE) for p in day_one_patterns)
             if not has_day_one_right:
                 warnings.append('Under 2025 reforms, flexible working requests can be made from day 1 (no 26-week qualifying period)')
 
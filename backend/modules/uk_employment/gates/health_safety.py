@@ -1,5 +1,7 @@
 import re
 
+from core.proximity import proximity
+
 
 class HealthSafetyGate:
     """
@@ -44,7 +46,7 @@ class HealthSafetyGate:
             r'provide.*safe\s+(?:system|place)\s+of\s+work'
         ]
 
-        has_duty = any(re.search(p, text, re.IGNORECASE) for p in duty_patterns)
+        has_duty = any(proximity.occurs(p, text, re.IGNORECASE) for p in duty_patterns)
 
         if has_duty:
             # Check for "so far as is reasonably practicable" (SFAIRP)
@@ -54,7 +56,7 @@ class HealthSafetyGate:
                 r'reasonably\s+practicable'
             ]
 
-            has_sfairp = any(re.search(p, text, re.IGNORECASE) for p in sfairp_patterns)
+            has_sfairp = any(proximity.occurs(p, text, re.IGNORECASE) for p in sfairp_patterns)
             # Good practice to include SFAIRP qualifier
 
         # 2. HEALTH AND SAFETY POLICY (required for 5+ employees)
@@ -64,7 +66,7 @@ class HealthSafetyGate:
             r'safety\s+policy\s+statement'
         ]
 
-        has_policy = any(re.search(p, text, re.IGNORECASE) for p in policy_patterns)
+        has_policy = any(proximity.occurs(p, text, re.IGNORECASE) for p in policy_patterns)
 
         if has_policy:
             # Check for three parts of policy
@@ -76,7 +78,7 @@ class HealthSafetyGate:
 
             missing_components = []
             for component, pattern in policy_components.items():
-                if not re.search(pattern, text, re.IGNORECASE):
+                if not proximity.occurs(pattern, text, re.IGNORECASE):
                     missing_components.append(component)
 
             if len(missing_components) >= 2:
@@ -90,7 +92,7 @@ class HealthSafetyGate:
                 r'review\s+(?:at\s+least\s+)?(?:annually|yearly|every\s+year)'
             ]
 
-            has_review = any(re.search(p, text, re.IGNORECASE) for p in review_patterns)
+            has_review = any(proximity.occurs(p, text, re.IGNORECASE) for p in review_patterns)
             if not has_review:
                 warnings.append('H&S policy should be reviewed regularly (at least annually)')
 
@@ -101,7 +103,7 @@ class HealthSafetyGate:
                 r'(?:managing\s+director|CEO|director).*(?:date|signed)'
             ]
 
-            has_signature = any(re.search(p, text, re.IGNORECASE) for p in signature_patterns)
+            has_signature = any(proximity.occurs(p, text, re.IGNORECASE) for p in signature_patterns)
             if not has_signature:
                 warnings.append('H&S policy should be signed by senior management')
 
@@ -113,7 +115,7 @@ class HealthSafetyGate:
             r'identify.*hazards?'
         ]
 
-        has_risk_assessment = any(re.search(p, text, re.IGNORECASE) for p in risk_assessment_patterns)
+        has_risk_assessment = any(proximity.occurs(p, text, re.IGNORECASE) for p in risk_assessment_patterns)
 
         if has_risk_assessment:
             # Check for 5 steps of risk assessment
@@ -127,7 +129,7 @@ class HealthSafetyGate:
 
             steps_found = 0
             for step, pattern in five_steps.items():
-                if re.search(pattern, text, re.IGNORECASE):
+                if proximity.occurs(pattern, text, re.IGNORECASE):
                     steps_found += 1
 
             if steps_found < 3:
@@ -140,7 +142,7 @@ class HealthSafetyGate:
                 r'document(?:ed|ation)'
             ]
 
-            has_recording = any(re.search(p, text, re.IGNORECASE) for p in recording_patterns)
+            has_recording = any(proximity.occurs(p, text, re.IGNORECASE) for p in recording_patterns)
             if not has_recording:
                 warnings.append('Risk assessments must be recorded in writing (employers with 5+ employees)')
 
@@ -151,7 +153,7 @@ class HealthSafetyGate:
                 r'priority\s+(?:actions?|risks?)'
             ]
 
-            has_findings = any(re.search(p, text, re.IGNORECASE) for p in findings_patterns)
+            has_findings = any(proximity.occurs(p, text, re.IGNORECASE) for p in findings_patterns)
 
             # Check for control measures hierarchy
             hierarchy_patterns = [
@@ -163,7 +165,7 @@ class HealthSafetyGate:
                 r'PPE\b|personal\s+protective\s+equipment'
             ]
 
-            control_mentions = sum(1 for p in hierarchy_patterns if re.search(p, text, re.IGNORECASE))
+            control_mentions = sum(1 for p in hierarchy_patterns if proximity.occurs(p, text, re.IGNORECASE))
             if control_mentions >= 3:
                 # Good - mentions hierarchy of controls
                 pass
@@ -180,7 +182,7 @@ class HealthSafetyGate:
             r'VDU\b'
         ]
 
-        has_dse = any(re.search(p, text, re.IGNORECASE) for p in dse_patterns)
+        has_dse = any(proximity.occurs(p, text, re.IGNORECASE) for p in dse_patterns)
 
         if has_dse:
             dse_requirements = [
@@ -190,7 +192,7 @@ class HealthSafetyGate:
                 r'adjustable\s+(?:chair|desk|screen)'
             ]
 
-            dse_compliant = sum(1 for p in dse_requirements if re.search(p, text, re.IGNORECASE))
+            dse_compliant = sum(1 for p in dse_requirements if proximity.occurs(p, text, re.IGNORECASE))
             if dse_compliant < 2:
                 warnings.append('DSE assessments should cover: workstation setup, breaks, eye tests, adjustable equipment')
 
@@ -202,7 +204,7 @@ class HealthSafetyGate:
             r'TILE\b'  # Task, Individual, Load, Environment
         ]
 
-        has_manual_handling = any(re.search(p, text, re.IGNORECASE) for p in manual_handling_patterns)
+        has_manual_handling = any(proximity.occurs(p, text, re.IGNORECASE) for p in manual_handling_patterns)
 
         if has_manual_handling:
             tile_factors = [
@@ -212,7 +214,7 @@ class HealthSafetyGate:
                 r'environment'
             ]
 
-            tile_found = sum(1 for p in tile_factors if re.search(p, text, re.IGNORECASE))
+            tile_found = sum(1 for p in tile_factors if proximity.occurs(p, text, re.IGNORECASE))
             if tile_found < 3:
                 warnings.append('Manual handling assessment should consider TILE: Task, Individual, Load, Environment')
 
@@ -225,7 +227,7 @@ class HealthSafetyGate:
             r'\bSDS\b'
         ]
 
-        has_coshh = any(re.search(p, text, re.IGNORECASE) for p in coshh_patterns)
+        has_coshh = any(proximity.occurs(p, text, re.IGNORECASE) for p in coshh_patterns)
 
         if has_coshh:
             coshh_requirements = [
@@ -236,7 +238,7 @@ class HealthSafetyGate:
                 r'emergency\s+procedures?'
             ]
 
-            coshh_compliant = sum(1 for p in coshh_requirements if re.search(p, text, re.IGNORECASE))
+            coshh_compliant = sum(1 for p in coshh_requirements if proximity.occurs(p, text, re.IGNORECASE))
             if coshh_compliant < 2:
                 warnings.append('COSHH assessment should cover: identification, exposure control, storage, emergency procedures')
 
@@ -248,7 +250,7 @@ class HealthSafetyGate:
             r'notif(?:y|ication).*(?:serious|major)\s+(?:injury|incident)'
         ]
 
-        has_riddor = any(re.search(p, text, re.IGNORECASE) for p in riddor_patterns)
+        has_riddor = any(proximity.occurs(p, text, re.IGNORECASE) for p in riddor_patterns)
 
         if has_riddor:
             # Check for types of reportable incidents
@@ -260,7 +262,7 @@ class HealthSafetyGate:
                 'occupational_disease': r'occupational\s+disease|work[\s-]related\s+(?:illness|disease)'
             }
 
-            types_mentioned = sum(1 for p in reportable_types.values() if re.search(p, text, re.IGNORECASE))
+            types_mentioned = sum(1 for p in reportable_types.values() if proximity.occurs(p, text, re.IGNORECASE))
 
             if types_mentioned < 2:
                 warnings.append('RIDDOR reportable incidents include: deaths, major injuries, 7+ day injuries, dangerous occurrences, occupational diseases')
@@ -273,7 +275,7 @@ class HealthSafetyGate:
                 r'as\s+soon\s+as\s+(?:possible|practicable)'
             ]
 
-            has_timeframe = any(re.search(p, text, re.IGNORECASE) for p in timeframe_patterns)
+            has_timeframe = any(proximity.occurs(p, text, re.IGNORECASE) for p in timeframe_patterns)
             if not has_timeframe:
                 warnings.append('RIDDOR reports must be made: immediately for deaths/major injuries, within 10 days for 7+ day injuries, within 15 days for diseases')
 
@@ -285,7 +287,7 @@ class HealthSafetyGate:
                 r'RIDDOR\s+(?:hotline|reporting)'
             ]
 
-            has_hse_info = any(re.search(p, text, re.IGNORECASE) for p in hse_patterns)
+            has_hse_info = any(proximity.occurs(p, text, re.IGNORECASE) for p in hse_patterns)
             if not has_hse_info:
                 warnings.append('Should provide HSE contact details for RIDDOR reporting (online or 0345 300 9923)')
 
@@ -297,7 +299,7 @@ class HealthSafetyGate:
             r'BI\s+510'  # Standard accident book reference
         ]
 
-        has_accident_book = any(re.search(p, text, re.IGNORECASE) for p in accident_book_patterns)
+        has_accident_book = any(proximity.occurs(p, text, re.IGNORECASE) for p in accident_book_patterns)
 
         if has_accident_book:
             # Check for data protection compliance
@@ -309,7 +311,7 @@ class HealthSafetyGate:
                 r'removable\s+pages?'
             ]
 
-            has_gdpr = any(re.search(p, text, re.IGNORECASE) for p in gdpr_patterns)
+            has_gdpr = any(proximity.occurs(p, text, re.IGNORECASE) for p in gdpr_patterns)
             if not has_gdpr:
                 warnings.append('Accident book must comply with GDPR (use BI 510 with removable pages to protect personal data)')
 
@@ -325,7 +327,7 @@ class HealthSafetyGate:
             r'competent\s+person'
         ]
 
-        has_training = any(re.search(p, text, re.IGNORECASE) for p in training_patterns)
+        has_training = any(proximity.occurs(p, text, re.IGNORECASE) for p in training_patterns)
 
         if has_training:
             # Check for adequate training provision
@@ -337,7 +339,7 @@ class HealthSafetyGate:
                 r'first\s+aid'
             ]
 
-            training_coverage = sum(1 for p in training_types if re.search(p, text, re.IGNORECASE))
+            training_coverage = sum(1 for p in training_types if proximity.occurs(p, text, re.IGNORECASE))
             # Good if covers multiple types
 
         # 8. PPE (Personal Protective Equipment)
@@ -348,7 +350,7 @@ class HealthSafetyGate:
             r'safety\s+(?:equipment|glasses|boots|helmet|gloves)'
         ]
 
-        has_ppe = any(re.search(p, text, re.IGNORECASE) for p in ppe_patterns)
+        has_ppe = any(proximity.occurs(p, text, re.IGNORECASE) for p in ppe_patterns)
 
         if has_ppe:
             # Check PPE is last resort (after elimination, substitution, engineering controls)
@@ -359,7 +361,7 @@ class HealthSafetyGate:
                 r'hierarchy\s+of\s+controls?'
             ]
 
-            has_last_resort = any(re.search(p, text, re.IGNORECASE) for p in last_resort_patterns)
+            has_last_resort = any(proximity.occurs(p, text, re.IGNORECASE) for p in last_resort_patterns)
             if not has_last_resort:
                 warnings.append('PPE should be last resort after other control measures (elimination, substitution, engineering controls)')
 
@@ -372,7 +374,7 @@ class HealthSafetyGate:
                 r'replace(?:d|ment)'
             ]
 
-            has_provision = any(re.search(p, text, re.IGNORECASE) for p in provision_patterns)
+            has_provision = any(proximity.occurs(p, text, re.IGNORECASE) for p in provision_patterns)
             if not has_provision:
                 warnings.append('Employer must provide PPE free of charge and maintain it')
 
@@ -383,7 +385,7 @@ class HealthSafetyGate:
                 r'proper\s+use'
             ]
 
-            has_ppe_training = any(re.search(p, text, re.IGNORECASE) for p in ppe_training_patterns)
+            has_ppe_training = any(proximity.occurs(p, text, re.IGNORECASE) for p in ppe_training_patterns)
             if not has_ppe_training:
                 warnings.append('Employees must be trained in correct PPE use')
 
@@ -395,7 +397,7 @@ class HealthSafetyGate:
             r'employee\s+(?:involvement|participation)'
         ]
 
-        has_consultation = any(re.search(p, text, re.IGNORECASE) for p in consultation_patterns)
+        has_consultation = any(proximity.occurs(p, text, re.IGNORECASE) for p in consultation_patterns)
 
         if has_consultation:
             # Check for safety representatives
@@ -405,7 +407,7 @@ class HealthSafetyGate:
                 r'elected\s+representative'
             ]
 
-            has_reps = any(re.search(p, text, re.IGNORECASE) for p in rep_patterns)
+            has_reps = any(proximity.occurs(p, text, re.IGNORECASE) for p in rep_patterns)
             # Good practice
 
         # 10. FIRST AID
@@ -416,7 +418,7 @@ class HealthSafetyGate:
             r'first\s+aid\s+(?:kit|box|equipment)'
         ]
 
-        has_first_aid = any(re.search(p, text, re.IGNORECASE) for p in first_aid_patterns)
+        has_first_aid = any(proximity.occurs(p, text, re.IGNORECASE) for p in first_aid_patterns)
 
         if has_first_aid:
             # Check for adequate provision
@@ -427,7 +429,7 @@ class HealthSafetyGate:
                 r'first\s+aid\s+(?:room|facility)'
             ]
 
-            first_aid_coverage = sum(1 for p in provision_requirements if re.search(p, text, re.IGNORECASE))
+            first_aid_coverage = sum(1 for p in provision_requirements if proximity.occurs(p, text, re.IGNORECASE))
             if first_aid_coverage < 2:
                 warnings.append('First aid provision should include: trained first-aider or appointed person, first aid kit, appropriate facilities')
 
@@ -439,7 +441,7 @@ class HealthSafetyGate:
             r'assembly\s+point'
         ]
 
-        has_fire = any(re.search(p, text, re.IGNORECASE) for p in fire_patterns)
+        has_fire = any(proximity.occurs(p, text, re.IGNORECASE) for p in fire_patterns)
 
         if has_fire:
             fire_requirements = [
@@ -450,7 +452,7 @@ class HealthSafetyGate:
                 r'fire\s+(?:warden|marshal)'
             ]
 
-            fire_coverage = sum(1 for p in fire_requirements if re.search(p, text, re.IGNORECASE))
+            fire_coverage = sum(1 for p in fire_requirements if proximity.occurs(p, text, re.IGNORECASE))
             if fire_coverage < 2:
                 warnings.append('Fire safety should cover: risk assessment, evacuation procedures, drills, assembly points')
 
@@ -463,7 +465,7 @@ class HealthSafetyGate:
             r'breastfeeding'
         ]
 
-        has_pregnancy = any(re.search(p, text, re.IGNORECASE) for p in pregnancy_patterns)
+        has_pregnancy = any(proximity.occurs(p, text, re.IGNORECASE) for p in pregnancy_patterns)
 
         if has_pregnancy:
             pregnancy_requirements = [
@@ -474,7 +476,7 @@ class HealthSafetyGate:
                 r'rest\s+(?:facilities|area)'
             ]
 
-            pregnancy_coverage = sum(1 for p in pregnancy_requirements if re.search(p, text, re.IGNORECASE))
+            pregnancy_coverage = sum(1 for p in pregnancy_requirements if proximity.occurs(p, text, re.IGNORECASE))
             if pregnancy_coverage < 2:
                 warnings.append('Must assess risks to new and expectant mothers, adjust work or provide alternatives, suspend on full pay if necessary')
 
@@ -486,7 +488,7 @@ class HealthSafetyGate:
             r'child\s+employment'
         ]
 
-        has_young_workers = any(re.search(p, text, re.IGNORECASE) for p in young_worker_patterns)
+        has_young_workers = any(proximity.occurs(p, text, re.IGNORECASE) for p in young_worker_patterns)
 
         if has_young_workers:
             young_worker_requirements = [
@@ -497,7 +499,8 @@ class HealthSafetyGate:
                 r'working\s+time\s+(?:limits?|restrictions?)'
             ]
 
-            young_worker_coverage = sum(1 for p in young_worker_requirements if re.search(p, text, re.IGNORECASE))
+            young_worker_coverage = sum(1 for p in young_worker_requirements
+                                        if proximity.occurs(p, text, re.IGNORECASE))
             if young_worker_coverage < 2:
                 warnings.append('Young workers require: specific risk assessment, parental notification, training/supervision, working time restrictions')
 
@@ -1,5 +1,8 @@
 import re
 
+from core.pattern_registry import pattern_registry
+from core.proximity import proximity
+
 
 class RedundancyProceduresGate:
     """
@@ -44,7 +47,7 @@ class RedundancyProceduresGate:
             r'collective\s+consultation'
         ]
 
-        has_consultation = any(re.search(p, text, re.IGNORECASE) for p in consultation_patterns)
+        has_consultation = any(proximity.occurs(p, text, re.IGNORECASE) for p in consultation_patterns)
 
         # Check for collective consultation thresholds
         collective_patterns = [
@@ -54,10 +57,11 @@ class RedundancyProceduresGate:
             r'(?:30|thirty)\s+days?\s+(?:notice|consultation)'
         ]
 
-        has_collective_threshold = any(re.search(p, text, re.IGNORECASE) for p in collective_patterns)
+        has_collective_threshold = any(proximity.occurs(p, text, re.IGNORECASE) for p in collective_patterns)
 
         # Check for 20+ redundancies in 90 days (collective consultation required)
-        large_redundancy_match = re.search(r'(\d+)\s+(?:employees|redundancies|dismissals)', text, re.IGNORECASE)
+        large_redundancy_match = pattern_registry.search(r'(\d+)\s+(?:employees|redundancies|dismissals)', text,
+                                                         re.IGNORECASE)
         if large_redundancy_match:
             number = int(large_redundancy_match.group(1))
             if number >= 20 and not has_collective_threshold:
@@ -72,7 +76,7 @@ class RedundancyProceduresGate:
                 r'personal\s+consultation'
             ]
 
-            has_individual = any(re.search(p, text, re.IGNORECASE) for p in individual_patterns)
+            has_individual = any(proximity.occurs(p, text, re.IGNORECASE) for p in individual_patterns)
             if not has_individual:
                 warnings.append('Should include individual consultation with each affected employee')
 
@@ -87,7 +91,7 @@ class RedundancyProceduresGate:
 
             missing_info = []
             for item, pattern in info_requirements.items():
-                if not re.search(pattern, text, re.IGNORECASE):
+                if not proximity.occurs(pattern, text, re.IGNORECASE):
                     missing_info.append(item)
 
             if missing_info and len(missing_info) >= 3:
@@ -101,7 +105,7 @@ class RedundancyProceduresGate:
                 r'ways\s+to\s+avoid\s+redundanc'
             ]
 
-            has_meaningful = any(re.search(p, text, re.IGNORECASE) for p in meaningful_patterns)
+            has_meaningful = any(proximity.occurs(p, text, re.IGNORECASE) for p in meaningful_patterns)
             if not has_meaningful:
                 warnings.append('Consultation must be meaningful - consider views and explore alternatives to redundancy')
 
@@ -117,7 +121,7 @@ class RedundancyProceduresGate:
             r'matrix|scoring\s+(?:system|method)'
         ]
 
-        has_selection = any(re.search(p, text, re.IGNORECASE) for p in selection_patterns)
+        has_selection = any(proximity.occurs(p, text, re.IGNORECASE) for p in selection_patterns)
 
         if has_selection:
             # Check for objective criteria
@@ -131,7 +135,7 @@ class RedundancyProceduresGate:
                 r'redundancy\s+points?\s+(?:system|matrix|score)'
             ]
 
-            has_objective = any(re.search(p, text, re.IGNORECASE) for p in objective_criteria)
+            has_objective = any(proximity.occurs(p, text, re.IGNORECASE) for p in objective_criteria)
             if not has_objective:
                 warnings.append('Selection criteria should be objective and measurable (e.g., skills, performance, attendance)')
 
@@ -147,7 +151,7 @@ class RedundancyProceduresGate:
 
             prohibited_found = []
             for pattern in prohibited_patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
                 if matches:
                     # Context check - if mentioned as "not discriminatory" it's OK
                     for m in matches:
@@ -174,7 +178,7 @@ class RedundancyProceduresGate:
                 r'who\s+(?:is|will\s+be)\s+at\s+risk'
             ]
 
-            has_pool = any(re.search(p, text, re.IGNORECASE) for p in pool_patterns)
+            has_pool = any(proximity.occurs(p, text, re.IGNORECASE) for p in pool_patterns)
             if not has_pool:
                 warnings.append('Should define redundancy pool (who is at risk) with clear, objective rationale')
 
@@ -191,7 +195,7 @@ class RedundancyProceduresGate:
             r'ex[\s-]gratia'
         ]
 
-        has_payment = any(re.search(p, text, re.IGNORECASE) for p in payment_patterns)
+        has_payment = any(proximity.occurs(p, text, re.IGNORECASE) for p in payment_patterns)
 
         if has_payment:
             # Check for statutory redundancy pay calculation
@@ -203,7 +207,7 @@ class RedundancyProceduresGate:
                 r'£\d+\s+(?:per\s+)?week.*cap|maximum\s+(?:of\s+)?£\d+'
             ]
 
-            has_calc = any(re.search(p, text, re.IGNORECASE) for p in statutory_calc_patterns)
+            has_calc = any(proximity.occurs(p, text, re.IGNORECASE) for p in statutory_calc_patterns)
             if not has_calc:
                 warnings.append('Should explain redundancy pay calculation (0.5 week <22yrs, 1 week 22-40yrs, 1.5 weeks 41+)')
 
@@ -214,7 +218,7 @@ class RedundancyProceduresGate:
                 r'(?:worked\s+for|been\s+employed).*(?:2|two)\s+years?'
             ]
 
-            has_qualifying = any(re.search(p, text, re.IGNORECASE) for p in qualifying_patterns)
+            has_qualifying = any(proximity.occurs(p, text, re.IGNORECASE) for p in qualifying_patterns)
             if not has_qualifying:
                 warnings.append('Should reference 2-year qualifying period for statutory redundancy pay')
 
@@ -226,7 +230,7 @@ class RedundancyProceduresGate:
                 r'(?:\d+)\s+(?:weeks?|months?)\s+(?:per\s+year|for\s+each\s+year)'
             ]
 
-            has_enhanced = any(re.search(p, text, re.IGNORECASE) for p in enhanced_patterns)
+            has_enhanced = any(proximity.occurs(p, text, re.IGNORECASE) for p in enhanced_patterns)
             # Enhanced is optional but good practice
 
             # Check for notice pay and payment in lieu
@@ -237,7 +241,7 @@ class RedundancyProceduresGate:
                 r'(?:pay|paid)\s+during\s+notice\s+period'
             ]
 
-            has_notice_pay = any(re.search(p, text, re.IGNORECASE) for p in notice_pay_patterns)
+            has_notice_pay = any(proximity.occurs(p, text, re.IGNORECASE) for p in notice_pay_patterns)
             # Good to clarify notice pay separate from redundancy pay
 
         # 4. ALTERNATIVE EMPLOYMENT / MITIGATION
@@ -249,7 +253,7 @@ class RedundancyProceduresGate:
             r'trial\s+period'
         ]
 
-        has_alternative = any(re.search(p, text, re.IGNORECASE) for p in alternative_patterns)
+        has_alternative = any(proximity.occurs(p, text, re.IGNORECASE) for p in alternative_patterns)
 
         if has_alternative:
             # Check for trial period (statutory 4 weeks)
@@ -259,7 +263,7 @@ class RedundancyProceduresGate:
                 r'statutory\s+trial\s+period'
             ]
 
-            has_trial = any(re.search(p, text, re.IGNORECASE) for p in trial_patterns)
+            has_trial = any(proximity.occurs(p, text, re.IGNORECASE) for p in trial_patterns)
             if has_trial:
                 # Good - trial period mentioned
                 pass
@@ -275,7 +279,7 @@ class RedundancyProceduresGate:
             r'grievance'
         ]
 
-        has_appeal = any(re.search(p, text, re.IGNORECASE) for p in appeal_patterns)
+        has_appeal = any(proximity.occurs(p, text, re.IGNORECASE) for p in appeal_patterns)
 
         if has_appeal:
             # Check for appeal timeframe
@@ -284,7 +288,7 @@ class RedundancyProceduresGate:
                 r'appeal.*(?:within\s+)?(\d+)\s+(?:days?|weeks?)'
             ]
 
-            has_appeal_time = any(re.search(p, text, re.IGNORECASE) for p in appeal_time_patterns)
+            has_appeal_time = any(proximity.occurs(p, text, re.IGNORECASE) for p in appeal_time_patterns)
             if not has_appeal_time:
                 warnings.append('Appeal process should specify timeframe (typically 5-10 working days)')
 
@@ -299,7 +303,7 @@ class RedundancyProceduresGate:
             r'service\s+provision\s+change'
         ]
 
-        has_tupe = any(re.search(p, text, re.IGNORECASE) for p in tupe_patterns)
+        has_tupe = any(proximity.occurs(p, text, re.IGNORECASE) for p in tupe_patterns)
 
         if has_tupe:
             # Check for automatic transfer of employment
@@ -310,7 +314,7 @@ class RedundancyProceduresGate:
                 r'continuity\s+of\s+employment'
             ]
 
-            has_transfer_mention = any(re.search(p, text, re.IGNORECASE) for p in transfer_patterns)
+            has_transfer_mention = any(proximity.occurs(p, text, re.IGNORECASE) for p in transfer_patterns)
             if not has_transfer_mention:
                 warnings.append('TUPE transfers: employment contracts transfer automatically to new employer')
 
@@ -322,7 +326,7 @@ class RedundancyProceduresGate:
                 r'(?:cannot|must\s+not)\s+(?:worsen|reduce|diminish)\s+terms'
             ]
 
-            has_protection = any(re.search(p, text, re.IGNORECASE) for p in protection_patterns)
+            has_protection = any(proximity.occurs(p, text, re.IGNORECASE) for p in protection_patterns)
             if not has_protection:
                 warnings.append('TUPE: terms and conditions are protected - cannot be worsened due to transfer')
 
@@ -334,7 +338,7 @@ class RedundancyProceduresGate:
                 r'ELI'
             ]
 
-            has_tupe_consultation = any(re.search(p, text, re.IGNORECASE) for p in tupe_consultation_patterns)
+            has_tupe_consultation = any(proximity.occurs(p, text, re.IGNORECASE) for p in tupe_consultation_patterns)
             if not has_tupe_consultation:
                 warnings.append('TUPE: must inform and consult employees about transfer')
 
@@ -345,7 +349,7 @@ class RedundancyProceduresGate:
                 r'entailing\s+changes\s+(?:in|to)\s+(?:the\s+)?workforce'
             ]
 
-            has_eto = any(re.search(p, text, re.IGNORECASE) for p in eto_patterns)
+            has_eto = any(proximity.occurs(p, text, re.IGNORECASE) for p in eto_patterns)
             # ETO is exception to TUPE protection - if mentioned, should be carefully justified
 
             if has_eto:
@@ -358,7 +362,7 @@ class RedundancyProceduresGate:
             r'(?:\d+)\s+(?:weeks?|months?)\s+notice'
         ]
 
-        has_notice = any(re.search(p, text, re.IGNORECASE) for p in notice_patterns)
+        has_notice = any(proximity.occurs(p, text, re.IGNORECASE) for p in notice_patterns)
 
         if has_notice:
             # Check for statutory minimum compliance
@@ -368,7 +372,7 @@ class RedundancyProceduresGate:
                 r'(?:up\s+to\s+)?(?:12|twelve)\s+weeks?'
             ]
 
-            has_statutory = any(re.search(p, text, re.IGNORECASE) for p in statutory_notice_patterns)
+            has_statutory = any(proximity.occurs(p, text, re.IGNORECASE) for p in statutory_notice_patterns)
             if not has_statutory:
                 warnings.append('Notice period should reference statutory minimum (1 week per year, max 12 weeks)')
 
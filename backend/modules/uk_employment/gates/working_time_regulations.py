@@ -1,5 +1,9 @@
 import re
 
+from core.document_context import DocumentContext
+from core.pattern_registry import pattern_registry
+from core.proximity import proximity
+
 
 class WorkingTimeRegulationsGate:
     """
@@ -11,9 +15,9 @@ class WorkingTimeRegulationsGate:
         self.severity = "critical"
         self.legal_source = "Working Time Regulations 1998 (amended 2025)"
 
-    def _is_relevant(self, text):
+    def _is_relevant(self, ctx):
         """Check if document relates to working time"""
-        text_lower = text.lower()
+        text_lower = ctx.lower
         keywords = [
             'working time', 'working hours', 'hours of work', 'work hours',
             'rest break', 'rest period', 'annual leave', 'holiday',
@@ -23,14 +27,18 @@ class WorkingTimeRegulationsGate:
         return any(kw in text_lower for kw in keywords)
 
     def check(self, text, document_type):
-        if not self._is_relevant(text):
+        return self.check_ctx(DocumentContext(text, document_type))
+
+    def check_ctx(self, ctx):
+        text = ctx.text
+        if not self._is_relevant(ctx):
             return {
                 'status': 'N/A',
                 'message': 'Not applicable - document does not relate to working time',
                 'legal_source': self.legal_source
             }
 
-        text_lower = text.lower()
+        text_lower = ctx.lower
         spans = []
         issues = []
         warnings = []
@@ -45,22 +53,18 @@ class WorkingTimeRegulationsGate:
 
         hours_mentioned = []
         for pattern in max_hours_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern_registry.finditer(pattern, text, re.IGNORECASE))
             for m in matches:
                 try:
-                    hours = int(re.search(r'\d+', m.group()).group())
+                    hours = int(pattern_registry.search(r'\d+', m.group()).group())
                     hours_mentioned.append(hours)
 
                     if hours > 48:
-                        # Check for opt-out
-                        context_start = max(0, m.start() - 150)
-                        context_end = min(len(text), m.end() + 150)
-                        context = text[context_start:context_end].lower()
-
-                        has_opt_out = any(phrase in context for phrase in [
-                            'opt-out', 'opt out', 'voluntary', 'agreement', 'consent',
-                            'choose to work', 'elect to work'
-                        ])
+                        # Check for opt-out within 150 characters either side
+                        has_opt_out = proximity.around(
+                            r'opt-out|opt out|voluntary|agreement|consent|choose to work|elect to work',
+                            text, m.start(), m.end(), 150, re.IGNORECASE
+                        )
 
                         if not has_opt_out:
                             spans.append({
@@ -89,7 +93,7 @@ class WorkingTimeRegulationsGate:
             r'Working\s+Time\s+Regulations.*maximum'
         ]
 
-        has_48_hour_ref = any(re.search(p, text, re.IGNORECASE) for p in forty_eight_patterns)
+        has_48_hour_ref = any(proximity.occurs(p, text, re.IGNORECASE) for p in forty_eight_patterns)
 
         # Check for averaging period
         averaging_patterns = [
@@ -98,7 +102,7 @@ class WorkingTimeRegulationsGate:
             r'reference\s+period'
         ]
 
-        has_averaging = any(re.search(p, text, re.IGNORECASE) for p in averaging_patterns)
+        has_averaging = any(proximity.occurs(p, text, re.IGNORECASE) for p in averaging_patterns)
 
         if has_48_hour_ref and not has_averaging:
             warnings.append('48-hour week should reference 17-week averaging period (26 weeks for certain sectors)')
@@ -111,7 +115,7 @@ class WorkingTimeRegulationsGate:
             r'voluntary\s+agreement.*exceed.*48'
         ]
 
-        has_opt_out = any(re.search(p, text, re.IGNORECASE) for p in opt_out_patterns)
+        has_opt_out = any(proximity.occurs(p, text, re.IGNORECASE) for p in opt_out_patterns)
 
         if has_opt_out:
             # Check opt-out is voluntary and in writing
@@ -124,7 +128,7 @@ class WorkingTimeRegulationsGate:
                 r'freely\s+agree'
             ]
 
-            has_voluntary = any(re.search(p, text, re.IGNORECASE) for p in voluntary_patterns)
+            has_voluntary = any(proximity.occurs(p, text, re.IGNORECASE) for p in voluntary_patterns)
             if not has_voluntary:
                 issues.append('CRITICAL: Opt-out must be voluntary - no pressure or detriment for refusing')
 
@@ -135,7 +139,7 @@ class WorkingTimeRegulationsGate:
                 r'signed\s+(?:agreement|opt[\s-]out)'
             ]
 
-            has_written = any(re.search(p, text, re.IGNORECASE) for p in written_patterns)
+            has_written = any(proximity.occurs(p, text, re.IGNORECASE) for p in written_patterns)
             if not has_written:
                 warnings.append('Opt-out agreement must be in writing and signed by employee')
 
@@ -147,7 +151,7 @@ class WorkingTimeRegulationsGate:
                 r'end\s+(?:the\s+)?agreement'
             ]
 
-            has_cancel = any(re.search(p, text, re.IGNORECASE) for p in cancel_patterns)
+            has_cancel = any(proximity.occurs(p, text, re.IGNORECASE) for p in cancel_patterns)
             if not has_cancel:
                 warnings.append('Opt-out agreement should specify right to cancel with notice (7 days to 3 months)')
 
@@ -158,7 +162,7 @@ class WorkingTimeRegulationsGate:
                 r'evidence.*compliance'
             ]
 
-            has_records = any(re.search(p, text, re.IGNORECASE) for p in records_patterns)
+            has_records = any(proximity.occurs(p, text, re.IGNORECASE) for p in records_patterns)
             if not has_records and has_opt_out:
                 warnings.append('Employer must keep records of employees who opt out of 48-hour week')
 
@@ -171,7 +175,7 @@ class WorkingTimeRegulationsGate:
             r'rest\s+period'
         ]
 
-        has_breaks = any(re.search(p, text, re.IGNORECASE) for p in break_patterns)
+        has_breaks = any(proximity.occurs(p, text, re.IGNORECASE) for p in break_patterns)
 
         if has_breaks:
             # Check for 20-minute break for 6+ hour shifts
@@ -181,7 +185,7 @@ class WorkingTimeRegulationsGate:
                 r'(?:at\s+least|minimum\s+of)\s+20\s+minutes?'
             ]
 
-            has_20_min = any(re.search(p, text, re.IGNORECASE) for p in twenty_min_patterns)
+            has_20_min = any(proximity.occurs(p, text, re.IGNORECASE) for p in twenty_min_patterns)
 
             six_hour_patterns = [
                 r'(?:6|six)\s+hours?',
@@ -189,7 +193,7 @@ class WorkingTimeRegulationsGate:
                 r'work(?:ing)?\s+(?:more\s+than\s+)?(?:6|six)\s+hours?'
             ]
 
-            has_6_hour_ref = any(re.search(p, text, re.IGNORECASE) for p in six_hour_patterns)
+            has_6_hour_ref = any(proximity.occurs(p, text, re.IGNORECASE) for p in six_hour_patterns)
 
             if has_6_hour_ref and not has_20_min:
                 warnings.append('Workers working 6+ hours are entitled to 20-minute uninterrupted rest break')
@@ -202,7 +206,7 @@ class WorkingTimeRegulationsGate:
                 r'away\s+from\s+(?:work\s+)?(?:station|desk)'
             ]
 
-            has_uninterrupted = any(re.search(p, text, re.IGNORECASE) for p in uninterrupted_patterns)
+            has_uninterrupted = any(proximity.occurs(p, text, re.IGNORECASE) for p in uninterrupted_patterns)
             if has_20_min and not has_uninterrupted:
                 warnings.append('Rest break must be uninterrupted and away from workstation')
 
@@ -217,7 +221,7 @@ class WorkingTimeRegulationsGate:
             r'(?:at\s+least|minimum)\s+11\s+hours?\s+(?:off|rest)'
         ]
 
-        has_daily_rest = any(re.search(p, text, re.IGNORECASE) for p in daily_rest_patterns)
+        has_daily_rest = any(proximity.occurs(p, text, re.IGNORECASE) for p in daily_rest_patterns)
 
         if not has_daily_rest and has_breaks:
             warnings.append('Should reference 11 consecutive hours daily rest between working days')
@@ -231,7 +235,7 @@ class WorkingTimeRegulationsGate:
             r'rest\s+day'
         ]
 
-        has_weekly_rest = any(re.search(p, text, re.IGNORECASE) for p in weekly_rest_patterns)
+        has_weekly_rest = any(proximity.occurs(p, text, re.IGNORECASE) for p in weekly_rest_patterns)
 
         if not has_weekly_rest and has_daily_rest:
             warnings.append('Should reference weekly rest period (24 hours per week or 48 hours per fortnight)')
@@ -244,7 +248,7 @@ class WorkingTimeRegulationsGate:
             r'vacation'
         ]
 
-        has_annual_leave = any(re.search(p, text, re.IGNORECASE) for p in annual_leave_patterns)
+        has_annual_leave = any(proximity.occurs(p, text, re.IGNORECASE) for p in annual_leave_patterns)
 
         if has_annual_leave:
             # Check for 5.6 weeks / 28 days
@@ -255,10 +259,11 @@ class WorkingTimeRegulationsGate:
                 r'(?:20|twenty)\s+days?\s+(?:plus|and)\s+(?:8|eight)\s+(?:bank\s+)?holidays'
             ]
 
-            has_leave_amount = any(re.search(p, text, re.IGNORECASE) for p in leave_amount_patterns)
+            has_leave_amount = any(proximity.occurs(p, text, re.IGNORECASE) for p in leave_amount_patterns)
 
             # Check if amount is less than statutory
-            days_match = re.search(r'(\d+)\s+days?\s+(?:annual\s+leave|holiday|paid\s+leave)', text, re.IGNORECASE)
+            days_match = pattern_registry.search(r'(\d+)\s+days?\s+(?:annual\s+leave|holiday|paid\s+leave)', text,
+                                                 re.IGNORECASE)
             if days_match:
                 days = int(days_match.group(1))
                 if days < 28:
@@ -286,7 +291,7 @@ class WorkingTimeRegulationsGate:
                 r'(?:next\s+)?(?:holiday\s+)?year'
             ]
 
-            has_carry_over = any(re.search(p, text, re.IGNORECASE) for p in carry_over_patterns)
+            has_carry_over = any(proximity.occurs(p, text, re.IGNORECASE) for p in carry_over_patterns)
             # Good practice to clarify carry-over policy
 
             # Check payment on termination
@@ -296,7 +301,7 @@ class WorkingTimeRegulationsGate:
                 r'accrued\s+but\s+untaken'
             ]
 
-            has_termination_pay = any(re.search(p, text, re.IGNORECASE) for p in termination_pay_patterns)
+            has_termination_pay = any(proximity.occurs(p, text, re.IGNORECASE) for p in termination_pay_patterns)
             if not has_termination_pay:
                 warnings.append('Should clarify payment for accrued but untaken holiday on termination')
 
@@ -308,7 +313,7 @@ class WorkingTimeRegulationsGate:
             r'night\s+time'
         ]
 
-        has_night_work = any(re.search(p, text, re.IGNORECASE) for p in night_work_patterns)
+        has_night_work = any(proximity.occurs(p, text, re.IGNORECASE) for p in night_work_patterns)
 
         if has_night_work:
             # Check for maximum 8-hour average for night workers
@@ -318,7 +323,7 @@ class WorkingTimeRegulationsGate:
                 r'(?:no\s+more\s+than|up\s+to)\s+8\s+hours?.*night'
             ]
 
-            has_night_hours = any(re.search(p, text, re.IGNORECASE) for p in night_hours_patterns)
+            has_night_hours = any(proximity.occurs(p, text, re.IGNORECASE) for p in night_hours_patterns)
             if not has_night_hours:
                 warnings.append('Night workers should not work more than 8 hours in any 24-hour period (on average)')
 
@@ -329,7 +334,7 @@ class WorkingTimeRegulationsGate:
                 r'free\s+health\s+assessment'
             ]
 
-            has_health = any(re.search(p, text, re.IGNORECASE) for p in health_patterns)
+            has_health = any(proximity.occurs(p, text, re.IGNORECASE) for p in health_patterns)
             if not has_health:
                 warnings.append('Night workers are entitled to free health assessments')
 
@@ -340,7 +345,7 @@ class WorkingTimeRegulationsGate:
                 r'if\s+(?:health|medical)\s+(?:issues|problems|grounds)'
             ]
 
-            has_transfer = any(re.search(p, text, re.IGNORECASE) for p in transfer_patterns)
+            has_transfer = any(proximity.occurs(p, text, re.IGNORECASE) for p in transfer_patterns)
             # Good practice to mention
 
         # 8. RECORD KEEPING (2025 requirement)
@@ -351,7 +356,7 @@ class WorkingTimeRegulationsGate:
             r'attendance\s+records?'
         ]
 
-        has_records = any(re.search(p, text, re.IGNORECASE) for p in records_patterns)
+        has_records = any(proximity.occurs(p, text, re.IGNORECASE) for p in records_patterns)
 
         if not has_records and hours_mentioned:
             warnings.append('Employer must keep adequate records of working hours to demonstrate WTR compliance')
@@ -364,7 +369,7 @@ class WorkingTimeRegulationsGate:
             r'senior\s+executives?'
         ]
 
-        has_unmeasured = any(re.search(p, text, re.IGNORECASE) for p in unmeasured_patterns)
+        has_unmeasured = any(proximity.occurs(p, text, re.IGNORECASE) for p in unmeasured_patterns)
 
         if has_unmeasured:
             # Check this is appropriate exemption
@@ -379,7 +384,7 @@ class WorkingTimeRegulationsGate:
             r'enforcement'
         ]
 
-        has_enforcement = any(re.search(p, text, re.IGNORECASE) for p in enforcement_patterns)
+        has_enforcement = any(proximity.occurs(p, text, re.IGNORECASE) for p in enforcement_patterns)
 
         # Determine overall status
         if issues:
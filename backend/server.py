@@ -1,3 +1,5 @@
+import os
+import gzip
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -8,8 +10,9 @@ from core.interceptor import AnthropicInterceptor, OpenAIInterceptor, GeminiInte
 from core.providers import ProviderRouter
 from core.security import SecurityManager, RateLimiter, rate_limit, sanitize_error
 from core.audit_log import AuditLogger
-from core.cache import ValidationCache
+from core.cache import ValidationCache, GateResultCache, DeterministicResultCache, ProviderResponseCache
 from core.gate_registry import gate_registry
+from core.pattern_registry import pattern_registry
 from core.corrector import DocumentCorrector  # NEW: Document correction engine
 from core.synthesis import SynthesisEngine
 
@@ -25,10 +28,16 @@ app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024
 security = SecurityManager()
 rate_limiter = RateLimiter()
 audit_log = AuditLogger()
-cache = ValidationCache(max_size=500, ttl_seconds=1800)  # 30min TTL
+# LOKI_CACHE_BACKEND=sqlite shares results between worker processes (LOKI_CACHE_PATH);
+# LOKI_NEAR_DUPLICATE_THRESHOLD reuses verdicts of near-identical documents;
+# LOKI_RESULT_STORE_PATH keeps results across restarts (loaded below)
+cache = ValidationCache.from_config(os.environ, max_size=500, ttl_seconds=1800,
+                                    compress_threshold=64 * 1024)  # 30min TTL, gzip large bodies
+gate_cache = GateResultCache(max_size=20000, ttl_seconds=1800)  # per-gate verdicts, shared across module selections
 
-# Initialize async engine with parallel execution (max 4 concurrent gates)
-engine = AsyncLOKIEngine(max_workers=4)
+# Initialize engine; LOKI_EXECUTION_MODE selects serial/thread/process/asyncio
+# gate execution (thread pool with 4 workers by default)
+engine = AsyncLOKIEngine.from_config(os.environ, gate_cache=gate_cache)
 
 # Load core modules
 engine.load_module('hr_scottish')
@@ -53,12 +62,71 @@ for module_name in new_modules:
     except Exception as e:
         print(f"⚠ Could not load module {module_name}: {str(e)}")
 
-anthropic_interceptor = AnthropicInterceptor(engine)
-openai_interceptor = OpenAIInterceptor(engine)
-gemini_interceptor = GeminiInterceptor(engine)
+# Start process workers now (if enabled) so they load modules before the first request.
+# Workers re-import this script as __mp_main__ when it is run directly; they must not start their own.
+if __name__ != '__mp_main__':
+    engine.warm_up()
+
+# Warm the cache with the most requested stored results (gate versions are
+# registered by now, so results from older gates are skipped)
+if cache.result_store is not None:
+    preloaded = cache.preload(
+        limit=int(os.environ.get('LOKI_PRELOAD_ENTRIES', 200)),
+        budget_seconds=float(os.environ.get('LOKI_PRELOAD_BUDGET_MS', 2000)) / 1000,
+    )
+    print(f"✓ Preloaded {preloaded} cached validations")
+
+
+def _budget_ms(value):
+    """Parse a latency budget (ms) from config or a request body; None disables it"""
+    if value in (None, ''):
+        return None
+    budget = float(value)
+    if budget <= 0:
+        raise ValueError('budget_ms must be positive')
+    return budget
+
+
+def _cached_response(entry, cached):
+    """
+    Write a CachedResult body as the response without re-serializing it
+
+    Gzipped bodies go out as-is to clients that accept gzip. Whether the
+    result came from the cache is reported in the X-LOKI-Cached header.
+    """
+    body = entry.body
+    send_gzip = entry.gzipped and 'gzip' in (request.headers.get('Accept-Encoding') or '')
+    if entry.gzipped and not send_gzip:
+        body = gzip.decompress(body)
+    response = make_response(body)
+    response.mimetype = 'application/json'
+    if send_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    if entry.gzipped:
+        response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['X-LOKI-Cached'] = 'true' if cached else 'false'
+    return response
+
+
+# Per-route validation latency budgets (unset = wait for every gate)
+INTERCEPT_BUDGET_MS = _budget_ms(os.environ.get('LOKI_INTERCEPT_BUDGET_MS'))
+VALIDATE_BUDGET_MS = _budget_ms(os.environ.get('LOKI_VALIDATE_BUDGET_MS'))
+
+# Opt-in: LOKI_PROVIDER_CACHE_TTL (seconds) reuses provider responses and their
+# validation for identical temperature-0 requests from the same API key
+PROVIDER_CACHE_TTL = os.environ.get('LOKI_PROVIDER_CACHE_TTL')
+provider_cache = ProviderResponseCache(ttl_seconds=float(PROVIDER_CACHE_TTL)) if PROVIDER_CACHE_TTL else None
+
+# The blocking proxy paths only need to know whether the risk is CRITICAL
+anthropic_interceptor = AnthropicInterceptor(engine, budget_ms=INTERCEPT_BUDGET_MS, mode='verdict',
+                                             response_cache=provider_cache)
+openai_interceptor = OpenAIInterceptor(engine, budget_ms=INTERCEPT_BUDGET_MS, mode='verdict',
+                                       response_cache=provider_cache)
+gemini_interceptor = GeminiInterceptor(engine, budget_ms=INTERCEPT_BUDGET_MS, mode='verdict')
 provider_router = ProviderRouter()
-corrector = DocumentCorrector()  # NEW: Initialize corrector
-synthesis_engine = SynthesisEngine(engine, audit_logger=audit_log)
+corrector = DocumentCorrector(result_cache=DeterministicResultCache(max_size=256))  # NEW: Initialize corrector
+synthesis_engine = SynthesisEngine(engine, audit_logger=audit_log,
+                                   result_cache=DeterministicResultCache(max_size=128))
 
 BASE_DIR = Path(__file__).resolve().parent
 FRONTEND_DIR = BASE_DIR.parent / 'frontend'
@@ -221,6 +289,15 @@ def health():
 
             health_data['gate_counts'] = gate_counts
             health_data['cache_stats'] = cache.get_stats()
+            health_data['gate_cache_stats'] = gate_cache.get_stats()
+            health_data['correction_cache_stats'] = corrector.result_cache.get_stats()
+            health_data['synthesis_cache_stats'] = synthesis_engine.result_cache.get_stats()
+            health_data['provider_cache_stats'] = provider_cache.get_stats() if provider_cache else None
+            health_data['executor_stats'] = engine.executor.get_stats()
+            health_data['analysis_stats'] = engine.analysis_counters.get_stats()
+            health_data['block_memo_stats'] = pattern_registry.get_stats()['block_memo']
+            if engine.gate_executor is not engine.executor:
+                health_data['gate_executor_stats'] = engine.gate_executor.get_stats()
 
         return jsonify(health_data)
     except Exception as e:
@@ -245,9 +322,13 @@ def proxy_messages():
 
         # Extract optional modules for validation (default: all loaded modules)
         modules = data.pop('modules', None)
+        try:
+            budget_ms = _budget_ms(data.pop('budget_ms', None))
+        except (TypeError, ValueError):
+            return jsonify(sanitize_error('budget_ms must be a positive number')), 400
 
         # Use interceptor to call Anthropic and validate
-        result = anthropic_interceptor.intercept_and_validate(data, api_key, modules)
+        result = anthropic_interceptor.intercept_and_validate(data, api_key, modules, budget_ms=budget_ms)
         # Always return the response; UI will flag issues
         return jsonify(result), 200
 
@@ -301,24 +382,35 @@ def validate_document():
         if not text:
             return jsonify(sanitize_error('No text provided')), 400
 
-        # Check cache first
-        cached_result = cache.get(text, document_type, modules)
-        if cached_result:
-            cached_result['_cached'] = True
-            return jsonify({
-                'validation': cached_result,
-                'risk': cached_result.get('overall_risk', 'LOW')
-            })
-
-        # Run validation
-        validation = engine.check_document(
-            text=text,
-            document_type=document_type,
-            active_modules=modules
+        try:
+            budget_ms = _budget_ms(data.get('budget_ms', VALIDATE_BUDGET_MS))
+        except (TypeError, ValueError):
+            return jsonify(sanitize_error('budget_ms must be a positive number')), 400
+
+        # A hit is the stored body, never a shared dict. On a miss only one
+        # request validates the document; identical requests arriving
+        # meanwhile, in this or another worker, wait for its result.
+        # Complete results only are cached; a partial one would hide the
+        # timed-out gates. With LOKI_NEAR_DUPLICATE_THRESHOLD set, a miss
+        # may reuse the verdict of a near-identical document; the result then
+        # carries a ``near_duplicate`` section, also kept in the audit log,
+        # and its own ``document_hash`` but none of the source's span offsets.
+        entry, validation = cache.get_or_compute(
+            text, document_type, modules,
+            lambda: engine.check_document(
+                text=text,
+                document_type=document_type,
+                active_modules=modules,
+                budget_ms=budget_ms
+            ),
+            cacheable=lambda result: not result.get('partial')
         )
-
-        # Cache result
-        cache.set(text, document_type, modules, validation)
+        if validation is None:
+            try:
+                cache.touch(text, document_type, modules)
+            except Exception:
+                pass  # The store only warms later restarts
+            return _cached_response(entry, cached=True)
 
         # Audit log
         try:
@@ -326,16 +418,29 @@ def validate_document():
             audit_log.log_validation(text, document_type, modules, validation, client_id)
         except Exception:
             pass  # Don't fail request if audit fails
+        try:
+            cache.persist(text, document_type, modules, entry)
+        except Exception:
+            pass  # The store only warms later restarts
+
+        # The body was already encoded for the cache; send it instead of re-serializing
+        if entry is not None:
+            return _cached_response(entry, cached=False)
 
         if isinstance(validation, dict) and validation.get('overall_risk') is not None:
             risk = validation['overall_risk']
         else:
             risk = 'LOW'
 
-        return jsonify({
+        response = jsonify({
             'validation': validation,
             'risk': risk
         })
+        response.headers['X-LOKI-Cached'] = 'false'
+        if isinstance(validation, dict) and validation.get('near_duplicate'):
+            response.headers['X-LOKI-Near-Duplicate'] = str(validation['near_duplicate']['similarity'])
+            response.headers['X-LOKI-Near-Duplicate-Source'] = validation['near_duplicate']['source_key']
+        return response
 
     except Exception as e:
         return jsonify(sanitize_error(e)), 500
@@ -497,6 +602,10 @@ def cache_stats():
     """Get cache statistics"""
     try:
         stats = cache.get_stats()
+        stats['gate_cache'] = gate_cache.get_stats()
+        stats['correction_cache'] = corrector.result_cache.get_stats()
+        stats['synthesis_cache'] = synthesis_engine.result_cache.get_stats()
+        stats['provider_cache'] = provider_cache.get_stats() if provider_cache else None
         return jsonify(stats), 200
     except Exception as e:
         return jsonify(sanitize_error(e)), 500
@@ -509,6 +618,11 @@ def clear_cache():
     """Clear validation cache"""
     try:
         cache.clear()
+        gate_cache.clear()
+        corrector.result_cache.clear()
+        synthesis_engine.result_cache.clear()
+        if provider_cache:
+            provider_cache.clear()
         return jsonify({'message': 'Cache cleared', 'success': True}), 200
     except Exception as e:
         return jsonify(sanitize_error(e)), 500
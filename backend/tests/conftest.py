@@ -0,0 +1,53 @@
+"""
+Fixtures shared by the backend tests
+Gold fixture documents and the normalization of engine results compared across runs
+"""
+from pathlib import Path
+
+import pytest
+
+GOLD_FIXTURES_DIR = Path(__file__).resolve().parents[2] / 'tests' / 'semantic' / 'gold_fixtures'
+
+
+def _comparable(result, *volatile):
+    """
+    Copy of an engine result without what differs between identical validations.
+
+    Drops the top-level and per-gate timestamps, the pattern-plan counters
+    and the other top-level sections named in ``volatile`` (e.g. 'gate_cache').
+    """
+    dropped = {'timestamp', 'pattern_plan', *volatile}
+    result = {k: v for k, v in result.items() if k not in dropped}
+    if 'modules' in result:
+        result['modules'] = {
+            module_id: dict(module, gates={
+                gate_id: {k: v for k, v in gate.items() if k != 'timestamp'}
+                for gate_id, gate in module['gates'].items()
+            }) if isinstance(module.get('gates'), dict) else module
+            for module_id, module in result['modules'].items()
+        }
+    return result
+
+
+@pytest.fixture(scope='session')
+def gold_fixtures_dir():
+    return GOLD_FIXTURES_DIR
+
+
+@pytest.fixture(scope='session')
+def gold_fixtures():
+    """``(path, text)`` of every gold fixture document, in a stable order."""
+    fixtures = [(path, path.read_text(encoding='utf-8')) for path in sorted(GOLD_FIXTURES_DIR.glob('*/*.txt'))]
+    assert fixtures, f"no gold fixtures under {GOLD_FIXTURES_DIR}"
+    return fixtures
+
+
+@pytest.fixture(scope='session')
+def gold_texts(gold_fixtures):
+    return [text for _, text in gold_fixtures]
+
+
+@pytest.fixture(scope='session')
+def comparable():
+    """``comparable(result, *volatile_sections)``: see ``_comparable``."""
+    return _comparable
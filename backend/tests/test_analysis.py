@@ -0,0 +1,79 @@
+import pytest
+
+from analyzers.pii_scanner import find_pii_entities, scan_pii
+from core.analysis import UNIVERSAL_CHECKS, DocumentAnalysis
+from core.async_engine import AsyncLOKIEngine
+from core.document_context import DocumentContext
+from core.universal_detectors import UniversalDetectors
+
+
+TEXTS = [
+    '',
+    'No personal data here, just policy wording.',
+    'Contact jane.doe@example.com or call 07700 900123. NI number AB 12 34 56 C.',
+    'Card 4111 1111 1111 1111 will be published on pastebin.',
+    'Our privacy notice: email dpo@example.org. NHS 943 476 5919.',
+    'The fee is guaranteed. The fee is not guaranteed. Studies show 97% agree.',
+]
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_sections_match_direct_detector_calls(text):
+    universal = UniversalDetectors()
+    analysis = DocumentAnalysis(universal, DocumentContext(text, 'contract'))
+
+    assert analysis.universal_section() == {
+        'pii': universal.detect_pii(text, document_type='contract'),
+        'contradictions': universal.detect_contradictions(text),
+        'hallucinations': universal.detect_hallucination_markers(text),
+        'bias': universal.detect_bias(text),
+        'harm': universal.detect_harm(text),
+        'illegal_content': universal.detect_illegal_content(text),
+    }
+    assert analysis.analyzer_section() == {
+        'pii': scan_pii(text, document_type='contract'),
+        'contradictions': universal.detect_contradictions(text),
+        'hallucinations': universal.detect_hallucination_markers(text),
+    }
+
+
+def test_pii_views_are_built_from_one_scan(monkeypatch):
+    scans = []
+    monkeypatch.setattr('core.analysis.find_pii_entities',
+                        lambda content: scans.append(content) or find_pii_entities(content))
+    # The universal view must reuse the stage's matches, not scan again
+    monkeypatch.setattr('core.universal_detectors.find_pii_entities', lambda content: 1 / 0)
+    text = TEXTS[2]
+    analysis = DocumentAnalysis(UniversalDetectors(), DocumentContext(text, 'contract'))
+
+    spans = analysis.universal_section()['pii']['spans']
+    entities = analysis.analyzer_section()['pii']['entities']
+    assert scans == [text]
+    assert [(span['start'], span['end']) for span in spans if span['type'] == 'ni_number'] == [
+        (entity['start'], entity['end']) for entity in entities if entity['type'] == 'ni_number']
+    assert text[spans[0]['start']:spans[0]['end']] == 'AB 12 34 56 C'
+
+
+def test_each_detector_runs_once_per_document():
+    engine = AsyncLOKIEngine(max_workers=2)
+    engine.load_module('gdpr_uk')
+    try:
+        for text in TEXTS:
+            engine.check_document(text, 'contract', None)
+    finally:
+        engine.shutdown()
+
+    assert engine.analysis_counters.get_stats() == {name: len(TEXTS) for name in UNIVERSAL_CHECKS}
+
+
+def test_analyzer_failure_does_not_break_universal_section(monkeypatch):
+    universal = UniversalDetectors()
+    analysis = DocumentAnalysis(universal, DocumentContext('text'))
+    monkeypatch.setattr(universal, 'detect_hallucination_markers', lambda text: 1 / 0)
+
+    section = analysis.analyzer_section()
+    assert section['hallucinations']['status'] == 'ERROR'
+    assert 'status' in section['pii']
+    with pytest.raises(ZeroDivisionError):
+        analysis.universal_section()
+    assert analysis.counters.get_stats()['hallucinations'] == 1
@@ -33,3 +33,19 @@ def test_validate_document_basic_flow():
     data = resp.get_json()
     gates = data['validation']['modules']['fca_financial_promotions']['gates']
     assert gates['risk_warnings']['status'] == 'FAIL'
+
+
+def test_cache_hit_is_flagged_by_header_not_by_mutation():
+    client = app.test_client()
+    payload = {
+        'text': 'We keep your personal data indefinitely and share it with partners.',
+        'document_type': 'privacy_policy',
+        'modules': ['gdpr_uk'],
+    }
+    first = client.post('/validate-document', json=payload)
+    second = client.post('/validate-document', json=payload)
+    assert first.status_code == second.status_code == 200
+    assert first.headers['X-LOKI-Cached'] == 'false'
+    assert second.headers['X-LOKI-Cached'] == 'true'
+    assert '_cached' not in second.get_json()['validation']
+    assert second.get_data() == first.get_data()
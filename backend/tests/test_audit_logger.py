@@ -81,3 +81,14 @@ def test_audit_logger_records_gate_details(tmp_path):
 
     trends = logger.get_risk_trends(days=7)
     assert trends['timeline']
+
+
+def test_audit_logger_flags_reused_verdicts(tmp_path):
+    logger = AuditLogger(db_path=str(tmp_path / 'audit.db'))
+    validation = build_validation_result()
+    logger.log_validation('Sample document', 'policy', ['gdpr_uk'], validation)
+    validation['near_duplicate'] = {'source_key': 'abc', 'similarity': 0.97, 'threshold': 0.95}
+    logger.log_validation('Sample  document!', 'policy', ['gdpr_uk'], validation)
+
+    flags = sorted((entry['near_duplicate'] or {}).get('similarity', 0) for entry in logger.get_recent_entries())
+    assert flags == [0, 0.97]
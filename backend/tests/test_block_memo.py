@@ -0,0 +1,83 @@
+import re
+
+import pytest
+
+from core.block_memo import LOCAL, SEAM, BlockMatchMemo, pattern_tier
+from core.pattern_registry import PatternRegistry
+
+
+PATTERNS = [
+    (r'\bguaranteed\b', re.I),
+    (r'capital\s+at\s+risk', re.I),
+    (r'\d+\s+(?:days|weeks)', 0),
+    (r'(foo)\s+(bar)?', 0),
+    (r'[A-Z][a-z]+\s+[A-Z][a-z]+', 0),
+    (r'^data', re.M),
+    (r'.*consent', 0),
+    (r'\s+the', 0),
+    (r'processing\s*\n\s*personal', 0),
+]
+
+
+def _revise(text, tag):
+    paragraphs = text.split('\n\n')
+    for i in (3, len(paragraphs) // 2, len(paragraphs) - 2):
+        paragraphs[i] += f' Revised by {tag} foo\n\nbar 14 days later.'
+    return '\n\n'.join(paragraphs)
+
+
+def _assert_same(memo, compiled, text):
+    assert [m.span() for m in memo.finditer(compiled, text)] == [m.span() for m in compiled.finditer(text)]
+    found, expected = memo.search(compiled, text), compiled.search(text)
+    assert (found and found.span()) == (expected and expected.span())
+    assert memo.findall(compiled, text) == compiled.findall(text)
+
+
+@pytest.mark.parametrize('pattern, flags, tier', [
+    (r'\bguaranteed\b', re.I, LOCAL),
+    (r'capital\s+at\s+risk', re.I, (SEAM, 13)),
+    (r'^data', re.M, LOCAL),
+    (r'^data', 0, None),
+    (r'\s+the', 0, (SEAM, 3)),
+    (r'\s+', 0, None),
+    (r'[^.]+', 0, None),
+    (r'(\w+) \1', 0, None),
+])
+def test_pattern_tiers(pattern, flags, tier):
+    result = pattern_tier(re.compile(pattern, flags))
+    assert (result[0] if result and tier == LOCAL else result) == tier
+
+
+def test_matches_equal_whole_document_scan_across_revisions(gold_texts):
+    memo = BlockMatchMemo()
+    original = '\n\n'.join(gold_texts)
+    compiled = [re.compile(pattern, flags) for pattern, flags in PATTERNS]
+
+    for text in (original, _revise(original, 'A'), _revise(original, 'B'), original):
+        for pattern in compiled:
+            _assert_same(memo, pattern, text)
+
+    stats = memo.get_stats()
+    assert stats['cold_documents'] == 1
+    assert stats['block_hits'] > stats['block_scans']
+    assert stats['block_seeds'] > 0
+
+
+def test_gap_spanning_matches_fall_back_to_whole_document():
+    memo = BlockMatchMemo(min_chars=0, min_block_solid=8)
+    pattern = re.compile(r'(foo)\s+(bar)?')
+    base = '\n\n'.join(['alpha beta gamma delta', 'epsilon zeta eta theta', 'iota kappa lambda mu'] * 3)
+
+    _assert_same(memo, pattern, base)
+    for text in (base.replace('delta', 'delta foo'), base.replace('delta\n\nepsilon', 'foo\n\nbar')):
+        _assert_same(memo, pattern, text)
+    assert memo.get_stats()['whole_document_scans'] >= 1
+
+
+def test_registry_routes_through_memo(gold_texts):
+    registry = PatternRegistry(block_memo=BlockMatchMemo())
+    text = '\n\n'.join(gold_texts)
+
+    assert registry.findall(r'\bdata\b', text, re.I) == re.findall(r'\bdata\b', text, re.I)
+    assert registry.get_stats()['block_memo']['cold_documents'] == 1
+    assert PatternRegistry().get_stats()['block_memo'] is None
@@ -0,0 +1,61 @@
+import time
+
+from core.universal_detectors import UniversalDetectors
+
+
+SAMPLE = (
+    "The fee is not refundable. The fee is a one-off charge. "
+    "Staff must not share passwords. Staff must rotate passwords monthly. "
+    "Backups never leave the building. Laptops always stay encrypted. "
+    "Recovery is impossible after deletion. Recovery is possible within 30 days"
+)
+
+
+def _reference(detector, text):
+    """Every ordered sentence pair, as the original quadratic scan, restricted to shared subjects."""
+    sentences = (text or '').split('.')
+    found = []
+    for i, first in enumerate(sentences):
+        for j in range(i + 1, len(sentences)):
+            second = sentences[j]
+            if not any(neg.search(first) and pos.search(second) for neg, pos in detector._contradiction_patterns):
+                continue
+            if detector._subject_terms(first) & detector._subject_terms(second):
+                found.append({'sentence_1': first.strip(), 'sentence_2': second.strip()})
+    return found
+
+
+def test_findings_match_pairwise_scan(gold_texts):
+    detector = UniversalDetectors()
+    for text in [SAMPLE, '', 'No markers here.'] + gold_texts:
+        result = detector.detect_contradictions(text)
+        assert result['contradictions'] == _reference(detector, text)
+        assert result['status'] == ('FAIL' if result['contradictions'] else 'PASS')
+
+
+def test_unrelated_sentences_are_not_paired():
+    result = UniversalDetectors().detect_contradictions(SAMPLE)
+    pairs = {(c['sentence_1'], c['sentence_2']) for c in result['contradictions']}
+    assert ('The fee is not refundable', 'The fee is a one-off charge') in pairs
+    assert ('Recovery is impossible after deletion', 'Recovery is possible within 30 days') in pairs
+    # "never"/"always" sentences share no subject
+    assert not any('Backups' in first and 'Laptops' in second for first, second in pairs)
+
+
+def test_reported_pairs_are_capped():
+    detector = UniversalDetectors()
+    text = '. '.join(['The policy is not binding'] + ['The policy is a contract'] * 200)
+    result = detector.detect_contradictions(text)
+    assert len(result['contradictions']) == detector.max_contradictions
+    assert result['truncated'] is True
+
+
+def test_scales_linearly_with_sentence_count():
+    detector = UniversalDetectors()
+    sentences = [
+        f"Clause {i} is not a waiver of term {i}" if i % 2 else f"Clause {i} is a binding term {i}"
+        for i in range(10000)
+    ]
+    start = time.perf_counter()
+    detector.detect_contradictions('. '.join(sentences))
+    assert time.perf_counter() - start < 5
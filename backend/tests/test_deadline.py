@@ -0,0 +1,146 @@
+import time
+
+import pytest
+
+from core.async_engine import AsyncLOKIEngine
+
+
+MODULES = ['hr_scottish', 'gdpr_uk', 'nda_uk', 'tax_uk', 'fca_uk', 'uk_employment', 'scottish_law']
+
+
+class _Gate:
+    legal_source = 'Test'
+
+    def __init__(self, severity, delay=0.0, log=None):
+        self.severity = severity
+        self.delay = delay
+        self.log = log
+
+    def check(self, text, document_type):
+        if self.log is not None:
+            self.log.append(self.severity)
+        time.sleep(self.delay)
+        return {'status': 'PASS', 'severity': 'none', 'message': self.severity}
+
+
+def _engine(mode, gates):
+    engine = AsyncLOKIEngine(max_workers=2, execution_mode=mode)
+
+    class _Module:
+        pass
+
+    module = _Module()
+    module.gates = gates
+    engine.modules['budgeted'] = module
+    return engine
+
+
+@pytest.mark.parametrize('mode', ['serial', 'thread', 'asyncio'])
+def test_unfinished_gates_time_out_and_result_is_partial(mode):
+    engine = _engine(mode, {
+        'slow_low': _Gate('low', delay=1.0),
+        'fast_critical': _Gate('critical'),
+        'slow_medium': _Gate('medium', delay=1.0),
+    })
+    try:
+        start = time.monotonic()
+        result = engine.check_document('text', 'memo', ['budgeted'], budget_ms=200)
+        elapsed = time.monotonic() - start
+    finally:
+        engine.shutdown()
+
+    gates = result['modules']['budgeted']['gates']
+    assert list(gates) == ['slow_low', 'fast_critical', 'slow_medium']
+    assert gates['fast_critical']['status'] == 'PASS'
+    assert 'TIMEOUT' in {gates['slow_low']['status'], gates['slow_medium']['status']}
+    assert result['partial'] is True
+    assert result['modules']['budgeted']['summary']['timeout'] >= 1
+    assert result['budget']['gates_timed_out'] >= 1
+    assert result['overall_risk'] == 'LOW'
+    # Serial mode cannot interrupt the gate already running
+    assert elapsed < (1.5 if mode == 'serial' else 0.9)
+
+
+def test_detector_timeouts_make_the_result_partial(monkeypatch):
+    engine = _engine('thread', {'fast_low': _Gate('low')})
+    monkeypatch.setattr(engine.universal, 'detect_hallucination_markers', lambda text: time.sleep(1.0) or {})
+    try:
+        start = time.monotonic()
+        result = engine.check_document('text', 'memo', ['budgeted'], budget_ms=200)
+        elapsed = time.monotonic() - start
+    finally:
+        engine.shutdown()
+
+    assert result['budget']['gates_timed_out'] == 0
+    assert result['universal'] == {'error': 'Detector timeout'}
+    assert result['analyzers']['hallucinations']['status'] == 'ERROR'
+    assert result['partial'] is True
+    assert elapsed < 0.9
+
+
+def test_critical_gates_are_scheduled_first():
+    log = []
+    engine = _engine('serial', {
+        'a': _Gate('low', log=log),
+        'b': _Gate('medium', log=log),
+        'c': _Gate('critical', log=log),
+        'd': _Gate('high', log=log),
+    })
+    result = engine.check_document('text', 'memo', ['budgeted'])
+
+    assert log == ['critical', 'high', 'medium', 'low']
+    assert list(result['modules']['budgeted']['gates']) == ['a', 'b', 'c', 'd']
+    assert result['partial'] is False
+    assert 'budget' not in result
+
+
+class _FailingGate(_Gate):
+    def check(self, text, document_type):
+        super().check(text, document_type)
+        return {'status': 'FAIL', 'severity': self.severity, 'message': 'violation'}
+
+
+@pytest.mark.parametrize('mode', ['serial', 'thread', 'asyncio'])
+def test_verdict_mode_skips_gates_once_risk_is_critical(mode):
+    engine = _engine(mode, {
+        'slow_high': _Gate('high', delay=1.0),
+        'critical_1': _FailingGate('critical'),
+        'critical_2': _FailingGate('critical'),
+        'slow_low': _Gate('low', delay=1.0),
+    })
+    try:
+        start = time.monotonic()
+        result = engine.check_document('text', 'memo', ['budgeted'], mode='verdict')
+        elapsed = time.monotonic() - start
+    finally:
+        engine.shutdown()
+
+    assert result['overall_risk'] == 'CRITICAL'
+    assert result['mode'] == 'verdict'
+    assert set(result['skipped_gates']) >= {'budgeted.slow_low'}
+    assert result['modules']['budgeted']['summary']['skipped'] == len(result['skipped_gates'])
+    assert elapsed < 1.9
+
+
+@pytest.mark.parametrize('mode', ['serial', 'thread', 'asyncio'])
+def test_verdict_mode_reaches_the_same_risk_on_gold_fixtures(mode, gold_fixtures):
+    engine = AsyncLOKIEngine(max_workers=2, execution_mode=mode)
+    for module_name in MODULES:
+        engine.load_module(module_name)
+    skipped = 0
+    try:
+        for path, text in gold_fixtures:
+            full = engine.check_document(text, 'contract', None)
+            verdict = engine.check_document(text, 'contract', None, mode='verdict')
+            assert verdict['overall_risk'] == full['overall_risk'], path.name
+            if full['overall_risk'] != 'CRITICAL':
+                assert verdict['skipped_gates'] == []
+            skipped += len(verdict['skipped_gates'])
+    finally:
+        engine.shutdown()
+    assert skipped > 0
+
+
+def test_unknown_check_mode_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncLOKIEngine(execution_mode='serial').check_document('text', 'memo', None, mode='fast')
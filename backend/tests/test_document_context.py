@@ -0,0 +1,86 @@
+from core.async_engine import AsyncLOKIEngine
+from core.document_context import DocumentContext
+from modules.fca_uk.gates.fair_clear_not_misleading import FairClearNotMisleadingGate
+
+
+SAMPLE = (
+    "Guaranteed returns of 12% every year!  Invest   today.\n"
+    "\n"
+    "Capital at risk. Past performance is not a guide to future results?"
+)
+
+
+def test_context_views_are_computed_once():
+    ctx = DocumentContext(SAMPLE, 'promotion')
+    assert ctx.lower is ctx.lower
+    assert ctx.lower == SAMPLE.lower()
+    assert ctx.normalized.startswith('guaranteed returns of 12% every year! invest today.')
+    assert {'guaranteed', 'capital', 'risk'} <= ctx.tokens
+
+
+def test_sentence_and_paragraph_offsets_point_into_text():
+    ctx = DocumentContext(SAMPLE)
+    assert [s.text for s in ctx.sentences] == [
+        'Guaranteed returns of 12% every year!',
+        'Invest   today.',
+        'Capital at risk.',
+        'Past performance is not a guide to future results?',
+    ]
+    for span in ctx.sentences + ctx.paragraphs:
+        assert SAMPLE[span.start:span.end] == span.text
+    assert len(ctx.paragraphs) == 2
+    offset = SAMPLE.index('Capital')
+    assert ctx.sentence_at(offset).text == 'Capital at risk.'
+
+
+def test_context_tolerates_missing_text():
+    ctx = DocumentContext(None, None)
+    assert ctx.text == ''
+    assert ctx.document_type == 'unknown'
+    assert ctx.sentences == []
+    assert not ctx.contains_any(['risk'])
+
+
+def test_check_and_check_ctx_agree():
+    gate = FairClearNotMisleadingGate()
+    legacy = gate.check(SAMPLE, 'promotion')
+    shared = gate.check_ctx(DocumentContext(SAMPLE, 'promotion'))
+    assert legacy == shared
+    assert legacy['status'] == 'FAIL'
+
+
+class _LegacyOnlyGate:
+    legal_source = 'Test'
+
+    def check(self, text, document_type):
+        return {'status': 'PASS', 'severity': 'none', 'message': f'{document_type}:{len(text)}'}
+
+
+class _ContextGate:
+    legal_source = 'Test'
+
+    def __init__(self):
+        self.seen = []
+
+    def check(self, text, document_type):
+        raise AssertionError('engine should prefer check_ctx')
+
+    def check_ctx(self, ctx):
+        self.seen.append(ctx)
+        return {'status': 'PASS', 'severity': 'none', 'message': ctx.lower}
+
+
+def test_engine_shares_one_context_and_falls_back_to_check():
+    engine = AsyncLOKIEngine(max_workers=2)
+    first, second = _ContextGate(), _ContextGate()
+
+    class _Module:
+        gates = {'legacy': _LegacyOnlyGate(), 'first': first, 'second': second}
+
+    engine.modules['test'] = _Module()
+    result = engine.check_document('Some TEXT', 'memo', ['test'])
+    gates = result['modules']['test']['gates']
+
+    assert gates['legacy']['message'] == 'memo:9'
+    assert gates['first']['message'] == 'some text'
+    assert first.seen[0] is second.seen[0]
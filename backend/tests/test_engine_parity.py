@@ -0,0 +1,61 @@
+import pytest
+
+from core.async_engine import AsyncLOKIEngine
+from core.config_manager import ConfigManager
+from core.engine import LOKIEngine
+
+
+MODULES = ['hr_scottish', 'gdpr_uk', 'nda_uk', 'tax_uk', 'fca_uk', 'uk_employment', 'scottish_law']
+
+
+@pytest.fixture(scope='module')
+def corpus(gold_fixtures):
+    return [(path.name, text) for path, text in gold_fixtures] + [('empty', '')]
+
+
+@pytest.fixture(scope='module')
+def reference_results(corpus, comparable):
+    engine = AsyncLOKIEngine(execution_mode='serial')
+    for module_name in MODULES:
+        engine.load_module(module_name)
+    results = {name: comparable(engine.check_document(text, 'contract', None)) for name, text in corpus}
+    engine.shutdown()
+    return results
+
+
+@pytest.mark.parametrize('mode', ['thread', 'process', 'asyncio'])
+def test_every_execution_mode_gives_identical_results(mode, reference_results, corpus, comparable):
+    engine = AsyncLOKIEngine(max_workers=3, execution_mode=mode, process_workers=2)
+    try:
+        for module_name in MODULES:
+            engine.load_module(module_name)
+        engine.warm_up()
+        for name, text in corpus:
+            assert comparable(engine.check_document(text, 'contract', None)) == reference_results[name], name
+    finally:
+        engine.shutdown()
+
+
+def test_loki_engine_is_the_same_engine(reference_results, corpus, comparable):
+    engine = LOKIEngine()
+    assert engine.execution_mode == 'serial'
+    for module_name in MODULES:
+        engine.load_module(module_name)
+    for name, text in corpus:
+        assert comparable(engine.check_document(text, 'contract', None)) == reference_results[name], name
+
+    # Errors are sanitized the same way (no traceback)
+    error = engine.check_document(None, 'contract', None)
+    assert error['error'] == 'Engine error'
+    assert 'trace' not in error
+
+
+def test_execution_mode_is_chosen_by_config():
+    config = ConfigManager()
+    config.env = {'LOKI_EXECUTION_MODE': 'asyncio', 'LOKI_GATE_WORKERS': '2'}
+    engine = AsyncLOKIEngine.from_config(config)
+    assert engine.execution_mode == 'asyncio'
+    assert engine.gate_executor.get_stats()['workers'] == 2
+    engine.shutdown()
+
+    assert AsyncLOKIEngine.from_config({}).execution_mode == 'thread'
@@ -0,0 +1,176 @@
+import concurrent.futures
+import queue
+import threading
+from multiprocessing import shared_memory
+
+import pytest
+
+from core.async_engine import AsyncLOKIEngine
+from core.executors import GateExecutor, ProcessGateExecutor, _unlink_when_done
+
+
+def test_executor_tracks_completed_and_failed_tasks():
+    executor = GateExecutor(max_workers=2, max_queue=4)
+    try:
+        ok = executor.submit(lambda: 42)
+        bad = executor.submit(lambda: 1 / 0)
+        assert ok.result(timeout=5) == 42
+        with pytest.raises(ZeroDivisionError):
+            bad.result(timeout=5)
+    finally:
+        executor.shutdown()
+
+    stats = executor.get_stats()
+    assert stats['submitted'] == stats['completed'] == 2
+    assert stats['failed'] == 1
+    assert stats['active'] == 0 and stats['queue_depth'] == 0
+
+
+def test_bounded_queue_rejects_when_full():
+    release = threading.Event()
+    executor = GateExecutor(max_workers=1, max_queue=1, submit_timeout=0.05)
+    try:
+        running = executor.submit(release.wait)
+        waiting = executor.submit(release.wait)
+        with pytest.raises(queue.Full):
+            executor.submit(release.wait)
+
+        stats = executor.get_stats()
+        assert stats['queue_depth'] >= 1
+        assert stats['rejected'] == 1
+    finally:
+        release.set()
+        running.result(timeout=5)
+        waiting.result(timeout=5)
+        executor.shutdown()
+
+    assert executor.get_stats()['peak_queue_depth'] >= 1
+
+
+class _Gate:
+    legal_source = 'Test'
+
+    def __init__(self, label):
+        self.label = label
+
+    def check(self, text, document_type):
+        return {'status': 'PASS', 'severity': 'none', 'message': self.label}
+
+
+def test_engine_reuses_one_executor_and_keeps_gate_order(monkeypatch):
+    engine = AsyncLOKIEngine(max_workers=3)
+
+    class _Small:
+        gates = {'a': _Gate('a'), 'b': _Gate('b')}
+
+    class _Large:
+        gates = {f'g{i}': _Gate(f'g{i}') for i in range(26)}
+
+    engine.modules['small'] = _Small()
+    engine.modules['large'] = _Large()
+
+    def no_new_pools(*args, **kwargs):
+        raise AssertionError('engine should not create per-request pools')
+
+    monkeypatch.setattr(concurrent.futures, 'ThreadPoolExecutor', no_new_pools)
+
+    for _ in range(3):
+        result = engine.check_document('text', 'memo', ['large', 'small'])
+        assert list(result['modules']['large']['gates']) == [f'g{i}' for i in range(26)]
+        assert result['modules']['small']['summary']['pass'] == 2
+
+    # 28 gates + 6 analysis stages per request, all through the shared executor
+    assert engine.executor.get_stats()['submitted'] == 3 * 34
+
+
+def _gate_results(result):
+    return {
+        module_name: {name: {k: v for k, v in gate.items() if k != 'timestamp'}
+                      for name, gate in module['gates'].items()}
+        for module_name, module in result['modules'].items()
+    }
+
+
+def test_process_mode_matches_thread_mode():
+    text = (
+        "VAT invoice no. 1042. Guaranteed returns of 12% with no risk! "
+        "This disciplinary hearing letter concerns gross misconduct."
+    )
+    thread_engine = AsyncLOKIEngine(max_workers=2)
+    process_engine = AsyncLOKIEngine(execution_mode='process', process_workers=2)
+    try:
+        for engine in (thread_engine, process_engine):
+            for module_name in ('tax_uk', 'fca_uk', 'hr_scottish'):
+                engine.load_module(module_name)
+        process_engine.warm_up()
+
+        expected = _gate_results(thread_engine.check_document(text, 'letter', None))
+        assert _gate_results(process_engine.check_document(text, 'letter', None)) == expected
+
+        stats = process_engine.gate_executor.get_stats()
+        assert stats['starts'] == 1
+        assert stats['batches'] <= 2 * 2
+        assert stats['local_fallbacks'] == 0
+    finally:
+        thread_engine.shutdown()
+        process_engine.shutdown()
+
+
+def test_process_mode_runs_unknown_gates_in_parent():
+    engine = AsyncLOKIEngine(execution_mode='process', process_workers=1)
+
+    class _Runtime:
+        gates = {'only_here': _Gate('parent')}
+
+    engine.modules['runtime'] = _Runtime()
+    try:
+        engine.warm_up()
+        result = engine.check_document('text', 'memo', ['runtime'])
+        assert result['modules']['runtime']['gates']['only_here']['message'] == 'parent'
+        assert engine.gate_executor.get_stats()['local_fallbacks'] == 1
+    finally:
+        engine.shutdown()
+
+
+def test_process_mode_runs_gates_locally_until_started():
+    engine = AsyncLOKIEngine(execution_mode='process', process_workers=1)
+    engine.load_module('tax_uk')
+    try:
+        engine.check_document('VAT invoice no. 1042.', 'invoice', None)
+        stats = engine.gate_executor.get_stats()
+        assert stats['starts'] == stats['batches'] == 0
+        assert stats['local_fallbacks'] > 0
+    finally:
+        engine.shutdown()
+
+
+def test_process_pool_is_replaced_without_shutting_down_in_flight_work():
+    executor = ProcessGateExecutor(max_workers=1)
+    assert executor._context.get_start_method() != 'fork'
+    try:
+        executor.start(['tax_uk'])
+        first = executor._pool
+        running = first.submit(sum, range(10))
+        executor.start(['tax_uk', 'fca_uk'])
+        assert executor._pool is not first and executor.get_stats()['starts'] == 2
+        assert running.result(timeout=30) == 45
+    finally:
+        executor.shutdown()
+
+
+def test_shared_document_outlives_unfinished_batches():
+    shm = shared_memory.SharedMemory(create=True, size=8)
+    finished, running = concurrent.futures.Future(), concurrent.futures.Future()
+    finished.set_result([])
+    _unlink_when_done(shm, [finished, running])
+
+    attached = shared_memory.SharedMemory(name=shm.name)
+    attached.close()
+    running.set_result([])
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=shm.name)
+
+
+def test_unknown_execution_mode_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncLOKIEngine(execution_mode='fibers')
@@ -0,0 +1,64 @@
+from core.async_engine import AsyncLOKIEngine
+from core.cache import GateResultCache
+from core.gate_registry import gate_registry
+
+
+def _engine(gate_cache=None):
+    engine = AsyncLOKIEngine(execution_mode='serial', gate_cache=gate_cache)
+    for module_name in ('gdpr_uk', 'nda_uk'):
+        engine.load_module(module_name)
+    return engine
+
+
+def test_wider_module_selection_only_runs_missing_gates(gold_fixtures_dir, comparable):
+    gate_cache = GateResultCache()
+    engine = _engine(gate_cache)
+    text = (gold_fixtures_dir / 'gdpr_uk' / '02_missing_consent.txt').read_text(encoding='utf-8')
+
+    first = engine.check_document(text, 'privacy_notice', ['gdpr_uk'])
+    assert first['gate_cache']['hits'] == 0
+    gdpr_executed = first['gate_cache']['stored']
+    assert gdpr_executed > 0
+
+    second = engine.check_document(text, 'privacy_notice', ['gdpr_uk', 'nda_uk'])
+    assert second['gate_cache']['hits'] == gdpr_executed
+    assert comparable(second)['modules']['gdpr_uk'] == comparable(first)['modules']['gdpr_uk']
+
+    # Same results as an engine without the cache
+    uncached = _engine().check_document(text, 'privacy_notice', ['gdpr_uk', 'nda_uk'])
+    assert comparable(second, 'gate_cache') == comparable(uncached, 'gate_cache')
+
+
+def test_document_type_is_part_of_the_key():
+    gate_cache = GateResultCache()
+    engine = _engine(gate_cache)
+    text = 'We share your data with partners.'
+    engine.check_document(text, 'privacy_notice', ['gdpr_uk'])
+    assert engine.check_document(text, 'contract', ['gdpr_uk'])['gate_cache']['hits'] == 0
+
+
+def test_gate_version_change_invalidates_its_entries(monkeypatch):
+    gate_cache = GateResultCache()
+    engine = _engine(gate_cache)
+    text = 'We collect your email address for marketing.'
+    first = engine.check_document(text, 'privacy_notice', ['gdpr_uk'])
+
+    gate_id = next(iter(engine.modules['gdpr_uk'].gates))
+    info = gate_registry.get_gate_info(f"gdpr_uk.{gate_id}")
+    monkeypatch.setattr(info, 'version', info.version + '-rev2')
+
+    second = engine.check_document(text, 'privacy_notice', ['gdpr_uk'])
+    assert second['gate_cache']['hits'] == first['gate_cache']['stored'] - 1
+    assert gate_cache.get_stats()['invalidations'] == 1
+
+
+def test_cache_is_lru_bounded_and_returns_copies():
+    gate_cache = GateResultCache(max_size=2)
+    for gate_id in ('a', 'b', 'c'):
+        gate_cache.set('doc', 'mod', gate_id, '1.0.0', {'status': 'PASS', 'details': [gate_id]})
+    assert gate_cache.get('doc', 'mod', 'a', '1.0.0') is None
+
+    hit = gate_cache.get('doc', 'mod', 'c', '1.0.0')
+    hit['details'].append('mutated')
+    assert gate_cache.get('doc', 'mod', 'c', '1.0.0')['details'] == ['c']
+    assert gate_cache.get_stats()['size'] == 2
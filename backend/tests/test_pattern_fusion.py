@@ -0,0 +1,100 @@
+import random
+import re
+
+import pytest
+
+from core.block_memo import BlockMatchMemo
+from core.gate_introspection import extract_fused_groups, extract_patterns
+from core.pattern_fusion import FusedPatterns, fusion_lane
+from core.pattern_registry import PatternRegistry
+from modules.fca_uk.gates.fair_clear_not_misleading import FairClearNotMisleadingGate
+from modules.fca_uk.gates.vulnerability_identification import VulnerabilityIdentificationGate
+
+
+GROUPS = {
+    'superlatives': [
+        r'\b(?:best|highest|top|leading|number\s+one|#1|unbeatable)\b',
+        r'\b(?:guaranteed|promise|ensure)\b.*(?:return|profit|gain|yield)',
+        r'\bguaranteed\b.*\d+%',
+        r'\b(?:risk-free|no\s+risk)\b(?!\s+(?:deposit|up\s+to))',
+    ],
+    'benefits': [
+        r'\d+%\s+(?:return|yield|gain|profit)',
+        r'(?:up\s+to|as\s+much\s+as)\s+\d+%',
+    ],
+    'drivers': [
+        r'\b(?:debt|arrears|hardship)\b',
+        r'\b(?:bereavement|widow|widower)\b',
+        r'^(?:note|important):',
+        r'^(?:warning|risk):',
+    ],
+}
+WORDS = ('best guaranteed return 5% risk-free no risk up to 10% top #1 debt arrears widow widower '
+         'note: warning: Best GUARANTEED profit').split()
+
+
+def _separate(groups, flags, text):
+    return {name: [[m.span() for m in re.finditer(pattern, text, flags)] for pattern in patterns]
+            for name, patterns in groups.items()}
+
+
+@pytest.mark.parametrize('pattern, lane', [
+    (r'\bguaranteed\b', (r'\b', frozenset('g'))),
+    (r'\b(?:best|top|#1)\b', (r'\b', frozenset('bt#'))),
+    (r'^(?:note|warning):', ('^', frozenset('nw'))),
+    (r'guaranteed', None),           # no anchor: the engine skips ahead on its own
+    (r'\b\w+ment\b', None),          # first characters are not a literal set
+    (r'\b(\w)x\1', None),            # backreference
+    (r'\b(?P<word>best)', None),     # named group
+    (r'\b(?:a)?', None),             # can match the empty string
+    (r'(?i)\bbest', None),           # inline global flags
+])
+def test_fusion_lanes(pattern, lane):
+    assert fusion_lane(pattern, re.I) == lane
+
+
+@pytest.mark.parametrize('flags', [re.I, re.I | re.M])
+def test_scan_matches_separate_finditer(flags, gold_texts):
+    fused = FusedPatterns(GROUPS, flags)
+    assert fused.get_stats()['lanes'] == 2 and fused.passes < 10
+
+    rng = random.Random(7)
+    texts = gold_texts + [
+        ' '.join(rng.choice(WORDS + ['x', '\n', 'a\n\nb']) for _ in range(rng.randint(1, 80)))
+        for _ in range(300)
+    ]
+    for text in texts:
+        assert fused.scan(text) == _separate(GROUPS, flags, text)
+
+
+def test_overlapping_candidates_are_dropped_like_finditer():
+    groups = {'claims': [r'\bguaranteed\b.*\d+%', r'\bguaranteed\b', r'\b[579]%']}
+    fused = FusedPatterns(groups, re.I)
+    text = 'Guaranteed 5% and 7%, guaranteed 9%'
+
+    assert fused.get_stats()['fused'] == 3
+    assert fused.scan(text) == {'claims': [[(0, 35)], [(0, 10), (22, 32)], [(11, 13), (18, 20), (33, 35)]]}
+    assert fused.scan(text) == _separate(groups, re.I, text)
+
+
+def test_registry_fuse_is_planned_once_and_scans_through_the_memo(gold_texts):
+    registry = PatternRegistry(block_memo=BlockMatchMemo())
+    text = '\n\n'.join(gold_texts)
+    fused = registry.fuse(GROUPS, re.I)
+
+    assert registry.fuse({name: list(patterns) for name, patterns in GROUPS.items()}, re.I) is fused
+    assert fused.scan(text) == _separate(GROUPS, re.I, text)
+    assert registry.get_stats()['fused_sets'] == 1
+    assert registry.get_stats()['block_memo']['cold_documents'] == 1
+
+
+@pytest.mark.parametrize('gate_class, pattern', [
+    (FairClearNotMisleadingGate, r'\bguaranteed\b.*\d+%'),
+    (VulnerabilityIdentificationGate, r'\b(?:debt|indebted|arrears|struggling|difficulty|hardship)\b'),
+])
+def test_fused_gate_patterns_stay_visible_to_introspection(gate_class, pattern):
+    gate = gate_class()
+    assert (pattern, re.I) in extract_patterns(gate)
+
+    [(groups, flags)] = extract_fused_groups(gate)
+    assert flags == re.I and any(pattern in patterns for patterns in groups.values())
@@ -0,0 +1,78 @@
+import re
+from contextlib import nullcontext
+
+from core.async_engine import AsyncLOKIEngine
+from core.block_memo import BlockMatchMemo
+from core.document_context import DocumentContext
+from core.pattern_registry import PatternRegistry, pattern_registry
+
+MODULES = ['hr_scottish', 'gdpr_uk', 'nda_uk', 'tax_uk', 'fca_uk', 'uk_employment', 'scottish_law']
+
+SHARED = r'\b(?:guaranteed|risk-free)\b'
+GROUPED = r'(\d+)%\s+(return|yield)'
+ONLY_A = r'\bbest\b'
+TEXT = 'Best guaranteed 5% return. Guaranteed 7% yield, risk-free and the best.'
+
+
+def _registry():
+    registry = PatternRegistry(block_memo=BlockMatchMemo())
+    for gate_id, patterns in (('a', (SHARED, GROUPED, ONLY_A)), ('b', (SHARED, GROUPED))):
+        registry._gate_handles[f'm.{gate_id}'] = [registry.register(p, re.I) for p in patterns]
+    return registry
+
+
+def test_plan_counts_unique_and_shared_patterns():
+    plan = _registry().plan(['m.a', 'm.b'])
+    stats = plan.get_stats()
+    counts = (stats['gates'], stats['unique_patterns'], stats['pattern_references'], stats['shared_patterns'])
+    assert counts == (2, 3, 5, 2)
+
+
+def test_shared_patterns_run_once_and_match_plain_re():
+    registry = _registry()
+    ctx = DocumentContext(TEXT)
+    plan = registry.plan(['m.a', 'm.b'])
+
+    with registry.bind(ctx, plan):
+        for _ in range(2):
+            assert registry.search(SHARED, ctx.text, re.I).span() == re.search(SHARED, TEXT, re.I).span()
+            assert [m.span() for m in registry.finditer(SHARED, ctx.text, re.I)] == \
+                [m.span() for m in re.finditer(SHARED, TEXT, re.I)]
+            assert registry.findall(GROUPED, ctx.text, re.I) == re.findall(GROUPED, TEXT, re.I)
+            assert registry.findall(ONLY_A, ctx.text, re.I) == re.findall(ONLY_A, TEXT, re.I)
+        # A different string with equal content is not bound
+        assert registry.search(SHARED, ''.join(TEXT), re.I) is not None
+
+    stats = plan.get_stats()
+    assert stats['shared_runs'] == 2
+    assert stats['searches_avoided'] == 4
+    assert len(ctx.matches) == 2
+    assert not registry._bound
+
+
+def test_unbound_registry_searches_directly():
+    registry = _registry()
+    ctx = DocumentContext(TEXT)
+    plan = registry.plan(['m.a', 'm.b'])
+    assert registry.findall(SHARED, ctx.text, re.I) == re.findall(SHARED, TEXT, re.I)
+    assert plan.get_stats()['searches'] == 0 and not ctx.matches
+
+
+def test_engine_reports_plan_and_keeps_verdicts(monkeypatch, gold_texts, comparable):
+    engine = AsyncLOKIEngine(execution_mode='serial')
+    for module in MODULES:
+        engine.load_module(module)
+
+    avoided = 0
+    shared = []
+    for text in gold_texts:
+        result = engine.check_document(text, 'contract', None)
+        plan = result['pattern_plan']
+        avoided += plan['searches_avoided']
+        assert plan['unique_patterns'] <= plan['pattern_references']
+        assert plan['shared_runs'] <= plan['shared_patterns']
+        shared.append(comparable(result))
+    assert avoided > 0
+
+    monkeypatch.setattr(pattern_registry, 'bind', lambda ctx, plan: nullcontext(plan))
+    assert [comparable(engine.check_document(text, 'contract', None)) for text in gold_texts] == shared
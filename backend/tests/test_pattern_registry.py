@@ -0,0 +1,84 @@
+import re
+import threading
+
+from core.gate_introspection import extract_patterns
+from core.pattern_registry import PatternRegistry
+import modules.fca_uk.gates.fair_clear_not_misleading as fair_clear_module
+from modules.fca_uk.gates.fair_clear_not_misleading import FairClearNotMisleadingGate
+
+
+def test_register_deduplicates_and_returns_stable_handles():
+    registry = PatternRegistry()
+    first = registry.register(r'\bguaranteed\b', re.IGNORECASE)
+    second = registry.register(r'\bguaranteed\b', re.IGNORECASE)
+    other = registry.register(r'\bguaranteed\b')
+
+    assert first == second
+    assert first != other
+    assert registry.get(first).flags & re.IGNORECASE
+    stats = registry.get_stats()
+    assert stats['compiles'] == 2
+    assert stats['deduplicated'] == 1
+
+
+def test_helpers_match_re_module():
+    registry = PatternRegistry()
+    text = 'Capital at risk. Returns are NOT guaranteed; capital at risk.'
+    pattern = r'capital\s+at\s+risk'
+
+    assert registry.search(pattern, text, re.I).span() == re.search(pattern, text, re.I).span()
+    assert registry.findall(pattern, text, re.I) == re.findall(pattern, text, re.I)
+    assert [m.span() for m in registry.finditer(pattern, text, re.I)] == \
+        [m.span() for m in re.finditer(pattern, text, re.I)]
+    assert registry.sub(pattern, 'X', text, flags=re.I) == re.sub(pattern, 'X', text, flags=re.I)
+    assert registry.split(r'[.;]', text) == re.split(r'[.;]', text)
+    assert registry.match('Capital', text) is not None
+    assert registry.fullmatch('Capital', text) is None
+
+    stats = registry.get_stats()
+    assert stats['misses'] == 3  # pattern/re.I, pattern/0 via split, 'Capital'
+    assert stats['hits'] == stats['lookups'] - 3
+
+
+def test_hits_are_counted_per_thread_without_the_lock():
+    registry = PatternRegistry()
+    registry.register('risk', re.I)
+
+    def lookups():
+        for _ in range(1000):
+            registry.compile('risk', re.I)
+
+    lookups()
+    # A hit from a thread that already counted one never waits for the lock
+    with registry._lock:
+        lookups()
+    threads = [threading.Thread(target=lookups) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.get_stats()['hits'] == 6000
+
+
+def test_compiled_patterns_pass_through():
+    registry = PatternRegistry()
+    compiled = re.compile('risk')
+    assert registry.compile(compiled) is compiled
+    assert len(registry) == 0
+
+
+def test_gate_literals_are_precompiled(monkeypatch):
+    gate = FairClearNotMisleadingGate()
+    patterns = extract_patterns(gate)
+    assert patterns
+    assert all(isinstance(p, str) and isinstance(f, int) for p, f in patterns)
+
+    registry = PatternRegistry()
+    handles = registry.register_gate('fca_uk', 'fair_clear_not_misleading', gate)
+    assert registry.gate_handles('fca_uk.fair_clear_not_misleading') == handles
+
+    # Route the gate's lookups through this registry: nothing should compile lazily
+    before = registry.get_stats()['compiles']
+    monkeypatch.setattr(fair_clear_module, 'pattern_registry', registry)
+    gate.check('Guaranteed returns with no risk! Invest now.', 'promotion')
+    assert registry.get_stats()['compiles'] == before
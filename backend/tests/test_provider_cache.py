@@ -0,0 +1,115 @@
+import pytest
+
+from core import interceptor
+from core.cache import ProviderResponseCache
+from core.interceptor import AnthropicInterceptor
+
+
+class _Engine:
+    modules = {'gdpr_uk': None}
+
+    def __init__(self, risk='LOW', partial=False, validation=None):
+        self.calls = 0
+        self.risk = risk
+        self.partial = partial
+        self.validation = validation
+
+    def check_document(self, text, document_type, active_modules, **kwargs):
+        self.calls += 1
+        if self.validation is not None:
+            return self.validation
+        return {'overall_risk': self.risk, 'partial': self.partial, 'modules': {}}
+
+
+class _Response:
+    status_code = 200
+
+    def json(self):
+        return {'content': [{'type': 'text', 'text': 'We process personal data lawfully.'}]}
+
+
+@pytest.fixture
+def provider_calls(monkeypatch):
+    calls = []
+
+    def post(url, headers, json, timeout):
+        calls.append(json)
+        return _Response()
+
+    monkeypatch.setattr(interceptor.requests, 'post', post)
+    return calls
+
+
+def _request(**overrides):
+    return dict({'model': 'claude', 'max_tokens': 64, 'temperature': 0,
+                 'messages': [{'role': 'user', 'content': 'Hi'}]}, **overrides)
+
+
+def test_keys_cover_determinism_payload_and_api_key():
+    cache = ProviderResponseCache()
+    key = cache.make_key('anthropic', 'sk-a', _request())
+
+    assert key == cache.make_key('anthropic', 'sk-a', dict(reversed(list(_request().items()))))
+    assert key != cache.make_key('anthropic', 'sk-b', _request())
+    assert key != cache.make_key('anthropic', 'sk-a', _request(), scope=['tax_uk'])
+    assert 'sk-a' not in key
+    assert cache.make_key('anthropic', 'sk-a', _request(temperature=0.7)) is None
+    assert cache.make_key('anthropic', 'sk-a', {'model': 'claude'}) is None
+    assert cache.get_stats()['skipped_nondeterministic'] == 2
+
+
+def test_entries_expire(monkeypatch):
+    cache = ProviderResponseCache(ttl_seconds=10)
+    now = [1000.0]
+    monkeypatch.setattr('core.cache.time.time', lambda: now[0])
+    cache.set('k', {'response': 1})
+    assert cache.get('k') == {'response': 1}
+    now[0] += 10
+    assert cache.get('k') is None
+
+
+def test_identical_deterministic_requests_reuse_response_and_validation(provider_calls):
+    engine = _Engine()
+    proxy = AnthropicInterceptor(engine, response_cache=ProviderResponseCache())
+
+    first = proxy.intercept(_request(), 'sk-a')
+    second = proxy.intercept(_request(), 'sk-a')
+    assert len(provider_calls) == 1 and engine.calls == 1
+    assert second.pop('loki_cached') is True
+    assert second == first
+
+    proxy.intercept(_request(), 'sk-b')
+    proxy.intercept(_request(temperature=1), 'sk-a')
+    proxy.intercept(_request(temperature=1), 'sk-a')
+    assert len(provider_calls) == 4
+
+
+def test_partial_validations_are_not_cached(provider_calls):
+    proxy = AnthropicInterceptor(_Engine(partial=True), response_cache=ProviderResponseCache())
+
+    proxy.intercept_and_validate(_request(), 'sk-a')
+    assert 'loki_cached' not in proxy.intercept_and_validate(_request(), 'sk-a')
+    assert len(provider_calls) == 2
+
+
+@pytest.mark.parametrize('validation', [
+    {'error': 'Engine error', 'detail': 'boom'},
+    {'overall_risk': 'LOW', 'modules': {'gdpr_uk': {'error': 'Module execution failed'}}},
+    {'overall_risk': 'LOW', 'modules': {'gdpr_uk': {'gates': {
+        'consent': {'status': 'PASS'}, 'lawful_basis': {'status': 'ERROR', 'message': 'TimeoutError'},
+    }}}},
+])
+def test_failed_validations_are_not_cached(provider_calls, validation):
+    proxy = AnthropicInterceptor(_Engine(validation=validation), response_cache=ProviderResponseCache())
+
+    proxy.intercept(_request(), 'sk-a')
+    assert 'loki_cached' not in proxy.intercept(_request(), 'sk-a')
+    assert len(provider_calls) == 2
+
+
+def test_blocked_verdicts_are_cached(provider_calls):
+    proxy = AnthropicInterceptor(_Engine(risk='CRITICAL'), response_cache=ProviderResponseCache())
+
+    assert proxy.intercept(_request(), 'sk-a')['blocked'] is True
+    assert proxy.intercept(_request(), 'sk-a')['loki_cached'] is True
+    assert len(provider_calls) == 1
@@ -0,0 +1,161 @@
+import ast
+import inspect
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from core.async_engine import AsyncLOKIEngine
+from core.document_context import DocumentContext
+from core.gate_introspection import extract_patterns
+from core.pattern_registry import PatternRegistry
+from core.proximity import Proximity, split_chain
+from modules.nda_uk.gates.protected_crime_reporting import ProtectedCrimeReportingGate
+
+# Modules whose gates answer ``A.*B`` checks through proximity
+MODULES = ['gdpr_uk', 'nda_uk', 'uk_employment', 'fca_advanced']
+
+TEXT = ('The employee shall not disclose any information.\n'
+        'Nothing prevents a report to the police. Holiday is 28 days.')
+
+
+@pytest.mark.parametrize('pattern,flags,chains', [
+    (r'not.*disclose.*to.*(?:police|regulator)', re.I, [['not', 'disclose', 'to', '(?:police|regulator)']]),
+    (r'agree.*?terms|consent', 0, [['agree', 'terms'], ['consent']]),
+    (r'[.*]x.*(a|b)', 0, [['[.*]x', '(a|b)']]),
+    (r'y.*\.*x', 0, [['y', r'\.*x']]),
+    (r'.*annual leave', 0, [['annual leave']]),
+])
+def test_split_chain(pattern, flags, chains):
+    assert split_chain(pattern, flags) == chains
+
+
+@pytest.mark.parametrize('pattern,flags', [
+    (r'annual\s+leave', 0),                     # no gap
+    (r'(?:a.*b)', 0),                           # gap not at top level
+    (r'a.*+b', 0),                              # possessive gap
+    (r'(?i)a.*b', 0),                           # inline flags
+    (r'a .* b', re.VERBOSE),
+    (r'(\w+).*\1', 0),                          # backreference across terms
+    (r'between.*(?:\(.*\)|limited)', 0),        # a term with its own open wildcard
+    (r'\d+.*\d', 0),                            # variable-length term before the last
+    (r'hours?.*s', 0),
+    (r'(?:notice)?.*period', 0),                # term matching the empty string
+    (r'x\s.*B', 0),                             # term before the last spanning a line break
+])
+def test_split_chain_rejects_unsafe_patterns(pattern, flags):
+    assert split_chain(pattern, flags) is None
+
+
+@pytest.mark.parametrize('pattern,flags', [
+    (r'not.*disclose.*police', re.I),
+    (r'disclose.*police', re.I),
+    (r'disclose.*police', re.I | re.S),
+    (r'police.*not', re.I),
+    (r'report.*police|holiday.*weeks', re.I),
+    (r'(\d+).*days', 0),
+    (r'days.*\d', 0),
+    (r'is.*is', 0),
+])
+def test_occurs_matches_re_search(pattern, flags):
+    assert Proximity(PatternRegistry()).occurs(pattern, TEXT, flags) == bool(re.search(pattern, TEXT, flags))
+
+
+@pytest.mark.parametrize('pattern,text', [
+    (r'\d+.*\d', '12'),
+    (r'xa.*aa', 'xaaa'),       # the needed 'aa' starts inside the first one
+    (r'hours?.*s', 'hours'),
+    (r'A.*x\s.*B', 'A x x\nB'),  # only the later 'x\n' leaves 'B' on its line
+])
+def test_occurs_matches_re_search_where_terms_could_backtrack_or_overlap(pattern, text):
+    assert re.search(pattern, text)
+    assert Proximity(PatternRegistry()).occurs(pattern, text)
+
+
+def test_follows_bounds_gaps_by_characters_and_sentences():
+    proximity = Proximity(PatternRegistry())
+    text = 'Nothing prevents a report to the police. The regulator may be told.'
+
+    assert proximity.follows(['report', 'police'], text)
+    assert proximity.follows(['report', 'police'], text, within=8)
+    assert not proximity.follows(['report', 'police'], text, within=7)
+    assert proximity.follows(['report', 'police'], text, sentences=0)
+    assert not proximity.follows(['report', 'regulator'], text, sentences=0)
+    assert proximity.follows(['report', 'regulator'], text, sentences=1)
+    assert proximity.near('police', 'report', text, within=8)
+    assert not proximity.follows(['police', 'report'], text)
+
+
+def test_around_checks_window_either_side():
+    proximity = Proximity(PatternRegistry())
+    text = 'voluntary ' + 'x' * 40 + ' 60 hours per week ' + 'y' * 40 + ' opt-out'
+    start = text.index('60')
+    end = start + len('60 hours per week')
+
+    assert proximity.around('voluntary', text, start, end, 51)
+    assert not proximity.around('voluntary', text, start, end, 50)
+    assert proximity.around('opt-out', text, start, end, 49)
+    assert not proximity.around('opt-out', text, start, end, 48)
+
+
+def test_position_lists_are_shared_through_bound_context():
+    registry = PatternRegistry()
+    proximity = Proximity(registry)
+    ctx = DocumentContext(TEXT)
+
+    with registry.bind(ctx, registry.plan([])):
+        assert proximity.occurs(r'not.*disclose', ctx.text)
+        cached = dict(ctx.matches)
+        assert proximity.occurs(r'not.*disclose.*information', ctx.text)
+    assert any(key[:2] == ('proximity', 'not') for key in cached)
+    assert len(ctx.matches) > len(cached)
+
+
+def test_introspection_returns_chain_terms_for_occurs():
+    patterns = extract_patterns(ProtectedCrimeReportingGate())
+    assert ('disclose', re.I) in patterns
+    assert (r'not.*disclose.*to.*(?:police|law enforcement|authorities|regulatory)', re.I) not in patterns
+
+
+def test_occurs_agrees_with_re_on_gold_fixtures(gold_texts):
+    texts = gold_texts + [text.replace('\n', ' ') for text in gold_texts]
+
+    # Every string literal of the loaded gates that splits into a chain
+    engine = AsyncLOKIEngine(execution_mode='serial')
+    for module in MODULES:
+        engine.load_module(module)
+    sources = {inspect.getsourcefile(type(gate_obj)) for module_obj in engine.modules.values()
+               for gate_obj in module_obj.gates.values()}
+    engine.shutdown()
+    chains = set()
+    for path in sources:
+        for node in ast.walk(ast.parse(Path(path).read_text(encoding='utf-8'))):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                for flags in (0, re.I):
+                    if split_chain(node.value, flags):
+                        chains.add((node.value, flags))
+    assert len(chains) > 100
+
+    proximity = Proximity(PatternRegistry())
+    mismatches = [(pattern, flags) for pattern, flags in sorted(chains) for text in texts
+                  if proximity.occurs(pattern, text, flags) != bool(re.search(pattern, text, flags))]
+    assert not mismatches
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_chain_cost_grows_linearly_on_adversarial_line():
+    proximity = Proximity(PatternRegistry())
+    pattern = r'not.*disclose.*to.*police'
+
+    def seconds(size):
+        text = ('not disclose to ' * (size // 16 + 1))[:size]
+        start = time.perf_counter()
+        assert not proximity.occurs(pattern, text, re.I)
+        return time.perf_counter() - start
+
+    small, large = seconds(64 * 1024), seconds(1024 * 1024)
+    # 16x the input: quadratic backtracking would take ~256x as long
+    assert large < small * 40
+    assert large < 1.0
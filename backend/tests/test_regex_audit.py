@@ -0,0 +1,106 @@
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from analyzers import bias_detector, hallucination_heuristic, pii_scanner
+from core.async_engine import AsyncLOKIEngine
+from core.gate_introspection import extract_module_patterns
+from core.regex_audit import RegexAuditor, adversarial_inputs, collect_patterns, witness
+
+BASELINE_PATH = Path(__file__).with_name('redos_baseline.json')
+MODULES = [
+    'hr_scottish', 'gdpr_uk', 'nda_uk', 'tax_uk', 'fca_uk',
+    'uk_employment', 'gdpr_advanced', 'fca_advanced', 'scottish_law', 'industry_specific',
+]
+ANALYZERS = [pii_scanner, bias_detector, hallucination_heuristic]
+# Worst-case time any pattern may take on a 1 MB adversarial input
+BUDGET_SECONDS = 1.0
+BUDGET_SIZE = 1024 * 1024
+# Patterns are timed up to this size and their growth curve extrapolated to BUDGET_SIZE
+AUDIT_SIZE = 64 * 1024
+# Growth exponent above which a pattern counts as super-linear
+SUPERLINEAR = 1.5
+
+
+def _all_patterns():
+    engine = AsyncLOKIEngine(execution_mode='serial')
+    for module in MODULES:
+        engine.load_module(module)
+    try:
+        return collect_patterns(engine.modules, ANALYZERS)
+    finally:
+        engine.shutdown()
+
+
+def _baseline():
+    return {(entry['pattern'], entry['flags']) for entry in json.loads(BASELINE_PATH.read_text(encoding='utf-8'))}
+
+
+@pytest.mark.parametrize('pattern,flags', [
+    (r'\b(?:guaranteed|risk-free)\b.*(?:return|profit)', re.I),
+    (r'work(?:ing)?\s+hours?.*(\d+)\s+hours?\s+per\s+week', re.I),
+    (r'\b(?:\d[ -]*?){13,16}\b', 0),
+    (r'(?P<word>\w+)\s+(?P=word)', 0),
+    (r'[^\s@]+@[^\s@]+\.[a-z]{2,}', 0),
+])
+def test_witness_matches_its_pattern(pattern, flags):
+    sample = witness(pattern, flags)
+    assert sample
+    assert re.search(pattern, sample, flags)
+
+
+def test_adversarial_inputs_are_single_lines_of_requested_size():
+    inputs = adversarial_inputs(r'guaranteed.*return', re.I, 4096)
+    assert {'repeat', 'truncated', 'half', 'letters', 'digits'} <= set(inputs)
+    assert all(len(text) == 4096 and '\n' not in text for text in inputs.values())
+    # The near-miss input opens a match at every repetition and never completes it
+    assert 'guaranteed' in inputs['truncated'] and not re.search(r'guaranteed.*return', inputs['truncated'])
+
+
+def test_auditor_ranks_quadratic_pattern_above_linear():
+    auditor = RegexAuditor(target_size=256 * 1024, ceiling=0.2)
+    report = auditor.audit({
+        (r'\bguaranteed\b', re.I): ['m.linear'],
+        (r'guaranteed.*return', re.I): ['m.quadratic'],
+    })
+
+    assert [row['sources'] for row in report] == [['m.quadratic'], ['m.linear']]
+    quadratic, linear = report
+    assert quadratic['input'] in ('truncated', 'half')
+    assert quadratic['exponent'] >= 1.5
+    assert quadratic['ms_per_kb'] > 10 * linear['ms_per_kb']
+    assert not linear['projected'] and linear['measured_size'] == 256 * 1024
+
+
+def test_analyzer_module_patterns_are_extracted():
+    patterns = extract_module_patterns(pii_scanner)
+    assert (r"\b(?:\d[ -]*?){13,16}\b", 0) in patterns
+    assert (r"\b\d{3}-\d{2}-\d{4}\b", 0) in patterns
+
+
+def test_baseline_lists_only_patterns_still_in_the_tree():
+    stale = _baseline() - set(_all_patterns())
+    assert not stale, f"Remove rewritten patterns from {BASELINE_PATH.name}: {sorted(stale)}"
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_no_new_pattern_exceeds_budget_on_1mb_input():
+    baseline = _baseline()
+    auditor = RegexAuditor(target_size=AUDIT_SIZE, ceiling=BUDGET_SECONDS)
+    over = []
+    for key, sources in _all_patterns().items():
+        if key in baseline:
+            continue
+        # Short runs give noisy exponents: a pattern must project over budget on every attempt
+        for _ in range(3):
+            row = auditor.measure(*key)
+            projected = row['seconds'] * (BUDGET_SIZE / AUDIT_SIZE) ** row['exponent']
+            if row['exponent'] < SUPERLINEAR or projected <= BUDGET_SECONDS:
+                break
+        else:
+            over.append((round(projected, 2), row['exponent'], row['input'], key[0], sources))
+    assert not over, (f"Patterns projected over {BUDGET_SECONDS}s on 1 MB adversarial input: "
+                      f"{sorted(over, reverse=True)}")
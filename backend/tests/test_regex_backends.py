@@ -0,0 +1,178 @@
+import re
+
+import pytest
+
+from core.async_engine import AsyncLOKIEngine
+from core.pattern_registry import PatternRegistry, pattern_registry
+from core.regex_audit import collect_patterns
+from core.regex_backends import (
+    BACKENDS, BackendPattern, RegexBackend, UnsupportedPattern, _EngineBackend, available_backends,
+    create_backend, portable,
+)
+
+MODULES = ['hr_scottish', 'gdpr_uk', 'nda_uk', 'tax_uk', 'fca_uk', 'uk_employment', 'scottish_law']
+# Backends compared against re (stdlib would only be compared with itself)
+ALTERNATE_ENGINES = ['re2', 'regex']
+
+
+class _Recorder:
+    """Engine stand-in: ``re`` underneath, counting the calls it receives."""
+
+    def __init__(self, compiled):
+        self.compiled = compiled
+        self.calls = 0
+
+    def __getattr__(self, method):
+        def call(*args, **kwargs):
+            self.calls += 1
+            return getattr(self.compiled, method)(*args, **kwargs)
+        return call
+
+
+class _NoLookaroundBackend(_EngineBackend):
+    name = 'no-lookaround'
+    methods = frozenset(('search', 'match', 'fullmatch', 'finditer', 'findall'))
+    bounded = False
+
+    def _engine_compile(self, stdlib, flags):
+        if '(?=' in stdlib.pattern or '(?!' in stdlib.pattern:
+            raise UnsupportedPattern(stdlib.pattern)
+        return _Recorder(stdlib)
+
+
+@pytest.fixture(scope='module')
+def texts(gold_texts):
+    # Joined lines exercise long single-line inputs
+    return gold_texts + [text.replace('\n', ' ') for text in gold_texts]
+
+
+def _require(name):
+    if not BACKENDS[name].available:
+        pytest.skip(f"{name} engine not installed")
+    return create_backend(name)
+
+
+def test_stdlib_is_the_default_backend():
+    registry = PatternRegistry()
+    assert isinstance(registry.compile(r'\bguaranteed\b', re.I), re.Pattern)
+    assert registry.get_stats()['backend'] == {'backend': 'stdlib'}
+    assert 'stdlib' in available_backends()
+    assert create_backend('auto').name in available_backends()
+
+
+def test_create_backend_rejects_unknown_and_missing_engines():
+    with pytest.raises(ValueError):
+        create_backend('pcre')
+    for name, backend in BACKENDS.items():
+        if not backend.available:
+            with pytest.raises(ValueError, match='not installed'):
+                create_backend(name)
+
+
+@pytest.mark.parametrize('text,expected', [
+    ('Plain ASCII, 48 hours.', True),
+    ('£100 — “quoted” – fees', True),
+    ('Café terms', False),
+    ('non breaking space', False),
+    ('vertical\x0btab', False),
+    (b'bytes', False),
+])
+def test_portable_text(text, expected):
+    assert portable(text) is expected
+
+
+def test_unsupported_constructs_fall_back_per_pattern():
+    backend = _NoLookaroundBackend()
+    assert isinstance(backend.compile(r'fee(?=s)'), re.Pattern)
+    compiled = backend.compile(r'\bfees?\b', re.I)
+    assert isinstance(compiled, BackendPattern)
+    assert (compiled.pattern, compiled.groups) == (r'\bfees?\b', 0)
+    assert backend.get_stats() == {'backend': 'no-lookaround', 'engine_patterns': 1, 'fallbacks': 1}
+    with pytest.raises(re.error):
+        backend.compile(r'fee(')
+
+
+def test_text_and_bounds_the_engine_could_misread_go_to_re():
+    compiled = _NoLookaroundBackend().compile(r'\bcafe\b', re.I)
+
+    assert compiled.search('the cafe opens').span() == (4, 8)
+    assert compiled.engine.calls == 1
+    # 'é' is a word character to re: there is no boundary before 'cafe'
+    assert compiled.search('écafe') is None
+    assert compiled.engine.calls == 1
+    # pos/endpos stay on re for engines that keep the outer text as context
+    assert compiled.search('the cafe', 4).span() == (4, 8)
+    assert compiled.engine.calls == 1
+
+    insensitive = _NoLookaroundBackend().compile(r'cafe')
+    assert insensitive.search('écafe').span() == (1, 5)
+    assert insensitive.engine.calls == 1
+
+
+def test_set_backend_recompiles_and_keeps_handles():
+    registry = PatternRegistry()
+    handle = registry.register(r'risk\s+warning', re.I)
+    fused = registry.fuse({'a': [r'risk\s+warning', r'risk\s+free']}, re.I)
+
+    registry.set_backend(_NoLookaroundBackend())
+    assert registry.handle(r'risk\s+warning', re.I) == handle
+    assert isinstance(registry.get(handle), BackendPattern)
+    assert registry.compile(registry.get(handle)) is registry.get(handle)
+    assert registry.search(r'risk\s+warning', 'A Risk  Warning.', re.I).span() == (2, 15)
+    assert registry.fuse({'a': [r'risk\s+warning', r'risk\s+free']}, re.I) is not fused
+    assert registry.get_stats()['backend']['engine_patterns'] >= 1
+
+
+@pytest.mark.parametrize('name', ALTERNATE_ENGINES)
+def test_gate_patterns_match_like_re_on_gold_fixtures(name, texts):
+    backend = _require(name)
+    engine = AsyncLOKIEngine(execution_mode='serial')
+    for module in MODULES:
+        engine.load_module(module)
+    patterns = collect_patterns(engine.modules)
+    engine.shutdown()
+
+    registry = PatternRegistry(backend=backend)
+    mismatches = []
+    for text in texts:
+        for pattern, flags in patterns:
+            expected = [(m.span(), m.groups()) for m in re.finditer(pattern, text, flags)]
+            found = [(m.span(), m.groups()) for m in registry.finditer(pattern, text, flags)]
+            if found != expected:
+                mismatches.append((pattern, flags))
+    assert not sorted(set(mismatches))
+
+
+@pytest.mark.parametrize('name', ALTERNATE_ENGINES)
+def test_engine_results_are_identical_under_each_backend(name, texts, comparable):
+    backend = _require(name)
+    engine = AsyncLOKIEngine(execution_mode='serial')
+    for module in MODULES:
+        engine.load_module(module)
+    saved = pattern_registry.backend
+    try:
+        expected = [comparable(engine.check_document(text, 'contract', None)) for text in texts]
+        pattern_registry.set_backend(backend)
+        assert [comparable(engine.check_document(text, 'contract', None)) for text in texts] == expected
+    finally:
+        pattern_registry.set_backend(saved)
+        engine.shutdown()
+
+
+def test_regex_backend_times_out_catastrophic_backtracking():
+    backend = _require('regex')
+    backend.timeout = 0.05
+    compiled = backend.compile(r'(a+)+$')
+    with pytest.raises(TimeoutError):
+        compiled.search('a' * 40 + 'b')
+
+
+def test_from_config_selects_backend():
+    saved = pattern_registry.backend
+    try:
+        AsyncLOKIEngine.from_config({'LOKI_REGEX_BACKEND': 'stdlib'}).shutdown()
+        assert type(pattern_registry.backend) is RegexBackend
+        with pytest.raises(ValueError):
+            AsyncLOKIEngine.from_config({'LOKI_REGEX_BACKEND': 'pcre'})
+    finally:
+        pattern_registry.set_backend(saved)
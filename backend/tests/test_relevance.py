@@ -0,0 +1,44 @@
+from core.async_engine import AsyncLOKIEngine
+from core.gate_introspection import relevance_keywords
+from core.relevance import KeywordAutomaton, RelevanceScan
+from modules.fca_uk.gates.no_implicit_advice import NoImplicitAdviceGate
+from modules.gdpr_uk.gates.consent import ConsentGate
+from modules.uk_employment.gates.working_time_regulations import WorkingTimeRegulationsGate
+
+
+MODULES = ['hr_scottish', 'gdpr_uk', 'nda_uk', 'tax_uk', 'fca_uk', 'uk_employment', 'scottish_law']
+
+
+def test_automaton_matches_substring_semantics():
+    keywords = ['opt', 'opt-out', 'opt out', 'out', 'rest', 'rest break', 'break', 'vat', 'a']
+    automaton = KeywordAutomaton(keywords)
+    for text in ['you may opt-out of rest breaks', 'private', 'invoice', '', 'optometrist']:
+        assert automaton.scan(text) == {kw for kw in keywords if kw in text}
+
+
+def test_relevance_keywords_are_extracted_from_is_relevant():
+    working_time = relevance_keywords(WorkingTimeRegulationsGate())
+    assert {'working time', 'annual leave', 'opt-out'} <= working_time
+
+    consent = ConsentGate()
+    assert relevance_keywords(consent) == frozenset(consent.relevance_keywords)
+
+    # Regex-based relevance cannot be bounded by keywords: always executed
+    assert relevance_keywords(NoImplicitAdviceGate()) is None
+
+
+def test_prefilter_matches_full_execution_on_gold_fixtures(monkeypatch, gold_fixtures, comparable):
+    engine = AsyncLOKIEngine(max_workers=4)
+    for module_name in MODULES:
+        engine.load_module(module_name)
+
+    skipped = 0
+    for path, text in gold_fixtures:
+        filtered = engine.check_document(text, 'contract', None)
+        skipped += filtered['relevance']['gates_skipped']
+
+        with monkeypatch.context() as patched:
+            patched.setattr(RelevanceScan, 'is_relevant', lambda self, module_id, gate_id: True)
+            full = engine.check_document(text, 'contract', None)
+        assert comparable(filtered, 'relevance') == comparable(full, 'relevance'), path.name
+    assert skipped > 0
@@ -0,0 +1,80 @@
+from core.cache import DeterministicResultCache, result_signature
+from core.corrector import DocumentCorrector
+from core.synthesis import SynthesisEngine
+
+
+def _validation(timestamp):
+    return {
+        'validation': {
+            'modules': {
+                'tax_uk': {
+                    'gates': {
+                        'vat_threshold': {
+                            'status': 'FAIL', 'severity': 'high',
+                            'message': 'Outdated VAT threshold', 'timestamp': timestamp,
+                        },
+                        'hmrc_scam': {'status': 'PASS', 'severity': 'none', 'timestamp': timestamp},
+                    }
+                }
+            }
+        }
+    }
+
+
+def test_signature_ignores_timestamps_and_key_order():
+    assert result_signature({'a': 1, 'timestamp': 'x'}, [1]) == result_signature({'timestamp': 'y', 'a': 1}, [1])
+    assert result_signature({'a': 1}) != result_signature({'a': 2})
+
+
+def test_cache_returns_private_copies_and_evicts_lru():
+    cache = DeterministicResultCache(max_size=2)
+    cache.set('a', {'items': [1]})
+    cache.get('a')['items'].append(2)
+    assert cache.get('a') == {'items': [1]}
+
+    cache.set('b', {})
+    cache.set('c', {})
+    assert cache.get('a') is None
+    assert cache.get_stats() == {'size': 2, 'max_size': 2, 'hits': 2, 'misses': 1, 'hit_rate': 66.67}
+
+
+def test_corrections_are_served_from_cache():
+    corrector = DocumentCorrector(result_cache=DeterministicResultCache())
+    text = 'Businesses must register for VAT once turnover exceeds £85,000.'
+
+    first = corrector.correct_document(text, _validation('2025-01-01T00:00:00'))
+    # A fresh validation of the same document differs only in timestamps
+    second = corrector.correct_document(text, _validation('2025-01-01T00:05:00'))
+    assert second == first
+    assert corrector.result_cache.get_stats()['hits'] == 1
+
+    corrector.correct_document(text, _validation('x'), advanced_options={'multi_level': True})
+    corrector.correct_document(text + ' ', _validation('x'))
+    assert corrector.result_cache.get_stats()['misses'] == 3
+
+
+class _Engine:
+    modules = {'tax_uk': None}
+
+    def __init__(self):
+        self.calls = 0
+
+    def check_document(self, text, document_type, active_modules):
+        self.calls += 1
+        return {'modules': {}}
+
+
+def test_synthesis_revalidates_only_on_a_miss():
+    engine = _Engine()
+    synthesis = SynthesisEngine(engine, result_cache=DeterministicResultCache())
+    validation = _validation('2025-01-01T00:00:00')['validation']
+
+    first = synthesis.synthesize('Invoice terms.', validation, context={'company_name': 'Acme'})
+    calls = engine.calls
+    assert calls >= 1
+    assert synthesis.synthesize('Invoice terms.', validation, context={'company_name': 'Acme'}) == first
+    assert engine.calls == calls
+
+    synthesis.synthesize('Invoice terms.', validation, context={'company_name': 'Other'})
+    assert engine.calls > calls
+    assert synthesis.result_cache.get_stats()['hits'] == 1
@@ -0,0 +1,462 @@
+import hashlib
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from core import cache as cache_module
+from core import result_store as result_store_module
+from core.cache import ValidationCache
+from core.near_duplicate import NearDuplicateIndex
+from core.result_store import ResultStore
+
+
+def test_key_matches_concatenated_hash_without_building_it():
+    cache = ValidationCache()
+    text = 'Clause ' * 50000 + 'é'
+    expected = hashlib.sha256(f"{text}|contract|gdpr_uk,nda_uk".encode()).hexdigest()
+    assert cache._make_cache_key(text, 'contract', ['nda_uk', 'gdpr_uk']) == expected
+
+
+def test_eviction_is_bounded_by_bytes():
+    cache = ValidationCache(max_size=100, max_bytes=10_000, shards=1)
+    payload = {'spans': ['x' * 1000]}
+    for i in range(30):
+        cache.set(f'doc {i}', 'contract', [], payload)
+
+    stats = cache.get_stats()
+    assert stats['bytes'] <= 10_000
+    assert stats['size'] < 30
+    assert stats['evictions'] == 30 - stats['size']
+    # Least recently used went first
+    assert cache.get('doc 0', 'contract', []) is None
+    assert cache.get('doc 29', 'contract', []) == payload
+
+
+def test_oversized_results_are_not_cached():
+    cache = ValidationCache(max_bytes=1000, shards=1)
+    cache.set('doc', 'contract', [], {'spans': ['x' * 5000]})
+    assert cache.get('doc', 'contract', []) is None
+    assert cache.get_stats()['bytes'] == 0
+
+
+def test_entry_count_and_lru_order():
+    cache = ValidationCache(max_size=2, shards=1)
+    cache.set('a', 't', [], {'n': 'a'})
+    cache.set('b', 't', [], {'n': 'b'})
+    assert cache.get('a', 't', [])  # a becomes most recently used
+    cache.set('c', 't', [], {'n': 'c'})
+    assert cache.get('b', 't', []) is None
+    assert cache.get('a', 't', []) == {'n': 'a'}
+
+
+def test_ttl_expiry_uses_the_heap(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, 'time', lambda: now[0])
+    cache = ValidationCache(ttl_seconds=100, shards=4)
+    for i in range(20):
+        now[0] = 1000.0 + i
+        cache.set(f'doc {i}', 't', [], {'i': i})
+    # Replacing an entry leaves a stale heap item behind that must be ignored
+    now[0] = 1020.0
+    cache.set('doc 0', 't', [], {'i': 0})
+
+    now[0] = 1109.5
+    assert cache.cleanup_expired() == 9
+    assert cache.get('doc 0', 't', []) == {'i': 0}
+    assert cache.get('doc 1', 't', []) is None
+    assert cache.get('doc 19', 't', []) == {'i': 19}
+    assert cache.get_stats()['size'] == 11
+
+
+def test_concurrent_access_keeps_accounting_consistent():
+    cache = ValidationCache(max_size=64, max_bytes=64 * 200, shards=8)
+
+    def worker(seed):
+        for i in range(500):
+            key = f'doc {(seed * 7 + i) % 150}'
+            if cache.get(key, 't', []) is None:
+                cache.set(key, 't', [], {'v': key})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.get_stats()
+    assert stats['hits'] + stats['misses'] == 8 * 500
+    assert stats['size'] <= 64
+    assert stats['bytes'] == sum(size for shard in cache.backend._shards for _, _, size in shard.entries.values())
+
+
+def test_entries_are_encoded_once_and_never_shared():
+    cache = ValidationCache(shards=1)
+    result = {'overall_risk': 'HIGH', 'modules': {'m': {'gates': {}}}}
+    entry = cache.set('doc', 't', [], result)
+    assert entry.risk == 'HIGH'
+    assert cache.get_entry('doc', 't', []) is entry
+
+    copy = cache.get('doc', 't', [])
+    copy['modules']['m']['gates']['x'] = 'mutated'
+    result['overall_risk'] = 'LOW'
+    assert cache.get('doc', 't', []) == {'overall_risk': 'HIGH', 'modules': {'m': {'gates': {}}}}
+
+
+def test_large_bodies_are_compressed():
+    cache = ValidationCache(shards=1, compress_threshold=1024)
+    result = {'overall_risk': 'LOW', 'spans': ['repeated span text'] * 500}
+    entry = cache.set('doc', 't', [], result)
+    assert entry.gzipped
+    assert len(entry.body) < len(entry.json_bytes()) / 10
+    assert cache.get('doc', 't', []) == result
+    assert not cache.set('small', 't', [], {'overall_risk': 'LOW'}).gzipped
+
+
+def _sqlite_cache(path, **kwargs):
+    backend = cache_module.SQLiteCacheBackend(path, max_size=kwargs.pop('max_size', 1000),
+                                              max_bytes=kwargs.pop('max_bytes', 1 << 20))
+    return ValidationCache(backend=backend, **kwargs)
+
+
+def test_sqlite_backend_is_shared_between_workers(tmp_path):
+    first = _sqlite_cache(tmp_path / 'cache.db')
+    second = _sqlite_cache(tmp_path / 'cache.db')
+
+    entry = first.set('doc', 'contract', ['gdpr_uk'], {'overall_risk': 'HIGH'})
+    assert second.get_entry('doc', 'contract', ['gdpr_uk']) == entry
+    assert second.get('other', 'contract', []) is None
+
+    # Counters live in the database, so once a worker's buffered reads are
+    # written every worker reports the same totals
+    second.backend.flush()
+    for cache in (first, second):
+        stats = cache.get_stats()
+        assert stats['backend'] == 'sqlite'
+        assert (stats['size'], stats['hits'], stats['misses']) == (1, 1, 1)
+
+    second.clear()
+    assert first.get('doc', 'contract', ['gdpr_uk']) is None
+
+
+def test_sqlite_reads_take_no_write_lock(tmp_path):
+    cache = _sqlite_cache(tmp_path / 'cache.db')
+    cache.set('doc', 'contract', [], {'overall_risk': 'LOW'})
+
+    # Another worker holding the write lock does not delay hits or misses
+    writer = sqlite3.connect(str(tmp_path / 'cache.db'), isolation_level=None)
+    writer.execute('BEGIN IMMEDIATE')
+    try:
+        start = time.monotonic()
+        for _ in range(10):
+            assert cache.get('doc', 'contract', []) == {'overall_risk': 'LOW'}
+            assert cache.get('other', 'contract', []) is None
+        assert time.monotonic() - start < 1.0
+    finally:
+        writer.execute('ROLLBACK')
+        writer.close()
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (10, 10)
+
+
+def test_sqlite_reads_are_written_in_batches(tmp_path):
+    backend = cache_module.SQLiteCacheBackend(tmp_path / 'cache.db', access_batch=3, access_interval=60)
+    cache = ValidationCache(backend=backend)
+    peer = cache_module.SQLiteCacheBackend(tmp_path / 'cache.db')
+    cache.set('doc', 'contract', [], {'overall_risk': 'LOW'})
+
+    cache.get('doc', 'contract', [])
+    cache.get('doc', 'contract', [])
+    assert peer.stats()['hits'] == 0
+    cache.get('doc', 'contract', [])
+    assert peer.stats()['hits'] == 3
+
+
+def test_sqlite_clear_releases_leases(tmp_path):
+    first = _sqlite_cache(tmp_path / 'cache.db')
+    second = _sqlite_cache(tmp_path / 'cache.db')
+    assert first.backend.acquire_lease('key', 60)
+    assert not second.backend.acquire_lease('key', 60)
+
+    first.clear()
+    assert second.backend.acquire_lease('key', 60)
+
+
+def test_sqlite_backend_evicts_and_expires(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(cache_module.time, 'time', lambda: clock[0])
+    cache = _sqlite_cache(tmp_path / 'cache.db', max_size=3, ttl_seconds=100)
+
+    for i in range(4):
+        clock[0] += 1
+        cache.set(f'doc {i}', 'contract', [], {'i': i})
+    stats = cache.get_stats()
+    assert (stats['size'], stats['evictions']) == (3, 1)
+    assert cache.get('doc 0', 'contract', []) is None
+
+    clock[0] += 100
+    assert cache.get('doc 3', 'contract', []) is None
+    assert cache.cleanup_expired() == 2
+    assert cache.get_stats()['size'] == 0
+
+
+def test_get_or_compute_runs_once_across_workers(tmp_path):
+    workers = [_sqlite_cache(tmp_path / 'cache.db') for _ in range(4)]
+    calls = []
+    started = threading.Event()
+    outcomes = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        # Hold the lease long enough for every other worker to miss
+        threading.Event().wait(0.3)
+        return {'overall_risk': 'LOW'}
+
+    def validate(cache):
+        entry, result = cache.get_or_compute('doc', 'contract', [], compute, poll_interval=0.01)
+        outcomes.append((entry.validation(), result is not None))
+
+    threads = [threading.Thread(target=validate, args=(workers[0],))]
+    threads[0].start()
+    started.wait(5)
+    threads += [threading.Thread(target=validate, args=(cache,)) for cache in workers[1:]]
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(calls) == 1
+    assert sorted(computed for _, computed in outcomes) == [False, False, False, True]
+    assert all(validation == {'overall_risk': 'LOW'} for validation, _ in outcomes)
+    assert workers[0].get_stats()['lease_waits'] == 3
+
+
+def test_get_or_compute_does_not_store_rejected_results(tmp_path):
+    for cache in (ValidationCache(), _sqlite_cache(tmp_path / 'cache.db')):
+        entry, result = cache.get_or_compute('doc', 'contract', [], lambda: {'partial': True},
+                                             cacheable=lambda v: not v.get('partial'))
+        assert entry is None and result == {'partial': True}
+        assert cache.get_stats()['size'] == 0
+        # The lease was released, so the next request computes again
+        entry, result = cache.get_or_compute('doc', 'contract', [], lambda: {'partial': False})
+        assert result == {'partial': False} and entry.validation() == result
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_concurrent_identical_requests_are_coalesced():
+    cache = ValidationCache()
+    release = threading.Event()
+    calls = []
+    outcomes = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return {'overall_risk': 'LOW', 'partial': len(calls) > 1}
+
+    def validate():
+        outcomes.append(cache.get_or_compute('doc', 'contract', [], compute))
+
+    threads = [threading.Thread(target=validate) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: cache.get_stats()['coalesced'] == 4)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    entries = {entry for entry, _ in outcomes}
+    assert len(entries) == 1
+    assert [result is None for _, result in outcomes].count(True) == 4
+
+    # Later requests are ordinary cache hits
+    assert cache.get_or_compute('doc', 'contract', [], compute) == (entries.pop(), None)
+    assert cache.get_stats()['coalesced'] == 4
+
+
+def test_coalesced_requests_share_uncacheable_results_and_errors():
+    cache = ValidationCache()
+    release = threading.Event()
+    outcomes = []
+
+    def run(compute, **kwargs):
+        try:
+            outcomes.append(cache.get_or_compute('doc', 'contract', [], compute, **kwargs))
+        except Exception as exc:
+            outcomes.append(exc)
+
+    def partial():
+        release.wait(5)
+        return {'partial': True}
+
+    def failing():
+        release.wait(5)
+        raise RuntimeError('engine down')
+
+    for compute, kwargs in ((partial, {'cacheable': lambda v: not v['partial']}), (failing, {})):
+        release.clear()
+        outcomes.clear()
+        before = cache.get_stats()['coalesced']
+        threads = [threading.Thread(target=run, args=(compute,), kwargs=kwargs) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: cache.get_stats()['coalesced'] == before + 2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        if compute is partial:
+            assert [entry for entry, _ in outcomes] == [None] * 3
+            results = [result for _, result in outcomes]
+            assert results == [{'partial': True}] * 3
+            # Every request gets its own copy
+            assert len({id(result) for result in results}) == 3
+        else:
+            assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+        assert cache.get_stats()['size'] == 0
+
+
+POLICY = (
+    "Personal data is processed only for the purposes set out in this notice. "
+    "Data subjects may request access, rectification or erasure at any time. "
+    "Records are retained for six years and then securely destroyed. "
+) * 20
+
+
+def test_near_duplicate_reuses_verdict_and_flags_it():
+    cache = ValidationCache(near_duplicates=NearDuplicateIndex(threshold=0.9))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'overall_risk': 'LOW', 'n': len(calls)}
+
+    entry, result = cache.get_or_compute(POLICY, 'policy', ['gdpr_uk'], compute)
+    assert result == {'overall_risk': 'LOW', 'n': 1}
+
+    # Casing, punctuation and whitespace changes miss the exact key only
+    variant = POLICY.upper().replace('. ', ';  ')
+    entry, result = cache.get_or_compute(variant, 'policy', ['gdpr_uk'], compute)
+    assert entry is None and len(calls) == 1
+    assert result['n'] == 1
+    assert result['near_duplicate']['source_key'] == cache._make_cache_key(POLICY, 'policy', ['gdpr_uk'])
+    assert result['near_duplicate']['similarity'] >= 0.9
+    # Reused verdicts are never stored under the new key
+    assert cache.get(variant, 'policy', ['gdpr_uk']) is None
+
+    # Other scopes and different documents are validated
+    cache.get_or_compute(variant, 'contract', ['gdpr_uk'], compute)
+    cache.get_or_compute('An unrelated employment contract. ' * 40, 'policy', ['gdpr_uk'], compute)
+    assert len(calls) == 3
+
+    stats = cache.get_stats()
+    assert stats['near_duplicates'] == 1
+    assert stats['near_duplicate_index']['documents'] == 3
+
+
+def test_near_duplicate_describes_the_requested_document():
+    cache = ValidationCache(near_duplicates=NearDuplicateIndex(threshold=0.9))
+    source = {
+        'document_hash': hashlib.sha256(POLICY.encode()).hexdigest(),
+        'universal': {'pii': {'spans': [{'start': 3, 'end': 9, 'type': 'email'}]}},
+        'analyzers': {'pii': {'entities': [{'type': 'email', 'value': 'a@b.com', 'start': 3, 'end': 9}]}},
+        'modules': {'gdpr_uk': {'gates': {'consent': {'status': 'WARNING', 'spans': [{'start': 0, 'end': 4}]}}}},
+    }
+    cache.get_or_compute(POLICY, 'policy', ['gdpr_uk'], lambda: source)
+
+    variant = POLICY.upper()
+    _, result = cache.get_or_compute(variant, 'policy', ['gdpr_uk'], lambda: pytest.fail('recomputed'))
+    assert result['document_hash'] == hashlib.sha256(variant.encode()).hexdigest()
+    assert result['near_duplicate']['source_document_hash'] == source['document_hash']
+    assert result['near_duplicate']['offsets_dropped'] is True
+    # Offsets point into the source document, so none survive the reuse
+    assert result['universal']['pii']['spans'] == []
+    assert result['analyzers']['pii']['entities'] == [{'type': 'email', 'value': 'a@b.com'}]
+    assert result['modules']['gdpr_uk']['gates']['consent'] == {'status': 'WARNING', 'spans': []}
+    # The cached source result is untouched
+    assert cache.get(POLICY, 'policy', ['gdpr_uk']) == source
+
+
+def test_near_duplicate_of_evicted_entry_is_recomputed():
+    cache = ValidationCache(max_size=1, shards=1, near_duplicates=NearDuplicateIndex(threshold=0.9))
+    cache.set(POLICY, 'policy', [], {'overall_risk': 'LOW'})
+    cache.set('Something else entirely. ' * 30, 'policy', [], {'overall_risk': 'HIGH'})
+
+    assert cache.get_near_duplicate(POLICY + ' ', 'policy', []) is None
+    assert cache.near_duplicates.get_stats()['documents'] == 1
+
+
+def test_near_duplicate_reuse_is_opt_in():
+    assert ValidationCache.from_config({}).near_duplicates is None
+    cache = ValidationCache.from_config({'LOKI_NEAR_DUPLICATE_THRESHOLD': '0.97'}, max_size=10)
+    assert cache.near_duplicates.threshold == 0.97
+    assert cache.near_duplicates.max_size == 10
+
+
+def test_result_store_warms_a_new_cache(tmp_path):
+    store = ResultStore(tmp_path / 'results.db', max_entries=3)
+    cache = ValidationCache(result_store=store)
+    for i in range(4):
+        text = f'Document {i}'
+        entry = cache.set(text, 'contract', ['nda_uk'], {'overall_risk': 'LOW', 'i': i})
+        for _ in range(i + 1):
+            cache.persist(text, 'contract', ['nda_uk'], entry)
+    assert store.get_stats()['entries'] == 3  # the least requested document was dropped
+
+    restarted = ValidationCache(result_store=ResultStore(tmp_path / 'results.db'))
+    assert restarted.preload(limit=2) == 2
+    assert restarted.get('Document 3', 'contract', ['nda_uk'])['i'] == 3
+    assert restarted.get('Document 2', 'contract', ['nda_uk'])['i'] == 2
+    assert restarted.get('Document 1', 'contract', ['nda_uk']) is None
+    assert restarted.preload(limit=10, budget_seconds=0) == 0
+    assert restarted.get_stats()['preloaded'] == 2
+
+
+def test_result_store_skips_results_of_other_gate_versions(tmp_path, monkeypatch):
+    store = ResultStore(tmp_path / 'results.db')
+    cache = ValidationCache(result_store=store)
+    cache.persist('Policy', 'policy', ['gdpr_uk'], cache.set('Policy', 'policy', ['gdpr_uk'], {'overall_risk': 'LOW'}))
+
+    monkeypatch.setattr(result_store_module, 'ruleset_fingerprint', lambda modules: 'upgraded')
+    assert ValidationCache(result_store=store).preload() == 0
+
+
+def test_result_store_ranks_results_by_requests(tmp_path):
+    store = ResultStore(tmp_path / 'results.db', touch_batch=4)
+    cache = ValidationCache(result_store=store)
+    # Validated three times (say, evicted between requests) vs once and then served from the cache
+    for _ in range(3):
+        cache.persist('Recomputed', 'contract', [], cache.set('Recomputed', 'contract', [], {'overall_risk': 'LOW'}))
+    cache.persist('Popular', 'contract', [], cache.set('Popular', 'contract', [], {'overall_risk': 'HIGH'}))
+    for _ in range(5):
+        entry, result = cache.get_or_compute('Popular', 'contract', [], lambda: pytest.fail('recomputed'))
+        assert result is None
+        cache.touch('Popular', 'contract', [])
+    assert store.get_stats()['hits'] == 3 + 1 + 5
+
+    restarted = ValidationCache(result_store=ResultStore(tmp_path / 'results.db'))
+    assert restarted.preload(limit=1) == 1
+    assert restarted.get('Popular', 'contract', [])['overall_risk'] == 'HIGH'
+    assert restarted.get('Recomputed', 'contract', []) is None
+
+
+def test_preloaded_entries_join_the_near_duplicate_index_on_first_hit(tmp_path):
+    store = ResultStore(tmp_path / 'results.db')
+    cache = ValidationCache(result_store=store)
+    cache.persist(POLICY, 'policy', [], cache.set(POLICY, 'policy', [], {'overall_risk': 'LOW'}))
+
+    restarted = ValidationCache(result_store=store, near_duplicates=NearDuplicateIndex(threshold=0.9))
+    assert restarted.preload() == 1
+    assert restarted.get_near_duplicate(POLICY.upper(), 'policy', []) is None
+
+    assert restarted.get_or_compute(POLICY, 'policy', [], lambda: pytest.fail('recomputed'))[1] is None
+    assert restarted.get_near_duplicate(POLICY.upper(), 'policy', [])['near_duplicate']['similarity'] >= 0.9
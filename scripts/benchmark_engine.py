@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Engine Benchmark CLI
+Measures validation cost on documents assembled from the gold fixtures.
+
+Usage:
+    python scripts/benchmark_engine.py context [--size-kb 1024]
+    python scripts/benchmark_engine.py patterns [--rounds 3]
+    python scripts/benchmark_engine.py relevance [--size-kb 1024] [--module tax_uk]
+    python scripts/benchmark_engine.py executor [--rounds 3] [--workers 4] [--clients 8]
+    python scripts/benchmark_engine.py modes [--rounds 3] [--workers 4]
+    python scripts/benchmark_engine.py contradictions [--pairwise-limit 1000]
+    python scripts/benchmark_engine.py verdict [--rounds 3] [--workers 4]
+    python scripts/benchmark_engine.py blocks [--rounds 3]
+    python scripts/benchmark_engine.py fusion [--size-kb 256] [--module fca_uk]
+    python scripts/benchmark_engine.py redos [--size-kb 1024] [--top 25] [--budget-ms 1000] [--write-baseline PATH]
+    python scripts/benchmark_engine.py backends [--rounds 3] [--budget-ms 1000]
+"""
+import re
+import sys
+import json
+import random
+import statistics
+import time
+import argparse
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT / 'backend'))
+
+from core.async_engine import AsyncLOKIEngine
+from core.block_memo import BlockMatchMemo
+from core.document_context import DocumentContext
+from core.gate_introspection import extract_patterns
+from core.pattern_fusion import FusedPatterns
+from core.pattern_registry import pattern_registry
+from core.regex_audit import RegexAuditor, collect_patterns
+from core.regex_backends import available_backends, create_backend
+from core.relevance import relevance_index
+from core.universal_detectors import UniversalDetectors
+from analyzers import bias_detector, hallucination_heuristic, pii_scanner
+
+GOLD_FIXTURES_DIR = ROOT / 'tests' / 'semantic' / 'gold_fixtures'
+DEFAULT_MODULES = [
+    'hr_scottish', 'gdpr_uk', 'nda_uk', 'tax_uk', 'fca_uk',
+    'uk_employment', 'gdpr_advanced', 'fca_advanced', 'scottish_law', 'industry_specific',
+]
+
+
+def load_engine(modules=None, **kwargs):
+    """Build an engine with the requested modules loaded."""
+    engine = AsyncLOKIEngine(**kwargs)
+    for module_name in modules or DEFAULT_MODULES:
+        engine.load_module(module_name)
+    return engine
+
+
+def load_fixtures():
+    """Return {fixture_id: text} for every gold fixture."""
+    fixtures = {}
+    for path in sorted(GOLD_FIXTURES_DIR.glob('*/*.txt')):
+        fixtures[f"{path.parent.name}/{path.stem}"] = path.read_text(encoding='utf-8')
+    return fixtures
+
+
+def build_document(size_kb, module=None):
+    """Concatenate gold fixtures (optionally of one module) until the document reaches ``size_kb``."""
+    parts = [text for fixture_id, text in load_fixtures().items()
+             if module is None or fixture_id.startswith(f"{module}/")]
+    target = size_kb * 1024
+    chunks = []
+    length = 0
+    while length < target:
+        for part in parts:
+            chunks.append(part)
+            length += len(part) + 2
+            if length >= target:
+                break
+    return '\n\n'.join(chunks)
+
+
+def _gate_peak_bytes(run):
+    """Peak bytes allocated while ``run`` executes."""
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    return max(0, peak - before)
+
+
+def bench_context(args):
+    """Compare per-gate allocation of check() against the shared-context path."""
+    engine = load_engine()
+    text = build_document(args.size_kb)
+    document_type = 'contract'
+    gates = [
+        (f"{module_name}.{gate_id}", gate)
+        for module_name, module in engine.modules.items()
+        for gate_id, gate in module.gates.items()
+    ]
+    ctx_gates = sum(1 for _, gate in gates if hasattr(gate, 'check_ctx'))
+
+    print(f"Document: {len(text) / 1024:.0f} KB, {len(gates)} gates ({ctx_gates} context-aware)")
+
+    # Warm the regex cache so neither path pays first-compile allocations
+    for _, gate in gates:
+        gate.check(text, document_type)
+
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        legacy_bytes = sum(
+            _gate_peak_bytes(lambda gate=gate: gate.check(text, document_type))
+            for _, gate in gates
+        )
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ctx = DocumentContext(text, document_type)
+        shared_bytes = _gate_peak_bytes(lambda: ctx.lower)
+        shared_bytes += sum(
+            _gate_peak_bytes(lambda gate=gate: engine._execute_gate(name, gate, ctx))
+            for name, gate in gates
+        )
+        shared_seconds = time.perf_counter() - start
+        lower_bytes = _gate_peak_bytes(lambda: text.lower())
+    finally:
+        tracemalloc.stop()
+
+    saved = legacy_bytes - shared_bytes
+    print(f"{'path':<16}{'allocated MB':>14}{'seconds':>10}")
+    print(f"{'check()':<16}{legacy_bytes / 1e6:>14.1f}{legacy_seconds:>10.2f}")
+    print(f"{'check_ctx()':<16}{shared_bytes / 1e6:>14.1f}{shared_seconds:>10.2f}")
+    print(f"Saved {saved / 1e6:.1f} MB per request "
+          f"(~{saved / max(lower_bytes, 1):.0f} full-document lower() calls avoided)")
+
+
+def bench_patterns(args):
+    """Mixed-module traffic over the gold fixtures: registry lookups vs re's bounded cache."""
+    engine = load_engine()
+    fixtures = list(load_fixtures().values())
+    print(f"Registry after load: {pattern_registry.get_stats()}")
+
+    def run():
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for text in fixtures:
+                engine.check_document(text, 'contract', None)
+        return time.perf_counter() - start
+
+    run()  # warm-up: lazily compiled dynamic patterns land in the registry
+    before = pattern_registry.get_stats()
+    seconds = run()
+    after = pattern_registry.get_stats()
+
+    lookups = after['lookups'] - before['lookups']
+    misses = after['misses'] - before['misses']
+    print(f"{args.rounds} rounds x {len(fixtures)} fixtures in {seconds:.2f}s")
+    print(f"Lookups: {lookups}, misses: {misses}, compiled patterns: {after['patterns']} "
+          f"(re cache holds {getattr(re, '_MAXCACHE', 'n/a')})")
+
+
+def bench_relevance(args):
+    """Per-gate _is_relevant() scans against one keyword-automaton pass."""
+    engine = load_engine()
+    text = build_document(args.size_kb, module=args.module)
+    ctx = DocumentContext(text, 'contract')
+    ctx.lower  # both paths share the lower-cased view
+    gates = [
+        (module_name, gate_id, gate)
+        for module_name, module in engine.modules.items()
+        for gate_id, gate in module.gates.items()
+        if hasattr(gate, '_is_relevant')
+    ]
+
+    start = time.perf_counter()
+    relevant = 0
+    for _, _, gate in gates:
+        arg = ctx if hasattr(gate, 'check_ctx') else text
+        relevant += bool(gate._is_relevant(arg))
+    per_gate = time.perf_counter() - start
+
+    relevance_index.automaton  # build outside the timed region
+    start = time.perf_counter()
+    scan = relevance_index.scan(ctx)
+    one_pass = time.perf_counter() - start
+    summary = scan.summary(engine.modules)
+
+    print(f"Document: {len(text) / 1024:.0f} KB of {args.module or 'all'} fixtures, "
+          f"{len(gates)} gates with _is_relevant()")
+    print(f"Index: {relevance_index.get_stats()}")
+    print(f"Per-gate _is_relevant(): {per_gate * 1000:.1f} ms ({relevant} relevant)")
+    print(f"Automaton pass:          {one_pass * 1000:.1f} ms "
+          f"({summary['gates_skipped']} gates skipped, modules: {', '.join(summary['relevant_modules'])})")
+
+
+def bench_executor(args):
+    """Gold-fixture traffic from concurrent clients through the shared gate executor."""
+    engine = load_engine(max_workers=args.workers)
+    fixtures = list(load_fixtures().values()) * args.rounds
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as clients:
+        list(clients.map(lambda text: engine.check_document(text, 'contract', None), fixtures))
+    seconds = time.perf_counter() - start
+
+    print(f"{len(fixtures)} validations from {args.clients} clients on {args.workers} workers "
+          f"in {seconds:.2f}s ({len(fixtures) / seconds:.1f} docs/s)")
+    print(f"Executor: {engine.executor.get_stats()}")
+
+
+def _comparable(result):
+    """Validation result without per-run timestamps and search counters."""
+    modules = {
+        module_name: {**module, 'gates': {
+            gate_name: {k: v for k, v in gate.items() if k != 'timestamp'}
+            for gate_name, gate in module.get('gates', {}).items()
+        }}
+        for module_name, module in result.get('modules', {}).items()
+    }
+    return {**{k: v for k, v in result.items() if k not in ('timestamp', 'pattern_plan')}, 'modules': modules}
+
+
+def bench_modes(args):
+    """Every execution mode over the gold fixtures, checking the results match."""
+    fixtures = list(load_fixtures().values())
+    reference = None
+    print(f"{'mode':<10}{'start s':>9}{'docs/s':>9}{'identical':>11}")
+    for mode in AsyncLOKIEngine.EXECUTION_MODES:
+        engine = load_engine(max_workers=args.workers, execution_mode=mode, process_workers=args.workers)
+        try:
+            start = time.perf_counter()
+            engine.warm_up()
+            startup = time.perf_counter() - start
+
+            start = time.perf_counter()
+            results = [
+                _comparable(engine.check_document(text, 'contract', None))
+                for _ in range(args.rounds) for text in fixtures
+            ]
+            seconds = time.perf_counter() - start
+        finally:
+            engine.shutdown()
+        reference = reference or results
+        print(f"{mode:<10}{startup:>9.2f}{len(results) / seconds:>9.1f}{str(results == reference):>11}")
+
+
+def bench_verdict(args):
+    """Full validation against verdict mode on the gold fixtures, per execution mode."""
+    fixtures = list(load_fixtures().values())
+    print(f"{'mode':<10}{'full ms/doc':>12}{'verdict ms/doc':>15}{'skipped/doc':>12}{'same risk':>10}")
+    for mode in ('serial', 'thread'):
+        engine = load_engine(max_workers=args.workers, execution_mode=mode)
+        try:
+            timings = {}
+            risks = {}
+            skipped = 0
+            for check_mode in ('full', 'verdict'):
+                start = time.perf_counter()
+                risks[check_mode] = []
+                for _ in range(args.rounds):
+                    for text in fixtures:
+                        result = engine.check_document(text, 'contract', None, mode=check_mode)
+                        risks[check_mode].append(result['overall_risk'])
+                        skipped += len(result.get('skipped_gates', []))
+                timings[check_mode] = (time.perf_counter() - start) * 1000 / (args.rounds * len(fixtures))
+        finally:
+            engine.shutdown()
+        print(f"{mode:<10}{timings['full']:>12.2f}{timings['verdict']:>15.2f}"
+              f"{skipped / (args.rounds * len(fixtures)):>12.1f}{str(risks['full'] == risks['verdict']):>10}")
+
+
+def _edited_drafts(text, count, edits=3):
+    """``count`` revisions of ``text``, each appending a sentence to a few paragraphs."""
+    paragraphs = text.split('\n\n')
+    drafts = []
+    for revision in range(count):
+        rng = random.Random(revision)
+        edited = list(paragraphs)
+        for i in rng.sample(range(len(edited)), edits):
+            edited[i] += f" Revised by Party {revision} on {rng.randint(1, 28)} March 2025."
+        drafts.append('\n\n'.join(edited))
+    return drafts
+
+
+def bench_blocks(args):
+    """Successive drafts of one long document with and without the paragraph match memo."""
+    text = '\n\n'.join(load_fixtures().values())
+    drafts = _edited_drafts(text, args.rounds)
+    engine = load_engine(execution_mode='serial')
+    saved = pattern_registry.block_memo
+    results = {}
+    try:
+        print(f"{len(text) // 1024} KB document, {text.count(chr(10) * 2) + 1} paragraphs, "
+              f"3 edited per draft")
+        print(f"{'memo':<8}{'first ms':>10}{'draft ms':>10}")
+        for label, memo in (('off', None), ('on', BlockMatchMemo())):
+            pattern_registry.block_memo = memo
+            start = time.perf_counter()
+            results[label] = [_comparable(engine.check_document(text, 'contract', None))]
+            first = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            results[label] += [_comparable(engine.check_document(draft, 'contract', None)) for draft in drafts]
+            per_draft = (time.perf_counter() - start) * 1000 / len(drafts)
+            print(f"{label:<8}{first:>10.0f}{per_draft:>10.0f}")
+        print(f"Memo: {memo.get_stats()}")
+        print(f"Identical results: {results['off'] == results['on']}")
+    finally:
+        pattern_registry.block_memo = saved
+        engine.shutdown()
+
+
+def bench_fusion(args):
+    """Per gate: one finditer pass per pattern against the fused scan of the same patterns."""
+    engine = load_engine([args.module] if args.module else None)
+    text = build_document(args.size_kb, module=args.module)
+    print(f"Document: {len(text) / 1024:.0f} KB")
+    print(f"{'gate':<48}{'patterns':>9}{'passes':>7}{'separate ms':>12}{'fused ms':>10}{'same':>6}")
+    totals = [0.0, 0.0]
+    for module_name, module in engine.modules.items():
+        for gate_id, gate in module.gates.items():
+            by_flags = {}
+            for pattern, flags in extract_patterns(gate):
+                by_flags.setdefault(flags, []).append(pattern)
+            plans = [FusedPatterns({'patterns': patterns}, flags) for flags, patterns in by_flags.items()]
+            plans = [plan for plan in plans if plan.get_stats()['fused']]
+            if not plans:
+                continue
+
+            def run_separate():
+                return [[[m.span() for m in re.finditer(pattern, text, plan.flags)]
+                         for pattern in plan.groups['patterns']] for plan in plans]
+
+            def run_fused():
+                return [plan.scan(text)['patterns'] for plan in plans]
+
+            # Untimed first runs compile every pattern
+            separate, fused = run_separate(), run_fused()
+            start = time.perf_counter()
+            run_separate()
+            separate_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            run_fused()
+            fused_ms = (time.perf_counter() - start) * 1000
+
+            totals[0] += separate_ms
+            totals[1] += fused_ms
+            patterns = sum(plan.get_stats()['patterns'] for plan in plans)
+            passes = sum(plan.passes for plan in plans)
+            print(f"{module_name + '.' + gate_id:<48}{patterns:>9}{passes:>7}"
+                  f"{separate_ms:>12.1f}{fused_ms:>10.1f}{str(separate == fused):>6}")
+    print(f"{'total':<64}{totals[0]:>12.1f}{totals[1]:>10.1f}")
+    engine.shutdown()
+
+
+def _pairwise_contradictions(detector, text):
+    """The original all-pairs scan, kept here as the scaling baseline."""
+    sentences = text.split('.')
+    found = 0
+    for i, first in enumerate(sentences):
+        for second in sentences[i + 1:]:
+            for neg, pos in detector._contradiction_patterns:
+                if neg.search(first) and pos.search(second):
+                    found += 1
+    return found
+
+
+def bench_contradictions(args):
+    """Contradiction detection cost from 10 to 10,000 sentences."""
+    detector = UniversalDetectors()
+    sentences = [s.strip() for path in sorted(GOLD_FIXTURES_DIR.glob('*/*.txt'))
+                 for s in path.read_text(encoding='utf-8').split('.') if s.strip()]
+
+    print(f"{'sentences':>10} {'indexed ms':>11} {'pairs':>6} {'pairwise ms':>12}")
+    for count in (10, 100, 1000, 10000):
+        text = '. '.join(sentences[i % len(sentences)] for i in range(count))
+        start = time.perf_counter()
+        result = detector.detect_contradictions(text)
+        indexed = (time.perf_counter() - start) * 1000
+
+        pairwise = '-'
+        if count <= args.pairwise_limit:
+            start = time.perf_counter()
+            _pairwise_contradictions(detector, text)
+            pairwise = f"{(time.perf_counter() - start) * 1000:.1f}"
+        print(f"{count:>10} {indexed:>11.1f} {len(result['contradictions']):>6} {pairwise:>12}")
+
+
+def bench_redos(args):
+    """Rank every gate and analyzer regex by worst-case time per KB on adversarial input."""
+    engine = load_engine()
+    patterns = collect_patterns(engine.modules, [pii_scanner, bias_detector, hallucination_heuristic])
+    engine.shutdown()
+    auditor = RegexAuditor(target_size=args.size_kb * 1024, ceiling=args.budget_ms / 1000)
+    start = time.perf_counter()
+    report = auditor.audit(patterns)
+    over = [row for row in report if row['seconds'] * 1000 > args.budget_ms]
+
+    print(f"{len(report)} patterns audited at {args.size_kb} KB in {time.perf_counter() - start:.0f}s; "
+          f"{len(over)} over {args.budget_ms} ms")
+    print(f"{'ms/KB':>12}{'exp':>6}{'input':>10}  {'pattern':<60}sources")
+    for row in report[:args.top]:
+        marker = '~' if row['projected'] else ' '
+        print(f"{marker}{row['ms_per_kb']:>11.3g}{row['exponent']:>6}{row['input']:>10}  "
+              f"{row['pattern'][:58]!r:<60}{', '.join(row['sources'][:2])}")
+    print("~ = projected from a smaller input")
+
+    if args.write_baseline:
+        baseline = sorted(({'pattern': row['pattern'], 'flags': row['flags'], 'sources': row['sources']}
+                           for row in over), key=lambda entry: (entry['sources'], entry['pattern']))
+        Path(args.write_baseline).write_text(json.dumps(baseline, indent=1) + '\n', encoding='utf-8')
+        print(f"Wrote {len(baseline)} over-budget patterns to {args.write_baseline}")
+
+
+def bench_backends(args):
+    """Per-document latency percentiles under each installed regex backend, checking results match."""
+    fixtures = list(load_fixtures().values())
+    # Model output often arrives without line breaks, which is where .* patterns backtrack longest
+    documents = fixtures + [text.replace('\n', ' ') for text in fixtures]
+    engine = load_engine(execution_mode='serial')
+    saved = pattern_registry.backend
+    reference = None
+    print(f"{len(documents)} documents x {args.rounds} rounds, regex timeout {args.budget_ms:.0f} ms")
+    print(f"{'backend':<10}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'engine':>8}{'fallback':>10}{'identical':>11}")
+    try:
+        for name in available_backends():
+            pattern_registry.set_backend(create_backend(name, timeout=args.budget_ms / 1000))
+            engine.check_document(documents[0], 'contract', None)
+            latencies = []
+            results = []
+            for _ in range(args.rounds):
+                for text in documents:
+                    start = time.perf_counter()
+                    result = engine.check_document(text, 'contract', None)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    results.append(_comparable(result))
+            reference = reference or results
+            cuts = statistics.quantiles(latencies, n=100)
+            stats = pattern_registry.backend.get_stats()
+            print(f"{name:<10}{cuts[49]:>9.1f}{cuts[98]:>9.1f}{max(latencies):>9.1f}"
+                  f"{stats.get('engine_patterns', len(pattern_registry)):>8}{stats.get('fallbacks', 0):>10}"
+                  f"{str(results == reference):>11}")
+    finally:
+        pattern_registry.set_backend(saved)
+        engine.shutdown()
+
+
+BENCHMARKS = {
+    'context': bench_context,
+    'patterns': bench_patterns,
+    'relevance': bench_relevance,
+    'executor': bench_executor,
+    'modes': bench_modes,
+    'contradictions': bench_contradictions,
+    'verdict': bench_verdict,
+    'blocks': bench_blocks,
+    'fusion': bench_fusion,
+    'redos': bench_redos,
+    'backends': bench_backends,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--size-kb', type=int, default=1024, help='Document size for single-document benchmarks')
+    parser.add_argument('--module', help='Restrict generated documents to one module\'s fixtures')
+    parser.add_argument('--rounds', type=int, default=3, help='Passes over the gold fixtures for traffic benchmarks')
+    parser.add_argument('--workers', type=int, default=4, help='Engine executor size')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent client threads')
+    parser.add_argument('--pairwise-limit', type=int, default=1000,
+                        help='Largest sentence count to time the all-pairs baseline on')
+    parser.add_argument('--top', type=int, default=25, help='Patterns to list in the ReDoS report')
+    parser.add_argument('--budget-ms', type=float, default=1000,
+                        help='Worst-case latency budget per pattern (the regex backend\'s timeout)')
+    parser.add_argument('--write-baseline', help='Write the over-budget patterns to this JSON file')
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == '__main__':
+    main()